@@ -23,6 +23,7 @@ For full command reference, run:
 import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 
 def find_repo_root() -> Path:
@@ -64,16 +65,68 @@ def main():
     except SystemExit:
         return 1
 
+    # Opt-in tracing (TASKS_TRACE=1) must be installed before providers exist
+    from .telemetry import (
+        ROOT_SPAN_NAME,
+        TRACE_FILE_RELPATH,
+        get_tracer,
+        init_telemetry,
+        shutdown_telemetry,
+        tracing_enabled,
+    )
+
+    # Global --profile [cpu|alloc] is consumed here so profiling covers
+    # initialize_commands(); the profiler is only imported when requested
+    profile_mode = None
+    if any(arg == "--profile" or arg.startswith("--profile=") for arg in sys.argv[1:]):
+        from .profiling import extract_profile_option
+        try:
+            profile_mode, sys.argv[1:] = extract_profile_option(sys.argv[1:])
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+
+    init_telemetry(enabled=tracing_enabled(), trace_file=repo_root / TRACE_FILE_RELPATH)
+
+    # The app callback fills in the subcommand Click resolved; invocations
+    # that never reach it (bare `tasks`, --help) keep "help"
+    invocation = SimpleNamespace(command="help")
+
+    try:
+        with get_tracer(__name__).start_as_current_span(ROOT_SPAN_NAME) as span:
+            if profile_mode:
+                from .profiling import PROFILES_RELPATH, CommandProfiler
+                with CommandProfiler(
+                    profile_mode, repo_root / PROFILES_RELPATH, invocation.command
+                ) as profiler:
+                    exit_code = _run_app(repo_root, invocation, profiler)
+                    profiler.command = invocation.command
+            else:
+                exit_code = _run_app(repo_root, invocation)
+            span.set_attribute(ROOT_SPAN_NAME, invocation.command)
+            span.set_attribute("cli.exit_code", str(exit_code))
+            return exit_code
+    finally:
+        shutdown_telemetry()
+
+
+def _run_app(repo_root: Path, invocation: SimpleNamespace, profiler=None) -> int:
+    """Initialize commands and invoke the Typer app, returning the exit code.
+
+    The app's global callback sets invocation.command to the resolved subcommand.
+    """
     # Import and initialize Typer app
     from .app import app, initialize_commands
 
     # Initialize all Typer commands with repository context
     initialize_commands(repo_root)
+    if profiler is not None:
+        profiler.mark("initialize_commands")
 
     # Invoke Typer app
     # Typer/Click will automatically read from sys.argv when called
     try:
-        app()
+        app(obj=invocation)
     except SystemExit as e:
         return e.code if e.code is not None else 0
     except Exception as e:
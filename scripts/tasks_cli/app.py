@@ -11,6 +11,7 @@ Wave 2 (Active): pick, claim, complete, archive, graph, refresh-cache, check-hal
 
 import typer
 from pathlib import Path
+from typing import Optional
 
 from .context import TaskCliContext
 
@@ -22,6 +23,30 @@ app = typer.Typer(
 )
 
 
+@app.callback()
+def global_options(
+    ctx: typer.Context,
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        metavar="[cpu|alloc]",
+        help=(
+            "Profile the command under cProfile (cpu, default) or tracemalloc "
+            "(alloc); writes to .agent-output/profiles/ and prints hot spots "
+            "and peak memory to stderr"
+        ),
+    ),
+):
+    """Task workflow management CLI."""
+    # --profile is consumed by __main__ before commands are initialized so
+    # that initialize_commands() is profiled too; declared here for --help.
+
+    # Report the subcommand Click resolved (global options may precede it)
+    # so __main__ can label the root span and profile
+    if ctx.obj is not None and ctx.invoked_subcommand:
+        ctx.obj.command = ctx.invoked_subcommand
+
+
 @app.command()
 def version():
     """Display CLI version."""
@@ -102,7 +127,9 @@ def initialize_commands(
     from .commands.quarantine import register_quarantine_commands
     from .commands.validation_commands import register_validation_commands
     from .commands.metrics_commands import register_metrics_commands
+    from .commands.trace import register_trace_commands
 
     register_quarantine_commands(app, ctx)
     register_validation_commands(app, ctx)
     register_metrics_commands(app, ctx)
+    register_trace_commands(app, ctx)
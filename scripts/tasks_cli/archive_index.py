@@ -0,0 +1,375 @@
+"""
+Compact index of archived (completed) task IDs.
+
+Archived tasks in docs/completed-tasks/ only ever grow, yet pick, list
+and readiness checks need nothing from them beyond "is this ID
+completed?". The datastore keeps them out of the hot path by storing:
+
+- the archived IDs as one newline-joined string, split into a set only
+  when a lookup might hit
+- a bloom filter, so lookups for IDs that are not archived (the common
+  case when checking active blockers) are answered without the set
+
+Full Task records for archived tasks live in a separate cache file
+(tasks/.cache/archive_index.json), maintained by ArchiveTier and
+materialized on demand (see TaskDatastore.load_archived_tasks). The cache
+entry helpers (task_entry/task_from_entry) are shared by both tiers.
+"""
+
+import base64
+import hashlib
+import math
+import os
+from collections.abc import Set as AbstractSet
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+from .constants import CACHE_VERSION
+from .models import Task
+
+# Target false-positive rate for the bloom filter
+BLOOM_FALSE_POSITIVE_RATE = 0.01
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings (double hashing on blake2b)."""
+
+    def __init__(self, size_bits: int, hash_count: int, bits: Optional[bytearray] = None):
+        """
+        Initialize bloom filter.
+
+        Args:
+            size_bits: Number of bits in the filter (>= 8)
+            hash_count: Number of bit positions set per key
+            bits: Existing bit array (for deserialization)
+        """
+        self.size_bits = max(8, size_bits)
+        self.hash_count = max(1, hash_count)
+        self.bits = bits if bits is not None else bytearray((self.size_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(
+        cls,
+        capacity: int,
+        false_positive_rate: float = BLOOM_FALSE_POSITIVE_RATE,
+    ) -> "BloomFilter":
+        """
+        Create a filter sized for an expected number of keys.
+
+        Args:
+            capacity: Expected number of keys
+            false_positive_rate: Target false-positive rate
+
+        Returns:
+            Empty BloomFilter
+        """
+        capacity = max(1, capacity)
+        size_bits = math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        hash_count = round(size_bits / capacity * math.log(2))
+        return cls(size_bits, hash_count)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def to_dict(self) -> Dict:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            'size_bits': self.size_bits,
+            'hash_count': self.hash_count,
+            'bits': base64.b64encode(bytes(self.bits)).decode('ascii'),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BloomFilter":
+        """Deserialize from to_dict() output."""
+        return cls(
+            data['size_bits'],
+            data['hash_count'],
+            bytearray(base64.b64decode(data['bits'])),
+        )
+
+
+class ArchiveIndex:
+    """
+    Membership index for archived task IDs.
+
+    Supports `in`, len() and iteration; the ID set is only built on the
+    first lookup that the bloom filter cannot rule out.
+    """
+
+    def __init__(self, ids_blob: str, count: int, bloom: BloomFilter):
+        """
+        Initialize index.
+
+        Args:
+            ids_blob: Archived task IDs joined with newlines
+            count: Number of IDs in ids_blob
+            bloom: Bloom filter populated with the same IDs
+        """
+        self._ids_blob = ids_blob
+        self._count = count
+        self._bloom = bloom
+        self._ids: Optional[FrozenSet[str]] = None
+
+    @classmethod
+    def from_ids(cls, task_ids: Iterable[str]) -> "ArchiveIndex":
+        """Build an index (and its bloom filter) from task IDs."""
+        ids = sorted(set(task_ids))
+        bloom = BloomFilter.for_capacity(len(ids))
+        for task_id in ids:
+            bloom.add(task_id)
+        return cls('\n'.join(ids), len(ids), bloom)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ArchiveIndex":
+        """Deserialize from to_dict() output (as stored in the task cache)."""
+        return cls(data['ids'], data['count'], BloomFilter.from_dict(data['bloom']))
+
+    def to_dict(self) -> Dict:
+        """Serialize to a JSON-compatible dict."""
+        return {'ids': self._ids_blob, 'count': self._count, 'bloom': self._bloom.to_dict()}
+
+    @property
+    def ids(self) -> FrozenSet[str]:
+        """All archived IDs (built on first use)."""
+        if self._ids is None:
+            self._ids = frozenset(self._ids_blob.split('\n')) if self._count else frozenset()
+        return self._ids
+
+    def __contains__(self, task_id: object) -> bool:
+        if not self._count or not isinstance(task_id, str) or task_id not in self._bloom:
+            return False
+        return task_id in self.ids
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+
+class CompletedIds(AbstractSet):
+    """
+    Read-only set of completed task IDs across both datastore tiers.
+
+    Combines completed IDs from the loaded (active) tasks with the archive
+    index, without copying the archive into a new set.
+    """
+
+    def __init__(self, active_completed: Iterable[str], archive: ArchiveIndex):
+        """
+        Initialize view.
+
+        Args:
+            active_completed: Completed IDs among loaded tasks
+            archive: Index of archived completed IDs
+        """
+        self._active = frozenset(active_completed)
+        self._archive = archive
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._active or task_id in self._archive
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._active
+        for task_id in self._archive:
+            if task_id not in self._active:
+                yield task_id
+
+    def __len__(self) -> int:
+        return len(self._active) + sum(1 for task_id in self._archive if task_id not in self._active)
+
+
+class ArchiveTier:
+    """
+    Cold tier of the task cache: records for docs/completed-tasks/.
+
+    Tracks the archive directories' mtimes (the fingerprint the hot tier is
+    validated against) and keeps the cold-tier cache file in sync,
+    re-parsing only archived files whose mtime changed.
+    """
+
+    def __init__(
+        self,
+        archive_dir: Path,
+        cache_file: Path,
+        parser,
+        read_json: Callable[[Path], Optional[Dict]],
+        write_json: Callable[[Path, Dict], None],
+    ):
+        """
+        Initialize cold tier.
+
+        Args:
+            archive_dir: Archive root (docs/completed-tasks/)
+            cache_file: Cold-tier cache file
+            parser: TaskParser for archived files
+            read_json: Cache reader (None when missing or unreadable)
+            write_json: Atomic cache writer
+        """
+        self.archive_dir = archive_dir
+        self.cache_file = cache_file
+        self.parser = parser
+        self._read_json = read_json
+        self._write_json = write_json
+
+    def fingerprint(self) -> Dict[str, int]:
+        """Map every archive directory (relative path) to its mtime_ns."""
+        fingerprint = {}
+        if self.archive_dir.is_dir():
+            for directory, _, _ in os.walk(self.archive_dir):
+                relative = os.path.relpath(directory, self.archive_dir)
+                fingerprint[relative] = os.stat(directory).st_mtime_ns
+        return fingerprint
+
+    def fingerprint_matches(self, fingerprint: Dict[str, int]) -> bool:
+        """Stat only the recorded archive directories (new ones change a parent)."""
+        if not fingerprint:
+            return not self.archive_dir.is_dir()
+        for relative, mtime_ns in fingerprint.items():
+            try:
+                if os.stat(self.archive_dir / relative).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def read_entries(self) -> Optional[Dict[str, Dict]]:
+        """Read cold-tier entries (None when missing or from another version)."""
+        data = self._read_json(self.cache_file)
+        if data is None or data.get('version') != CACHE_VERSION:
+            return None
+        return data.get('tasks', {})
+
+    def load(
+        self,
+        previous: Optional[Dict],
+        fingerprint: Dict[str, int],
+        force: bool = False,
+    ) -> Tuple[Dict, Dict[str, Dict], int, bool]:
+        """
+        Get the archive index for a hot-tier rebuild.
+
+        The previous hot index's archive is reused when the archive
+        directories are unchanged; otherwise the cold tier is rebuilt.
+
+        Args:
+            previous: Previous hot index (None to re-parse everything)
+            fingerprint: Current fingerprint()
+            force: Rebuild even if the archive directories are unchanged
+
+        Returns:
+            Tuple of (serialized ArchiveIndex, non-completed archived
+            entries, number of archived task files, whether it was reused)
+        """
+        reuse = (
+            not force
+            and previous is not None
+            and previous.get('version') == CACHE_VERSION
+            and previous.get('archive_fingerprint') == fingerprint
+            and 'archive' in previous
+        )
+        if not reuse:
+            return (*self.rebuild(reuse=previous is not None), False)
+
+        archive = previous['archive']
+        stray = {
+            task_id: entry for task_id, entry in previous.get('tasks', {}).items()
+            if entry.get('archived')
+        }
+        archive_count = previous.get('archive_count', len(stray) + archive['count'])
+        return archive, stray, archive_count, True
+
+    def rebuild(self, reuse: bool) -> Tuple[Dict, Dict[str, Dict], int]:
+        """
+        Rebuild the cold tier, re-parsing only archived files that changed.
+
+        Args:
+            reuse: Reuse cached entries whose path and mtime are unchanged
+
+        Returns:
+            Tuple of (serialized ArchiveIndex, non-completed archived entries,
+            number of archived task files)
+        """
+        cached = (self.read_entries() or {}) if reuse else {}
+        by_path = {entry['path']: (task_id, entry) for task_id, entry in cached.items()}
+
+        completed: Dict[str, Dict] = {}
+        stray: Dict[str, Dict] = {}
+        for task_file in self.parser.archived_task_files():
+            hit = by_path.get(str(task_file))
+            if hit and entry_is_current(hit[1]):
+                task_id, entry = hit
+            else:
+                task = self.parser.parse_archived_file(task_file)
+                if task is None:
+                    continue
+                task_id, entry = task.id, task_entry(task)
+            if entry['status'] == 'completed':
+                completed[task_id] = entry
+            else:
+                stray[task_id] = dict(entry, archived=True)
+
+        self._write_json(self.cache_file, {'version': CACHE_VERSION, 'tasks': completed})
+        archive = ArchiveIndex.from_ids(completed).to_dict()
+        return archive, stray, len(completed) + len(stray)
+
+
+def task_entry(task: Task) -> Dict:
+    """Serialize a Task for the cache."""
+    return {
+        'path': task.path,
+        'title': task.title,
+        'status': task.status,
+        'priority': task.priority,
+        'area': task.area,
+        'schema_version': task.schema_version,
+        'unblocker': task.unblocker,
+        'order': task.order,
+        'blocked_by': list(task.blocked_by),
+        'depends_on': list(task.depends_on),
+        'blocked_reason': task.blocked_reason,
+        'mtime': task.mtime,
+        'hash': task.hash,
+    }
+
+
+def task_from_entry(task_id: str, entry: Dict) -> Task:
+    """Reconstruct a Task from a cache entry."""
+    return Task(
+        id=task_id,
+        title=entry.get('title', ''),
+        status=entry['status'],
+        priority=entry['priority'],
+        area=entry.get('area', ''),
+        path=entry['path'],
+        schema_version=entry.get('schema_version', '1.0'),
+        unblocker=entry.get('unblocker', False),
+        order=entry.get('order'),
+        blocked_by=entry.get('blocked_by', ()),
+        depends_on=entry.get('depends_on', ()),
+        blocked_reason=entry.get('blocked_reason'),
+        mtime=entry['mtime'],
+        hash=entry.get('hash', ''),
+    )
+
+
+def entry_is_current(entry: Dict) -> bool:
+    """Check that a cached file still exists with the cached mtime."""
+    try:
+        return os.stat(entry['path']).st_mtime == entry['mtime']
+    except OSError:
+        return False
@@ -0,0 +1,29 @@
+"""
+Benchmark suite for the tasks CLI.
+
+Generates synthetic repositories (generators), times CLI commands against
+them cold and warm with peak RSS (scenarios, harness), and gates on a
+stored baseline report.
+
+Usage (from scripts/):
+    python -m tasks_cli.benchmarks generate /tmp/bench-10k --tasks 10000
+    python -m tasks_cli.benchmarks run /tmp/bench-10k --output results.json
+    python -m tasks_cli.benchmarks run /tmp/bench-10k --baseline baseline.json --tolerance 0.2
+
+run exits 1 when any scenario regresses past the tolerance, so CI can gate
+on it. Compare only reports from the same RepoSpec and machine.
+"""
+
+from .generators import GeneratedRepo, RepoSpec, generate_repo
+from .harness import compare_to_baseline, run_benchmarks
+from .scenarios import SCENARIOS, Scenario
+
+__all__ = [
+    "GeneratedRepo",
+    "RepoSpec",
+    "SCENARIOS",
+    "Scenario",
+    "compare_to_baseline",
+    "generate_repo",
+    "run_benchmarks",
+]
@@ -0,0 +1,131 @@
+"""
+Command-line entry point for the benchmark suite.
+
+Usage:
+    python -m tasks_cli.benchmarks generate DIR [--tasks N] [--seed S] [--contexts N]
+    python -m tasks_cli.benchmarks run DIR [--scenario NAME ...] [--mode cold|warm ...]
+        [--samples N] [--output FILE] [--baseline FILE] [--tolerance F] [--rss-tolerance F]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from .generators import RepoSpec, generate_repo
+from .harness import (
+    DEFAULT_RSS_TOLERANCE,
+    DEFAULT_SAMPLES,
+    DEFAULT_TOLERANCE,
+    MODES,
+    ScenarioResult,
+    compare_to_baseline,
+    run_benchmarks,
+)
+from .scenarios import SCENARIOS
+
+
+def _format_result(result: ScenarioResult) -> str:
+    failed = [code for code in result.exit_codes if code != 0]
+    status = f"  exit {failed[0]}" if failed else ""
+    return (
+        f"  {result.scenario:<18} {result.mode:<5} "
+        f"{result.median_seconds * 1000:>9.1f} ms  {result.max_rss_kb / 1024:>7.1f} MiB{status}"
+    )
+
+
+def _format_regressions(regressions: List[Dict], tolerance: float, rss_tolerance: float) -> str:
+    if not regressions:
+        return f"No regressions (tolerance {tolerance:.0%} time, {rss_tolerance:.0%} RSS)"
+    lines = [f"{len(regressions)} regression(s):"]
+    for r in regressions:
+        lines.append(
+            f"  {r['scenario']} {r['mode']} {r['metric']}: "
+            f"{r['baseline']:.4g} -> {r['current']:.4g} ({r['change']:+.0%})"
+        )
+    return "\n".join(lines)
+
+
+def _generate(args: argparse.Namespace) -> int:
+    spec = RepoSpec(task_count=args.tasks, seed=args.seed, context_count=args.contexts)
+    start = time.perf_counter()
+    repo = generate_repo(Path(args.directory), spec)
+    print(
+        f"Generated {len(repo.task_ids)} tasks ({len(repo.ready_task_ids)} ready, "
+        f"{len(repo.context_task_ids)} with contexts) in {repo.root} "
+        f"[{time.perf_counter() - start:.1f}s]"
+    )
+    return 0
+
+
+def _run(args: argparse.Namespace) -> int:
+    print(f"{'scenario':<20} {'mode':<5} {'median':>12}  {'peak RSS':>11}")
+    report = run_benchmarks(
+        Path(args.directory),
+        scenarios=args.scenario,
+        modes=args.mode or MODES,
+        samples=args.samples,
+        progress=lambda result: print(_format_result(result), flush=True),
+    )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}")
+
+    exit_code = 0
+    if any(code != 0 for result in report["results"] for code in result["exit_codes"]):
+        print("ERROR: Some scenarios exited non-zero; timings may not be comparable")
+        exit_code = 1
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if baseline.get("repo") != json.loads(json.dumps(report["repo"])):
+            print("WARNING: Baseline was recorded against a different RepoSpec")
+        regressions = compare_to_baseline(report, baseline, args.tolerance, args.rss_tolerance)
+        print(_format_regressions(regressions, args.tolerance, args.rss_tolerance))
+        if regressions:
+            exit_code = 1
+    return exit_code
+
+
+def main() -> int:
+    """Generate a benchmark repository or run the scenarios against one."""
+    parser = argparse.ArgumentParser(description="Benchmarks for the tasks CLI")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate = subparsers.add_parser("generate", help="Create a synthetic repository")
+    generate.add_argument("directory", help="Directory to create (must not contain a git repo)")
+    generate.add_argument("--tasks", type=int, default=RepoSpec.task_count, help="Number of task files")
+    generate.add_argument("--seed", type=int, default=RepoSpec.seed, help="Random seed")
+    generate.add_argument(
+        "--contexts", type=int, default=RepoSpec.context_count,
+        help="Ready tasks to initialize contexts (with telemetry and QA logs) for"
+    )
+
+    run = subparsers.add_parser("run", help="Run scenarios against a generated repository")
+    run.add_argument("directory", help="Repository created by 'generate'")
+    run.add_argument(
+        "--scenario", action="append", choices=list(SCENARIOS),
+        help="Scenario to run (repeatable; default: all)"
+    )
+    run.add_argument("--mode", action="append", choices=MODES, help="cold and/or warm (default: both)")
+    run.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="Measured samples per scenario and mode")
+    run.add_argument("--output", help="Write the JSON report here")
+    run.add_argument("--baseline", help="Baseline JSON report to gate against")
+    run.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help="Allowed relative increase in median time (0.25 = 25%%)"
+    )
+    run.add_argument(
+        "--rss-tolerance", type=float, default=DEFAULT_RSS_TOLERANCE,
+        help="Allowed relative increase in peak RSS"
+    )
+
+    args = parser.parse_args()
+    return _generate(args) if args.command == "generate" else _run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+"""
+Synthetic repositories for benchmarking the tasks CLI.
+
+generate_repo() builds a git repository shaped like this one at any
+scale (1k-100k task files):
+
+- task YAML files under tasks/<area>/ (open work) and
+  docs/completed-tasks/ (archive tier), with every field context
+  initialization requires
+- dependency shapes seen in practice: per-area epics of blocked_by chains
+  with occasional fan-out, a few unblocker hubs that many tasks wait on,
+  and cross-area depends_on edges into shared contracts. Edges always
+  point at lower task numbers, so the graph is a DAG.
+- standards files with the sections init-context cites
+- task contexts for some ready tasks (initialized through
+  init_contexts_batch), each with per-agent telemetry files, QA logs and
+  recorded QA results
+
+Generation is deterministic for a given RepoSpec. A manifest
+(MANIFEST_FILENAME, git-ignored) records the spec and the task IDs that
+scenarios target.
+"""
+
+import json
+import random
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..providers import ProcessProvider
+
+MANIFEST_FILENAME = ".benchmark-repo.json"
+
+# Area -> share of tasks
+AREA_WEIGHTS: Dict[str, float] = {
+    "backend": 0.35,
+    "mobile": 0.30,
+    "shared": 0.15,
+    "infrastructure": 0.10,
+    "docs": 0.10,
+}
+
+STANDARDS_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    "standards/global.md": ("Release Governance", "Governance & Evidence"),
+    "standards/AGENTS.md": ("Agent Responsibilities",),
+    "standards/backend-tier.md": ("Edge & Interface Layer", "Lambda Application Layer"),
+    "standards/frontend-tier.md": ("Component Structure", "State Management"),
+    "standards/shared-contracts-tier.md": ("Contract-First Design", "Versioning"),
+    "standards/typescript.md": ("Strict Configuration", "Type Safety"),
+    "standards/cross-cutting.md": ("Hard-Fail Controls", "Maintainability & Change Impact"),
+    "standards/testing-standards.md": ("Testing Requirements", "Coverage Thresholds"),
+    "standards/infrastructure-tier.md": ("Infrastructure Layer",),
+}
+
+AGENT_ROLES = ("implementer", "reviewer", "validator")
+
+_LINT_LOG = "src/handler.ts\n  12:5  error  Unexpected any  @typescript-eslint/no-explicit-any\n"
+_TEST_LOG = "PASS src/handler.test.ts\n  ✓ handles request ({ms} ms)\n"
+
+
+@dataclass(frozen=True)
+class RepoSpec:
+    """Shape of a synthetic repository."""
+    task_count: int = 1000
+    seed: int = 0
+    completed_ratio: float = 0.6     # Oldest tasks are completed and archived
+    epic_size: Tuple[int, int] = (5, 20)
+    hub_ratio: float = 0.01          # Share of open tasks that are unblocker hubs
+    context_count: int = 20          # Ready tasks that get a context
+    qa_log_lines: int = 2000         # Lines per QA log (x2 logs per agent)
+
+
+@dataclass
+class GeneratedRepo:
+    """Manifest of a generated repository."""
+    root: Path
+    spec: RepoSpec
+    task_ids: List[str] = field(default_factory=list)
+    ready_task_ids: List[str] = field(default_factory=list)
+    context_task_ids: List[str] = field(default_factory=list)
+    deepest_task_id: Optional[str] = None   # Open task with the longest blocker chain
+
+    def save(self) -> None:
+        data = {
+            "spec": asdict(self.spec),
+            "task_count": len(self.task_ids),
+            "ready_task_ids": self.ready_task_ids,
+            "context_task_ids": self.context_task_ids,
+            "deepest_task_id": self.deepest_task_id,
+        }
+        (self.root / MANIFEST_FILENAME).write_text(json.dumps(data, indent=2) + "\n")
+
+    @classmethod
+    def load(cls, root: Path) -> "GeneratedRepo":
+        """
+        Read the manifest of a generated repository.
+
+        Raises:
+            FileNotFoundError: root was not produced by generate_repo()
+        """
+        data = json.loads((Path(root) / MANIFEST_FILENAME).read_text())
+        spec = dict(data["spec"])
+        spec["epic_size"] = tuple(spec["epic_size"])
+        return cls(
+            root=Path(root),
+            spec=RepoSpec(**spec),
+            ready_task_ids=data["ready_task_ids"],
+            context_task_ids=data["context_task_ids"],
+            deepest_task_id=data["deepest_task_id"],
+        )
+
+
+@dataclass
+class _Task:
+    number: int
+    area: str
+    status: str
+    blocked_by: List[int] = field(default_factory=list)
+    depends_on: List[int] = field(default_factory=list)
+    unblocker: bool = False
+
+    @property
+    def task_id(self) -> str:
+        return f"TASK-{self.number:05d}"
+
+
+def generate_repo(root: Path, spec: RepoSpec = RepoSpec()) -> GeneratedRepo:
+    """
+    Generate a synthetic repository and commit it.
+
+    Args:
+        root: Empty (or missing) directory to generate into
+        spec: Repository shape
+
+    Returns:
+        GeneratedRepo manifest (also saved to root)
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(spec.seed)
+
+    tasks = _build_graph(spec, rng)
+    for task in tasks:
+        _write_task(root, task, rng)
+    _write_standards(root)
+    (root / ".gitignore").write_text(f".agent-output/\ntasks/.cache/\n{MANIFEST_FILENAME}\n")
+    _commit(root)
+
+    repo = GeneratedRepo(root=root, spec=spec, task_ids=[task.task_id for task in tasks])
+    by_number = {task.number: task for task in tasks}
+    completed = {task.number for task in tasks if task.status == "completed"}
+    open_tasks = [task for task in tasks if task.status != "completed"]
+    repo.ready_task_ids = [
+        task.task_id for task in open_tasks
+        if task.status == "todo" and all(n in completed for n in task.blocked_by)
+    ]
+    if open_tasks:
+        deepest = max(open_tasks, key=lambda task: _chain_depth(task, by_number, completed))
+        repo.deepest_task_id = deepest.task_id
+
+    repo.context_task_ids = repo.ready_task_ids[:spec.context_count]
+    paths = {task.task_id: _task_path(root, task) for task in open_tasks}
+    _write_contexts(root, [(task_id, paths[task_id]) for task_id in repo.context_task_ids], spec, rng)
+    repo.save()
+    return repo
+
+
+# ============================================================================
+# Task graph
+# ============================================================================
+
+def _build_graph(spec: RepoSpec, rng: random.Random) -> List[_Task]:
+    areas = list(AREA_WEIGHTS)
+    weights = list(AREA_WEIGHTS.values())
+    completed_count = int(spec.task_count * spec.completed_ratio)
+
+    tasks: List[_Task] = []
+    epic_tail: Dict[str, List[int]] = {area: [] for area in areas}
+    epic_left: Dict[str, int] = {area: 0 for area in areas}
+    hubs: List[int] = []
+    shared_tasks: List[int] = []
+
+    for number in range(1, spec.task_count + 1):
+        area = rng.choices(areas, weights)[0]
+        status = "completed" if number <= completed_count else _open_status(rng)
+        task = _Task(number, area, status)
+
+        if epic_left[area] == 0:
+            # New epic: starts from a hub or a shared contract, if any
+            epic_left[area] = rng.randint(*spec.epic_size)
+            epic_tail[area] = []
+            if hubs and rng.random() < 0.3:
+                task.blocked_by.append(rng.choice(hubs[-20:]))
+            if area != "shared" and shared_tasks and rng.random() < 0.5:
+                task.depends_on.append(rng.choice(shared_tasks[-50:]))
+        else:
+            # Chain on the previous task, sometimes also an earlier sibling (fan-out)
+            tail = epic_tail[area]
+            task.blocked_by.append(tail[-1])
+            if len(tail) > 2 and rng.random() < 0.2:
+                task.blocked_by.append(rng.choice(tail[:-1]))
+        epic_left[area] -= 1
+        epic_tail[area].append(number)
+
+        if rng.random() < spec.hub_ratio:
+            task.unblocker = True
+            hubs.append(number)
+        if area == "shared":
+            shared_tasks.append(number)
+        task.blocked_by = sorted(set(task.blocked_by))
+        tasks.append(task)
+    return tasks
+
+
+def _open_status(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.05:
+        return "in_progress"
+    if roll < 0.10:
+        return "blocked"
+    if roll < 0.13:
+        return "draft"
+    return "todo"
+
+
+def _chain_depth(task: _Task, by_number: Dict[int, _Task], completed: set) -> int:
+    depth = 0
+    current = task
+    while True:
+        pending = [n for n in current.blocked_by if n not in completed]
+        if not pending:
+            return depth
+        depth += 1
+        current = by_number[pending[-1]]
+
+
+def _id_list(numbers: List[int]) -> str:
+    return "[" + ", ".join(f"TASK-{n:05d}" for n in numbers) + "]"
+
+
+def _task_path(root: Path, task: _Task) -> Path:
+    if task.status == "completed":
+        directory = root / "docs" / "completed-tasks"
+    else:
+        directory = root / "tasks" / task.area
+    return directory / f"{task.task_id}-synthetic-{task.area}-work-item-{task.number}.task.yaml"
+
+
+def _write_task(root: Path, task: _Task, rng: random.Random) -> None:
+    path = _task_path(root, task)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    priority = rng.choice(("P0", "P1", "P1", "P2", "P2", "P2"))
+    blocked_reason = '"Waiting on upstream contract"' if task.status == "blocked" else "null"
+    path.write_text(f"""\
+schema_version: "1.1"
+id: {task.task_id}
+title: "Synthetic {task.area} work item {task.number}"
+status: {task.status}
+blocked_reason: {blocked_reason}
+priority: {priority}
+area: {task.area}
+unblocker: {str(task.unblocker).lower()}
+estimate: {rng.choice(("S", "M", "L"))}
+order: {task.number}
+blocked_by: {_id_list(task.blocked_by)}
+depends_on: {_id_list(task.depends_on)}
+
+description: >-
+  Synthetic benchmark task {task.number} in the {task.area} area. It exists to
+  give the CLI a realistically sized task file to parse and hash.
+
+scope:
+  in:
+    - {task.area}/src/module{task.number % 50}/handler.ts
+    - {task.area}/src/module{task.number % 50}/handler.test.ts
+  out:
+    - Unrelated refactors
+
+context:
+  affected_packages: [{task.area}]
+  related_docs:
+    - standards/testing-standards.md
+  repo_paths:
+    - {task.area}/src/module{task.number % 50}
+
+plan:
+  - Implement the change
+  - Add tests
+  - Update documentation
+
+acceptance_criteria:
+  - Handler returns the documented response
+  - Tests cover the error paths
+
+deliverables:
+  - {task.area}/src/module{task.number % 50}/handler.ts
+
+validation:
+  pipeline:
+    - id: val-001
+      command: pnpm turbo run lint --filter={task.area}
+      description: Lint
+    - id: val-002
+      command: pnpm turbo run test --filter={task.area}
+      description: Unit tests
+""")
+
+
+def _write_standards(root: Path) -> None:
+    for relpath, sections in STANDARDS_SECTIONS.items():
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        body = "".join(
+            f"## {section}\n\n" + "".join(f"- Rule {i} for {section.lower()}.\n" for i in range(20)) + "\n"
+            for section in sections
+        )
+        path.write_text(f"# {path.stem}\n\n{body}")
+
+
+def _commit(root: Path) -> None:
+    git = ProcessProvider()
+    for cmd in (
+        ["git", "init", "-q", "-b", "main"],
+        ["git", "config", "user.name", "Benchmark"],
+        ["git", "config", "user.email", "benchmark@example.com"],
+        ["git", "config", "commit.gpgsign", "false"],
+        ["git", "add", "-A"],
+        ["git", "commit", "-q", "-m", "Synthetic benchmark repository"],
+    ):
+        git.run(cmd, cwd=root, timeout=600)
+
+
+# ============================================================================
+# Contexts, telemetry and QA logs
+# ============================================================================
+
+def _write_contexts(root: Path, tasks: List[Tuple[str, Path]], spec: RepoSpec, rng: random.Random) -> None:
+    from ..commands.init_context import init_contexts_batch
+    from ..context_store import TaskContextStore
+
+    failed = [r for r in init_contexts_batch(root, tasks, actor="benchmark") if not r["success"]]
+    if failed:
+        raise RuntimeError(f"Context initialization failed: {failed[0]['error']}")
+
+    store = TaskContextStore(root)
+    for task_id, _ in tasks:
+        task_dir = root / ".agent-output" / task_id
+        for role in AGENT_ROLES:
+            _write_telemetry(task_dir / f"telemetry-{role}.json", task_id, role, rng)
+            lint_log = task_dir / f"qa-{role}-lint.log"
+            test_log = task_dir / f"qa-{role}-test.log"
+            lint_errors = rng.choice((0, 0, 0, 1, 2))
+            tests_failed = rng.choice((0, 0, 0, 0, 1))
+            lint_log.write_text(
+                _LINT_LOG * spec.qa_log_lines
+                + f"\n✖ {lint_errors + 3} problems ({lint_errors} errors, 3 warnings)\n"
+            )
+            test_log.write_text(
+                "".join(_TEST_LOG.format(ms=i % 90) for i in range(spec.qa_log_lines))
+                + f"\nTests:       {tests_failed} failed, {300 - tests_failed} passed, 300 total\n"
+            )
+            store.update_coordination(
+                task_id=task_id,
+                agent_role=role,
+                updates={
+                    "status": "done",
+                    "qa_log_path": str(test_log.relative_to(root)),
+                    "qa_results": {
+                        "recorded_at": "2025-01-01T00:00:00+00:00",
+                        "agent": role,
+                        "git_sha": None,
+                        "results": [
+                            {"command_id": "val-001", "command": "pnpm lint", "exit_code": int(lint_errors > 0),
+                             "duration_ms": 4000, "log_path": str(lint_log.relative_to(root)),
+                             "summary": {"lint_errors": lint_errors, "lint_warnings": 3}},
+                            {"command_id": "val-002", "command": "pnpm test", "exit_code": int(tests_failed > 0),
+                             "duration_ms": 30000, "log_path": str(test_log.relative_to(root)),
+                             "summary": {"tests_passed": 300 - tests_failed, "tests_failed": tests_failed}},
+                        ],
+                    },
+                },
+                actor="benchmark",
+            )
+
+
+def _write_telemetry(path: Path, task_id: str, role: str, rng: random.Random) -> None:
+    warnings = [{"message": f"Warning {i % 4}", "level": "warning"} for i in range(rng.randint(0, 6))]
+    path.write_text(json.dumps({
+        "task_id": task_id,
+        "agent_role": role,
+        "session_start": "2025-01-01T10:00:00+00:00",
+        "session_end": "2025-01-01T10:45:00+00:00",
+        "metrics": {
+            "file_operations": {"read_calls": rng.randint(2, 30), "write_calls": rng.randint(1, 10)},
+            "cache_operations": {
+                "cache_hits": rng.randint(0, 40),
+                "cache_misses": rng.randint(0, 10),
+                "estimated_tokens_saved": rng.randint(0, 50000),
+            },
+        },
+        "warnings": warnings,
+        "json_calls": rng.randint(5, 50),
+        "json_parse_failures": 0,
+    }, indent=2))
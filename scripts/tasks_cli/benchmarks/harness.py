@@ -0,0 +1,244 @@
+"""
+Benchmark harness: timing and peak RSS per scenario, with baseline gating.
+
+Every sample runs in a fresh interpreter (multiprocessing "spawn"), so
+in-process caches never leak between samples and ru_maxrss is the peak
+resident set of that one command. Two modes:
+
+- cold: COLD_CACHE_PATHS are deleted before every sample, so the command
+  rebuilds the datastore index, archive index and metrics store. (The OS
+  page cache is left alone; dropping it needs root.)
+- warm: one unmeasured run primes the caches, then samples reuse them
+
+Timings exclude interpreter start-up and imports of the harness itself but
+include everything the command does, from initialize_commands() on.
+
+Reports are JSON (see run_benchmarks). compare_to_baseline() flags a
+scenario when its median time or peak RSS exceeds the baseline's by more
+than the tolerance; medians below MIN_REGRESSION_SECONDS apart are noise.
+"""
+
+import multiprocessing
+import os
+import platform
+import queue
+import resource
+import shutil
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .generators import GeneratedRepo
+from .scenarios import COLD_CACHE_PATHS, SCENARIOS
+
+REPORT_SCHEMA_VERSION = 1
+MODES = ("cold", "warm")
+
+DEFAULT_SAMPLES = 3
+DEFAULT_TOLERANCE = 0.25       # 25% slower median than baseline
+DEFAULT_RSS_TOLERANCE = 0.25   # 25% higher peak RSS than baseline
+MIN_REGRESSION_SECONDS = 0.010
+
+
+@dataclass
+class ScenarioResult:
+    """Samples of one scenario in one mode."""
+    scenario: str
+    mode: str
+    seconds: List[float] = field(default_factory=list)
+    peak_rss_kb: List[int] = field(default_factory=list)
+    exit_codes: List[int] = field(default_factory=list)
+
+    @property
+    def median_seconds(self) -> float:
+        return statistics.median(self.seconds)
+
+    @property
+    def max_rss_kb(self) -> int:
+        return max(self.peak_rss_kb)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["median_seconds"] = self.median_seconds
+        data["min_seconds"] = min(self.seconds)
+        data["max_rss_kb"] = self.max_rss_kb
+        return data
+
+
+def clear_caches(root: Path) -> None:
+    """Delete the caches a cold sample must rebuild."""
+    for relpath in COLD_CACHE_PATHS:
+        path = Path(root) / relpath
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink(missing_ok=True)
+
+
+def _peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+
+def _sample(root: str, scenario_name: str, queue) -> None:
+    """Child process: run one scenario once and report (seconds, peak RSS, exit code)."""
+    try:
+        os.chdir(root)
+        repo = GeneratedRepo.load(Path(root))
+        scenario = SCENARIOS[scenario_name]
+        start = time.perf_counter()
+        exit_code = scenario.run(repo)
+        elapsed = time.perf_counter() - start
+        queue.put((elapsed, _peak_rss_kb(), exit_code, None))
+    except Exception as e:
+        queue.put((None, None, None, f"{type(e).__name__}: {e}"))
+
+
+def run_sample(root: Path, scenario_name: str, timeout: float = 3600.0) -> tuple:
+    """
+    Run one sample of a scenario in a fresh interpreter.
+
+    Returns:
+        (seconds, peak_rss_kb, exit_code)
+
+    Raises:
+        RuntimeError: The scenario raised or the child process died
+    """
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_sample, args=(str(root), scenario_name, results))
+    process.start()
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                elapsed, peak_rss_kb, exit_code, error = results.get(timeout=1.0)
+                break
+            except queue.Empty:
+                if process.is_alive() and time.monotonic() < deadline:
+                    continue
+                process.kill()
+                raise RuntimeError(
+                    f"{scenario_name}: benchmark process "
+                    f"{'timed out' if process.is_alive() else f'exited with {process.exitcode}'}"
+                ) from None
+    finally:
+        process.join()
+    if error is not None:
+        raise RuntimeError(f"{scenario_name}: {error}")
+    return elapsed, peak_rss_kb, exit_code
+
+
+def run_benchmarks(
+    root: Path,
+    scenarios: Optional[Sequence[str]] = None,
+    modes: Sequence[str] = MODES,
+    samples: int = DEFAULT_SAMPLES,
+    progress=None,
+) -> dict:
+    """
+    Run scenarios against a generated repository.
+
+    Args:
+        root: Repository created by generate_repo()
+        scenarios: Scenario names (default: all, in SCENARIOS order)
+        modes: "cold" and/or "warm"
+        samples: Measured samples per scenario and mode
+        progress: Optional callable receiving each finished ScenarioResult
+
+    Returns:
+        Report dict: schema_version, created_at, environment, repo (the
+        generator spec) and results (ScenarioResult.to_dict() entries)
+    """
+    root = Path(root)
+    repo = GeneratedRepo.load(root)
+    names = list(scenarios or SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)}")
+
+    results = []
+    for name in names:
+        scenario = SCENARIOS[name]
+        for mode in modes:
+            if mode not in MODES:
+                raise ValueError(f"Unknown mode: {mode}")
+            result = ScenarioResult(name, mode)
+            if mode == "warm":
+                if scenario.reset:
+                    scenario.reset(repo)
+                run_sample(root, name)
+            for _ in range(samples):
+                if scenario.reset:
+                    scenario.reset(repo)
+                if mode == "cold":
+                    clear_caches(root)
+                elapsed, peak_rss_kb, exit_code = run_sample(root, name)
+                result.seconds.append(elapsed)
+                result.peak_rss_kb.append(peak_rss_kb)
+                result.exit_codes.append(exit_code)
+            if progress is not None:
+                progress(result)
+            results.append(result.to_dict())
+
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "repo": asdict(repo.spec),
+        "results": results,
+    }
+
+
+def compare_to_baseline(
+    report: dict,
+    baseline: dict,
+    tolerance: float = DEFAULT_TOLERANCE,
+    rss_tolerance: float = DEFAULT_RSS_TOLERANCE,
+) -> List[Dict]:
+    """
+    Find scenarios that regressed against a baseline report.
+
+    Scenarios missing from the baseline are not compared. Reports from
+    differently shaped repositories are compared anyway; check report["repo"].
+
+    Args:
+        report: Current run_benchmarks() report
+        baseline: Stored report to compare against
+        tolerance: Allowed relative increase of the median time
+        rss_tolerance: Allowed relative increase of the peak RSS
+
+    Returns:
+        One dict per regressed metric: scenario, mode, metric ("median_seconds"
+        or "max_rss_kb"), baseline, current, change (relative)
+    """
+    baseline_results = {(r["scenario"], r["mode"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        previous = baseline_results.get((result["scenario"], result["mode"]))
+        if previous is None:
+            continue
+        checks = (
+            ("median_seconds", tolerance, MIN_REGRESSION_SECONDS),
+            ("max_rss_kb", rss_tolerance, 0),
+        )
+        for metric, allowed, floor in checks:
+            before, after = previous[metric], result[metric]
+            if after > before * (1 + allowed) and after - before > floor:
+                regressions.append({
+                    "scenario": result["scenario"],
+                    "mode": result["mode"],
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "change": (after - before) / before if before else float("inf"),
+                })
+    return regressions
@@ -0,0 +1,164 @@
+"""
+Benchmark scenarios: one tasks CLI command each, against a generated repo.
+
+A scenario invokes the registered Typer command callback the way the CLI
+does - initialize_commands() builds the TaskCliContext, then the command
+runs with its options filled in - with output discarded. Argument parsing
+is the only part of a real invocation that is skipped.
+
+Scenarios run in a fresh interpreter per sample (see harness.py), since
+initialize_commands() registers commands on the process-wide app and the
+command caches are per process. Commands that change repository state
+declare a reset hook that restores it before every sample, untimed.
+"""
+
+import os
+import sys
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional
+
+import typer
+
+from .generators import GeneratedRepo
+
+# Caches a cold sample starts without (relative to the repo root). The
+# datastore's snapshot counter in tasks/.cache is state, not cache.
+COLD_CACHE_PATHS = (
+    "tasks/.cache/tasks_index.json",
+    "tasks/.cache/archive_index.json",
+    ".agent-output/.metrics.sqlite3",
+    ".agent-output/.qa-cache",
+)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmarked command."""
+    name: str
+    description: str
+    run: Callable[[GeneratedRepo], int]              # Returns the command's exit code
+    reset: Optional[Callable[[GeneratedRepo], None]] = None
+
+
+@contextmanager
+def _discard_output() -> Iterator[None]:
+    """Send stdout/stderr to /dev/null, including writers that hold the original streams."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = [os.dup(1), os.dup(2)]
+    with open(os.devnull, "w") as devnull:
+        os.dup2(devnull.fileno(), 1)
+        os.dup2(devnull.fileno(), 2)
+        try:
+            with redirect_stdout(devnull), redirect_stderr(devnull):
+                yield
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for fd, copy in zip((1, 2), saved):
+                os.dup2(copy, fd)
+                os.close(copy)
+
+
+def invoke_command(repo: GeneratedRepo, command: str, **params) -> int:
+    """
+    Run a registered CLI command in this process with output discarded.
+
+    Args:
+        repo: Generated repository (also the working directory)
+        command: Command name as registered on the Typer app
+        **params: Every parameter of the command callback
+
+    Returns:
+        Exit code the CLI would have returned
+    """
+    from ..app import app, initialize_commands
+
+    initialize_commands(repo.root)
+    callback = next(info.callback for info in app.registered_commands if info.name == command)
+    with _discard_output():
+        try:
+            callback(**params)
+        except typer.Exit as e:
+            return e.exit_code
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return 0
+
+
+def _context_task(repo: GeneratedRepo) -> str:
+    if not repo.context_task_ids:
+        raise ValueError("Scenario needs a generated repo with at least one context (context_count > 0)")
+    return repo.context_task_ids[0]
+
+
+def _list(repo: GeneratedRepo) -> int:
+    return invoke_command(repo, "list", filter=None, format="json")
+
+
+def _pick(repo: GeneratedRepo) -> int:
+    return invoke_command(repo, "pick", filter=None, format="json")
+
+
+def _validate(repo: GeneratedRepo) -> int:
+    return invoke_command(repo, "validate", format="json")
+
+
+def _explain(repo: GeneratedRepo) -> int:
+    return invoke_command(repo, "explain", task_id=repo.deepest_task_id, format="json")
+
+
+def _init_context(repo: GeneratedRepo) -> int:
+    from ..commands.init_context import DEFAULT_INIT_WORKERS
+
+    return invoke_command(
+        repo, "init-context",
+        task_id=None, base_commit=None, actor="benchmark", force_secrets=False,
+        all_ready=True, workers=DEFAULT_INIT_WORKERS, allow_preexisting_dirty=True, format="json",
+    )
+
+
+def _reset_init_context(repo: GeneratedRepo) -> None:
+    """Drop contexts of ready tasks the generator did not initialize."""
+    from ..context_store import TaskContextStore
+
+    store = TaskContextStore(repo.root)
+    keep = set(repo.context_task_ids)
+    for task_id in store.storage.list_task_ids():
+        if task_id not in keep:
+            store.purge_context(task_id)
+
+
+def _snapshot_worktree(repo: GeneratedRepo) -> int:
+    return invoke_command(
+        repo, "snapshot-worktree",
+        task_id=_context_task(repo), agent="implementer", actor="benchmark", previous_agent=None, format="json",
+    )
+
+
+def _reset_snapshot_worktree(repo: GeneratedRepo) -> None:
+    """Leave the implementer's work in the tree: edits across a few modules."""
+    for module in range(5):
+        path = repo.root / "backend" / "src" / f"module{module}" / "handler.ts"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(f"export const value{i} = {i};\n" for i in range(200)))
+
+
+def _collect_metrics(repo: GeneratedRepo) -> int:
+    return invoke_command(repo, "collect-metrics", task_id=_context_task(repo), baseline_path=None)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("list", "list --format json (hot and archive tiers)", _list),
+        Scenario("pick", "pick --format json", _pick),
+        Scenario("validate", "validate --format json (cycle and dangling edge checks)", _validate),
+        Scenario("explain", "explain --format json for the task with the longest blocker chain", _explain),
+        Scenario("init-context", "init-context --all-ready", _init_context, _reset_init_context),
+        Scenario("snapshot-worktree", "snapshot-worktree --agent implementer with five edited files",
+                 _snapshot_worktree, _reset_snapshot_worktree),
+        Scenario("collect-metrics", "collect-metrics for a task with telemetry and QA logs", _collect_metrics),
+    )
+}
@@ -0,0 +1,258 @@
+"""
+Transitive-closure index for the task dependency graph.
+
+explain, priority propagation and downstream queries all ask the same
+question: which tasks are reachable from X along one kind of edge? Rather
+than traversing the graph per query, each edge relation is condensed into
+strongly connected components (Tarjan) and every component gets a bitset
+(a Python int) of the components it reaches. Components are numbered in
+Tarjan's emission order, so everything a component reaches has a lower
+number and each bitset is built with one OR per edge.
+
+Relations:
+- blocked_by: transitive hard blockers of a task
+- depends_on: transitive informational dependencies of a task
+- blocks: tasks transitively blocked by a task (reverse blocked_by)
+
+Relations are built on first use. An index built for a newer snapshot can
+reuse relations from the previous index whose edges did not change (see
+TaskDatastore.get_closure_index).
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from .models import Task
+from .telemetry import get_tracer
+
+_tracer = get_tracer(__name__)
+
+RELATIONS = ('blocked_by', 'depends_on', 'blocks')
+
+
+class Reachability:
+    """Reachability over one edge relation, as per-component bitsets."""
+
+    __slots__ = ('signature', '_component_of', '_members', '_reach')
+
+    def __init__(self, nodes: Sequence[str], successors: Dict[str, Sequence[str]], signature: int):
+        """
+        Build reachability bitsets.
+
+        Args:
+            nodes: Node IDs (edges to other IDs are ignored)
+            successors: Mapping of node ID to the IDs its edges point to
+            signature: Hash of the edges, used to decide reuse across snapshots
+        """
+        self.signature = signature
+        self._component_of: Dict[str, int] = {}
+        self._members: List[List[str]] = []
+        self._reach: List[int] = []
+
+        component_of = self._component_of
+        for members in _strongly_connected_components(nodes, successors):
+            component = len(self._members)
+            for node in members:
+                component_of[node] = component
+
+            reach = 0
+            cyclic = len(members) > 1
+            for node in members:
+                for successor in successors.get(node, ()):
+                    target = component_of.get(successor)
+                    if target is None:
+                        continue  # Unknown ID (missing or archived)
+                    if target == component:
+                        cyclic = True
+                    else:
+                        reach |= (1 << target) | self._reach[target]
+            if cyclic:
+                # Members of a cycle reach each other (and themselves)
+                reach |= 1 << component
+
+            self._members.append(members)
+            self._reach.append(reach)
+
+    def mask(self, node: str) -> int:
+        """Bitset of components reachable from node (0 if unknown)."""
+        component = self._component_of.get(node)
+        return 0 if component is None else self._reach[component]
+
+    def bit(self, node: str) -> int:
+        """Bitset containing node's own component (0 if unknown)."""
+        component = self._component_of.get(node)
+        return 0 if component is None else 1 << component
+
+    def ids_of(self, mask: int) -> List[str]:
+        """Node IDs in the components of a bitset (in component order)."""
+        ids: List[str] = []
+        bits = bin(mask)[:1:-1]  # Least significant bit first
+        position = bits.find('1')
+        while position != -1:
+            ids.extend(self._members[position])
+            position = bits.find('1', position + 1)
+        return ids
+
+    def reachable(self, node: str) -> List[str]:
+        """Node IDs reachable from node."""
+        return self.ids_of(self.mask(node))
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+
+class ClosureIndex:
+    """Memoized transitive closures over a task list."""
+
+    def __init__(
+        self,
+        tasks: List[Task],
+        snapshot_id: Optional[int] = None,
+        previous: Optional["ClosureIndex"] = None,
+    ):
+        """
+        Initialize index (relations are built lazily).
+
+        Args:
+            tasks: Tasks to index
+            snapshot_id: Datastore snapshot the tasks were loaded from
+            previous: Index for an earlier snapshot whose unchanged relations
+                may be reused
+        """
+        self.tasks = tasks
+        self.snapshot_id = snapshot_id
+        self._relations: Dict[str, Reachability] = {}
+        self._previous = previous
+        self._reverse_blocked_by: Optional[Dict[str, List[str]]] = None
+
+    def relation(self, name: str) -> Reachability:
+        """
+        Get (building if needed) the reachability for one relation.
+
+        Args:
+            name: One of RELATIONS
+
+        Returns:
+            Reachability for the relation
+        """
+        reachability = self._relations.get(name)
+        if reachability is not None:
+            return reachability
+        if name not in RELATIONS:
+            raise ValueError(f"Unknown relation: {name}")
+
+        attribute = 'depends_on' if name == 'depends_on' else 'blocked_by'
+        signature = hash(tuple((task.id, getattr(task, attribute)) for task in self.tasks))
+
+        previous = self._previous._relations.get(name) if self._previous else None
+        if previous is not None and previous.signature == signature:
+            reachability = previous
+        else:
+            with _tracer.start_as_current_span("cli.graph.closure_index") as span:
+                if name == 'blocks':
+                    successors = self._reverse_edges()
+                else:
+                    successors = {task.id: getattr(task, attribute) for task in self.tasks}
+                reachability = Reachability([task.id for task in self.tasks], successors, signature)
+                span.set_attribute("relation", name)
+                span.set_attribute("task_count", len(self.tasks))
+                span.set_attribute("component_count", len(reachability))
+
+        self._relations[name] = reachability
+        return reachability
+
+    def blockers(self, task_id: str) -> Set[str]:
+        """Transitive blocked_by dependencies of a task."""
+        return set(self.relation('blocked_by').reachable(task_id))
+
+    def artifacts(self, task_id: str) -> Set[str]:
+        """Transitive depends_on dependencies of a task."""
+        return set(self.relation('depends_on').reachable(task_id))
+
+    def blocked_tasks(self, task_id: str) -> List[str]:
+        """
+        Tasks transitively blocked by a task (excluding the task itself).
+
+        Works for IDs that are not indexed (e.g. archived tasks) by starting
+        from the tasks that list them in blocked_by.
+
+        Args:
+            task_id: Blocking task ID
+
+        Returns:
+            Blocked task IDs, deterministic order
+        """
+        blocks = self.relation('blocks')
+        mask = blocks.mask(task_id)
+        if not blocks.bit(task_id):
+            for blocked_id in self._reverse_edges().get(task_id, ()):
+                mask |= blocks.bit(blocked_id) | blocks.mask(blocked_id)
+        return [blocked_id for blocked_id in blocks.ids_of(mask) if blocked_id != task_id]
+
+    def _reverse_edges(self) -> Dict[str, List[str]]:
+        """blocker ID -> IDs of tasks it blocks."""
+        if self._reverse_blocked_by is None:
+            reverse: Dict[str, List[str]] = {}
+            for task in self.tasks:
+                for blocker_id in task.blocked_by:
+                    reverse.setdefault(blocker_id, []).append(task.id)
+            self._reverse_blocked_by = reverse
+        return self._reverse_blocked_by
+
+
+def _strongly_connected_components(
+    nodes: Iterable[str],
+    successors: Dict[str, Sequence[str]],
+) -> Iterable[List[str]]:
+    """
+    Tarjan's algorithm (iterative, so deep chains don't hit the recursion limit).
+
+    Components are yielded after every component they reach, i.e. in
+    reverse topological order. Edges to IDs outside nodes are ignored.
+
+    Yields:
+        Lists of node IDs, one per component
+    """
+    known = set(nodes)
+    index_of: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    counter = 0
+
+    for root in nodes:
+        if root in index_of:
+            continue
+        index_of[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors.get(root, ())))]
+
+        while work:
+            node, edges = work[-1]
+            for successor in edges:
+                if successor not in known:
+                    continue
+                if successor not in index_of:
+                    index_of[successor] = lowlink[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(successors.get(successor, ()))))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    yield component
@@ -52,9 +52,7 @@ from .commands.standards_helpers import (
 
 # QA commands migrated to Typer in S5.3 - no longer re-exported
 # Use: python -m scripts.tasks_cli record-qa / compare-qa / resolve-drift
-from .commands.qa_commands import (
-    _infer_command_type,
-)
+from .qa_parsing import infer_command_type as _infer_command_type
 
 # Re-export validation commands
 from .commands.validation_commands import (
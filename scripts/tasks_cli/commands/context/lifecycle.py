@@ -22,6 +22,7 @@ from ...context_store import (
 from ...datastore import TaskDatastore
 from ...exceptions import ValidationError
 from ...providers import GitProvider
+from ..init_context import DEFAULT_INIT_WORKERS, cmd_init_all_ready
 
 
 def register_lifecycle_commands(app: typer.Typer, ctx: TaskCliContext) -> None:
@@ -34,7 +35,7 @@ def register_lifecycle_commands(app: typer.Typer, ctx: TaskCliContext) -> None:
     """
     @app.command("init-context")
     def init_context_cmd(
-        task_id: str = typer.Argument(..., help="Task ID to initialize context for"),
+        task_id: Optional[str] = typer.Argument(None, help="Task ID to initialize context for"),
         base_commit: Optional[str] = typer.Option(
             None, "--base-commit", help="Git commit to use as base (auto-detected if omitted)"
         ),
@@ -42,9 +43,28 @@ def register_lifecycle_commands(app: typer.Typer, ctx: TaskCliContext) -> None:
         force_secrets: bool = typer.Option(
             False, "--force-secrets", help="Bypass dirty working tree and source change warnings"
         ),
+        all_ready: bool = typer.Option(
+            False, "--all-ready", help="Initialize contexts for every ready task that has none yet"
+        ),
+        workers: int = typer.Option(
+            DEFAULT_INIT_WORKERS, "--workers", help="Worker threads for --all-ready"
+        ),
+        allow_preexisting_dirty: bool = typer.Option(
+            False, "--allow-preexisting-dirty", help="Skip the dirty working tree check (--all-ready)"
+        ),
         format: str = typer.Option("text", "--format", "-f", help="Output format: 'text' or 'json'"),
     ):
         """Initialize task context with immutable snapshot."""
+        if all_ready:
+            cmd_init_all_ready(ctx, actor, force_secrets, allow_preexisting_dirty, workers, format)
+            return
+        if not task_id:
+            if format == 'json':
+                ctx.output_channel.print_json({'success': False, 'error': 'Task ID or --all-ready is required'})
+            else:
+                print("Error: Task ID or --all-ready is required", file=sys.stderr)
+            raise typer.Exit(code=1)
+
         # Import helper from __main__ (stays there per plan)
         from ...__main__ import _build_immutable_context_from_task
 
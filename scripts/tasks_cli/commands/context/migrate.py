@@ -4,7 +4,6 @@ Context migration commands for tasks CLI.
 Implements schema migration functionality for context bundles.
 """
 
-import json
 import sys
 from typing import Any, Dict, List, Optional
 
@@ -82,16 +81,8 @@ def migrate_context(
         # Update context version
         context.version = new_version
 
-        # Write back atomically
-        context_file = store._runtime.get_context_file(task_id)
-        json_content = json.dumps(
-            context.to_dict(),
-            indent=2,
-            sort_keys=True,
-            ensure_ascii=False
-        )
-        json_content += '\n'
-        store._runtime.atomic_write(context_file, json_content)
+        # Write back (atomic; part of the caller's transaction for bulk runs)
+        store.storage.write_context(task_id, context.to_dict())
 
     return {
         'success': True,
@@ -105,26 +96,15 @@ def migrate_context(
 
 def discover_contexts(store: TaskContextStore) -> List[str]:
     """
-    Discover all context directories.
+    Discover all stored contexts.
 
     Args:
         store: TaskContextStore instance
 
     Returns:
-        List of task IDs with contexts
+        Sorted list of task IDs with contexts
     """
-    context_root = store.context_root
-    if not context_root.exists():
-        return []
-
-    task_ids = []
-    for context_dir in context_root.iterdir():
-        if context_dir.is_dir() and context_dir.name.startswith('TASK-'):
-            context_file = context_dir / 'context.json'
-            if context_file.exists():
-                task_ids.append(context_dir.name)
-
-    return sorted(task_ids)
+    return store.storage.list_task_ids()
 
 
 def register_migrate_command(context_app: typer.Typer, ctx: TaskCliContext) -> None:
@@ -189,11 +169,14 @@ def register_migrate_command(context_app: typer.Typer, ctx: TaskCliContext) -> N
                 print("Error: Must specify task_id or use --auto flag", file=sys.stderr)
             raise typer.Exit(code=1)
 
-        # Migrate each context
+        # Migrate each context (one transaction: all-or-nothing on the SQLite backend)
         results = []
-        for tid in task_ids:
-            result = migrate_context(store, tid, dry_run=dry_run, force=force)
-            results.append(result)
+        if dry_run:
+            results = [migrate_context(store, tid, dry_run=True, force=force) for tid in task_ids]
+        else:
+            with store.storage.transaction():
+                for tid in task_ids:
+                    results.append(migrate_context(store, tid, dry_run=False, force=force))
 
         # Output results
         if format == 'json':
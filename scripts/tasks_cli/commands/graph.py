@@ -11,7 +11,7 @@ the output module for formatting.
 """
 
 import sys
-from typing import List
+from typing import List, Optional
 
 import typer
 
@@ -23,23 +23,56 @@ from ..picker import check_halt_conditions
 
 # Command implementations
 
-def export_graph(ctx: TaskCliContext) -> int:
+def export_graph(
+    ctx: TaskCliContext,
+    task_id: Optional[str] = None,
+    hops: int = 2,
+    active_only: bool = False,
+    area: Optional[str] = None,
+    collapse_completed: bool = False,
+    output_path: Optional[str] = None,
+) -> int:
     """
     Export dependency graph in DOT format.
 
+    DOT lines are streamed to stdout (or output_path) as they are generated.
+
     Args:
         ctx: TaskCliContext with graph
+        task_id: Only export the neighborhood of this task
+        hops: Neighborhood radius (with task_id)
+        active_only: Exclude completed tasks
+        area: Only export tasks in this area
+        collapse_completed: Collapse connected completed tasks into summary nodes
+        output_path: Write to this file instead of stdout
 
     Returns:
-        Exit code (0 for success)
+        Exit code (0 for success, 1 for unknown task)
     """
-    # Get the dependency graph
-    graph = ctx.datastore.get_dependency_graph()
+    # Active-only exports never touch archived tasks, so the hot tier suffices
+    graph = ctx.graph if active_only else ctx.datastore.get_dependency_graph()
 
-    # Generate DOT format
-    dot_output = graph.export_dot()
+    try:
+        scope = graph.select_scope(
+            root=task_id, hops=hops, active_only=active_only, area=area
+        )
+    except KeyError:
+        print(f"Error: Task not found: {task_id}", file=sys.stderr)
+        return 1
+
+    lines = graph.iter_dot(task_ids=scope, collapse_completed=collapse_completed)
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for line in lines:
+                f.write(line)
+                f.write('\n')
+        print(f"Graph written to: {output_path}", file=sys.stderr)
+    else:
+        out = sys.stdout
+        for line in lines:
+            out.write(line)
+            out.write('\n')
 
-    print(dot_output)
     print("\n# Render with: dot -Tpng -o tasks.png", file=sys.stderr)
     print("# Or view online: https://dreampuf.github.io/GraphvizOnline/", file=sys.stderr)
 
@@ -89,8 +122,8 @@ def check_halt(
     # Configure output mode
     ctx.output_channel.set_json_mode(format_arg == 'json')
 
-    # Load tasks
-    tasks = ctx.datastore.load_tasks()
+    # Archived tasks are completed, so halt checks only need the hot tier
+    tasks = ctx.datastore.load_active_tasks()
 
     try:
         # Check for halt conditions
@@ -140,9 +173,42 @@ def register_commands(app: typer.Typer, ctx: TaskCliContext) -> None:
     """
 
     @app.command("graph")
-    def graph_cmd():
+    def graph_cmd(
+        task_id: Optional[str] = typer.Option(
+            None,
+            '--task',
+            help="Only export the neighborhood of this task"
+        ),
+        hops: int = typer.Option(
+            2,
+            '--hops',
+            help="Neighborhood radius around --task"
+        ),
+        active_only: bool = typer.Option(
+            False,
+            '--active-only',
+            help="Exclude completed tasks"
+        ),
+        area: Optional[str] = typer.Option(
+            None,
+            '--area',
+            help="Only export tasks in this area"
+        ),
+        collapse_completed: bool = typer.Option(
+            False,
+            '--collapse-completed',
+            help="Collapse connected completed tasks into summary nodes"
+        ),
+        output: Optional[str] = typer.Option(
+            None,
+            '--output',
+            help="Write DOT to this file instead of stdout"
+        )
+    ):
         """Export dependency graph in DOT format."""
-        exit_code = export_graph(ctx)
+        exit_code = export_graph(
+            ctx, task_id, hops, active_only, area, collapse_completed, output
+        )
         raise typer.Exit(code=exit_code)
 
     @app.command("refresh-cache")
@@ -1,12 +1,14 @@
-"""Legacy CLI command handler for context initialization."""
+"""CLI command handlers for context initialization (single task and --all-ready batch)."""
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple, Union
 import sys
-import json
-from datetime import datetime, timezone
+import typer
 import yaml
 import hashlib
+import threading
 
 from ..context_store import (
     TaskContextStore,
@@ -22,8 +24,8 @@ from ..output import (
 )
 from .standards_helpers import (
     _extract_standards_citations,
-    _build_standards_citations,
 )
+from .task_schema_helpers import _build_validation_commands, _required_task_fields
 
 # Exit codes per schemas doc section 6.1
 EXIT_SUCCESS = 0
@@ -59,6 +61,402 @@ def print_error(ctx: "TaskCliContext", error: Dict[str, Any], exit_code: int) ->
     sys.exit(exit_code)
 
 
+# Worker threads for batch initialization (init-context --all-ready)
+DEFAULT_INIT_WORKERS = 4
+
+# Batch workers record schema failures in the exception ledger; one writer at a time
+_ledger_write_lock = threading.Lock()
+
+
+class _InitContextError(Exception):
+    """Structured init-context failure (error dict + exit code)."""
+
+    def __init__(self, error: Dict[str, Any], exit_code: int):
+        super().__init__(error["message"])
+        self.error = error
+        self.exit_code = exit_code
+
+
+@dataclass
+class SharedInitState:
+    """
+    Repository state captured once and shared by every task in a batch.
+
+    Attributes:
+        base_commit: Current git HEAD (None if it could not be determined)
+        dirty_files: Dirty paths from one `git status`, or None when the
+            dirty-tree check is disabled (--allow-preexisting-dirty)
+    """
+    base_commit: Optional[str]
+    dirty_files: Optional[List[str]] = None
+
+    @classmethod
+    def capture(cls, repo_root: Path, check_dirty: bool = True) -> "SharedInitState":
+        """
+        Run the git HEAD and dirty-tree checks once.
+
+        Args:
+            repo_root: Repository root
+            check_dirty: Whether to collect dirty files
+
+        Returns:
+            SharedInitState
+
+        Raises:
+            Exception: git status failed (HEAD failures yield base_commit=None)
+        """
+        git_provider = GitProvider(repo_root)
+        dirty_files = None
+        if check_dirty:
+            _, dirty_files = git_provider.check_dirty_tree(allow_preexisting=False)
+        try:
+            base_commit = git_provider.get_current_commit()
+        except Exception:
+            base_commit = None
+        return cls(base_commit=base_commit, dirty_files=dirty_files)
+
+    def unexpected_dirty(self, task_id: str) -> List[str]:
+        """Dirty files other than the task's own .agent-output directory."""
+        if self.dirty_files is None:
+            return []
+        own_prefix = f".agent-output/{task_id}/"
+        return [f for f in self.dirty_files if not f.startswith(own_prefix)]
+
+
+def _initialize_task_context(
+    repo_root: Path,
+    context_store: TaskContextStore,
+    task_id: str,
+    shared: Callable[[], SharedInitState],
+    actor: str = 'task-runner',
+    force_secrets: bool = False,
+    task_path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Initialize one task's context using shared repository state.
+
+    Quarantine, lookup and schema checks run before the git state is
+    requested, so their errors take precedence over git failures.
+
+    Standards files and checklists are read through context_store.source_index,
+    so tasks initialized with the same store share one read/parse per file.
+    All context files are written atomically.
+
+    Args:
+        repo_root: Repository root
+        context_store: Context store (shared across a batch)
+        task_id: Task identifier
+        shared: Returns the git HEAD and dirty-tree state (called only
+            once the task passed validation)
+        actor: Recorded as the context creator
+        force_secrets: Bypass secret scanning
+        task_path: Task file (resolved from task_id if omitted)
+
+    Returns:
+        Success payload (task_id, base_commit, context_version, ...)
+
+    Raises:
+        _InitContextError: Validation, quarantine, git or lookup failure
+    """
+    if is_quarantined(task_id, repo_root):
+        raise _InitContextError({
+            "code": "E030",
+            "name": "TaskQuarantined",
+            "message": f"Task {task_id} is quarantined",
+            "details": {"task_id": task_id},
+            "recovery_action": "Release from quarantine or fix issues first"
+        }, EXIT_BLOCKER_ERROR)
+
+    task_path = task_path or resolve_task_path(task_id, repo_root)
+    if not task_path:
+        raise _InitContextError({
+            "code": "E041",
+            "name": "TaskNotFound",
+            "message": f"Task file not found for {task_id}",
+            "details": {"task_id": task_id},
+            "recovery_action": "Verify task ID and check tasks/ directory"
+        }, EXIT_IO_ERROR)
+
+    task_content = task_path.read_bytes()
+    task_data = yaml.safe_load(task_content)
+
+    fields = _required_task_fields(task_data)
+    scope_in, scope_out = fields['scope.in'], fields['scope.out']
+    acceptance_criteria, plan_steps = fields['acceptance_criteria'], fields['plan']
+    deliverables, validation_pipeline = fields['deliverables'], fields['validation.pipeline']
+    validation_errors = [f"{name} is empty" for name, value in fields.items() if not value]
+
+    if validation_errors:
+        with _ledger_write_lock:
+            add_exception(
+                task_id=task_id,
+                exception_type="invalid_schema",
+                parse_error="; ".join(validation_errors),
+                repo_root=repo_root
+            )
+        raise _InitContextError({
+            "code": "E001",
+            "name": "IncompleteTaskSchema",
+            "message": "Required task fields are empty",
+            "details": {"task_id": task_id, "missing_fields": validation_errors},
+            "recovery_action": "Populate all required fields: scope.in, scope.out, acceptance_criteria, plan, deliverables, validation.pipeline"
+        }, EXIT_VALIDATION_ERROR)
+
+    git_state = shared()
+    unexpected = git_state.unexpected_dirty(task_id)
+    if unexpected:
+        raise _InitContextError({
+            "code": "E050",
+            "name": "DirtyWorkingTree",
+            "message": "Git working tree has unexpected dirty files",
+            "details": {"files": unexpected[:10]},
+            "recovery_action": "Commit or stash changes, or use --allow-preexisting-dirty"
+        }, EXIT_GIT_ERROR)
+
+    task_snapshot = {
+        'title': task_data.get('title', ''),
+        'priority': task_data.get('priority', 'P1'),
+        'area': task_data.get('area', ''),
+        'description': task_data.get('description', ''),
+        'scope_in': scope_in,
+        'scope_out': scope_out,
+        'acceptance_criteria': acceptance_criteria,
+        'plan_steps': plan_steps,
+        'deliverables': deliverables
+    }
+
+    context_data = task_data.get('context', {})
+    repo_paths = context_data.get('repo_paths', []) if isinstance(context_data, dict) else []
+
+    qa_commands, validation_commands = _build_validation_commands(validation_pipeline)
+    task_snapshot['validation_commands'] = validation_commands
+
+    validation_baseline = {
+        'commands': qa_commands,
+        'initial_results': None
+    }
+
+    area = task_snapshot['area']
+    priority = task_snapshot['priority']
+    standards_citations = _extract_standards_citations(
+        context_store=context_store,
+        task_id=task_id,
+        area=area,
+        priority=priority,
+        task_data=task_data
+    )
+
+    immutable = {
+        'task_snapshot': task_snapshot,
+        'standards_citations': standards_citations,
+        'validation_baseline': validation_baseline,
+        'repo_paths': repo_paths
+    }
+
+    task_file_sha = hashlib.sha256(task_content).hexdigest()
+
+    base_commit = git_state.base_commit
+    if not base_commit:
+        raise _InitContextError({
+            "code": "E051",
+            "name": "GitHeadNotFound",
+            "message": "Unable to determine git HEAD",
+            "details": {},
+            "recovery_action": "Ensure working directory is in a git repository"
+        }, EXIT_GIT_ERROR)
+
+    source_files = [
+        SourceFile(
+            path=str(task_path.relative_to(repo_root)),
+            sha256=task_file_sha,
+            purpose='task_yaml'
+        )
+    ]
+
+    standards_files_seen = set()
+    for citation_dict in standards_citations:
+        standards_file_path = citation_dict.get('file')
+        if standards_file_path and standards_file_path not in standards_files_seen:
+            standards_files_seen.add(standards_file_path)
+            entry = context_store.source_index.get(standards_file_path)
+            if entry is not None:
+                source_files.append(
+                    SourceFile(
+                        path=standards_file_path,
+                        sha256=entry.sha256,
+                        purpose='standards_citation'
+                    )
+                )
+
+    snapshot_metadata = context_store.create_task_snapshot(task_id, task_path)
+
+    task_snapshot['snapshot_path'] = snapshot_metadata['snapshot_path']
+    task_snapshot['snapshot_sha256'] = snapshot_metadata['snapshot_sha256']
+    task_snapshot['original_path'] = snapshot_metadata['original_path']
+    task_snapshot['completed_path'] = snapshot_metadata['completed_path']
+    task_snapshot['created_at'] = snapshot_metadata['created_at']
+
+    context = context_store.init_context(
+        task_id=task_id,
+        immutable=immutable,
+        git_head=base_commit,
+        task_file_sha=task_file_sha,
+        created_by=actor,
+        force_secrets=force_secrets,
+        source_files=source_files
+    )
+
+    snapshot_file_path = repo_root / snapshot_metadata['snapshot_path']
+    context_store.attach_evidence(
+        task_id=task_id,
+        artifact_type='file',
+        artifact_path=snapshot_file_path,
+        description='Task snapshot at initialization',
+        metadata={
+            'snapshot_sha256': snapshot_metadata['snapshot_sha256'],
+            'original_path': snapshot_metadata['original_path']
+        }
+    )
+    context_store.snapshot_checklists(task_id, area)
+
+    return {
+        "task_id": task_id,
+        "context_initialized": True,
+        "base_commit": base_commit,
+        "context_version": context.version,
+        "acceptance_criteria_count": len(acceptance_criteria)
+    }
+
+
+def _unexpected_error(exc: Exception) -> Dict[str, Any]:
+    return {
+        "code": "E999",
+        "name": "UnknownError",
+        "message": str(exc),
+        "details": {},
+        "recovery_action": "Check logs and retry"
+    }
+
+
+def init_contexts_batch(
+    repo_root: Path,
+    tasks: Iterable[Union[str, Tuple[str, Path]]],
+    actor: str = 'task-runner',
+    force_secrets: bool = False,
+    allow_preexisting_dirty: bool = False,
+    workers: int = DEFAULT_INIT_WORKERS,
+) -> List[Dict[str, Any]]:
+    """
+    Initialize contexts for many tasks with shared repository state.
+
+    Runs `git status` and `git rev-parse HEAD` once, reads each standards file
+    and checklist once (shared SourceFileIndex), then initializes tasks in a
+    thread pool. Each task's context files are written atomically, so a
+    failed task never leaves a partial context behind.
+
+    Args:
+        repo_root: Repository root
+        tasks: Task IDs, or (task_id, task_path) pairs
+        actor: Recorded as the context creator
+        force_secrets: Bypass secret scanning
+        allow_preexisting_dirty: Skip the dirty-tree check
+        workers: Worker threads
+
+    Returns:
+        One result per task, in input order:
+        {"task_id", "success": True, ...payload} or
+        {"task_id", "success": False, "error": {...}, "exit_code"}
+    """
+    jobs = [(item, None) if isinstance(item, str) else tuple(item) for item in tasks]
+    if not jobs:
+        return []
+
+    shared = SharedInitState.capture(repo_root, check_dirty=not allow_preexisting_dirty)
+    context_store = TaskContextStore(repo_root)
+
+    def run(job: Tuple[str, Optional[Path]]) -> Dict[str, Any]:
+        task_id, task_path = job
+        try:
+            payload = _initialize_task_context(
+                repo_root, context_store, task_id, lambda: shared,
+                actor=actor, force_secrets=force_secrets, task_path=task_path,
+            )
+            return {"success": True, **payload}
+        except _InitContextError as e:
+            return {"task_id": task_id, "success": False, "error": e.error, "exit_code": e.exit_code}
+        except Exception as e:
+            return {"task_id": task_id, "success": False, "error": _unexpected_error(e),
+                    "exit_code": EXIT_GENERAL_ERROR}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(run, jobs))
+
+
+def cmd_init_all_ready(
+    ctx: "TaskCliContext",
+    actor: str,
+    force_secrets: bool,
+    allow_preexisting_dirty: bool,
+    workers: int,
+    format: str,
+) -> None:
+    """
+    Initialize contexts for all ready tasks in one batch (init-context --all-ready).
+
+    Ready tasks are the picker's candidates (all blockers completed, not
+    draft, not quarantined). Tasks that already have a context in the
+    configured storage backend are skipped.
+
+    Raises:
+        typer.Exit: Some tasks failed to initialize (exit code 1)
+    """
+    completed_ids = ctx.datastore.get_completed_ids()
+    quarantined = ctx.datastore.get_quarantined_ids()
+    ready = [
+        task for task in ctx.graph.topological_ready_set(completed_ids)
+        if task.status != 'draft' and task.id not in quarantined
+    ]
+
+    storage = ctx.context_store.storage
+    has_context = {task.id for task in ready if storage.context_exists(task.id)}
+    skipped = [task.id for task in ready if task.id in has_context]
+    pending = [(task.id, Path(task.path)) for task in ready if task.id not in has_context]
+
+    results = init_contexts_batch(
+        ctx.repo_root,
+        pending,
+        actor=actor,
+        force_secrets=force_secrets,
+        allow_preexisting_dirty=allow_preexisting_dirty,
+        workers=workers,
+    )
+    initialized = [r for r in results if r['success']]
+    failed = [
+        {'task_id': r['task_id'], 'code': r['error']['code'], 'error': r['error']['message']}
+        for r in results if not r['success']
+    ]
+
+    if format == 'json':
+        ctx.output_channel.print_json({
+            'success': not failed,
+            'initialized': [
+                {'task_id': r['task_id'], 'base_commit': r['base_commit'], 'context_version': r['context_version']}
+                for r in initialized
+            ],
+            'failed': failed,
+            'skipped': skipped,
+        })
+    else:
+        for result in initialized:
+            print(f"Initialized context for {result['task_id']}")
+        for failure in failed:
+            print(f"Error [{failure['code']}] {failure['task_id']}: {failure['error']}", file=sys.stderr)
+        print(f"{len(initialized)} initialized, {len(failed)} failed, {len(skipped)} skipped (existing context)")
+
+    if failed:
+        raise typer.Exit(code=1)
+
+
 def cmd_init_context(ctx: "TaskCliContext", args) -> int:
     """
     Enhanced context initialization with all validations.
@@ -78,269 +476,29 @@ def cmd_init_context(ctx: "TaskCliContext", args) -> int:
     try:
         repo_root = Path.cwd()
         context_store = TaskContextStore(repo_root)
-
-        if is_quarantined(args.task_id, repo_root):
-            error = {
-                "code": "E030",
-                "name": "TaskQuarantined",
-                "message": f"Task {args.task_id} is quarantined",
-                "details": {"task_id": args.task_id},
-                "recovery_action": "Release from quarantine or fix issues first"
-            }
-            print_error(ctx, error, exit_code=EXIT_BLOCKER_ERROR)
-
-        task_path = resolve_task_path(args.task_id, repo_root)
-        if not task_path:
-            error = {
-                "code": "E041",
-                "name": "TaskNotFound",
-                "message": f"Task file not found for {args.task_id}",
-                "details": {"task_id": args.task_id},
-                "recovery_action": "Verify task ID and check tasks/ directory"
-            }
-            print_error(ctx, error, exit_code=EXIT_IO_ERROR)
-        assert task_path is not None
-
-        with open(task_path, 'r', encoding='utf-8') as f:
-            task_data = yaml.safe_load(f)
-
-        scope = task_data.get('scope', {})
-        scope_in = scope.get('in', []) if isinstance(scope, dict) else []
-        scope_out = scope.get('out', []) if isinstance(scope, dict) else []
-        acceptance_criteria = task_data.get('acceptance_criteria', [])
-        plan_steps = task_data.get('plan', [])
-        deliverables = task_data.get('deliverables', [])
-        validation = task_data.get('validation', {})
-        validation_pipeline = validation.get('pipeline', validation.get('commands', [])) if isinstance(validation, dict) else []
-
-        validation_errors = []
-        if not acceptance_criteria:
-            validation_errors.append("acceptance_criteria is empty")
-        if not scope_in:
-            validation_errors.append("scope.in is empty")
-        if not scope_out:
-            validation_errors.append("scope.out is empty")
-        if not plan_steps:
-            validation_errors.append("plan is empty")
-        if not deliverables:
-            validation_errors.append("deliverables is empty")
-        if not validation_pipeline:
-            validation_errors.append("validation.pipeline is empty")
-
-        if validation_errors:
-            error = {
-                "code": "E001",
-                "name": "IncompleteTaskSchema",
-                "message": "Required task fields are empty",
-                "details": {"task_id": args.task_id, "missing_fields": validation_errors},
-                "recovery_action": "Populate all required fields: scope.in, scope.out, acceptance_criteria, plan, deliverables, validation.pipeline"
-            }
-            add_exception(
-                task_id=args.task_id,
-                exception_type="invalid_schema",
-                parse_error="; ".join(validation_errors)
-            )
-            print_error(ctx, error, exit_code=EXIT_VALIDATION_ERROR)
-
         allow_dirty = hasattr(args, 'allow_preexisting_dirty') and args.allow_preexisting_dirty
-        if not allow_dirty:
-            git_provider = GitProvider(repo_root)
-            is_clean, dirty_files = git_provider.check_dirty_tree(
-                allow_preexisting=False,
-                expected_files=[f".agent-output/{args.task_id}/"]
-            )
-            if not is_clean:
-                error = {
-                    "code": "E050",
-                    "name": "DirtyWorkingTree",
-                    "message": "Git working tree has unexpected dirty files",
-                    "details": {"files": dirty_files[:10]},
-                    "recovery_action": "Commit or stash changes, or use --allow-preexisting-dirty"
-                }
-                print_error(ctx, error, exit_code=EXIT_GIT_ERROR)
-
-        task_snapshot = {
-            'title': task_data.get('title', ''),
-            'priority': task_data.get('priority', 'P1'),
-            'area': task_data.get('area', ''),
-            'description': task_data.get('description', ''),
-            'scope_in': scope_in,
-            'scope_out': scope_out,
-            'acceptance_criteria': acceptance_criteria,
-            'plan_steps': plan_steps,
-            'deliverables': deliverables
-        }
 
-        context_data = task_data.get('context', {})
-        repo_paths = context_data.get('repo_paths', []) if isinstance(context_data, dict) else []
-
-        qa_commands = []
-        validation_commands = []
-        for idx, cmd in enumerate(validation_pipeline):
-            if isinstance(cmd, str):
-                qa_commands.append(cmd)
-                validation_commands.append({
-                    'id': f'val-{idx+1:03d}',
-                    'command': cmd,
-                    'description': f'Validation command {idx+1}',
-                    'cwd': '.',
-                    'package': None,
-                    'env': {},
-                    'expected_paths': [],
-                    'blocker_id': None,
-                    'timeout_ms': 120000,
-                    'retry_policy': {'max_attempts': 1, 'backoff_ms': 1000},
-                    'criticality': 'required',
-                    'expected_exit_codes': [0]
-                })
-            elif isinstance(cmd, dict):
-                command = cmd.get('command', cmd.get('cmd', ''))
-                if command:
-                    qa_commands.append(command)
-                    retry_policy = cmd.get('retry_policy', {})
-                    if isinstance(retry_policy, dict):
-                        retry_policy = {
-                            'max_attempts': retry_policy.get('max_attempts', 1),
-                            'backoff_ms': retry_policy.get('backoff_ms', 1000)
-                        }
-                    else:
-                        retry_policy = {'max_attempts': 1, 'backoff_ms': 1000}
-
-                    validation_commands.append({
-                        'id': cmd.get('id', f'val-{idx+1:03d}'),
-                        'command': command,
-                        'description': cmd.get('description', ''),
-                        'cwd': cmd.get('cwd', '.'),
-                        'package': cmd.get('package'),
-                        'env': cmd.get('env', {}),
-                        'expected_paths': cmd.get('expected_paths', []),
-                        'blocker_id': cmd.get('blocker_id'),
-                        'timeout_ms': cmd.get('timeout_ms', 120000),
-                        'retry_policy': retry_policy,
-                        'criticality': cmd.get('criticality', 'required'),
-                        'expected_exit_codes': cmd.get('expected_exit_codes', [0])
-                    })
-
-        task_snapshot['validation_commands'] = validation_commands
-
-        validation_baseline = {
-            'commands': qa_commands,
-            'initial_results': None
-        }
-
-        area = task_snapshot['area']
-        priority = task_snapshot['priority']
-        task_id = args.task_id
-        standards_citations = _extract_standards_citations(
-            context_store=context_store,
-            task_id=task_id,
-            area=area,
-            priority=priority,
-            task_data=task_data
-        )
-
-        immutable = {
-            'task_snapshot': task_snapshot,
-            'standards_citations': standards_citations,
-            'validation_baseline': validation_baseline,
-            'repo_paths': repo_paths
-        }
-
-        task_content = task_path.read_bytes()
-        task_file_sha = hashlib.sha256(task_content).hexdigest()
-
-        git_provider = GitProvider(repo_root)
         try:
-            base_commit = git_provider.get_current_commit()
-        except Exception:
-            base_commit = None
-        if not base_commit:
-            error = {
-                "code": "E051",
-                "name": "GitHeadNotFound",
-                "message": "Unable to determine git HEAD",
-                "details": {},
-                "recovery_action": "Ensure working directory is in a git repository"
-            }
-            print_error(ctx, error, exit_code=EXIT_GIT_ERROR)
-
-        source_files = [
-            SourceFile(
-                path=str(task_path.relative_to(repo_root)),
-                sha256=task_file_sha,
-                purpose='task_yaml'
+            result = _initialize_task_context(
+                repo_root,
+                context_store,
+                args.task_id,
+                lambda: SharedInitState.capture(repo_root, check_dirty=not allow_dirty),
+                actor=getattr(args, 'actor', 'task-runner'),
+                force_secrets=getattr(args, 'force_secrets', False),
             )
-        ]
-
-        standards_files_seen = set()
-        for citation_dict in standards_citations:
-            standards_file_path = citation_dict.get('file')
-            if standards_file_path and standards_file_path not in standards_files_seen:
-                standards_files_seen.add(standards_file_path)
-                full_path = repo_root / standards_file_path
-                if full_path.exists():
-                    standards_content = full_path.read_bytes()
-                    standards_sha = hashlib.sha256(standards_content).hexdigest()
-                    source_files.append(
-                        SourceFile(
-                            path=standards_file_path,
-                            sha256=standards_sha,
-                            purpose='standards_citation'
-                        )
-                    )
-
-        snapshot_metadata = context_store.create_task_snapshot(args.task_id, task_path)
-
-        task_snapshot['snapshot_path'] = snapshot_metadata['snapshot_path']
-        task_snapshot['snapshot_sha256'] = snapshot_metadata['snapshot_sha256']
-        task_snapshot['original_path'] = snapshot_metadata['original_path']
-        task_snapshot['completed_path'] = snapshot_metadata['completed_path']
-        task_snapshot['created_at'] = snapshot_metadata['created_at']
-
-        context = context_store.init_context(
-            task_id=args.task_id,
-            immutable=immutable,
-            git_head=base_commit,
-            task_file_sha=task_file_sha,
-            created_by=getattr(args, 'actor', 'task-runner'),
-            force_secrets=getattr(args, 'force_secrets', False),
-            source_files=source_files
-        )
-
-        snapshot_file_path = repo_root / snapshot_metadata['snapshot_path']
-        context_store.attach_evidence(
-            task_id=args.task_id,
-            artifact_type='file',
-            artifact_path=snapshot_file_path,
-            description='Task snapshot at initialization',
-            metadata={
-                'snapshot_sha256': snapshot_metadata['snapshot_sha256'],
-                'original_path': snapshot_metadata['original_path']
-            }
-        )
+        except _InitContextError as e:
+            print_error(ctx, e.error, exit_code=e.exit_code)
 
         if ctx.output_channel.json_mode:
-            print_success(ctx, {
-                "task_id": args.task_id,
-                "context_initialized": True,
-                "base_commit": base_commit,
-                "context_version": context.version,
-                "acceptance_criteria_count": len(acceptance_criteria)
-            })
+            print_success(ctx, result)
         else:
             print(f"✓ Context initialized for {args.task_id}")
-            print(f"  Base commit: {base_commit[:8]}")
+            print(f"  Base commit: {result['base_commit'][:8]}")
             print(f"  Context file: .agent-output/{args.task_id}/context.json")
-            print(f"  Acceptance criteria: {len(acceptance_criteria)} items")
+            print(f"  Acceptance criteria: {result['acceptance_criteria_count']} items")
 
         return EXIT_SUCCESS
 
     except Exception as e:
-        error = {
-            "code": "E999",
-            "name": "UnknownError",
-            "message": str(e),
-            "details": {},
-            "recovery_action": "Check logs and retry"
-        }
-        print_error(ctx, error, exit_code=EXIT_GENERAL_ERROR)
+        print_error(ctx, _unexpected_error(e), exit_code=EXIT_GENERAL_ERROR)
@@ -67,11 +67,9 @@ def _extract_standards_citations(
         sections = section_map.get(standards_file, [])
         if not sections:
             try:
-                file_path = context_store.repo_root / standards_file
-                if file_path.exists():
-                    content = file_path.read_text(encoding='utf-8')
-                    lines = content.split('\n')
-                    for line in lines:
+                entry = context_store.source_index.get(standards_file)
+                if entry is not None:
+                    for line in entry.lines:
                         if line.startswith('## '):
                             first_section = line[3:].strip()
                             sections = [first_section]
@@ -0,0 +1,76 @@
+"""Task schema helper functions for context initialization."""
+
+from typing import Any, Dict, List, Tuple
+
+
+def _required_task_fields(task_data: dict) -> Dict[str, Any]:
+    """
+    Extract the fields init-context requires to be non-empty.
+
+    Keys are the names reported in E001 errors (e.g. "scope.in"), in the
+    order they are reported.
+    """
+    scope = task_data.get('scope', {})
+    validation = task_data.get('validation', {})
+    return {
+        'acceptance_criteria': task_data.get('acceptance_criteria', []),
+        'scope.in': scope.get('in', []) if isinstance(scope, dict) else [],
+        'scope.out': scope.get('out', []) if isinstance(scope, dict) else [],
+        'plan': task_data.get('plan', []),
+        'deliverables': task_data.get('deliverables', []),
+        'validation.pipeline': (
+            validation.get('pipeline', validation.get('commands', []))
+            if isinstance(validation, dict) else []
+        ),
+    }
+
+
+def _build_validation_commands(validation_pipeline: List[Any]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Normalize validation.pipeline entries into (qa_commands, validation_commands)."""
+    qa_commands = []
+    validation_commands = []
+    for idx, cmd in enumerate(validation_pipeline):
+        if isinstance(cmd, str):
+            qa_commands.append(cmd)
+            validation_commands.append({
+                'id': f'val-{idx+1:03d}',
+                'command': cmd,
+                'description': f'Validation command {idx+1}',
+                'cwd': '.',
+                'package': None,
+                'env': {},
+                'expected_paths': [],
+                'blocker_id': None,
+                'timeout_ms': 120000,
+                'retry_policy': {'max_attempts': 1, 'backoff_ms': 1000},
+                'criticality': 'required',
+                'expected_exit_codes': [0]
+            })
+        elif isinstance(cmd, dict):
+            command = cmd.get('command', cmd.get('cmd', ''))
+            if command:
+                qa_commands.append(command)
+                retry_policy = cmd.get('retry_policy', {})
+                if isinstance(retry_policy, dict):
+                    retry_policy = {
+                        'max_attempts': retry_policy.get('max_attempts', 1),
+                        'backoff_ms': retry_policy.get('backoff_ms', 1000)
+                    }
+                else:
+                    retry_policy = {'max_attempts': 1, 'backoff_ms': 1000}
+
+                validation_commands.append({
+                    'id': cmd.get('id', f'val-{idx+1:03d}'),
+                    'command': command,
+                    'description': cmd.get('description', ''),
+                    'cwd': cmd.get('cwd', '.'),
+                    'package': cmd.get('package'),
+                    'env': cmd.get('env', {}),
+                    'expected_paths': cmd.get('expected_paths', []),
+                    'blocker_id': cmd.get('blocker_id'),
+                    'timeout_ms': cmd.get('timeout_ms', 120000),
+                    'retry_policy': retry_policy,
+                    'criticality': cmd.get('criticality', 'required'),
+                    'expected_exit_codes': cmd.get('expected_exit_codes', [0])
+                })
+    return qa_commands, validation_commands
@@ -86,16 +86,23 @@ def list_tasks(
         else:
             status_filter = filter_arg
 
+    # Archived tasks are materialized only when the listing can include them
+    archived = None
+    if status_filter in (None, 'completed'):
+        archived = ctx.datastore.load_archived_tasks()
+
     # Get filtered tasks
     tasks = ctx.picker.list_tasks(
         status_filter=status_filter,
-        unblocker_only=unblocker_only
+        unblocker_only=unblocker_only,
+        archived=archived
     )
 
     # Output based on format
     if format_arg == 'json':
+        # Generator: the channel streams one task dict at a time
         ctx.output_channel.print_json({
-            'tasks': [task_to_dict(task) for task in tasks],
+            'tasks': (task_to_dict(task) for task in tasks),
             'count': len(tasks),
             'filter': {
                 'status': status_filter,
@@ -0,0 +1,108 @@
+"""
+Typer-based trace commands.
+
+Implements local trace inspection:
+- trace-report: Summarize the slowest spans per command across recent runs
+
+Spans are recorded to .agent-output/traces/spans.jsonl when the CLI runs
+with TASKS_TRACE=1 (see telemetry.py).
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from ..context import TaskCliContext
+from ..telemetry import TRACE_ENV_VAR, TRACE_FILE_RELPATH, load_span_records, summarize_traces
+
+
+def trace_report(
+    ctx: TaskCliContext,
+    runs: int = 20,
+    top: int = 5,
+    trace_file: Optional[str] = None,
+    format_arg: str = 'text'
+) -> int:
+    """
+    Summarize the slowest spans per command across recent runs.
+
+    Args:
+        ctx: TaskCliContext with repo_root
+        runs: Number of most recent runs to analyze
+        top: Number of span names to show per command
+        trace_file: Trace file path (defaults to .agent-output/traces/spans.jsonl)
+        format_arg: Output format ('text' or 'json')
+
+    Returns:
+        Exit code (0 = success, 1 = no trace data)
+    """
+    path = Path(trace_file) if trace_file else ctx.repo_root / TRACE_FILE_RELPATH
+    records = load_span_records(path)
+
+    if not records:
+        message = f"No trace data found at {path} (run commands with {TRACE_ENV_VAR}=1)"
+        if format_arg == 'json':
+            ctx.output_channel.print_json({'success': False, 'error': message, 'path': str(path)})
+        else:
+            print(f"Error: {message}", file=sys.stderr)
+        return 1
+
+    report = summarize_traces(records, runs=runs, top=top)
+
+    if format_arg == 'json':
+        ctx.output_channel.print_json({'success': True, 'path': str(path), **report})
+        return 0
+
+    print(f"Trace report ({report['runs_analyzed']} runs from {path})")
+    for command, entry in report['commands'].items():
+        avg = entry['avg_duration_ms']
+        timing = f", avg {avg:.1f}ms, max {entry['max_duration_ms']:.1f}ms" if avg is not None else ""
+        print(f"\n{command}: {entry['runs']} run(s){timing}")
+        for span in entry['slowest_spans']:
+            print(
+                f"  {span['total_ms']:>10.1f}ms  {span['name']}"
+                f"  (x{span['count']}, avg {span['avg_ms']:.1f}ms, max {span['max_ms']:.1f}ms)"
+            )
+
+    return 0
+
+
+# Typer registration
+
+def register_trace_commands(app: typer.Typer, ctx: TaskCliContext) -> None:
+    """
+    Register Typer trace commands with the app.
+
+    Args:
+        app: Typer app instance to register commands with
+        ctx: TaskCliContext to inject into commands
+    """
+
+    @app.command("trace-report")
+    def trace_report_cmd(
+        runs: int = typer.Option(
+            20,
+            '--runs',
+            help="Number of most recent runs to analyze"
+        ),
+        top: int = typer.Option(
+            5,
+            '--top',
+            help="Number of slowest spans to show per command"
+        ),
+        trace_file: Optional[str] = typer.Option(
+            None,
+            '--file',
+            help="Trace file (default: .agent-output/traces/spans.jsonl)"
+        ),
+        format: str = typer.Option(
+            'text',
+            '--format',
+            help="Output format: text or json"
+        )
+    ):
+        """Summarize the slowest spans per command across recent runs."""
+        exit_code = trace_report(ctx, runs, top, trace_file, format)
+        raise typer.Exit(code=exit_code)
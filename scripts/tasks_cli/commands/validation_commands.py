@@ -79,7 +79,12 @@ def cmd_run_validation(ctx: "TaskCliContext", args) -> int:
             expected_exit_codes=args.expected_exit_codes if hasattr(args, 'expected_exit_codes') else [0]
         )
 
-        result = execute_validation_command(validation_cmd, args.task_id, repo_root)
+        result = execute_validation_command(
+            validation_cmd,
+            args.task_id,
+            repo_root,
+            use_cache=getattr(args, 'use_cache', None),
+        )
 
         if ctx.output_channel.json_mode:
             print_success(ctx, result)
@@ -87,7 +92,8 @@ def cmd_run_validation(ctx: "TaskCliContext", args) -> int:
             if result.get("skipped"):
                 print(f"⊘ Validation skipped: {result['skip_reason']}")
             elif result.get("success"):
-                print(f"✓ Validation passed: {args.command_id}")
+                suffix = " (cached)" if result.get("cached") else ""
+                print(f"✓ Validation passed: {args.command_id}{suffix}")
             else:
                 print(f"✗ Validation failed: {args.command_id}")
                 print(f"  Exit code: {result.get('exit_code')}")
@@ -131,6 +137,10 @@ def register_validation_commands(app, ctx) -> None:
         timeout_ms: int = typer.Option(120000, "--timeout", help="Timeout in milliseconds"),
         criticality: str = typer.Option("error", "--criticality", help="Criticality level"),
         expected_exit_codes: Optional[List[int]] = typer.Option(None, "--exit-code", help="Expected exit codes"),
+        cache: bool = typer.Option(
+            False, "--cache", help="Reuse QA results for unchanged inputs (or set TASKS_QA_CACHE=1)"
+        ),
+        no_cache: bool = typer.Option(False, "--no-cache", help="Always execute, bypassing the QA result cache"),
     ):
         """Run validation command with all features."""
         class Args:
@@ -148,4 +158,5 @@ def register_validation_commands(app, ctx) -> None:
         args.timeout_ms = timeout_ms
         args.criticality = criticality
         args.expected_exit_codes = expected_exit_codes or [0]
+        args.use_cache = False if no_cache else (True if cache else None)
         raise SystemExit(cmd_run_validation(ctx, args))
\ No newline at end of file
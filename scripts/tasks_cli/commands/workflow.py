@@ -20,6 +20,7 @@ import typer
 from ..context import TaskCliContext
 from ..context_store import ContextNotFoundError, TaskContextStore
 from ..exceptions import ValidationError, WorkflowHaltError
+from ..graph import DependencyGraph
 from ..models import Task
 from ..operations import TaskOperationError, TaskOperations
 
@@ -122,11 +123,16 @@ def pick_task(
     # Configure output mode
     ctx.output_channel.set_json_mode(format_arg == 'json')
 
-    # Get completed task IDs for readiness check
-    tasks = ctx.datastore.load_tasks()
-    graph = ctx.datastore.get_dependency_graph()
+    # Readiness only needs the hot tier plus the archived-ID index;
+    # quarantined tasks are never candidates
+    tasks = ctx.datastore.load_active_tasks(exclude_quarantined=True)
+    graph = DependencyGraph(
+        tasks,
+        archived_ids=ctx.datastore.get_archive_index(),
+        closure_index=ctx.datastore.get_closure_index(tasks),
+    )
     ctx.picker.refresh(tasks, graph)
-    completed_ids = {task.id for task in tasks if task.is_completed()}
+    completed_ids = ctx.datastore.get_completed_ids()
 
     # Determine status filter
     status_filter = filter_arg if filter_arg and filter_arg != "auto" else None
@@ -207,7 +213,7 @@ def claim_task(
         print(f"  File: {result_path}")
 
         # Invalidate cache
-        ctx.datastore.load_tasks(force_refresh=True)
+        ctx.datastore.refresh()
 
         return 0
 
@@ -254,7 +260,7 @@ def complete_task(
         print(f"  Archived to: {result_path}")
 
         # Invalidate cache
-        ctx.datastore.load_tasks(force_refresh=True)
+        ctx.datastore.refresh(archive_changed=True)
 
         return 0
 
@@ -301,7 +307,7 @@ def archive_task(
             print(f"✓ Archived task {task.id}")
             print(f"  Moved to: {result_path}")
 
-        ctx.datastore.load_tasks(force_refresh=True)
+        ctx.datastore.refresh(archive_changed=True)
         return 0
 
     except TaskOperationError as e:
@@ -352,8 +358,7 @@ def explain_task(
     closure = graph.compute_dependency_closure(task_id)
 
     # Get completed task IDs for readiness check
-    tasks = ctx.datastore.load_tasks()
-    completed_ids = {t.id for t in tasks if t.is_completed()}
+    completed_ids = {t.id for t in graph.tasks if t.is_completed()}
 
     # Check readiness
     is_ready = task.is_ready(completed_ids)
@@ -130,55 +130,57 @@ def register_worktree_commands(app: typer.Typer, ctx: TaskCliContext) -> None:
         """Snapshot working tree state at agent completion."""
         repo_root = ctx.repo_root
         context_store = TaskContextStore(repo_root)
-        context = context_store.get_context(task_id)
+        # Drift checks and the snapshot query the same HEAD/status/untracked state
+        with context_store.git_request_scope():
+            context = context_store.get_context(task_id)
 
-        if context is None:
-            if format == "json":
-                ctx.output_channel.emit_json({"success": False, "error": f"No context found for {task_id}"})
-            else:
-                print(f"Error: No context found for {task_id}", file=sys.stderr)
-            raise typer.Exit(code=EXIT_GENERAL_ERROR)
+            if context is None:
+                if format == "json":
+                    ctx.output_channel.emit_json({"success": False, "error": f"No context found for {task_id}"})
+                else:
+                    print(f"Error: No context found for {task_id}", file=sys.stderr)
+                raise typer.Exit(code=EXIT_GENERAL_ERROR)
 
-        base_commit = context.git_head
+            base_commit = context.git_head
 
-        try:
-            _check_drift_budget(context_store, task_id)
-            _auto_verify_worktree(context_store, task_id, agent)
-
-            snapshot = context_store.snapshot_worktree(
-                task_id=task_id,
-                agent_role=agent,
-                actor=actor,
-                base_commit=base_commit,
-                previous_agent=previous_agent,
-            )
-
-            if format == "json":
-                ctx.output_channel.emit_json(
-                    {
-                        "success": True,
-                        "task_id": task_id,
-                        "agent_role": agent,
-                        "snapshot": snapshot.to_dict(),
-                    }
+            try:
+                _check_drift_budget(context_store, task_id)
+                _auto_verify_worktree(context_store, task_id, agent)
+
+                snapshot = context_store.snapshot_worktree(
+                    task_id=task_id,
+                    agent_role=agent,
+                    actor=actor,
+                    base_commit=base_commit,
+                    previous_agent=previous_agent,
                 )
-            else:
-                print(f"Snapshotted working tree for {agent} on {task_id}")
-                print(f"  Base commit: {snapshot.base_commit[:8]}")
-                print(f"  Files changed: {len(snapshot.files_changed)}")
-                print(f"  Diff saved to: {snapshot.diff_from_base}")
-                print(f"  Diff stat: {snapshot.diff_stat}")
 
-                if snapshot.incremental_diff_error:
-                    print("\n  Incremental diff calculation failed:")
-                    print(f"  {snapshot.incremental_diff_error}")
+                if format == "json":
+                    ctx.output_channel.emit_json(
+                        {
+                            "success": True,
+                            "task_id": task_id,
+                            "agent_role": agent,
+                            "snapshot": snapshot.to_dict(),
+                        }
+                    )
+                else:
+                    print(f"Snapshotted working tree for {agent} on {task_id}")
+                    print(f"  Base commit: {snapshot.base_commit[:8]}")
+                    print(f"  Files changed: {len(snapshot.files_changed)}")
+                    print(f"  Diff saved to: {snapshot.diff_from_base}")
+                    print(f"  Diff stat: {snapshot.diff_stat}")
 
-        except (ValidationError, ContextNotFoundError, DriftError) as e:
-            if format == "json":
-                ctx.output_channel.emit_json({"success": False, "error": str(e)})
-            else:
-                print(f"Error: {e}", file=sys.stderr)
-            raise typer.Exit(code=EXIT_GENERAL_ERROR)
+                    if snapshot.incremental_diff_error:
+                        print("\n  Incremental diff calculation failed:")
+                        print(f"  {snapshot.incremental_diff_error}")
+
+            except (ValidationError, ContextNotFoundError, DriftError) as e:
+                if format == "json":
+                    ctx.output_channel.emit_json({"success": False, "error": str(e)})
+                else:
+                    print(f"Error: {e}", file=sys.stderr)
+                raise typer.Exit(code=EXIT_GENERAL_ERROR)
 
     @app.command("verify-worktree")
     def verify_worktree_cmd(
@@ -51,8 +51,17 @@ PRIORITY_RANK: Dict[str, int] = {
 DEFAULT_STATUS_RANK = 99
 DEFAULT_PRIORITY_RANK = 99
 
+# Graphviz fill colors for DOT graph export (unknown statuses are white)
+DOT_STATUS_COLORS: Dict[str, str] = {
+    TaskStatus.COMPLETED: 'lightgreen',
+    TaskStatus.IN_PROGRESS: 'lightyellow',
+    TaskStatus.BLOCKED: 'lightcoral',
+    TaskStatus.DRAFT: 'aliceblue',
+    TaskStatus.TODO: 'lightgray',
+}
+
 # Cache schema version
-CACHE_VERSION = 1
+CACHE_VERSION = 2
 
 # Snapshot tracking for audit trail
 SNAPSHOT_COUNTER_FILE = "tasks/.cache/snapshot_counter.txt"
@@ -82,7 +82,7 @@ class TaskCliContext:
 
         Instantiates all dependencies:
         - TaskDatastore for cache management
-        - Loads tasks from datastore
+        - Loads active tasks from datastore (archive stays unmaterialized)
         - Builds DependencyGraph from tasks
         - Creates TaskPicker with tasks and graph
         - Initializes TaskContextStore for agent coordination
@@ -96,12 +96,16 @@ class TaskCliContext:
         Returns:
             Fully initialized TaskCliContext
         """
-        # Create datastore and load tasks
+        # Create datastore and load the hot tier (archived tasks stay as an ID index)
         datastore = TaskDatastore(repo_root)
-        tasks = datastore.load_tasks()
+        tasks = datastore.load_active_tasks()
 
         # Build dependency graph
-        graph = DependencyGraph(tasks)
+        graph = DependencyGraph(
+            tasks,
+            archived_ids=datastore.get_archive_index(),
+            closure_index=datastore.get_closure_index(tasks),
+        )
 
         # Create picker
         picker = TaskPicker(tasks, graph)
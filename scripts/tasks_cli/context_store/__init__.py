@@ -44,6 +44,8 @@ from .delta_tracking import normalize_diff_for_hashing, calculate_scope_hash
 
 # Import managers for direct use
 from .qa import QABaselineManager
+from .qa_cache import QAResultCache
+from .qa_drift import QADriftTable, detect_bulk_drift
 from .runtime import RuntimeHelper
 from .facade import TaskContextService
 
@@ -83,6 +85,9 @@ __all__ = [
     'calculate_scope_hash',
     # Managers
     'QABaselineManager',
+    'QAResultCache',
+    'QADriftTable',
+    'detect_bulk_drift',
     'RuntimeHelper',
     'TaskContextService',
 ]
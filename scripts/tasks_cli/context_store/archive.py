@@ -0,0 +1,246 @@
+"""
+Deterministic, seekable tar archives for directory evidence.
+
+Directories are walked once; each file is hashed while it is streamed into
+the archive, so no file is read twice and no tar subprocess is needed.
+
+Every tar member is compressed as its own frame (a zstd frame or a gzip
+member). Concatenated frames are a valid .tar.zst / .tar.gz stream for
+standard tools, and the per-file frame offsets recorded in the index let
+one file be extracted by decompressing only its frame.
+
+Compression uses the optional zstandard module (multithreaded) and falls
+back to gzip (stdlib zlib) when it is not installed.
+
+Archives are reproducible: members are sorted by path and carry fixed
+mtime/ownership, and only the executable bit of the mode is kept.
+"""
+
+import hashlib
+import os
+import stat
+import tarfile
+import tempfile
+import zlib
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from ..file_modes import match_target_mode
+
+try:
+    import zstandard
+except ImportError:  # Optional: archives fall back to gzip
+    zstandard = None
+
+ZSTD_LEVEL = 3
+GZIP_LEVEL = 6
+
+FORMAT_ZSTD = "tar.zst"
+FORMAT_GZIP = "tar.gz"
+
+_CHUNK_SIZE = 1024 * 1024
+_END_OF_ARCHIVE = b"\0" * (2 * tarfile.BLOCKSIZE)
+
+
+class ArchiveError(Exception):
+    """Archive could not be written or read."""
+
+
+class ArchiveResult(NamedTuple):
+    """Written archive and its per-file index entries."""
+    format: str             # FORMAT_ZSTD or FORMAT_GZIP
+    path: Path              # Archive file
+    original_size: int      # Sum of file sizes
+    files: List[dict]       # Index entries (see write_archive)
+
+
+class _ZstdFrames:
+    """Compressed output split into independently decompressible zstd frames."""
+
+    def __init__(self, out):
+        # threads=-1: one compression worker per logical CPU
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+        self._writer = compressor.stream_writer(out, closefd=False)
+
+    def write(self, data: bytes) -> None:
+        self._writer.write(data)
+
+    def end_frame(self) -> None:
+        self._writer.flush(zstandard.FLUSH_FRAME)
+
+
+class _GzipFrames:
+    """Compressed output split into gzip members."""
+
+    def __init__(self, out):
+        self._out = out
+        self._compressor = None
+
+    def write(self, data: bytes) -> None:
+        if self._compressor is None:
+            # wbits=31: gzip container with a zero mtime (deterministic)
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        self._out.write(self._compressor.compress(data))
+
+    def end_frame(self) -> None:
+        if self._compressor is not None:
+            self._out.write(self._compressor.flush())
+            self._compressor = None
+
+
+def default_format() -> str:
+    """Archive format used when none is requested."""
+    return FORMAT_ZSTD if zstandard is not None else FORMAT_GZIP
+
+
+def write_archive(dir_path: Path, archive_base: Path, archive_format: Optional[str] = None) -> ArchiveResult:
+    """
+    Archive a directory into <archive_base>.tar.zst (or .tar.gz).
+
+    Members are named "<dir name>/<relative path>". Each index entry holds:
+    path, size, sha256 (of the file content), offset and length (of the
+    member's compressed frame in the archive) and data_offset (start of the
+    file content within the decompressed frame).
+
+    Args:
+        dir_path: Directory to archive
+        archive_base: Archive path without extension
+        archive_format: FORMAT_ZSTD or FORMAT_GZIP (default: zstd if available)
+
+    Returns:
+        ArchiveResult
+
+    Raises:
+        ArchiveError: zstd requested but unavailable, or a file changed while
+            being archived
+    """
+    archive_format = archive_format or default_format()
+    if archive_format == FORMAT_ZSTD and zstandard is None:
+        raise ArchiveError("zstandard module is not installed")
+    if archive_format not in (FORMAT_ZSTD, FORMAT_GZIP):
+        raise ArchiveError(f"Unknown archive format: {archive_format}")
+
+    archive_path = archive_base.with_suffix(f".{archive_format}")
+    fd, temp_path = tempfile.mkstemp(dir=archive_path.parent, prefix=f".{archive_path.name}.tmp")
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            frames = _ZstdFrames(out) if archive_format == FORMAT_ZSTD else _GzipFrames(out)
+            files, original_size = _write_members(dir_path, out, frames)
+            frames.write(_END_OF_ARCHIVE)
+            frames.end_frame()
+        match_target_mode(temp_path, archive_path)
+        os.replace(temp_path, archive_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return ArchiveResult(
+        format=archive_format,
+        path=archive_path,
+        original_size=original_size,
+        files=files,
+    )
+
+
+def _write_members(dir_path: Path, out, frames) -> tuple:
+    """Write one frame per member; return (index entries, total file bytes)."""
+    files = []
+    original_size = 0
+
+    for path in sorted(dir_path.rglob("*"), key=lambda p: p.relative_to(dir_path).as_posix()):
+        rel_path = path.relative_to(dir_path).as_posix()
+        name = f"{dir_path.name}/{rel_path}"
+        offset = out.tell()
+
+        if path.is_dir():
+            frames.write(_member_header(name, tarfile.DIRTYPE, 0, 0o755))
+            frames.end_frame()
+            continue
+        if not path.is_file():
+            continue
+
+        with open(path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            mode = 0o755 if st.st_mode & stat.S_IXUSR else 0o644
+            header = _member_header(name, tarfile.REGTYPE, st.st_size, mode)
+            frames.write(header)
+
+            sha256 = hashlib.sha256()
+            written = 0
+            while written < st.st_size and (chunk := f.read(min(_CHUNK_SIZE, st.st_size - written))):
+                sha256.update(chunk)
+                frames.write(chunk)
+                written += len(chunk)
+            grew = bool(f.read(1))
+
+        if written != st.st_size or grew:
+            raise ArchiveError(f"File changed while archiving: {path}")
+
+        remainder = written % tarfile.BLOCKSIZE
+        if remainder:
+            frames.write(b"\0" * (tarfile.BLOCKSIZE - remainder))
+        frames.end_frame()
+
+        original_size += written
+        files.append({
+            "path": rel_path,
+            "size": written,
+            "sha256": sha256.hexdigest(),
+            "offset": offset,
+            "length": out.tell() - offset,
+            "data_offset": len(header),
+        })
+
+    return files, original_size
+
+
+def _member_header(name: str, member_type: bytes, size: int, mode: int) -> bytes:
+    """Deterministic PAX header block(s) for a member."""
+    info = tarfile.TarInfo(name)
+    info.type = member_type
+    info.size = size
+    info.mode = mode
+    info.mtime = 0
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    return info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+
+
+def read_member(archive_path: Path, archive_format: str, entry: dict) -> bytes:
+    """
+    Read one file from an archive using its index entry.
+
+    Only the member's frame is read and decompressed.
+
+    Args:
+        archive_path: Archive written by write_archive
+        archive_format: FORMAT_ZSTD or FORMAT_GZIP
+        entry: Index entry for the file
+
+    Returns:
+        File content
+
+    Raises:
+        ArchiveError: Frame cannot be decompressed or content hash mismatches
+    """
+    with open(archive_path, 'rb') as f:
+        f.seek(entry["offset"])
+        frame = f.read(entry["length"])
+
+    if archive_format == FORMAT_ZSTD and zstandard is None:
+        raise ArchiveError("zstandard module is not installed")
+
+    decompress_errors = (zlib.error,) + ((zstandard.ZstdError,) if zstandard is not None else ())
+    try:
+        if archive_format == FORMAT_ZSTD:
+            member = zstandard.ZstdDecompressor().decompressobj().decompress(frame)
+        else:
+            member = zlib.decompress(frame, 31)
+    except decompress_errors as e:
+        raise ArchiveError(f"Cannot decompress {entry['path']} from {archive_path}: {e}") from e
+
+    data = member[entry["data_offset"]:entry["data_offset"] + entry["size"]]
+    if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+        raise ArchiveError(f"SHA256 mismatch for {entry['path']} in {archive_path}")
+    return data
@@ -0,0 +1,157 @@
+"""
+Concurrent execution paths for task context operations.
+
+Built on AsyncProcessProvider:
+- AsyncQAExecutionMixin: runs several QA validation commands concurrently
+  (pre-flight checks, retry policy and result shape shared with
+  QABaselineManager.execute_command)
+- snapshot_diffs_async: overlaps the worktree snapshot's diff, diff stat
+  and checksum pass
+
+The sync paths in qa.py and delta_tracking.py remain the defaults.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ..expected_paths import GlobExistenceChecker
+from ..models import ValidationCommand
+from ..providers import AsyncProcessProvider
+
+
+class AsyncQAExecutionMixin:
+    """
+    Concurrent validation command execution for QABaselineManager.
+
+    This mixin requires the including class to provide:
+    - self._async_process_provider: Optional AsyncProcessProvider
+    - self._path_checker: Optional GlobExistenceChecker
+    - self._prepare_command, self._log_dir, self._completed_result,
+      self._failed_attempt_result, self._retry_exhausted_result
+    """
+
+    @property
+    def async_process_provider(self) -> AsyncProcessProvider:
+        """AsyncProcessProvider used for concurrent execution (created on first use)."""
+        if self._async_process_provider is None:
+            self._async_process_provider = AsyncProcessProvider()
+        return self._async_process_provider
+
+    async def execute_command_async(
+        self,
+        cmd: ValidationCommand,
+        task_id: str
+    ) -> Dict:
+        """
+        Execute validation command through the AsyncProcessProvider.
+
+        Same pre-flight checks, retry policy and result shape as
+        execute_command(); awaiting several of these runs the commands
+        concurrently, bounded by the provider's max_concurrency.
+
+        Args:
+            cmd: ValidationCommand to execute
+            task_id: Task ID for context
+
+        Returns:
+            Result dict as returned by execute_command()
+        """
+        early_result, cwd, env, cache_key = self._prepare_command(cmd)
+        if early_result is not None:
+            return early_result
+
+        retry_policy = cmd.retry_policy
+        start_time = time.time()
+        cmd_args = ['sh', '-c', cmd.command]
+
+        for attempt in range(retry_policy.max_attempts):
+            try:
+                attempt_start = time.time()
+                result = await self.async_process_provider.run(
+                    cmd_args,
+                    cwd=cwd,
+                    env=env,
+                    timeout=cmd.timeout_ms / 1000,
+                    check=False,
+                    spill_dir=self._log_dir(task_id),
+                    spill_name=cmd.id
+                )
+                return self._completed_result(cmd, result, attempt_start, attempt, cache_key)
+
+            except Exception as e:
+                failure = self._failed_attempt_result(cmd, e, start_time, attempt)
+                if failure is not None:
+                    return failure
+                await asyncio.sleep(retry_policy.backoff_ms / 1000)
+
+        return self._retry_exhausted_result(cmd, start_time)
+
+    def execute_commands(
+        self,
+        cmds: List[ValidationCommand],
+        task_id: str
+    ) -> List[Dict]:
+        """
+        Execute several validation commands concurrently.
+
+        Args:
+            cmds: ValidationCommands to execute
+            task_id: Task ID for context
+
+        Returns:
+            Result dicts (see execute_command()) in the order of cmds
+        """
+        async def run_all() -> List[Dict]:
+            return list(await asyncio.gather(
+                *(self.execute_command_async(cmd, task_id) for cmd in cmds)
+            ))
+
+        # Pre-flight checks all run before any command starts, so one
+        # directory index serves every expected_paths check of the batch
+        self._path_checker = GlobExistenceChecker(self.repo_root)
+        try:
+            return asyncio.run(run_all())
+        finally:
+            self._path_checker = None
+
+
+async def snapshot_diffs_async(
+    tracker,
+    base_commit: str,
+    env: Dict[str, str],
+    diff_file: Path
+) -> Tuple[str, List, str]:
+    """
+    Generate diff, file checksums and diff stat concurrently.
+
+    The diff streams to diff_file while name-status and checksums run in
+    a worker thread alongside `git diff --stat`. Both git commands are
+    built through the tracker's GitProvider, so they carry the same
+    config overrides as the sync path.
+
+    Args:
+        tracker: DeltaTracker with an async process provider configured
+        base_commit: Base commit to diff against
+        env: Environment with GIT_INDEX_FILE pointing at the temporary index
+        diff_file: Artifact path receiving the raw diff
+
+    Returns:
+        (diff_content, files_changed, diff_stat)
+    """
+    provider = tracker._async_process_provider
+    git = tracker._git_provider
+    _, files_changed, stat_result = await asyncio.gather(
+        provider.run(
+            git.git_argv(['diff', base_commit]),
+            cwd=tracker.repo_root, env=env, timeout=30, stdout_path=diff_file,
+        ),
+        asyncio.to_thread(tracker._get_changed_files, base_commit, env),
+        provider.run(
+            git.git_argv(['diff', '--stat', base_commit]),
+            cwd=tracker.repo_root, env=env, timeout=30,
+        ),
+    )
+    diff_content = diff_file.read_text(encoding='utf-8')
+    return diff_content, files_changed, stat_result.stdout.strip()
@@ -8,6 +8,7 @@ Handles:
 - File checksum calculation
 """
 
+import asyncio
 import hashlib
 import os
 import tempfile
@@ -17,7 +18,9 @@ from typing import Dict, List, Optional, Tuple
 
 from ..exceptions import ValidationError, ContextNotFoundError, DriftError
 from ..providers import GitProvider
+from ..providers.git import scope_pathspecs
 from ..providers.exceptions import CommandFailed, NonZeroExitWithStdErr, TimeoutExceeded
+from .async_execution import snapshot_diffs_async
 
 
 # ============================================================================
@@ -91,16 +94,20 @@ class DeltaTracker:
     while maintaining clear separation of concerns.
     """
 
-    def __init__(self, repo_root: Path, git_provider=None):
+    def __init__(self, repo_root: Path, git_provider=None, async_process_provider=None):
         """
         Initialize delta tracker.
 
         Args:
             repo_root: Absolute path to repository root
             git_provider: Optional GitProvider instance (defaults to new instance)
+            async_process_provider: Optional AsyncProcessProvider; when set, snapshot
+                diff generation overlaps with checksum calculation and the diff is
+                streamed straight to its artifact file
         """
         self.repo_root = Path(repo_root)
         self._git_provider = git_provider or GitProvider(repo_root)
+        self._async_process_provider = async_process_provider
 
     def _calculate_file_sha256(self, file_path: Path) -> str:
         """
@@ -232,6 +239,24 @@ class DeltaTracker:
 
         return (in_scope, out_of_scope)
 
+    def _list_untracked_in_scope(self, repo_paths: List[str]) -> List[str]:
+        """
+        List untracked files within task scope only.
+
+        Unlike _get_untracked_files_in_scope, git only walks the scoped
+        directories, so the rest of a large worktree is never read.
+
+        Args:
+            repo_paths: List of paths defining task scope (from context)
+
+        Returns:
+            Untracked files matching repo_paths prefixes
+        """
+        return self._git_provider.ls_files(
+            paths=['--', *scope_pathspecs(repo_paths)],
+            untracked=True,
+        )
+
     def _get_changed_files(
         self,
         base_commit: str,
@@ -404,21 +429,28 @@ class DeltaTracker:
 
             # Generate cumulative diff from base using temporary index
             diff_file = context_dir / f"{agent_role}-from-base.diff"
-            diff_content = self._git_provider.diff(base_commit=base_commit, env=env)
+            if self._async_process_provider is not None:
+                # 5./8. Diff, diff stat and file checksums run concurrently
+                diff_content, files_changed, diff_stat = asyncio.run(
+                    snapshot_diffs_async(self, base_commit, env, diff_file)
+                )
+            else:
+                diff_content = self._git_provider.diff(base_commit=base_commit, env=env)
 
-            # 5. Calculate file checksums using temporary index
-            files_changed = self._get_changed_files(base_commit, env=env)
+                # 5. Calculate file checksums using temporary index
+                files_changed = self._get_changed_files(base_commit, env=env)
 
-            # 8. Get diff stat using temporary index
-            diff_stat = self._git_provider.diff_stat(base_commit, env=env)
+                # 8. Get diff stat using temporary index
+                diff_stat = self._git_provider.diff_stat(base_commit, env=env)
 
         finally:
             # Clean up temporary index file
             if os.path.exists(tmp_index_path):
                 os.unlink(tmp_index_path)
 
-        # Save diff file
-        diff_file.write_text(diff_content, encoding='utf-8')
+        # Save diff file (already streamed there by the async path)
+        if self._async_process_provider is None:
+            diff_file.write_text(diff_content, encoding='utf-8')
 
         # Check diff size and warn if > 10MB (proposal Section 3.6)
         diff_size_mb = diff_file.stat().st_size / (1024 * 1024)
@@ -518,7 +550,7 @@ class DeltaTracker:
                 # 2.5. Add in-scope untracked files to the temporary index as intent-to-add
                 # This ensures new files created by reviewer are included in the diff
                 # Only exclude .agent-output directory (not all .diff files)
-                in_scope_untracked, _ = self._get_untracked_files_in_scope(repo_paths)
+                in_scope_untracked = self._list_untracked_in_scope(repo_paths)
 
                 if in_scope_untracked:
                     pathspec = ['--'] + in_scope_untracked + [':!.agent-output/**']
@@ -609,7 +641,7 @@ class DeltaTracker:
 
         # 5. Calculate current diff and compare SHA
         # Use temporary index to include in-scope untracked files (mirrors snapshot_worktree)
-        in_scope_untracked, _ = self._get_untracked_files_in_scope(repo_paths)
+        in_scope_untracked = self._list_untracked_in_scope(repo_paths)
 
         with tempfile.NamedTemporaryFile(mode='w', suffix='.index', delete=False) as tmp_index:
             tmp_index_path = tmp_index.name
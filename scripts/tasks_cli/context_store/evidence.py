@@ -14,6 +14,8 @@ from typing import Any, Dict, List, Optional
 
 from ..exceptions import ValidationError
 from ..providers import ProcessProvider
+from .archive import ArchiveError, read_member, write_archive
+from .storage import ContextStorage, FilesystemContextStorage
 
 # ============================================================================
 # Constants
@@ -57,7 +59,13 @@ class EvidenceManager:
     - Listing evidence attachments
     """
 
-    def __init__(self, repo_root: Path, context_root: Path, process_provider=None):
+    def __init__(
+        self,
+        repo_root: Path,
+        context_root: Path,
+        process_provider=None,
+        storage: Optional[ContextStorage] = None
+    ):
         """
         Initialize evidence manager.
 
@@ -65,10 +73,19 @@ class EvidenceManager:
             repo_root: Repository root directory
             context_root: Context store root (.agent-output/)
             process_provider: Optional ProcessProvider instance (defaults to new instance)
+            storage: Optional ContextStorage for the evidence index (defaults to
+                evidence/index.json files under context_root)
         """
         self.repo_root = repo_root
         self.context_root = context_root
         self._process_provider = process_provider or ProcessProvider()
+        self._storage = storage
+
+    def _index_storage(self, atomic_write_func=None) -> ContextStorage:
+        """Storage holding the evidence index."""
+        if self._storage is not None:
+            return self._storage
+        return FilesystemContextStorage(self.context_root, atomic_write_func)
 
     def _get_evidence_dir(self, task_id: str) -> Path:
         """
@@ -175,8 +192,9 @@ class EvidenceManager:
         """
         Create deterministic archive from directory.
 
-        Implements tar.zst compression with index.json manifest per
-        Section 1.3 of task-context-cache-hardening-schemas.md.
+        Implements tar.zst compression (tar.gz when the zstandard module is
+        unavailable) with index.json manifest per Section 1.3 of
+        task-context-cache-hardening-schemas.md.
 
         Args:
             dir_path: Directory to archive
@@ -196,79 +214,63 @@ class EvidenceManager:
         if not dir_path.exists() or not dir_path.is_dir():
             raise ValidationError(f"Directory not found or not a directory: {dir_path}")
 
-        # 1. Create index of contents
+        # 1. Stream files into the archive, hashing as they are read
+        try:
+            archive = write_archive(dir_path, output_path)
+        except (ArchiveError, OSError) as archive_error:
+            raise ValidationError(
+                f"Failed to create archive: {str(archive_error)}"
+            ) from archive_error
+
+        # 2. Save index (per-file frame offsets allow single-file extraction)
         index = {
             "created_at": datetime.now(timezone.utc).isoformat(),
             "root": str(dir_path.relative_to(self.repo_root)),
-            "files": []
+            "archive": archive.path.name,
+            "format": archive.format,
+            "files": archive.files
         }
-
-        original_size = 0
-        for file_path in sorted(dir_path.rglob("*")):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(dir_path)
-                file_size = file_path.stat().st_size
-                original_size += file_size
-
-                sha256 = hashlib.sha256()
-                with open(file_path, 'rb') as f:
-                    while chunk := f.read(8192):
-                        sha256.update(chunk)
-
-                index["files"].append({
-                    "path": str(rel_path),
-                    "size": file_size,
-                    "sha256": sha256.hexdigest()
-                })
-
-        # 2. Save index
         index_path = output_path.with_suffix('.index.json')
         index_content = json.dumps(index, indent=2, sort_keys=True, ensure_ascii=False)
         index_content += '\n'
         atomic_write_func(index_path, index_content)
 
-        # 3. Create archive (prefer tar.zst, fallback to tar.gz)
-        compression_format = "tar.zst"
-        archive_path = output_path.with_suffix('.tar.zst')
-
-        try:
-            # Try tar.zst first (best compression)
-            self._process_provider.run(
-                ['tar', '--zstd', '--create', '--file', str(archive_path),
-                 '--directory', str(dir_path.parent), dir_path.name],
-                timeout=300,  # 5 minutes for large directories
-                check=True
-            )
-        except Exception:
-            # Fallback to tar.gz if zstd not available
-            import sys
-            print(
-                "Warning: zstd compression not available, falling back to gzip. "
-                "Install zstd for better compression.",
-                file=sys.stderr
-            )
-            compression_format = "tar.gz"
-            archive_path = output_path.with_suffix('.tar.gz')
-
-            try:
-                self._process_provider.run(
-                    ['tar', '--gzip', '--create', '--file', str(archive_path),
-                     '--directory', str(dir_path.parent), dir_path.name],
-                    timeout=300,  # 5 minutes for large directories
-                    check=True
-                )
-            except Exception as tar_error:
-                raise ValidationError(
-                    f"Failed to create archive: {str(tar_error)}"
-                ) from tar_error
-
-        # 4. Return metadata
+        # 3. Return metadata
         return CompressionMetadata(
-            format=compression_format,
-            original_size=original_size,
+            format=archive.format,
+            original_size=archive.original_size,
             index_path=str(index_path.relative_to(self.repo_root))
         )
 
+    def extract_archived_file(self, index_path: Path, file_path: str) -> bytes:
+        """
+        Read one file from a directory archive without unpacking the rest.
+
+        Args:
+            index_path: Archive index (absolute or relative to repo_root)
+            file_path: File path relative to the archived directory
+
+        Returns:
+            File content (SHA256-verified against the index)
+
+        Raises:
+            ValidationError: If the file is not in the index or cannot be read
+        """
+        if not index_path.is_absolute():
+            index_path = self.repo_root / index_path
+
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+
+        entry = next((e for e in index.get("files", []) if e["path"] == file_path), None)
+        if entry is None or "offset" not in entry:
+            raise ValidationError(f"File not found in archive index: {file_path}")
+
+        try:
+            return read_member(index_path.parent / index["archive"], index["format"], entry)
+        except (ArchiveError, OSError) as e:
+            raise ValidationError(f"Failed to read {file_path} from archive: {e}") from e
+
     def attach_evidence(
         self,
         task_id: str,
@@ -402,36 +404,8 @@ class EvidenceManager:
             metadata=artifact_metadata
         )
 
-        # Update evidence index
-        evidence_dir = self._get_evidence_dir(task_id)
-        evidence_dir.mkdir(parents=True, exist_ok=True)
-
-        index_path = evidence_dir / 'index.json'
-
-        # Read existing index or create new
-        if index_path.exists():
-            with open(index_path, 'r', encoding='utf-8') as f:
-                index = json.load(f)
-        else:
-            index = {
-                "version": 1,
-                "evidence": []
-            }
-
-        # Add attachment (replace if ID exists)
-        existing_idx = next(
-            (i for i, e in enumerate(index["evidence"]) if e["id"] == evidence_id),
-            None
-        )
-        if existing_idx is not None:
-            index["evidence"][existing_idx] = attachment.to_dict()
-        else:
-            index["evidence"].append(attachment.to_dict())
-
-        # Write index atomically
-        index_content = json.dumps(index, indent=2, sort_keys=True, ensure_ascii=False)
-        index_content += '\n'
-        atomic_write_func(index_path, index_content)
+        # Update evidence index (replaces an existing entry with the same ID)
+        self._index_storage(atomic_write_func).upsert_evidence(task_id, [attachment.to_dict()])
 
         return attachment
 
@@ -448,16 +422,7 @@ class EvidenceManager:
         # Import here to avoid circular dependency
         from .models import EvidenceAttachment
 
-        evidence_dir = self._get_evidence_dir(task_id)
-        index_path = evidence_dir / 'index.json'
-
-        if not index_path.exists():
-            return []
-
-        with open(index_path, 'r', encoding='utf-8') as f:
-            index = json.load(f)
-
         return [
             EvidenceAttachment.from_dict(e)
-            for e in index.get("evidence", [])
+            for e in self._index_storage().read_evidence(task_id)
         ]
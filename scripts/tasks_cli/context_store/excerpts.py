@@ -0,0 +1,154 @@
+"""
+Standards excerpt cache for task contexts.
+
+Implements Section 7 of task-context-cache-hardening-schemas.md: standards
+sections cited by a task are extracted once, written to
+.agent-output/{task_id}/evidence/standards/{excerpt_id}.md and recorded in
+that directory's index.json, so agents can re-verify them against the
+current standards file (content SHA) instead of re-reading whole files.
+
+Section lookup and hashing go through the context store's SourceFileIndex,
+so excerpts share file reads with context initialization.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from .models import StandardsExcerpt
+from .source_index import SourceFileIndex
+
+
+class StandardsExcerptCache:
+    """Extracts, caches and revalidates standards excerpts per task."""
+
+    def __init__(
+        self,
+        repo_root: Path,
+        source_index: SourceFileIndex,
+        get_evidence_dir_fn: Callable[[str], Path],
+        atomic_write_fn: Callable[[Path, str], None],
+    ):
+        """
+        Initialize excerpt cache.
+
+        Args:
+            repo_root: Repository root
+            source_index: Shared cache of standards file contents
+            get_evidence_dir_fn: Function to get evidence directory for task
+            atomic_write_fn: Callable for atomic file writes
+        """
+        self.repo_root = Path(repo_root)
+        self.source_index = source_index
+        self._get_evidence_dir = get_evidence_dir_fn
+        self._atomic_write = atomic_write_fn
+
+    def extract_standards_excerpt(
+        self,
+        task_id: str,
+        standards_file: str,
+        section_heading: str
+    ) -> StandardsExcerpt:
+        """
+        Extract a standards section and cache it in the task's evidence.
+
+        Implements Section 7 of task-context-cache-hardening-schemas.md.
+        The excerpt is written to
+        .agent-output/{task_id}/evidence/standards/{excerpt_id}.md and
+        recorded in that directory's index.json.
+
+        Args:
+            task_id: Task identifier
+            standards_file: Standards file relative to the repo root
+            section_heading: Section heading to extract
+
+        Returns:
+            StandardsExcerpt with cached_path set
+
+        Raises:
+            FileNotFoundError: Standards file does not exist
+            ValueError: Section not found in the file
+        """
+        body = self.source_index.excerpt(standards_file, section_heading)
+        if body is None:
+            raise ValueError(f"Section '{section_heading}' not found in {standards_file}")
+
+        excerpt_id = body.content_sha256[:8]
+        standards_dir = self._get_evidence_dir(task_id) / 'standards'
+        cached_file = standards_dir / f"{excerpt_id}.md"
+        self._atomic_write(cached_file, body.content)
+
+        excerpt = StandardsExcerpt(
+            file=standards_file,
+            section=section_heading,
+            requirement=body.requirement,
+            line_span=body.line_span,
+            content_sha256=body.content_sha256,
+            excerpt_id=excerpt_id,
+            cached_path=str(cached_file.relative_to(self.repo_root)),
+        )
+
+        index_path = standards_dir / 'index.json'
+        index = self._read_excerpt_index(index_path)
+        index['excerpts'] = [e for e in index['excerpts'] if e.get('excerpt_id') != excerpt_id]
+        index['excerpts'].append(excerpt.to_dict())
+        self._write_excerpt_index(index_path, index)
+
+        return excerpt
+
+    def verify_excerpt_freshness(self, excerpt: StandardsExcerpt) -> bool:
+        """
+        Check that an excerpt still matches its standards file.
+
+        Args:
+            excerpt: Previously extracted excerpt
+
+        Returns:
+            True if the section exists and its content hash is unchanged
+        """
+        try:
+            body = self.source_index.excerpt(excerpt.file, excerpt.section)
+        except FileNotFoundError:
+            return False
+        return body is not None and body.content_sha256 == excerpt.content_sha256
+
+    def invalidate_stale_excerpts(self, task_id: str) -> List[str]:
+        """
+        Remove cached excerpts whose standards sections changed.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            IDs of the removed (stale) excerpts
+        """
+        index_path = self._get_evidence_dir(task_id) / 'standards' / 'index.json'
+        if not index_path.exists():
+            return []
+
+        index = self._read_excerpt_index(index_path)
+        stale_ids = []
+        fresh = []
+        for entry in index['excerpts']:
+            excerpt = StandardsExcerpt.from_dict(entry)
+            if self.verify_excerpt_freshness(excerpt):
+                fresh.append(entry)
+                continue
+            stale_ids.append(excerpt.excerpt_id)
+            if excerpt.cached_path:
+                (self.repo_root / excerpt.cached_path).unlink(missing_ok=True)
+
+        if stale_ids:
+            index['excerpts'] = fresh
+            self._write_excerpt_index(index_path, index)
+        return stale_ids
+
+    def _read_excerpt_index(self, index_path: Path) -> Dict[str, Any]:
+        if index_path.exists():
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {'version': 1, 'excerpts': []}
+
+    def _write_excerpt_index(self, index_path: Path, index: Dict[str, Any]) -> None:
+        content = json.dumps(index, indent=2, sort_keys=True, ensure_ascii=False) + '\n'
+        self._atomic_write(index_path, content)
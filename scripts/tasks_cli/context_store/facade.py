@@ -18,12 +18,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from filelock import FileLock
-
 from ..exceptions import ContextExistsError, ContextNotFoundError, ValidationError
-from ..providers import ProcessProvider, GitProvider
+from ..providers import AsyncProcessProvider, ProcessProvider, GitProvider
+from ..telemetry import get_tracer
 from .delta_tracking import DeltaTracker, normalize_diff_for_hashing, calculate_scope_hash
 from .evidence import EvidenceManager
+from .excerpts import StandardsExcerptCache
 from .immutable import ImmutableSnapshotBuilder
 from .models import (
     AgentCoordination,
@@ -37,6 +37,10 @@ from .models import (
 )
 from .qa import QABaselineManager
 from .runtime import RuntimeHelper
+from .source_index import SourceFileIndex
+from .storage import ContextStorage, create_context_storage
+
+_tracer = get_tracer(__name__)
 
 
 class TaskContextService:
@@ -46,7 +50,9 @@ class TaskContextService:
         self,
         repo_root: Path,
         process_provider: Optional[ProcessProvider] = None,
-        git_provider: Optional[GitProvider] = None
+        git_provider: Optional[GitProvider] = None,
+        storage: Optional[ContextStorage] = None,
+        async_process_provider: Optional[AsyncProcessProvider] = None
     ):
         """
         Initialize task context service.
@@ -55,6 +61,10 @@ class TaskContextService:
             repo_root: Absolute path to repository root
             process_provider: Optional ProcessProvider instance (defaults to new instance)
             git_provider: Optional GitProvider instance (defaults to new instance)
+            storage: Optional ContextStorage backend (defaults to TASKS_CONTEXT_BACKEND,
+                then the filesystem layout)
+            async_process_provider: Optional AsyncProcessProvider; when set, worktree
+                snapshots overlap diff generation with checksum calculation
         """
         self.repo_root = Path(repo_root)
         self.context_root = self.repo_root / ".agent-output"
@@ -66,6 +76,7 @@ class TaskContextService:
         # Initialize providers
         self._process_provider = process_provider or ProcessProvider()
         self._git_provider = git_provider or GitProvider(repo_root)
+        self._async_process_provider = async_process_provider
 
         # Initialize runtime helper (S3.6)
         self._runtime = RuntimeHelper(
@@ -74,6 +85,12 @@ class TaskContextService:
             git_provider=self._git_provider
         )
 
+        # Context/coordination/evidence-index records
+        self.storage = storage or create_context_storage(self.context_root, self._runtime.atomic_write)
+
+        # Standards/checklist contents shared by all contexts built by this service
+        self.source_index = SourceFileIndex(self.repo_root)
+
         # Initialize immutable snapshot builder (S3.2)
         self._immutable = ImmutableSnapshotBuilder(
             repo_root=self.repo_root,
@@ -83,25 +100,38 @@ class TaskContextService:
             get_evidence_dir_fn=self._runtime.get_evidence_dir,
             get_manifest_file_fn=self._runtime.get_manifest_file,
             resolve_task_path_fn=self._runtime.resolve_task_path,
+            source_index=self.source_index,
+            storage=self.storage,
+        )
+
+        # Standards excerpts cached per task (evidence/standards/)
+        self._excerpts = StandardsExcerptCache(
+            repo_root=self.repo_root,
+            source_index=self.source_index,
+            get_evidence_dir_fn=self._runtime.get_evidence_dir,
+            atomic_write_fn=self._runtime.atomic_write,
         )
 
         # Initialize delta tracking manager (S3.3)
         self._delta = DeltaTracker(
             repo_root=self.repo_root,
-            git_provider=self._git_provider
+            git_provider=self._git_provider,
+            async_process_provider=self._async_process_provider
         )
 
         # Initialize evidence manager (S3.4)
         self._evidence = EvidenceManager(
             repo_root=self.repo_root,
             context_root=self.context_root,
-            process_provider=self._process_provider
+            process_provider=self._process_provider,
+            storage=self.storage
         )
 
         # Initialize QA baseline manager (S3.5)
         self._qa = QABaselineManager(
             repo_root=self.repo_root,
-            process_provider=self._process_provider
+            process_provider=self._process_provider,
+            async_process_provider=self._async_process_provider
         )
 
     # ========================================================================
@@ -137,10 +167,8 @@ class TaskContextService:
             ContextExistsError: If context already initialized
             ValidationError: If immutable data contains secrets or invalid data
         """
-        context_file = self._runtime.get_context_file(task_id)
-
         # Check if context already exists
-        if context_file.exists():
+        if self.storage.context_exists(task_id):
             raise ContextExistsError(
                 f"Context already initialized for {task_id}. "
                 f"Use purge_context() first to re-initialize."
@@ -158,10 +186,10 @@ class TaskContextService:
         )
 
         # Write atomically with lock
-        with FileLock(str(self.lock_file), timeout=10):
-            json_content = json.dumps(context.to_dict(), indent=2, sort_keys=True, ensure_ascii=False)
-            json_content += '\n'  # Trailing newline
-            self._runtime.atomic_write(context_file, json_content)
+        with _tracer.start_as_current_span("cli.context.save") as span, \
+                self.storage.transaction():
+            span.set_attribute("task_id", task_id)
+            self.storage.write_context(task_id, context.to_dict())
 
         return context
 
@@ -178,9 +206,12 @@ class TaskContextService:
         Returns:
             TaskContext or None if not found
         """
-        # Read with lock
-        with FileLock(str(self.lock_file), timeout=10):
-            return self._load_context_file(task_id)
+        # Backends write atomically, so reads don't take the store lock
+        with _tracer.start_as_current_span("cli.context.load") as span:
+            span.set_attribute("task_id", task_id)
+            context = self._load_context_file(task_id)
+            span.set_attribute("found", context is not None)
+            return context
 
     def get_manifest(self, task_id: str) -> Optional[ContextManifest]:
         """
@@ -232,7 +263,7 @@ class TaskContextService:
         self._runtime.scan_for_secrets(updates, force=force_secrets)
 
         # Load existing context with lock
-        with FileLock(str(self.lock_file), timeout=10):
+        with self.storage.transaction():
             context = self._load_context_file(task_id)
             if context is None:
                 raise ContextNotFoundError(f"No context found for {task_id}")
@@ -253,10 +284,9 @@ class TaskContextService:
             context.audit_update_count += 1
 
             # Write atomically
-            context_file = self._runtime.get_context_file(task_id)
-            json_content = json.dumps(context.to_dict(), indent=2, sort_keys=True, ensure_ascii=False)
-            json_content += '\n'
-            self._runtime.atomic_write(context_file, json_content)
+            with _tracer.start_as_current_span("cli.context.save") as span:
+                span.set_attribute("task_id", task_id)
+                self.storage.write_context(task_id, context.to_dict())
 
     def purge_context(self, task_id: str) -> None:
         """
@@ -267,8 +297,9 @@ class TaskContextService:
         Args:
             task_id: Task identifier
         """
-        context_dir = self._runtime.get_context_dir(task_id)
+        self.storage.delete_context(task_id)
 
+        context_dir = self._runtime.get_context_dir(task_id)
         if not context_dir.exists():
             return
 
@@ -508,7 +539,7 @@ class TaskContextService:
         Raises:
             ValidationError: If file not found or section not found
         """
-        return self._immutable.extract_standards_excerpt(
+        return self._excerpts.extract_standards_excerpt(
             task_id=task_id,
             standards_file=standards_file,
             section_heading=section_heading
@@ -526,7 +557,7 @@ class TaskContextService:
         Returns:
             True if excerpt is current, False if stale
         """
-        return self._immutable.verify_excerpt_freshness(excerpt)
+        return self._excerpts.verify_excerpt_freshness(excerpt)
 
     def invalidate_stale_excerpts(self, task_id: str) -> List[str]:
         """
@@ -540,7 +571,7 @@ class TaskContextService:
         Returns:
             List of stale excerpt IDs
         """
-        return self._immutable.invalidate_stale_excerpts(task_id)
+        return self._excerpts.invalidate_stale_excerpts(task_id)
 
     # ========================================================================
     # Task Snapshot Methods
@@ -608,6 +639,31 @@ class TaskContextService:
             completed_dir=completed_dir
         )
 
+    def git_request_scope(self):
+        """
+        Memoize git state queries (HEAD, status, untracked) for one command.
+
+        Delegates to GitProvider.request_scope().
+
+        Returns:
+            Context manager yielding the scope's GitStateCache
+        """
+        return self._git_provider.request_scope()
+
+    def get_current_git_head(self) -> str:
+        """
+        Get current git HEAD SHA.
+
+        Delegates to RuntimeHelper; memoized inside git_request_scope().
+
+        Returns:
+            Full git commit SHA (40 chars)
+
+        Raises:
+            ProcessError: If git command fails
+        """
+        return self._runtime.get_current_git_head()
+
     def resolve_task_path(self, task_id: str) -> Optional[Path]:
         """
         Resolve task file path from task ID.
@@ -628,7 +684,7 @@ class TaskContextService:
 
     def _load_context_file(self, task_id: str) -> Optional[TaskContext]:
         """
-        Load context from file without acquiring lock.
+        Load context from storage without acquiring lock.
 
         Internal method - callers must handle locking.
 
@@ -638,14 +694,10 @@ class TaskContextService:
         Returns:
             TaskContext or None if not found
         """
-        context_file = self._runtime.get_context_file(task_id)
-
-        if not context_file.exists():
+        data = self.storage.read_context(task_id)
+        if data is None:
             return None
 
-        with open(context_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
         context = TaskContext.from_dict(data)
 
         # Check staleness
@@ -8,7 +8,6 @@ for task context initialization. Extracted from context_store.py (S3.2).
 import hashlib
 import json
 import re
-import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from textwrap import fill
@@ -25,9 +24,14 @@ from .models import (
     TaskSnapshot,
     ValidationBaseline,
 )
+from .source_index import SourceFileIndex, find_section_boundaries
+from .storage import ContextStorage, FilesystemContextStorage
 
 # Import ValidationError from parent exceptions module
 from ..exceptions import ValidationError
+from ..telemetry import get_tracer
+
+_tracer = get_tracer(__name__)
 
 
 # ============================================================================
@@ -127,6 +131,8 @@ class ImmutableSnapshotBuilder:
         get_evidence_dir_fn,
         get_manifest_file_fn,
         resolve_task_path_fn,
+        source_index: Optional[SourceFileIndex] = None,
+        storage: Optional[ContextStorage] = None,
     ):
         """
         Initialize snapshot builder.
@@ -139,6 +145,8 @@ class ImmutableSnapshotBuilder:
             get_evidence_dir_fn: Function to get evidence directory for task
             get_manifest_file_fn: Function to get manifest file path for task
             resolve_task_path_fn: Function to resolve task file path from task_id
+            source_index: Shared cache of standards/checklist files (created if omitted)
+            storage: Context storage holding evidence indexes (filesystem layout if omitted)
         """
         self.repo_root = Path(repo_root)
         self.context_root = Path(context_root)
@@ -147,6 +155,8 @@ class ImmutableSnapshotBuilder:
         self._get_evidence_dir = get_evidence_dir_fn
         self._get_manifest_file = get_manifest_file_fn
         self._resolve_task_path = resolve_task_path_fn
+        self.source_index = source_index or SourceFileIndex(self.repo_root)
+        self._storage = storage or FilesystemContextStorage(self.context_root, atomic_write_fn)
 
     def _scan_for_secrets(self, data: dict, force: bool = False) -> None:
         """
@@ -177,7 +187,8 @@ class ImmutableSnapshotBuilder:
                 for idx, item in enumerate(value):
                     _scan_value(item, f"{path}[{idx}]")
 
-        _scan_value(data)
+        with _tracer.start_as_current_span("cli.context.scan_secrets"):
+            _scan_value(data)
 
     def init_context(
         self,
@@ -435,80 +446,51 @@ class ImmutableSnapshotBuilder:
         evidence_dir = self._get_evidence_dir(task_id)
         evidence_dir.mkdir(parents=True, exist_ok=True)
 
-        # Snapshot each checklist by copying to evidence directory with SHA-tracking
+        # Snapshot each checklist by copying to evidence directory with SHA-tracking.
+        # Content and hashes come from the shared source index, so a batch of
+        # tasks reads each checklist once.
         for checklist_rel_path in default_checklists:
-            checklist_path = self.repo_root / checklist_rel_path
-
-            if not checklist_path.exists():
+            entry = self.source_index.get(checklist_rel_path)
+            if entry is None:
                 continue
 
             try:
-                # Read checklist content and calculate hash
-                checklist_bytes = checklist_path.read_bytes()
-                size_bytes = len(checklist_bytes)
+                size_bytes = len(entry.content)
 
                 # Validate size (file type has 1MB limit)
                 if size_bytes > 1 * 1024 * 1024:
                     continue  # Skip large files
 
-                # Calculate SHA256 hash
-                sha256_hash = hashlib.sha256(checklist_bytes).hexdigest()
+                sha256_hash = entry.sha256
                 evidence_id = sha256_hash[:16]
 
                 # Copy to evidence directory with hash-based filename
-                file_extension = checklist_path.suffix
+                file_extension = Path(checklist_rel_path).suffix
                 target_filename = f"{evidence_id}{file_extension}"
                 target_path = evidence_dir / target_filename
 
                 # Copy file to evidence directory if not already there
                 if not target_path.exists():
-                    shutil.copy2(checklist_path, target_path)
+                    target_path.write_bytes(entry.content)
 
                 # Create EvidenceAttachment pointing to evidence copy
-                attachment = EvidenceAttachment(
+                attachments.append(EvidenceAttachment(
                     id=evidence_id,
                     type='file',
                     path=str(target_path.relative_to(self.repo_root)),
                     sha256=sha256_hash,
                     size=size_bytes,
                     created_at=datetime.now(timezone.utc).isoformat(),
-                    description=f"Checklist snapshot: {checklist_path.name}"
-                )
-
-                # Update evidence index
-                index_path = evidence_dir / 'index.json'
-
-                # Read existing index or create new
-                if index_path.exists():
-                    with open(index_path, 'r', encoding='utf-8') as f:
-                        index = json.load(f)
-                else:
-                    index = {
-                        "version": 1,
-                        "evidence": []
-                    }
-
-                # Add attachment (replace if ID exists)
-                existing_idx = next(
-                    (i for i, e in enumerate(index["evidence"]) if e["id"] == evidence_id),
-                    None
-                )
-                if existing_idx is not None:
-                    index["evidence"][existing_idx] = attachment.to_dict()
-                else:
-                    index["evidence"].append(attachment.to_dict())
-
-                # Write index atomically
-                index_content = json.dumps(index, indent=2, sort_keys=True, ensure_ascii=False)
-                index_content += '\n'
-                self._atomic_write(index_path, index_content)
-
-                attachments.append(attachment)
+                    description=f"Checklist snapshot: {Path(checklist_rel_path).name}"
+                ))
 
             except Exception:
-                # Skip if processing fails (read error, etc.)
+                # Skip if processing fails (write error, etc.)
                 continue
 
+        if attachments:
+            self._storage.upsert_evidence(task_id, [attachment.to_dict() for attachment in attachments])
+
         return attachments
 
     def create_snapshot_and_embed(
@@ -593,40 +575,4 @@ class ImmutableSnapshotBuilder:
             3. Section ends at next same-level or higher-level heading (exclusive)
             4. If no subsequent heading, section extends to EOF
         """
-        lines = content.split('\n')
-
-        section_start = None
-        section_end = None
-        current_level = None
-
-        # Normalize heading for comparison
-        normalized_target = heading.lower().replace(' ', '-').replace('&', 'and')
-
-        for i, line in enumerate(lines):
-            # Match markdown headings (# through ######)
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if not heading_match:
-                continue
-
-            level = len(heading_match.group(1))
-            heading_text = heading_match.group(2).strip()
-
-            # Normalize current heading
-            normalized_current = heading_text.lower().replace(' ', '-').replace('&', 'and')
-
-            if normalized_current == normalized_target and section_start is None:
-                # Found target heading
-                section_start = i + 1  # Start after heading line
-                current_level = level
-            elif section_start is not None and level <= current_level:
-                # Found next heading at same or higher level
-                section_end = i
-                break
-
-        if section_start is None:
-            return None
-
-        if section_end is None:
-            section_end = len(lines)
-
-        return (section_start, section_end)
+        return find_section_boundaries(content.split('\n'), heading)
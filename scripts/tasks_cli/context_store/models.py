@@ -897,7 +897,7 @@ class WorktreeSnapshot:
     snapshot_time: str
     diff_from_base: str          # Path to diff file
     diff_sha: str                # SHA256 of normalized diff
-    status_report: str           # Raw git status --porcelain -z
+    status_report: str           # Raw git status --porcelain=v2 -z
     files_changed: List[FileSnapshot]
     diff_stat: str               # git diff --stat output
     scope_hash: str              # SHA256 of repo_paths array
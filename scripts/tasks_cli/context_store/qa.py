@@ -14,38 +14,64 @@ This is ONLY safe because:
 4. No user input or external data is passed to subprocess commands
 
 DO NOT use this module with untrusted command sources or user-provided task files.
+
+OUTPUT CAPTURE:
+---------------
+Command output is spilled to .agent-output/<task_id>/qa-logs/<command_id>.{stdout,stderr}.log
+while it streams; results carry head/tail previews in stdout/stderr plus
+stdout_log/stderr_log handles (path, size, sha256), so memory stays bounded
+however much a command prints.
 """
 
 import os
 import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
+from ..expected_paths import GlobExistenceChecker, check_expected_paths
 from ..models import ValidationCommand
-from ..providers import ProcessProvider
+from ..providers import ProcessProvider, SpilledOutput
+from ..task_status import check_blocker_status
+from .async_execution import AsyncQAExecutionMixin
 from .models import QAResults
+from .qa_cache import QAResultCache, qa_cache_enabled
+
+QA_LOG_DIRNAME = "qa-logs"
 
 
-class QABaselineManager:
+class QABaselineManager(AsyncQAExecutionMixin):
     """
     Manages QA command execution and baseline drift detection.
 
     Encapsulates all QA-related operations for task context:
-    - Command execution with retry and timeout
+    - Command execution with retry and timeout (one at a time or concurrently)
     - Baseline vs current result comparison
     - Drift detection and reporting
     """
 
-    def __init__(self, repo_root: Path, process_provider=None):
+    def __init__(
+        self,
+        repo_root: Path,
+        process_provider=None,
+        result_cache=None,
+        async_process_provider=None
+    ):
         """
         Initialize QA baseline manager.
 
         Args:
             repo_root: Repository root path
             process_provider: Optional ProcessProvider instance (defaults to new instance)
+            result_cache: Optional QAResultCache; when set, results for unchanged
+                inputs are served without executing (opt-in)
+            async_process_provider: Optional AsyncProcessProvider for concurrent
+                execution (defaults to a new instance on first use)
         """
         self.repo_root = repo_root
         self._process_provider = process_provider or ProcessProvider()
+        self._result_cache = result_cache
+        self._async_process_provider = async_process_provider
+        self._path_checker: Optional[GlobExistenceChecker] = None
 
     def execute_command(
         self,
@@ -72,55 +98,16 @@ class QABaselineManager:
                 duration_ms: int,
                 attempts: int
             }
+            stdout/stderr hold previews of spilled output; executed results
+            also carry stdout_log and stderr_log ({path, size, sha256, truncated}).
+            When a result cache is configured, executed and cached results also
+            carry cached, log_path, log_sha256 and summary.
         """
-        # 1. Check if blocked by another task
-        if cmd.blocker_id:
-            is_blocked, reason = self._check_blocker_status(cmd.blocker_id)
-            if is_blocked:
-                return {
-                    "success": False,
-                    "exit_code": None,
-                    "stdout": "",
-                    "stderr": "",
-                    "skipped": True,
-                    "skip_reason": reason,
-                    "duration_ms": 0,
-                    "attempts": 0
-                }
+        early_result, cwd, env, cache_key = self._prepare_command(cmd)
+        if early_result is not None:
+            return early_result
 
-        # 2. Verify expected paths exist
-        all_exist, missing = self._verify_expected_paths(cmd.expected_paths)
-        if not all_exist:
-            return {
-                "success": False,
-                "exit_code": None,
-                "stdout": "",
-                "stderr": "",
-                "skipped": True,
-                "skip_reason": f"Expected path not found: {missing[0]}",
-                "duration_ms": 0,
-                "attempts": 0
-            }
-
-        # 3. Prepare environment
-        env = os.environ.copy()
-        env.update(cmd.env)
-
-        # 4. Change to working directory
-        cwd = self.repo_root / cmd.cwd
-        if not cwd.exists():
-            return {
-                "success": False,
-                "exit_code": None,
-                "stdout": "",
-                "stderr": "",
-                "skipped": True,
-                "skip_reason": f"Working directory does not exist: {cwd}",
-                "duration_ms": 0,
-                "attempts": 0
-            }
-
-        # 5. Execute with retry policy
+        # Execute with retry policy
         retry_policy = cmd.retry_policy
         start_time = time.time()
 
@@ -137,59 +124,152 @@ class QABaselineManager:
                     cwd=cwd,
                     env=env,
                     timeout=cmd.timeout_ms / 1000,
-                    check=False  # Don't raise on non-zero exit
+                    check=False,  # Don't raise on non-zero exit
+                    spill_dir=self._log_dir(task_id),
+                    spill_name=cmd.id
                 )
-                attempt_duration = int((time.time() - attempt_start) * 1000)
+                return self._completed_result(cmd, result, attempt_start, attempt, cache_key)
 
-                success = result.returncode in cmd.expected_exit_codes
+            except Exception as e:
+                failure = self._failed_attempt_result(cmd, e, start_time, attempt)
+                if failure is not None:
+                    return failure
+                # Retry after backoff
+                time.sleep(retry_policy.backoff_ms / 1000)
 
-                return {
-                    "success": success,
-                    "exit_code": result.returncode,
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
-                    "skipped": False,
-                    "skip_reason": None,
-                    "duration_ms": attempt_duration,
-                    "attempts": attempt + 1
-                }
+        return self._retry_exhausted_result(cmd, start_time)
 
-            except Exception as e:
-                # Check if timeout
-                if "timeout" in str(e).lower() or "TimeoutExceeded" in type(e).__name__:
-                    if attempt < retry_policy.max_attempts - 1:
-                        # Retry after backoff
-                        time.sleep(retry_policy.backoff_ms / 1000)
-                        continue
-
-                    # Final timeout
-                    total_duration = int((time.time() - start_time) * 1000)
-                    return {
-                        "success": False,
-                        "exit_code": -1,
-                        "stdout": "",
-                        "stderr": f"Command timed out after {cmd.timeout_ms}ms",
-                        "skipped": False,
-                        "skip_reason": None,
-                        "duration_ms": total_duration,
-                        "attempts": attempt + 1,
-                        "timeout": True
-                    }
-                else:
-                    # Unexpected error
-                    total_duration = int((time.time() - start_time) * 1000)
-                    return {
-                        "success": False,
-                        "exit_code": -1,
-                        "stdout": "",
-                        "stderr": f"Unexpected error: {str(e)}",
-                        "skipped": False,
-                        "skip_reason": None,
-                        "duration_ms": total_duration,
-                        "attempts": attempt + 1,
-                        "error": str(e)
-                    }
+    def _prepare_command(
+        self,
+        cmd: ValidationCommand
+    ) -> Tuple[Optional[Dict], Path, Dict[str, str], Optional[str]]:
+        """
+        Run pre-flight checks for a validation command.
 
+        Returns:
+            (early_result, cwd, env, cache_key); early_result is a skipped or
+            cached result to return without executing, otherwise None
+        """
+        cwd = self.repo_root / cmd.cwd
+
+        # 1. Check if blocked by another task
+        if cmd.blocker_id:
+            is_blocked, reason = self._check_blocker_status(cmd.blocker_id)
+            if is_blocked:
+                return _skipped_result(reason), cwd, {}, None
+
+        # 2. Verify expected paths exist
+        all_exist, missing = self._verify_expected_paths(cmd.expected_paths)
+        if not all_exist:
+            return _skipped_result(f"Expected path not found: {missing[0]}"), cwd, {}, None
+
+        # 3. Prepare environment
+        env = os.environ.copy()
+        env.update(cmd.env)
+
+        # 4. Change to working directory
+        if not cwd.exists():
+            return _skipped_result(f"Working directory does not exist: {cwd}"), cwd, env, None
+
+        # 5. Serve from QA result cache when inputs are unchanged
+        cache_key = self._result_cache.key_for(cmd) if self._result_cache else None
+        cached = self._result_cache.cached_execution(cache_key, cmd) if cache_key else None
+        if cached is not None:
+            return cached, cwd, env, cache_key
+
+        return None, cwd, env, cache_key
+
+    def _log_dir(self, task_id: str) -> Path:
+        """Directory receiving spilled output of the task's validation commands."""
+        return self.repo_root / ".agent-output" / task_id / QA_LOG_DIRNAME
+
+    def _log_handle(self, output: SpilledOutput) -> Dict:
+        """Result-dict form of a spilled stream (path relative to the repo root)."""
+        try:
+            path = str(output.path.relative_to(self.repo_root))
+        except ValueError:
+            path = str(output.path)
+        return {
+            "path": path,
+            "size": output.size,
+            "sha256": output.sha256,
+            "truncated": output.truncated,
+        }
+
+    def _completed_result(
+        self,
+        cmd: ValidationCommand,
+        result,
+        attempt_start: float,
+        attempt: int,
+        cache_key: Optional[str]
+    ) -> Dict:
+        """Build the result of an attempt that ran to completion (and cache it)."""
+        attempt_duration = int((time.time() - attempt_start) * 1000)
+
+        execution = {
+            "success": result.returncode in cmd.expected_exit_codes,
+            "exit_code": result.returncode,
+            "stdout": _output_text(result.stdout),
+            "stderr": _output_text(result.stderr),
+            "skipped": False,
+            "skip_reason": None,
+            "duration_ms": attempt_duration,
+            "attempts": attempt + 1
+        }
+        for name in ("stdout", "stderr"):
+            output = getattr(result, name)
+            if isinstance(output, SpilledOutput):
+                execution[f"{name}_log"] = self._log_handle(output)
+        if cache_key:
+            execution.update(self._result_cache.record_execution(
+                cache_key, cmd, result, attempt_duration
+            ))
+        return execution
+
+    def _failed_attempt_result(
+        self,
+        cmd: ValidationCommand,
+        error: Exception,
+        start_time: float,
+        attempt: int
+    ) -> Optional[Dict]:
+        """Build the result for an attempt that raised, or None to retry it."""
+        # Check if timeout
+        if "timeout" in str(error).lower() or "TimeoutExceeded" in type(error).__name__:
+            if attempt < cmd.retry_policy.max_attempts - 1:
+                return None
+
+            # Final timeout
+            total_duration = int((time.time() - start_time) * 1000)
+            return {
+                "success": False,
+                "exit_code": -1,
+                "stdout": "",
+                "stderr": f"Command timed out after {cmd.timeout_ms}ms",
+                "skipped": False,
+                "skip_reason": None,
+                "duration_ms": total_duration,
+                "attempts": attempt + 1,
+                "timeout": True
+            }
+
+        # Unexpected error
+        total_duration = int((time.time() - start_time) * 1000)
+        return {
+            "success": False,
+            "exit_code": -1,
+            "stdout": "",
+            "stderr": f"Unexpected error: {str(error)}",
+            "skipped": False,
+            "skip_reason": None,
+            "duration_ms": total_duration,
+            "attempts": attempt + 1,
+            "error": str(error)
+        }
+
+    @staticmethod
+    def _retry_exhausted_result(cmd: ValidationCommand, start_time: float) -> Dict:
         # Should never reach here
         return {
             "success": False,
@@ -199,7 +279,7 @@ class QABaselineManager:
             "skipped": False,
             "skip_reason": None,
             "duration_ms": int((time.time() - start_time) * 1000),
-            "attempts": retry_policy.max_attempts
+            "attempts": cmd.retry_policy.max_attempts
         }
 
     def detect_drift(self, baseline: QAResults, current: QAResults) -> Dict:
@@ -405,18 +485,7 @@ class QABaselineManager:
             - is_blocked: True if blocker is active (not completed)
             - reason: Human-readable reason string
         """
-        from ..datastore import TaskDatastore
-        ds = TaskDatastore(self.repo_root)
-        tasks = ds.load_tasks()
-        blocker_task = next((t for t in tasks if t.id == blocker_id), None)
-
-        if blocker_task is None:
-            return False, f"Blocker {blocker_id} not found"
-
-        if blocker_task.status != "completed":
-            return True, f"Blocked by {blocker_id} (status: {blocker_task.status})"
-
-        return False, ""
+        return check_blocker_status(blocker_id, self.repo_root)
 
     def _verify_expected_paths(self, patterns: list[str]) -> tuple[bool, list[str]]:
         """
@@ -429,14 +498,13 @@ class QABaselineManager:
             Tuple of (all_exist, missing_patterns):
             - all_exist: True if all patterns have at least one match
             - missing_patterns: List of patterns that had no matches
-        """
-        missing = []
-        for pattern in patterns:
-            matches = list(self.repo_root.glob(pattern))
-            if not matches:
-                missing.append(pattern)
 
-        return len(missing) == 0, missing
+        Inside execute_commands() the batch shares one directory index.
+        """
+        if not patterns:
+            return True, []
+        report = check_expected_paths(patterns, self.repo_root, self._path_checker)
+        return report.all_exist, report.missing
 
 
 # Standalone functions for backward compatibility
@@ -445,7 +513,8 @@ class QABaselineManager:
 def execute_validation_command(
     cmd: ValidationCommand,
     task_id: str,
-    repo_root: Path
+    repo_root: Path,
+    use_cache: Optional[bool] = None,
 ) -> Dict:
     """
     Execute validation command with pre-flight checks.
@@ -457,11 +526,13 @@ def execute_validation_command(
         cmd: ValidationCommand to execute
         task_id: Task ID for context
         repo_root: Repository root path
+        use_cache: Use the QA result cache (None defers to TASKS_QA_CACHE)
 
     Returns:
         Command execution result dict
     """
-    manager = QABaselineManager(repo_root)
+    result_cache = QAResultCache(repo_root) if qa_cache_enabled(use_cache) else None
+    manager = QABaselineManager(repo_root, result_cache=result_cache)
     return manager.execute_command(cmd, task_id)
 
 
@@ -500,3 +571,24 @@ def format_drift_report(drift: Dict) -> str:
     # Use a dummy repo_root since formatting doesn't need it
     manager = QABaselineManager(Path.cwd())
     return manager.format_drift_report(drift)
+
+
+def _skipped_result(reason: str) -> Dict:
+    """Result of a validation command skipped by a pre-flight check."""
+    return {
+        "success": False,
+        "exit_code": None,
+        "stdout": "",
+        "stderr": "",
+        "skipped": True,
+        "skip_reason": reason,
+        "duration_ms": 0,
+        "attempts": 0
+    }
+
+
+def _output_text(output) -> str:
+    """Text for a result dict: the captured string or a spilled stream's preview."""
+    if isinstance(output, SpilledOutput):
+        return output.preview
+    return output or ""
@@ -0,0 +1,473 @@
+"""
+QA result cache for validation commands.
+
+The implementer, reviewer and validator agents routinely re-run the same
+validation commands (``pnpm lint``, ``pnpm test``) against an unchanged
+worktree. This module lets them share one execution: results are keyed on
+the command and a content fingerprint of its inputs, and a hit returns the
+stored exit code, log path and parsed QACommandSummary without executing.
+
+Cache key (SHA256 over):
+- command string, cwd and the command's explicit env overrides
+- git tree hash of the command's cwd at HEAD (GitProvider.get_tree_hash)
+- checksums of uncommitted files under cwd
+
+Caching is opt-in (TASKS_QA_CACHE=1 or ``run-validation --cache``) and
+``--no-cache`` always bypasses it. Entries live under
+``.agent-output/.qa-cache/`` and are evicted by age and LRU entry count.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from ..file_modes import match_target_mode
+from ..models import ValidationCommand
+from ..providers import GitProvider, SpilledOutput
+from ..providers.git import scope_pathspecs
+from .models import QACommandResult
+from .runtime import RuntimeHelper
+
+QA_CACHE_ENV_VAR = "TASKS_QA_CACHE"
+QA_CACHE_DIRNAME = ".qa-cache"
+DEFAULT_MAX_ENTRIES = 200
+DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+def qa_cache_enabled(use_cache: Optional[bool] = None) -> bool:
+    """
+    Resolve whether QA result caching is active.
+
+    Args:
+        use_cache: Explicit CLI choice (--cache/--no-cache); None defers to env
+
+    Returns:
+        True if caching should be used for this invocation
+    """
+    if use_cache is not None:
+        return use_cache
+    return os.environ.get(QA_CACHE_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+class QAResultCache:
+    """
+    Content-addressed cache of validation command results.
+
+    Each entry is a JSON file ``<key>.json`` holding a QACommandResult and
+    its creation time; the combined stdout/stderr log
+    is stored alongside as ``<key>.log``. File mtimes double as LRU access
+    times (touched on every hit).
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        git_provider=None,
+        clock=None,
+    ):
+        """
+        Initialize QA result cache.
+
+        Args:
+            repo_root: Repository root path
+            cache_dir: Cache directory (defaults to .agent-output/.qa-cache)
+            max_entries: Maximum number of entries kept after eviction
+            max_age_seconds: Entries older than this are treated as misses
+            git_provider: Optional GitProvider instance (defaults to new instance)
+            clock: Optional clock for testing (defaults to time module)
+        """
+        self.repo_root = Path(repo_root)
+        self.cache_dir = cache_dir or (self.repo_root / ".agent-output" / QA_CACHE_DIRNAME)
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self.clock = clock or time
+        self._git_provider = git_provider or GitProvider(self.repo_root)
+        self._runtime = RuntimeHelper(
+            self.repo_root, self.cache_dir.parent, git_provider=self._git_provider
+        )
+
+    # ========================================================================
+    # Keys and Fingerprints
+    # ========================================================================
+
+    def fingerprint(self, cmd: ValidationCommand) -> Optional[str]:
+        """
+        Fingerprint the inputs of a validation command.
+
+        Combines the committed tree hash of the command's cwd with checksums
+        of uncommitted files below it.
+
+        Args:
+            cmd: Validation command
+
+        Returns:
+            SHA256 hex digest, or None if the worktree cannot be fingerprinted
+            (e.g. not a git repository) - such commands are never cached
+        """
+        scope = cmd.cwd or "."
+        try:
+            try:
+                tree_hash = self._git_provider.get_tree_hash(scope)
+            except Exception:
+                # Directory not committed yet - dirty checksums cover it
+                tree_hash = "untracked"
+            dirty = self.dirty_file_checksums([scope])
+        except Exception:
+            return None
+
+        payload = json.dumps({"tree": tree_hash, "dirty": dirty}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def key_for(self, cmd: ValidationCommand) -> Optional[str]:
+        """
+        Compute the cache key for a validation command.
+
+        Only the command's explicit env overrides participate in the key;
+        the inherited process environment varies per shell and agent.
+
+        Args:
+            cmd: Validation command
+
+        Returns:
+            SHA256 hex digest, or None if the command is not cacheable
+        """
+        fingerprint = self.fingerprint(cmd)
+        if fingerprint is None:
+            return None
+
+        payload = json.dumps({
+            "command": cmd.command,
+            "cwd": cmd.cwd,
+            "env": dict(sorted(cmd.env.items())),
+            "inputs": fingerprint,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def dirty_file_checksums(self, repo_paths: List[str]) -> Dict[str, str]:
+        """
+        Checksum uncommitted files (modified, staged or untracked) within scope.
+
+        Fingerprints the working-tree delta on top of the committed tree.
+        Deleted files map to 'deleted'.
+
+        Args:
+            repo_paths: Path prefixes defining the scope ('.' matches everything)
+
+        Returns:
+            Dict of repo-relative path -> SHA256 hex digest, sorted by path
+        """
+        status_result = self._git_provider.status(
+            include_untracked=True,
+            pathspecs=scope_pathspecs(repo_paths),
+        )
+
+        prefixes = [p.rstrip('/') for p in repo_paths]
+        checksums: Dict[str, str] = {}
+
+        for path in sorted(status_result['files']):
+            if path.startswith('.agent-output/'):
+                continue
+            if not any(
+                prefix == '.' or path == prefix or path.startswith(prefix + '/')
+                for prefix in prefixes
+            ):
+                continue
+
+            file_path = self.repo_root / path
+            if file_path.is_file():
+                checksums[path] = _file_sha256(file_path)
+            elif not file_path.exists():
+                checksums[path] = 'deleted'
+
+        return checksums
+
+    # ========================================================================
+    # Lookup and Storage
+    # ========================================================================
+
+    def cached_execution(self, key: str, cmd: ValidationCommand) -> Optional[Dict]:
+        """
+        Serve an execute_command() result from the cache.
+
+        Args:
+            key: Cache key from key_for()
+            cmd: Validation command being executed
+
+        Returns:
+            Result dict (not executed, zero attempts), or None on miss
+        """
+        cached = self.get(key)
+        if cached is None:
+            return None
+        return {
+            "success": cached.exit_code in cmd.expected_exit_codes,
+            "exit_code": cached.exit_code,
+            "stdout": "",
+            "stderr": "",
+            "skipped": False,
+            "skip_reason": None,
+            "duration_ms": 0,
+            "attempts": 0,
+            **cached_result_fields(cached, cached=True),
+        }
+
+    def record_execution(self, key: str, cmd: ValidationCommand, result, duration_ms: int) -> Dict:
+        """
+        Cache a completed execution.
+
+        Args:
+            key: Cache key from key_for()
+            cmd: Validation command that was executed
+            result: Process result (returncode, stdout, stderr)
+            duration_ms: Execution time in milliseconds
+
+        Returns:
+            Extra execute_command() result fields (see cached_result_fields)
+        """
+        stored = self.put(key, cmd, result.returncode, duration_ms, result.stdout, result.stderr)
+        return cached_result_fields(stored, cached=False)
+
+
+    def get(self, key: str) -> Optional[QACommandResult]:
+        """
+        Look up a cached result.
+
+        Expired or corrupt entries are removed and reported as misses.
+
+        Args:
+            key: Cache key from key_for()
+
+        Returns:
+            Cached QACommandResult, or None on miss
+        """
+        entry_path = self._entry_path(key)
+        if not entry_path.exists():
+            return None
+
+        try:
+            data = json.loads(entry_path.read_text(encoding="utf-8"))
+            created_ts = datetime.fromisoformat(data["created_at"]).timestamp()
+            result = QACommandResult.from_dict(data["result"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self._remove(key)
+            return None
+
+        if self.clock.time() - created_ts > self.max_age_seconds:
+            self._remove(key)
+            return None
+
+        if result.log_path and not (self.repo_root / result.log_path).exists():
+            self._remove(key)
+            return None
+
+        # Touch entry so eviction keeps recently used results
+        now = self.clock.time()
+        os.utime(entry_path, (now, now))
+        return result
+
+    def put(
+        self,
+        key: str,
+        cmd: ValidationCommand,
+        exit_code: int,
+        duration_ms: int,
+        stdout: Union[str, SpilledOutput],
+        stderr: Union[str, SpilledOutput],
+    ) -> QACommandResult:
+        """
+        Store a freshly executed result, then evict stale entries.
+
+        Writes the combined output log, parses it into a QACommandSummary and
+        records both atomically.
+
+        Args:
+            key: Cache key from key_for()
+            cmd: Validation command that was executed
+            exit_code: Process exit code
+            duration_ms: Execution time in milliseconds
+            stdout: Captured standard output (text or spilled log handle)
+            stderr: Captured standard error (text or spilled log handle)
+
+        Returns:
+            QACommandResult that was cached
+        """
+        # Lazy import: qa_parsing imports the context_store package
+        from ..qa_parsing import infer_command_type, parse_qa_log
+
+        log_path = self._log_path(key)
+        log_sha256 = _write_combined_log(log_path, (stdout, stderr))
+
+        summary = parse_qa_log(log_path, infer_command_type(cmd.command))
+        result = QACommandResult(
+            command_id=cmd.id,
+            command=cmd.command,
+            exit_code=exit_code,
+            duration_ms=duration_ms,
+            log_path=self._display_path(log_path),
+            log_sha256=log_sha256,
+            summary=summary if summary.to_dict() else None,
+        )
+
+        now = self.clock.time()
+        entry = {
+            "key": key,
+            "created_at": datetime.fromtimestamp(now, tz=timezone.utc).isoformat(),
+            "result": result.to_dict(),
+        }
+        entry_path = self._entry_path(key)
+        self._runtime.atomic_write(entry_path, json.dumps(entry, indent=2))
+        os.utime(entry_path, (now, now))
+
+        self.evict()
+        return result
+
+    def evict(self) -> int:
+        """
+        Apply the eviction policy.
+
+        Drops entries older than max_age_seconds, then the least recently
+        used entries beyond max_entries.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        entries = []
+        for entry_path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((entry_path.stat().st_mtime, entry_path.stem))
+            except FileNotFoundError:
+                continue
+
+        now = self.clock.time()
+        entries.sort(reverse=True)  # Most recently used first
+
+        removed = 0
+        for index, (mtime, key) in enumerate(entries):
+            if index >= self.max_entries or now - mtime > self.max_age_seconds:
+                self._remove(key)
+                removed += 1
+
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every cache entry.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        keys = [entry_path.stem for entry_path in self.cache_dir.glob("*.json")]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    # ========================================================================
+    # Helpers
+    # ========================================================================
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _log_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.log"
+
+    def _display_path(self, path: Path) -> str:
+        try:
+            return str(path.relative_to(self.repo_root))
+        except ValueError:
+            return str(path)
+
+    def _remove(self, key: str) -> None:
+        for path in (self._entry_path(key), self._log_path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA256 hex digest of a file, read in chunks."""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(8192), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class _HashingWriter:
+    """Binary file wrapper hashing everything written through it."""
+
+    def __init__(self, f):
+        self._file = f
+        self.hash = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.hash.update(data)
+        return self._file.write(data)
+
+
+def _write_combined_log(path: Path, parts: Iterable[Union[str, SpilledOutput, None]]) -> str:
+    """
+    Atomically write stdout then stderr to one log, streaming spilled logs.
+
+    Args:
+        path: Target log path
+        parts: Captured text or spilled log handles (None is skipped)
+
+    Returns:
+        SHA256 hex digest of the written log
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer = _HashingWriter(f)
+            for part in parts:
+                if isinstance(part, SpilledOutput):
+                    with open(part.path, "rb") as src:
+                        shutil.copyfileobj(src, writer)
+                elif part:
+                    writer.write(part.encode("utf-8"))
+        match_target_mode(temp_path, path)
+        os.replace(temp_path, path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return writer.hash.hexdigest()
+
+
+def cached_result_fields(result: QACommandResult, cached: bool) -> Dict:
+    """
+    Extra execute_command() result fields describing a cached QA result.
+
+    Args:
+        result: Cached or freshly stored QACommandResult
+        cached: True if served from cache without executing
+
+    Returns:
+        Dict with cached flag, log_path, log_sha256 and summary
+    """
+    return {
+        "cached": cached,
+        "log_path": result.log_path,
+        "log_sha256": result.log_sha256,
+        "summary": result.summary.to_dict() if result.summary else {},
+    }
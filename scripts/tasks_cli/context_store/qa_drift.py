@@ -0,0 +1,353 @@
+"""
+Bulk QA drift detection across task contexts.
+
+QABaselineManager.detect_drift compares one QAResults pair field by field.
+Release gating needs the same answer for every active task at once, so
+this module loads the QA results stored in all contexts into one columnar
+table - one row per (task, stage, command), one float column per metric,
+NaN for "not reported" - and evaluates each drift rule as a single pass
+over aligned columns instead of per-field branches per pair.
+
+Stages, in hand-off order:
+
+- baseline: ValidationBaseline.initial_results (QAResults format)
+- implementer, reviewer, validator: coordination qa_results, either in
+  QAResults format or as recorded by record-qa (one parsed summary, keyed
+  by its command_type)
+
+Each stage's result for a command is compared with the nearest earlier
+stage that reported the same command. The rules are those of detect_drift:
+exit code 0 -> non-zero, more lint/type errors or failed tests, and
+coverage (lines/branches) moving by more than one percentage point.
+"""
+
+import math
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..telemetry import get_tracer
+from .storage import AGENT_ROLES, ContextStorage
+
+_tracer = get_tracer(__name__)
+
+BASELINE_STAGE = "baseline"
+DRIFT_STAGES: Tuple[str, ...] = (BASELINE_STAGE,) + AGENT_ROLES
+
+_NAN = math.nan
+
+
+@dataclass(frozen=True)
+class _Metric:
+    """One drift rule over a metric column."""
+    column: str
+    regression: str
+    improvement: str
+    tolerance: float       # Changes up to this size are not drift
+    direction: int         # +1: higher is worse (error counts), -1: higher is better
+    severity: str
+    integer: bool
+
+
+DRIFT_METRICS: Tuple[_Metric, ...] = (
+    _Metric("lint_errors", "lint_errors_increased", "lint_errors_decreased", 0.0, 1, "error", True),
+    _Metric("type_errors", "type_errors_increased", "type_errors_decreased", 0.0, 1, "error", True),
+    _Metric("tests_failed", "tests_failed_increased", "tests_failed_decreased", 0.0, 1, "error", True),
+    _Metric("coverage_lines", "coverage_lines_dropped", "coverage_lines_improved", 1.0, -1, "warning", False),
+    _Metric("coverage_branches", "coverage_branches_dropped", "coverage_branches_improved", 1.0, -1, "warning", False),
+)
+
+METRIC_COLUMNS: Tuple[str, ...] = ("exit_code",) + tuple(metric.column for metric in DRIFT_METRICS)
+
+
+def _number(value) -> float:
+    return _NAN if value is None else float(value)
+
+
+class QADriftTable:
+    """Columnar QA results: one row per (task, stage, command).
+
+    Tasks and commands are interned to integer codes; metric columns are
+    float arrays aligned with the task/stage/command code columns.
+    """
+
+    def __init__(self):
+        self.task_ids: List[str] = []
+        self.command_ids: List[str] = []
+        self._task_codes: Dict[str, int] = {}
+        self._command_codes: Dict[str, int] = {}
+        self.task = array("l")
+        self.stage = array("b")
+        self.command = array("l")
+        self.columns: Dict[str, array] = {name: array("d") for name in METRIC_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.task)
+
+    @classmethod
+    def from_storage(
+        cls,
+        storage: ContextStorage,
+        task_ids: Optional[Iterable[str]] = None,
+    ) -> 'QADriftTable':
+        """
+        Load QA results from stored contexts.
+
+        Args:
+            storage: Context storage backend
+            task_ids: Tasks to load (default: every stored context, i.e. all
+                active tasks - contexts are purged on completion)
+
+        Returns:
+            QADriftTable with every stage of every task
+        """
+        table = cls()
+        for task_id in (storage.list_task_ids() if task_ids is None else task_ids):
+            data = storage.read_context(task_id)
+            if data is not None:
+                table.add_context(task_id, data)
+        return table
+
+    def add_context(self, task_id: str, data: dict) -> None:
+        """
+        Add every stage of one context (TaskContext.to_dict format).
+
+        Args:
+            task_id: Task identifier
+            data: Context dict
+        """
+        baseline = (data.get("immutable") or {}).get("validation_baseline") or {}
+        initial = baseline.get("initial_results")
+        if isinstance(initial, dict):
+            self.add_results(task_id, BASELINE_STAGE, initial.get("results") or [])
+
+        coordination = data.get("coordination") or {}
+        for role in AGENT_ROLES:
+            qa_results = (coordination.get(role) or {}).get("qa_results")
+            if not isinstance(qa_results, dict):
+                continue
+            if "results" in qa_results:
+                self.add_results(task_id, role, qa_results["results"] or [])
+            elif qa_results.get("summary") is not None:
+                # record-qa format: one parsed log, no exit code
+                self.add_results(task_id, role, [{
+                    "command_id": qa_results.get("command_type") or "unknown",
+                    "summary": qa_results["summary"],
+                }])
+
+    def add_results(self, task_id: str, stage: str, results: Sequence[dict]) -> None:
+        """
+        Add one stage's command results (QACommandResult.to_dict format).
+
+        Args:
+            task_id: Task identifier
+            stage: One of DRIFT_STAGES
+            results: Command result dicts; missing fields become NaN
+        """
+        task_code = self._task_codes.get(task_id)
+        if task_code is None:
+            task_code = self._task_codes[task_id] = len(self.task_ids)
+            self.task_ids.append(task_id)
+        stage_code = DRIFT_STAGES.index(stage)
+
+        columns = self.columns
+        exit_codes = columns["exit_code"].append
+        lint_errors = columns["lint_errors"].append
+        type_errors = columns["type_errors"].append
+        tests_failed = columns["tests_failed"].append
+        coverage_lines = columns["coverage_lines"].append
+        coverage_branches = columns["coverage_branches"].append
+        for result in results:
+            command_id = result["command_id"]
+            command_code = self._command_codes.get(command_id)
+            if command_code is None:
+                command_code = self._command_codes[command_id] = len(self.command_ids)
+                self.command_ids.append(command_id)
+
+            # detect_drift only compares metrics when both sides have a summary
+            summary = result.get("summary") or {}
+            coverage = summary.get("coverage") or {}
+            self.task.append(task_code)
+            self.stage.append(stage_code)
+            self.command.append(command_code)
+            exit_codes(_number(result.get("exit_code")))
+            lint_errors(_number(summary.get("lint_errors")))
+            type_errors(_number(summary.get("type_errors")))
+            tests_failed(_number(summary.get("tests_failed")))
+            coverage_lines(_number(coverage.get("lines")))
+            coverage_branches(_number(coverage.get("branches")))
+
+    def comparison_pairs(self) -> Tuple[List[int], List[int]]:
+        """
+        Align each row with the row it is compared against.
+
+        Rows are ordered by (task, command, stage); within a (task, command)
+        group every row is paired with its predecessor. When a stage
+        reported a command twice, the later row wins (as in detect_drift).
+
+        Returns:
+            (baseline rows, current rows) as parallel index lists
+        """
+        stages = len(DRIFT_STAGES)
+        commands = max(len(self.command_ids), 1)
+        keys = [
+            (task * commands + command) * stages + stage
+            for task, command, stage in zip(self.task, self.command, self.stage)
+        ]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        # Keep the last row of each (task, command, stage)
+        order = [
+            row for row, following in zip(order, order[1:] + [None])
+            if following is None or keys[following] != keys[row]
+        ]
+        base_rows: List[int] = []
+        current_rows: List[int] = []
+        for previous, row in zip(order, order[1:]):
+            if keys[previous] // stages == keys[row] // stages:
+                base_rows.append(previous)
+                current_rows.append(row)
+        return base_rows, current_rows
+
+
+def detect_bulk_drift(table: QADriftTable) -> Dict:
+    """
+    Evaluate every drift rule over all comparison pairs of a table.
+
+    Args:
+        table: Loaded QADriftTable
+
+    Returns:
+        Consolidated report:
+            {
+                has_drift: bool,
+                task_count, row_count, comparison_count: int,
+                regressions: List[dict],
+                improvements: List[dict],
+                regression_counts: {type: count},
+                improvement_counts: {type: count},
+                tasks_with_drift: List[str]
+            }
+        Entries carry task_id, agent, compared_to, command_id, type,
+        baseline, current and (except exit code regressions) delta and
+        severity as in detect_drift.
+    """
+    with _tracer.start_as_current_span("cli.qa.bulk_drift") as span:
+        base_rows, current_rows = table.comparison_pairs()
+
+        rule_count = len(DRIFT_METRICS) + 1   # Rule 0: exit code, rule i: DRIFT_METRICS[i - 1]
+        pair_count = len(base_rows)
+        # Hits are encoded as pair * rule_count + rule, so sorting them yields
+        # (task, command, stage) order with rules in detect_drift order per pair
+        regression_hits: List[int] = []
+        improvement_hits: List[int] = []
+
+        exit_codes = table.columns["exit_code"]
+        base = [exit_codes[i] for i in base_rows]
+        current = [exit_codes[i] for i in current_rows]
+        # NaN (no exit code recorded) is != 0, so the current side needs an explicit check
+        regression_hits.extend(
+            k * rule_count for k, b, c in zip(range(pair_count), base, current)
+            if b == 0 and c != 0 and not math.isnan(c)
+        )
+
+        for rule, metric in enumerate(DRIFT_METRICS, start=1):
+            column = table.columns[metric.column]
+            direction = metric.direction
+            tolerance = metric.tolerance
+            # Signed change, positive = worse; NaN on either side compares False below
+            change = [(column[j] - column[i]) * direction for i, j in zip(base_rows, current_rows)]
+            regression_hits.extend(k * rule_count + rule for k, d in enumerate(change) if d > tolerance)
+            improvement_hits.extend(k * rule_count + rule for k, d in enumerate(change) if d < -tolerance)
+
+        regression_hits.sort()
+        improvement_hits.sort()
+
+        def entries(hits: List[int], regression: bool) -> List[dict]:
+            items = []
+            for hit in hits:
+                k, rule = divmod(hit, rule_count)
+                base_row, row = base_rows[k], current_rows[k]
+                item = {
+                    "task_id": table.task_ids[table.task[row]],
+                    "agent": DRIFT_STAGES[table.stage[row]],
+                    "compared_to": DRIFT_STAGES[table.stage[base_row]],
+                    "command_id": table.command_ids[table.command[row]],
+                }
+                if rule == 0:
+                    item.update(type="exit_code_regression", baseline=0,
+                                current=int(exit_codes[row]), severity="error")
+                else:
+                    metric = DRIFT_METRICS[rule - 1]
+                    convert = int if metric.integer else float
+                    before, after = table.columns[metric.column][base_row], table.columns[metric.column][row]
+                    item.update(
+                        type=metric.regression if regression else metric.improvement,
+                        baseline=convert(before),
+                        current=convert(after),
+                        delta=convert(abs(after - before)),
+                    )
+                    if regression:
+                        item["severity"] = metric.severity
+                items.append(item)
+            return items
+
+        regressions = entries(regression_hits, True)
+        improvements = entries(improvement_hits, False)
+        report = {
+            "has_drift": bool(regressions),
+            "task_count": len(table.task_ids),
+            "row_count": len(table),
+            "comparison_count": pair_count,
+            "regressions": regressions,
+            "improvements": improvements,
+            "regression_counts": _count_types(regressions),
+            "improvement_counts": _count_types(improvements),
+            "tasks_with_drift": sorted({item["task_id"] for item in regressions}),
+        }
+
+        span.set_attribute("task_count", report["task_count"])
+        span.set_attribute("row_count", report["row_count"])
+        span.set_attribute("comparison_count", report["comparison_count"])
+        span.set_attribute("regression_count", len(report["regressions"]))
+        span.set_attribute("improvement_count", len(report["improvements"]))
+        return report
+
+
+def _count_types(items: List[dict]) -> Dict[str, int]:
+    return dict(sorted(Counter(item["type"] for item in items).items()))
+
+
+def format_bulk_drift_report(report: Dict) -> str:
+    """
+    Format a bulk drift report as human-readable text.
+
+    Args:
+        report: Output from detect_bulk_drift()
+
+    Returns:
+        Formatted string report
+    """
+    lines = [
+        f"QA drift across {report['task_count']} task(s) "
+        f"({report['comparison_count']} comparison(s))"
+    ]
+    if not report["has_drift"]:
+        lines.append("✓ No regressions detected")
+    else:
+        lines.append(
+            f"⚠ {len(report['regressions'])} regression(s) in "
+            f"{len(report['tasks_with_drift'])} task(s):"
+        )
+        for reg in report["regressions"]:
+            symbol = "✖" if reg.get("severity") == "error" else "⚠"
+            where = f"{reg['task_id']} {reg['agent']} vs {reg['compared_to']}"
+            change = f"baseline: {reg['baseline']}, current: {reg['current']}"
+            if "delta" in reg:
+                change += f", Δ{reg['delta']}"
+            lines.append(f"  {symbol} {where} {reg['command_id']}: {reg['type']} ({change})")
+
+    if report["improvements"]:
+        counts = ", ".join(f"{name}: {count}" for name, count in report["improvement_counts"].items())
+        lines.append(f"✓ {len(report['improvements'])} improvement(s) ({counts})")
+    return "\n".join(lines)
@@ -21,6 +21,9 @@ from typing import Any, List, Optional
 
 from ..exceptions import ValidationError
 from ..providers import GitProvider
+from ..telemetry import get_tracer
+
+_tracer = get_tracer(__name__)
 
 
 # ============================================================================
@@ -203,7 +206,9 @@ class RuntimeHelper:
                         return result
             return None
 
-        matched_pattern = scan_value(data)
+        with _tracer.start_as_current_span("cli.context.scan_secrets") as span:
+            matched_pattern = scan_value(data)
+            span.set_attribute("matched", matched_pattern is not None)
         if matched_pattern:
             raise ValidationError(
                 f"Potential secret detected (pattern: {matched_pattern}). "
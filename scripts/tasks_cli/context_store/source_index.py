@@ -0,0 +1,223 @@
+"""
+Shared cache of context source files (standards and checklists).
+
+Context initialization reads the same standards files and checklists for
+every task. SourceFileIndex reads each file once per (mtime, size), keeps
+its bytes and SHA256, and memoizes markdown section lookups and excerpt
+normalization, so initializing contexts for a batch of tasks parses each
+standards file once.
+
+Entries are re-validated with a stat() on every lookup, so edits made
+while the index is alive are picked up.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Requirement summaries are capped per schema §7 (StandardsCitation.requirement)
+REQUIREMENT_MAX_CHARS = 140
+
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+
+
+class ExcerptBody(NamedTuple):
+    """Normalized section content of a standards file."""
+    content: str            # Normalized section body (heading excluded)
+    content_sha256: str     # SHA256 of content
+    line_span: str          # 1-based span of the body, e.g. "L5-L12"
+    requirement: str        # First sentence (<= REQUIREMENT_MAX_CHARS)
+
+
+def normalize_heading(heading: str) -> str:
+    """Normalize a heading for comparison ("Edge & Layer" == "edge-and-layer")."""
+    return heading.strip().lower().replace(' ', '-').replace('&', 'and')
+
+
+def find_section_boundaries(lines: List[str], heading: str) -> Optional[Tuple[int, int]]:
+    """
+    Find a markdown section's body (0-based [start, end) line range).
+
+    The section starts after the heading line and ends at the next heading
+    of the same or a higher level (or EOF).
+
+    Args:
+        lines: File content split on newlines
+        heading: Section heading (any normalization-equivalent form)
+
+    Returns:
+        (start, end) tuple, or None if the heading is not found
+    """
+    target = normalize_heading(heading)
+    section_start = None
+    current_level = None
+
+    for i, line in enumerate(lines):
+        heading_match = _HEADING_RE.match(line)
+        if not heading_match:
+            continue
+        level = len(heading_match.group(1))
+        if section_start is None:
+            if normalize_heading(heading_match.group(2)) == target:
+                section_start = i + 1
+                current_level = level
+        elif level <= current_level:
+            return (section_start, i)
+
+    if section_start is None:
+        return None
+    return (section_start, len(lines))
+
+
+class SourceEntry:
+    """One source file's content with memoized section excerpts."""
+
+    __slots__ = ('content', 'sha256', '_lines', '_excerpts')
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.sha256 = hashlib.sha256(content).hexdigest()
+        self._lines: Optional[List[str]] = None
+        self._excerpts: Dict[str, Optional[ExcerptBody]] = {}
+
+    @property
+    def lines(self) -> List[str]:
+        """Content decoded as UTF-8 and split on newlines."""
+        if self._lines is None:
+            self._lines = self.content.decode('utf-8').split('\n')
+        return self._lines
+
+    def excerpt(self, heading: str) -> Optional[ExcerptBody]:
+        """
+        Get the normalized body of a section.
+
+        Normalization (so hashes are stable across whitespace-only edits):
+        trailing whitespace stripped, runs of blank lines collapsed, leading
+        and trailing blank lines trimmed.
+
+        Args:
+            heading: Section heading
+
+        Returns:
+            ExcerptBody, or None if the section does not exist
+        """
+        key = normalize_heading(heading)
+        if key in self._excerpts:
+            return self._excerpts[key]
+
+        boundaries = find_section_boundaries(self.lines, heading)
+        body = None
+        if boundaries is not None:
+            body = _normalize_section(self.lines, *boundaries)
+        self._excerpts[key] = body
+        return body
+
+
+class SourceFileIndex:
+    """Thread-safe, stat-validated cache of repo files used as context sources."""
+
+    def __init__(self, repo_root: Path):
+        """
+        Initialize index.
+
+        Args:
+            repo_root: Repository root (source paths are relative to it)
+        """
+        self.repo_root = Path(repo_root)
+        self._entries: Dict[str, Tuple[Tuple[int, int], SourceEntry]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, relative_path: str) -> Optional[SourceEntry]:
+        """
+        Get a source file's cached entry.
+
+        Args:
+            relative_path: Path relative to the repository root
+
+        Returns:
+            SourceEntry, or None if the file does not exist
+        """
+        path = self.repo_root / relative_path
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._entries.get(relative_path)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            try:
+                entry = SourceEntry(path.read_bytes())
+            except OSError:
+                return None
+            self._entries[relative_path] = (key, entry)
+            return entry
+
+    def excerpt(self, relative_path: str, heading: str) -> Optional[ExcerptBody]:
+        """
+        Get a section excerpt from a source file.
+
+        Args:
+            relative_path: Markdown file relative to the repository root
+            heading: Section heading
+
+        Returns:
+            ExcerptBody, or None if the section does not exist
+
+        Raises:
+            FileNotFoundError: File does not exist
+        """
+        entry = self.get(relative_path)
+        if entry is None:
+            raise FileNotFoundError(f"Standards file not found: {relative_path}")
+        with self._lock:
+            return entry.excerpt(heading)
+
+
+def _normalize_section(lines: List[str], start: int, end: int) -> ExcerptBody:
+    """Normalize section lines [start, end) into an ExcerptBody."""
+    body: List[str] = []
+    first_line = last_line = None
+    for number, line in enumerate(lines[start:end], start=start + 1):
+        line = line.rstrip()
+        if not line:
+            if body and body[-1]:
+                body.append('')
+            continue
+        if first_line is None:
+            first_line = number
+        last_line = number
+        body.append(line)
+    if body and not body[-1]:
+        body.pop()
+
+    content = '\n'.join(body) + '\n' if body else ''
+    if first_line is None:
+        # Empty section: point at the heading line
+        first_line = last_line = start
+
+    return ExcerptBody(
+        content=content,
+        content_sha256=hashlib.sha256(content.encode('utf-8')).hexdigest(),
+        line_span=f"L{first_line}-L{last_line}",
+        requirement=_first_sentence(body),
+    )
+
+
+def _first_sentence(body: List[str]) -> str:
+    """First sentence of the first prose/bullet line, markdown markers stripped."""
+    for line in body:
+        text = re.sub(r'^\s*(?:[-*+]|\d+[.)])\s+', '', line)
+        text = text.replace('**', '').replace('`', '').strip()
+        if not text or _HEADING_RE.match(line):
+            continue
+        sentence = re.split(r'(?<=[.!?])\s', text, maxsplit=1)[0]
+        if len(sentence) > REQUIREMENT_MAX_CHARS:
+            sentence = sentence[:REQUIREMENT_MAX_CHARS - 3].rstrip() + '...'
+        return sentence
+    return ''
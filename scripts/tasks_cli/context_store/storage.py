@@ -0,0 +1,499 @@
+"""
+Storage backends for task context records.
+
+TaskContextService reads and writes three kinds of records through a
+ContextStorage backend:
+
+- the context (immutable snapshot + coordination + audit), one per task
+- per-agent coordination state, indexed for cross-task queries
+- the evidence index (attachment metadata; artifact files stay on disk)
+
+Backends:
+
+- FilesystemContextStorage (default): the original layout,
+  .agent-output/TASK-XXXX/context.json and evidence/index.json, written
+  atomically under the context store FileLock. Cross-task queries scan
+  every context.
+- SQLiteContextStorage: .agent-output/.contexts.sqlite3 in WAL mode (one
+  row per context plus coordination and evidence tables). Readers never
+  block, coordination updates are transactional, queries use indexes and
+  bulk migrations commit in one transaction.
+
+Diffs, snapshots, manifests and evidence artifacts remain files under
+.agent-output/TASK-XXXX/ with either backend. The backend is chosen with
+TASKS_CONTEXT_BACKEND ("filesystem" or "sqlite").
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, ContextManager, Iterator, List, Optional, Tuple
+
+from filelock import FileLock
+
+CONTEXT_BACKEND_ENV_VAR = "TASKS_CONTEXT_BACKEND"
+CONTEXT_BACKENDS = ("filesystem", "sqlite")
+SQLITE_STORE_FILENAME = ".contexts.sqlite3"
+SCHEMA_VERSION = 1
+
+AGENT_ROLES = ("implementer", "reviewer", "validator")
+
+# Lone surrogates left by surrogateescape decoding of git output
+_SURROGATES = re.compile("[\ud800-\udfff]")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contexts (
+    task_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    git_head TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS coordination (
+    task_id TEXT NOT NULL REFERENCES contexts (task_id) ON DELETE CASCADE,
+    agent_role TEXT NOT NULL,
+    status TEXT NOT NULL,
+    drift_budget INTEGER NOT NULL,
+    PRIMARY KEY (task_id, agent_role)
+);
+CREATE INDEX IF NOT EXISTS coordination_drift ON coordination (drift_budget);
+CREATE INDEX IF NOT EXISTS coordination_status ON coordination (agent_role, status);
+
+CREATE TABLE IF NOT EXISTS evidence (
+    task_id TEXT NOT NULL,
+    evidence_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (task_id, evidence_id)
+);
+"""
+
+
+class ContextStorage(ABC):
+    """
+    Interface for context record storage.
+
+    Reads never need a transaction. Read-modify-write sequences (e.g.
+    coordination updates, migrations) run inside transaction(), which is
+    exclusive and re-entrant within a thread.
+    """
+
+    @abstractmethod
+    def read_context(self, task_id: str) -> Optional[dict]:
+        """Get a context dict (TaskContext.to_dict format), or None."""
+
+    @abstractmethod
+    def write_context(self, task_id: str, data: dict) -> None:
+        """Create or replace a context."""
+
+    def context_exists(self, task_id: str) -> bool:
+        """Check whether a context exists."""
+        return self.read_context(task_id) is not None
+
+    @abstractmethod
+    def context_signature(self, task_id: str) -> Optional[Tuple[int, int]]:
+        """
+        Cheap change token for a context, or None if it does not exist.
+
+        Equal signatures mean the context was not rewritten in between, so
+        caches derived from it (e.g. the metrics store) can skip re-reading.
+        """
+
+    @abstractmethod
+    def delete_context(self, task_id: str) -> None:
+        """Delete a context and its evidence index (idempotent)."""
+
+    @abstractmethod
+    def list_task_ids(self) -> List[str]:
+        """Task IDs that have a context, sorted."""
+
+    def find_contexts(
+        self,
+        agent_role: Optional[str] = None,
+        status: Optional[str] = None,
+        min_drift_budget: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Find contexts by coordination state.
+
+        A context matches if any agent (or the given agent_role) matches
+        all given criteria.
+
+        Args:
+            agent_role: Restrict to one agent role
+            status: Coordination status to match
+            min_drift_budget: Minimum drift_budget (e.g. 1 for any drift)
+
+        Returns:
+            Sorted task IDs
+        """
+        roles = (agent_role,) if agent_role else AGENT_ROLES
+        matches = []
+        for task_id in self.list_task_ids():
+            data = self.read_context(task_id)
+            if data is None:
+                continue
+            coordination = data.get('coordination', {})
+            for role in roles:
+                if _coordination_matches(coordination.get(role, {}), status, min_drift_budget):
+                    matches.append(task_id)
+                    break
+        return matches
+
+    @abstractmethod
+    def read_evidence(self, task_id: str) -> List[dict]:
+        """Evidence attachment dicts for a task, in attachment order."""
+
+    @abstractmethod
+    def upsert_evidence(self, task_id: str, entries: List[dict]) -> None:
+        """Add evidence attachment dicts, replacing entries with the same id."""
+
+    @abstractmethod
+    def transaction(self) -> ContextManager[None]:
+        """Exclusive section for read-modify-write operations."""
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class FilesystemContextStorage(ContextStorage):
+    """Context records as JSON files under .agent-output/TASK-XXXX/."""
+
+    def __init__(self, context_root: Path, atomic_write_fn: Optional[Callable[[Path, str], None]] = None):
+        """
+        Initialize filesystem storage.
+
+        Args:
+            context_root: Context store root (.agent-output/)
+            atomic_write_fn: Callable for atomic file writes (required for writes)
+        """
+        self.context_root = Path(context_root)
+        self.lock_file = self.context_root / ".context_store.lock"
+        self._atomic_write = atomic_write_fn
+        # One (re-entrant, per-thread) lock object so nested transactions don't deadlock
+        self._lock = FileLock(str(self.lock_file), timeout=10)
+
+    def _context_file(self, task_id: str) -> Path:
+        return self.context_root / task_id / "context.json"
+
+    def _evidence_index(self, task_id: str) -> Path:
+        return self.context_root / task_id / "evidence" / "index.json"
+
+    def read_context(self, task_id: str) -> Optional[dict]:
+        # Lock-free: writers replace the file atomically
+        return _read_json(self._context_file(task_id))
+
+    def write_context(self, task_id: str, data: dict) -> None:
+        self._atomic_write(self._context_file(task_id), _dump_json(data))
+
+    def context_exists(self, task_id: str) -> bool:
+        return self._context_file(task_id).exists()
+
+    def context_signature(self, task_id: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self._context_file(task_id).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def delete_context(self, task_id: str) -> None:
+        for path in (self._context_file(task_id), self._evidence_index(task_id)):
+            path.unlink(missing_ok=True)
+
+    def list_task_ids(self) -> List[str]:
+        if not self.context_root.exists():
+            return []
+        task_ids = []
+        with os.scandir(self.context_root) as entries:
+            for entry in entries:
+                if entry.name.startswith('TASK-') and entry.is_dir() and self.context_exists(entry.name):
+                    task_ids.append(entry.name)
+        return sorted(task_ids)
+
+    def read_evidence(self, task_id: str) -> List[dict]:
+        index = _read_json(self._evidence_index(task_id))
+        return index.get("evidence", []) if index else []
+
+    def upsert_evidence(self, task_id: str, entries: List[dict]) -> None:
+        index_path = self._evidence_index(task_id)
+        index = _read_json(index_path) or {"version": 1, "evidence": []}
+
+        position_by_id = {e["id"]: i for i, e in enumerate(index["evidence"])}
+        for entry in entries:
+            existing_idx = position_by_id.get(entry["id"])
+            if existing_idx is not None:
+                index["evidence"][existing_idx] = entry
+            else:
+                position_by_id[entry["id"]] = len(index["evidence"])
+                index["evidence"].append(entry)
+
+        self._atomic_write(index_path, _dump_json(index))
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        self.context_root.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            yield
+
+
+class SQLiteContextStorage(ContextStorage):
+    """Context records in a WAL-mode SQLite database."""
+
+    def __init__(self, db_path: Path, busy_timeout_ms: int = 10000):
+        """
+        Initialize SQLite storage.
+
+        Connections are per thread, so the store can be shared by worker
+        threads (e.g. batch init-context).
+
+        Args:
+            db_path: Database file (e.g. .agent-output/.contexts.sqlite3)
+            busy_timeout_ms: How long writers wait for the write lock
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._ensure_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode; transactions are explicit (BEGIN IMMEDIATE)
+            conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+            conn.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _ensure_schema(self) -> None:
+        conn = self._conn()
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version not in (0, SCHEMA_VERSION):
+            raise RuntimeError(
+                f"Context database {self.db_path} has schema version {version}, "
+                f"expected {SCHEMA_VERSION}"
+            )
+        # executescript commits on its own; DDL is idempotent
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        conn = self._conn()
+        if self._local.depth:
+            # Nested: part of the enclosing transaction
+            self._local.depth += 1
+            try:
+                yield
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._local.depth = 0
+
+    def read_context(self, task_id: str) -> Optional[dict]:
+        row = self._conn().execute("SELECT data FROM contexts WHERE task_id = ?", (task_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def write_context(self, task_id: str, data: dict) -> None:
+        coordination = data.get('coordination', {})
+        with self.transaction():
+            conn = self._conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO contexts (task_id, version, git_head, data) VALUES (?, ?, ?, ?)",
+                (task_id, data.get('version', 1), data.get('git_head'), json.dumps(data, sort_keys=True)),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO coordination (task_id, agent_role, status, drift_budget)"
+                " VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        task_id,
+                        role,
+                        coordination.get(role, {}).get('status', 'pending'),
+                        coordination.get(role, {}).get('drift_budget', 0),
+                    )
+                    for role in AGENT_ROLES
+                ],
+            )
+
+    def context_exists(self, task_id: str) -> bool:
+        row = self._conn().execute("SELECT 1 FROM contexts WHERE task_id = ?", (task_id,)).fetchone()
+        return row is not None
+
+    def context_signature(self, task_id: str) -> Optional[Tuple[int, int]]:
+        row = self._conn().execute("SELECT data FROM contexts WHERE task_id = ?", (task_id,)).fetchone()
+        if row is None:
+            return None
+        data = row[0].encode('utf-8')
+        return zlib.crc32(data), len(data)
+
+    def delete_context(self, task_id: str) -> None:
+        with self.transaction():
+            conn = self._conn()
+            conn.execute("DELETE FROM contexts WHERE task_id = ?", (task_id,))
+            conn.execute("DELETE FROM evidence WHERE task_id = ?", (task_id,))
+
+    def list_task_ids(self) -> List[str]:
+        return [row[0] for row in self._conn().execute("SELECT task_id FROM contexts ORDER BY task_id")]
+
+    def find_contexts(
+        self,
+        agent_role: Optional[str] = None,
+        status: Optional[str] = None,
+        min_drift_budget: Optional[int] = None,
+    ) -> List[str]:
+        clauses = []
+        params: list = []
+        if agent_role is not None:
+            clauses.append("agent_role = ?")
+            params.append(agent_role)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if min_drift_budget is not None:
+            clauses.append("drift_budget >= ?")
+            params.append(min_drift_budget)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"SELECT DISTINCT task_id FROM coordination {where} ORDER BY task_id"
+        return [row[0] for row in self._conn().execute(query, params)]
+
+    def read_evidence(self, task_id: str) -> List[dict]:
+        rows = self._conn().execute(
+            "SELECT data FROM evidence WHERE task_id = ? ORDER BY position", (task_id,)
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def upsert_evidence(self, task_id: str, entries: List[dict]) -> None:
+        with self.transaction():
+            conn = self._conn()
+            (next_position,) = conn.execute(
+                "SELECT COALESCE(MAX(position) + 1, 0) FROM evidence WHERE task_id = ?", (task_id,)
+            ).fetchone()
+            for entry in entries:
+                data = json.dumps(entry, sort_keys=True)
+                updated = conn.execute(
+                    "UPDATE evidence SET data = ? WHERE task_id = ? AND evidence_id = ?",
+                    (data, task_id, entry["id"]),
+                ).rowcount
+                if not updated:
+                    conn.execute(
+                        "INSERT INTO evidence (task_id, evidence_id, position, data) VALUES (?, ?, ?, ?)",
+                        (task_id, entry["id"], next_position, data),
+                    )
+                    next_position += 1
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+def create_context_storage(
+    context_root: Path,
+    atomic_write_fn: Callable[[Path, str], None],
+    backend: Optional[str] = None,
+) -> ContextStorage:
+    """
+    Create the configured storage backend.
+
+    Args:
+        context_root: Context store root (.agent-output/)
+        atomic_write_fn: Callable for atomic file writes (filesystem backend)
+        backend: "filesystem" or "sqlite" (defaults to TASKS_CONTEXT_BACKEND,
+            then "filesystem")
+
+    Returns:
+        ContextStorage instance
+
+    Raises:
+        ValueError: Unknown backend name
+    """
+    backend = (backend or os.environ.get(CONTEXT_BACKEND_ENV_VAR, "") or "filesystem").strip().lower()
+    if backend == "filesystem":
+        return FilesystemContextStorage(context_root, atomic_write_fn)
+    if backend == "sqlite":
+        return SQLiteContextStorage(Path(context_root) / SQLITE_STORE_FILENAME)
+    raise ValueError(f"Unknown context backend {backend!r} (expected one of {CONTEXT_BACKENDS})")
+
+
+def copy_contexts(source: ContextStorage, target: ContextStorage) -> int:
+    """
+    Copy all contexts and evidence indexes between backends.
+
+    Runs in one target transaction (a single commit for SQLite).
+
+    Args:
+        source: Backend to read from
+        target: Backend to write to
+
+    Returns:
+        Number of contexts copied
+    """
+    task_ids = source.list_task_ids()
+    with target.transaction():
+        for task_id in task_ids:
+            data = source.read_context(task_id)
+            if data is None:
+                continue
+            target.write_context(task_id, data)
+            evidence = source.read_evidence(task_id)
+            if evidence:
+                target.upsert_evidence(task_id, evidence)
+    return len(task_ids)
+
+
+def _coordination_matches(agent: dict, status: Optional[str], min_drift_budget: Optional[int]) -> bool:
+    if status is not None and agent.get('status', 'pending') != status:
+        return False
+    if min_drift_budget is not None and agent.get('drift_budget', 0) < min_drift_budget:
+        return False
+    return True
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _dump_json(data: dict) -> str:
+    """Deterministic JSON (matches the existing context.json formatting).
+
+    Undecodable file names from git arrive as lone surrogates
+    (surrogateescape), which cannot be written as UTF-8. Documents holding
+    any are written with \\u escapes instead; json.load restores the same
+    strings, so os.fsencode still recovers the original bytes.
+    """
+    text = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
+    if _SURROGATES.search(text):
+        text = json.dumps(data, indent=2, sort_keys=True)
+    return text + '\n'
@@ -57,6 +57,8 @@ class TaskContextStore:
         # Expose internal managers for backward compatibility
         self._runtime = self._facade._runtime
         self._snapshot_builder = self._facade._immutable
+        self.source_index = self._facade.source_index
+        self.storage = self._facade.storage
 
     # ========================================================================
     # Context Lifecycle Methods (delegate to facade)
@@ -214,6 +216,14 @@ class TaskContextStore:
         """Resolve task file path from task ID."""
         return self._facade.resolve_task_path(task_id)
 
+    def git_request_scope(self):
+        """Memoize git state queries (HEAD, status, untracked) for one command."""
+        return self._facade.git_request_scope()
+
+    def get_current_git_head(self) -> str:
+        """Get current git HEAD SHA."""
+        return self._facade.get_current_git_head()
+
     def create_task_snapshot(
         self,
         task_id: str,
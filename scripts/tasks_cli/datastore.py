@@ -1,9 +1,22 @@
 """
 Persistent datastore for task metadata cache.
 
-Maintains a JSON cache at tasks/.cache/tasks_index.json with atomic writes
-to prevent torn reads under concurrent access. Cache is automatically
-invalidated when file mtime or hash changes.
+Maintains a tiered JSON cache with atomic writes to prevent torn reads
+under concurrent access:
+
+- tasks/.cache/tasks_index.json (hot tier): full records for active tasks
+  plus a compact index of archived IDs (see archive_index.py). This is all
+  pick, list and readiness checks read, so their startup cost tracks the
+  active backlog rather than repo history.
+- tasks/.cache/archive_index.json (cold tier): full records for tasks in
+  docs/completed-tasks/, materialized on demand (explain, graph, list
+  completed).
+
+The hot tier is invalidated when an active file is added, removed or
+modified, or when any archive directory's mtime changes (files moved in or
+out). Archived files edited in place are picked up when the cold tier is
+materialized, or by refresh-cache. Archive rebuilds re-parse only files
+whose mtime changed.
 
 See: docs/proposals/task-workflow-python-refactor.md Section 3.3
 """
@@ -14,13 +27,26 @@ import os
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from filelock import FileLock
 
+from .archive_index import (
+    ArchiveIndex,
+    ArchiveTier,
+    CompletedIds,
+    entry_is_current,
+    task_entry,
+    task_from_entry,
+)
+from .closure_index import ClosureIndex
 from .constants import CACHE_VERSION, SNAPSHOT_COUNTER_FILE
 from .models import Task
 from .parser import TaskParser
+from .quarantine import quarantined_ids
+from .telemetry import get_tracer
+
+_tracer = get_tracer(__name__)
 
 
 class TaskDatastore:
@@ -39,132 +65,344 @@ class TaskDatastore:
         self.lock_file = self.cache_dir / "tasks_index.lock"
         self.snapshot_counter_file = repo_root / SNAPSHOT_COUNTER_FILE
         self.parser = TaskParser(repo_root)
+        self.archive = ArchiveTier(
+            repo_root / "docs" / "completed-tasks",
+            self.cache_dir / "archive_index.json",
+            self.parser,
+            self._read_json,
+            self._write_json,
+        )
+
+        # Archive index and active completed IDs from the last hot load
+        self._archive_index: Optional[ArchiveIndex] = None
+        self._active_completed: List[str] = []
+        self._snapshot_id: Optional[int] = None
+
+        # Task IDs left out of the last hot load (quarantined tasks)
+        self._excluded_ids: FrozenSet[str] = frozenset()
+
+        # Closure indexes per (graph scope, excluded IDs) for the current snapshot
+        self._closure_indexes: Dict[Tuple[str, FrozenSet[str]], ClosureIndex] = {}
 
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def load_tasks(self, force_refresh: bool = False) -> List[Task]:
         """
-        Load tasks from cache or parse from YAML files.
+        Load all tasks, including materialized archived tasks.
+
+        Prefer load_active_tasks() + get_completed_ids() on hot paths.
 
         Args:
-            force_refresh: Force cache rebuild even if valid
+            force_refresh: Force cache rebuild (re-parse every file) even if valid
 
         Returns:
-            List of Task objects
+            List of Task objects (active first, then archived)
         """
-        # Use file lock to prevent concurrent access issues
-        with FileLock(str(self.lock_file), timeout=10):
-            if not force_refresh and self._is_cache_valid():
-                tasks = self._load_from_cache()
-                if tasks is not None:
-                    return tasks
-
-            # Cache invalid or force refresh - rebuild
-            tasks = self.parser.discover_tasks()
-            self._save_to_cache(tasks)
+        with _tracer.start_as_current_span("cli.datastore.load_tasks") as span:
+            span.set_attribute("force_refresh", force_refresh)
+            tasks = self.load_active_tasks(force_refresh) + self.load_archived_tasks()
+            span.set_attribute("task_count", len(tasks))
             return tasks
 
-    def _is_cache_valid(self) -> bool:
+    def load_active_tasks(self, force_refresh: bool = False, exclude_quarantined: bool = False) -> List[Task]:
         """
-        Check if cache file exists and is potentially valid.
+        Load the hot tier: active tasks and the archived-ID index.
 
-        Validates that:
-        1. Cache file exists
-        2. No new task files have been added since cache was built
+        Archived tasks whose status is not 'completed' stay in the hot tier
+        so they keep taking part in readiness and halt checks.
+
+        Args:
+            force_refresh: Force cache rebuild (re-parse every file) even if valid
+            exclude_quarantined: Skip quarantined tasks while building task
+                records (the cached index still contains them)
 
         Returns:
-            True if cache exists and no new files detected
+            List of Task objects outside the archive tier
         """
-        if not self.cache_file.exists():
-            return False
+        with _tracer.start_as_current_span("cli.datastore.load_active_tasks") as span:
+            span.set_attribute("force_refresh", force_refresh)
+
+            # Use file lock to prevent concurrent access issues
+            with FileLock(str(self.lock_file), timeout=10):
+                index = self._read_json(self.cache_file)
+                cache_hit = (
+                    not force_refresh
+                    and index is not None
+                    and self._is_hot_index_valid(index)
+                )
+                if not cache_hit:
+                    index = self._rebuild(None if force_refresh else index)
+
+            excluded = self.get_quarantined_ids() if exclude_quarantined else frozenset()
+            tasks = self._activate(index, excluded)
+            span.set_attribute("cache_hit", cache_hit)
+            span.set_attribute("excluded_count", len(excluded))
+            span.set_attribute("task_count", len(tasks))
+            span.set_attribute("archive_count", len(self._archive_index))
+            return tasks
 
-        try:
-            # Load cache to check for new files
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+    def refresh(self, archive_changed: bool = False) -> List[Task]:
+        """
+        Rebuild the hot tier after this process modified task files.
 
-            cached_paths = {task_info['path'] for task_info in data.get('tasks', {}).values()}
+        Unlike force_refresh, unchanged archived files are not re-parsed.
 
-            # Scan for all .task.yaml files in tasks/ directory
-            tasks_dir = self.repo_root / "tasks"
-            completed_dir = self.repo_root / "docs" / "completed-tasks"
-
-            actual_files = set()
-            for directory in [tasks_dir, completed_dir]:
-                if directory.exists():
-                    for task_file in directory.rglob("*.task.yaml"):
-                        actual_files.add(str(task_file))
-
-            # Check if any new files exist that aren't in cache
-            new_files = actual_files - cached_paths
-            if new_files:
-                # New files detected - cache is stale
+        Args:
+            archive_changed: Files were moved into or out of the archive
+
+        Returns:
+            List of Task objects outside the archive tier
+        """
+        with FileLock(str(self.lock_file), timeout=10):
+            index = self._rebuild(self._read_json(self.cache_file) or {}, archive_changed)
+        return self._activate(index)
+
+    def _activate(self, index: Dict, excluded: FrozenSet[str] = frozenset()) -> List[Task]:
+        """
+        Build hot-tier tasks from an index and remember its archive index.
+
+        Excluded tasks are left out of the returned candidates only; a
+        completed task still counts as completed for its dependents.
+        """
+        tasks = [
+            task_from_entry(task_id, entry)
+            for task_id, entry in index['tasks'].items()
+            if task_id not in excluded
+        ]
+        self._archive_index = ArchiveIndex.from_dict(index['archive'])
+        self._active_completed = [
+            task_id for task_id, entry in index['tasks'].items()
+            if entry['status'] == 'completed'
+        ]
+        self._snapshot_id = index.get('snapshot_id')
+        self._excluded_ids = excluded
+        return tasks
+
+    def get_quarantined_ids(self) -> FrozenSet[str]:
+        """
+        Get IDs of quarantined tasks (cached until the quarantine index changes).
+
+        Returns:
+            Frozen set of task IDs
+        """
+        return quarantined_ids(self.repo_root)
+
+    def load_archived_tasks(self) -> List[Task]:
+        """
+        Materialize the cold tier: completed tasks from docs/completed-tasks/.
+
+        Re-parses archived files modified since they were cached.
+
+        Returns:
+            List of archived Task objects
+        """
+        with _tracer.start_as_current_span("cli.datastore.load_archived_tasks") as span:
+            with FileLock(str(self.lock_file), timeout=10):
+                entries = self.archive.read_entries()
+                stale = entries is None or any(
+                    not entry_is_current(entry) for entry in entries.values()
+                )
+                if stale:
+                    index = self._rebuild(self._read_json(self.cache_file) or {}, rebuild_archive=True)
+                    self._activate(index)
+                    entries = self.archive.read_entries() or {}
+
+            span.set_attribute("cache_hit", not stale)
+            span.set_attribute("task_count", len(entries))
+            return [task_from_entry(task_id, entry) for task_id, entry in entries.items()]
+
+    def get_archive_index(self) -> ArchiveIndex:
+        """
+        Get the archived-ID index (loads the hot tier if needed).
+
+        Returns:
+            ArchiveIndex of completed archived task IDs
+        """
+        if self._archive_index is None:
+            self.load_active_tasks()
+        return self._archive_index
+
+    def get_completed_ids(self) -> CompletedIds:
+        """
+        Get completed task IDs across both tiers without materializing the archive.
+
+        Returns:
+            Set-like view of completed task IDs
+        """
+        archive = self.get_archive_index()
+        return CompletedIds(self._active_completed, archive)
+
+    def get_dependency_graph(self):
+        """
+        Build a dependency graph over all tasks (materializes the archive).
+
+        Returns:
+            DependencyGraph including archived tasks
+        """
+        from .graph import DependencyGraph
+        tasks = self.load_tasks()
+        return DependencyGraph(tasks, closure_index=self.get_closure_index(tasks, 'all'))
+
+    def get_closure_index(self, tasks: List[Task], scope: str = 'active') -> ClosureIndex:
+        """
+        Get the transitive-closure index for the current snapshot.
+
+        The index is memoized per scope, snapshot ID and set of excluded
+        (quarantined) tasks. When the snapshot changes, relations whose edges
+        are unchanged are carried over.
+
+        Args:
+            tasks: Tasks loaded for this snapshot
+            scope: 'active' (hot tier) or 'all' (including archived tasks)
+
+        Returns:
+            ClosureIndex for tasks
+        """
+        key = (scope, self._excluded_ids if scope == 'active' else frozenset())
+        cached = self._closure_indexes.get(key)
+        if (
+            cached is not None
+            and self._snapshot_id is not None
+            and cached.snapshot_id == self._snapshot_id
+        ):
+            return cached
+        index = ClosureIndex(tasks, snapshot_id=self._snapshot_id, previous=cached)
+        self._closure_indexes[key] = index
+        return index
+
+    # ========================================================================
+    # Hot tier validation
+    # ========================================================================
+
+    def _is_hot_index_valid(self, index: Dict) -> bool:
+        """
+        Check the hot tier against the filesystem.
+
+        Validates that:
+        1. Cache version matches
+        2. No active task files were added or removed
+        3. No cached hot-tier file was modified
+        4. No archive directory changed (files archived or removed)
+
+        Returns:
+            True if the hot tier can be used as-is
+        """
+        try:
+            if index.get('version') != CACHE_VERSION:
                 return False
+            if not self.archive.fingerprint_matches(index['archive_fingerprint']):
+                return False
+
+            cached_paths = set()
+            for entry in index['tasks'].values():
+                if not entry_is_current(entry):
+                    return False
+                cached_paths.add(entry['path'])
 
+            tasks_dir = self.repo_root / "tasks"
+            if tasks_dir.exists():
+                for task_file in tasks_dir.rglob("*.task.yaml"):
+                    if str(task_file) not in cached_paths:
+                        # New file detected - cache is stale
+                        return False
             return True
 
-        except (json.JSONDecodeError, KeyError, OSError):
-            # Cache corrupted or unreadable
+        except (KeyError, TypeError, AttributeError):
+            # Cache from an incompatible layout
             return False
 
-    def _load_from_cache(self) -> Optional[List[Task]]:
+    # ========================================================================
+    # Rebuild
+    # ========================================================================
+
+    def _rebuild(self, previous: Optional[Dict], rebuild_archive: bool = False) -> Dict:
         """
-        Load tasks from JSON cache.
+        Rebuild the hot tier, reusing the archive tier when it is unchanged.
+
+        Args:
+            previous: Previous hot index (None to re-parse everything)
+            rebuild_archive: Refresh the archive tier even if its directories are unchanged
 
         Returns:
-            List of Task objects or None if cache is stale/invalid
+            New hot index as written to disk
         """
-        try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        with _tracer.start_as_current_span("cli.datastore.rebuild") as span:
+            tasks = {task.id: task_entry(task) for task in self.parser.discover_active_tasks()}
+            fingerprint = self.archive.fingerprint()
 
-            # Validate cache version
-            if data.get('version') != CACHE_VERSION:
-                return None
-
-            tasks = []
-            task_data = data.get('tasks', {})
-
-            for task_id, cached_task in task_data.items():
-                # Check if file still exists
-                path = Path(cached_task['path'])
-                if not path.exists():
-                    # File deleted - cache stale
-                    return None
-
-                # Check if file modified since cache
-                stat = path.stat()
-                if stat.st_mtime != cached_task['mtime']:
-                    # File modified - cache stale
-                    return None
-
-                # Reconstruct Task object from cache
-                task = Task(
-                    id=task_id,
-                    title=cached_task.get('title', ''),
-                    status=cached_task['status'],
-                    priority=cached_task['priority'],
-                    area=cached_task.get('area', ''),
-                    path=cached_task['path'],
-                    unblocker=cached_task.get('unblocker', False),
-                    order=cached_task.get('order'),
-                    blocked_by=cached_task.get('blocked_by', []),
-                    depends_on=cached_task.get('depends_on', []),
-                    blocked_reason=cached_task.get('blocked_reason'),
-                    mtime=cached_task['mtime'],
-                    hash=cached_task.get('hash', ''),
-                )
-                tasks.append(task)
+            archive, stray, archive_count, reuse_archive = self.archive.load(
+                previous, fingerprint, force=rebuild_archive
+            )
+            span.set_attribute("archive_reused", reuse_archive)
 
-            return tasks
+            # Archived tasks that are not completed stay in the hot tier
+            for task_id, entry in stray.items():
+                tasks.setdefault(task_id, entry)
+
+            index = {
+                'version': CACHE_VERSION,
+                'generated_at': datetime.now(timezone.utc).isoformat(),
+                'snapshot_id': self._get_next_snapshot_id(),
+                'config_hash': self._compute_config_hash(),
+                'tasks': tasks,
+                'archive': archive,
+                'archive_count': archive_count,
+                'archive_fingerprint': fingerprint,
+            }
+            self._write_json(self.cache_file, index)
+            return index
 
-        except (json.JSONDecodeError, KeyError, OSError) as e:
+    # ========================================================================
+    # Cache I/O
+    # ========================================================================
+
+    def _read_json(self, path: Path) -> Optional[Dict]:
+        """Read a cache file, returning None when missing or unreadable."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else None
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError) as e:
             # Cache corrupted or unreadable - return None to trigger rebuild
             import sys
             print(f"Warning: Cache invalid ({e}), rebuilding...", file=sys.stderr, flush=True)
             return None
 
+    def _write_json(self, path: Path, data: Dict) -> None:
+        """
+        Write a cache file atomically (temp file + rename).
+
+        Failures are reported but not raised: the cache is an optimization.
+        """
+        try:
+            fd, temp_path = tempfile.mkstemp(
+                suffix='.json.tmp',
+                dir=self.cache_dir,
+                text=True
+            )
+
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    # Sort keys for deterministic output
+                    json.dump(data, f, indent=2, sort_keys=True)
+
+                # Atomic rename (POSIX guarantees atomicity)
+                os.replace(temp_path, path)
+
+            except Exception:
+                # Clean up temp file on error
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+
+        except Exception as e:
+            print(f"Warning: Failed to save cache: {e}", flush=True)
+
     def _get_next_snapshot_id(self) -> int:
         """
         Get next snapshot ID (monotonically increasing counter).
@@ -210,80 +448,6 @@ class TaskDatastore:
         except OSError:
             return None
 
-    def _save_to_cache(self, tasks: List[Task]) -> None:
-        """
-        Save tasks to JSON cache with atomic write.
-
-        Uses temp file + rename pattern to ensure atomic writes.
-
-        Args:
-            tasks: List of tasks to cache
-        """
-        try:
-            # Build cache data structure
-            task_data = {}
-            archives = []
-
-            for task in tasks:
-                task_entry = {
-                    'path': task.path,
-                    'title': task.title,
-                    'status': task.status,
-                    'priority': task.priority,
-                    'area': task.area,
-                    'unblocker': task.unblocker,
-                    'order': task.order,
-                    'blocked_by': task.blocked_by,
-                    'depends_on': task.depends_on,
-                    'blocked_reason': task.blocked_reason,
-                    'mtime': task.mtime,
-                    'hash': task.hash,
-                }
-                task_data[task.id] = task_entry
-
-                # Track archived tasks
-                if 'completed-tasks' in task.path:
-                    archives.append(task.id)
-
-            # Get snapshot ID and config hash for audit trail
-            snapshot_id = self._get_next_snapshot_id()
-            config_hash = self._compute_config_hash()
-
-            cache = {
-                'version': CACHE_VERSION,
-                'generated_at': datetime.now(timezone.utc).isoformat(),
-                'snapshot_id': snapshot_id,
-                'config_hash': config_hash,
-                'tasks': task_data,
-                'archives': archives,
-            }
-
-            # Write to temp file then atomic rename
-            fd, temp_path = tempfile.mkstemp(
-                suffix='.json.tmp',
-                dir=self.cache_dir,
-                text=True
-            )
-
-            try:
-                with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                    # Sort keys for deterministic output
-                    json.dump(cache, f, indent=2, sort_keys=True)
-
-                # Atomic rename (POSIX guarantees atomicity)
-                os.replace(temp_path, self.cache_file)
-
-            except Exception:
-                # Clean up temp file on error
-                try:
-                    os.unlink(temp_path)
-                except OSError:
-                    pass
-                raise
-
-        except Exception as e:
-            print(f"Warning: Failed to save cache: {e}", flush=True)
-
     def get_snapshot_id(self) -> Optional[int]:
         """
         Get current snapshot ID from cache.
@@ -321,8 +485,10 @@ class TaskDatastore:
                 'generated_at': data.get('generated_at'),
                 'snapshot_id': data.get('snapshot_id'),
                 'config_hash': data.get('config_hash'),
-                'task_count': len(data.get('tasks', {})),
-                'archive_count': len(data.get('archives', [])),
+                'task_count': (
+                    len(data.get('tasks', {})) + data.get('archive', {}).get('count', 0)
+                ),
+                'archive_count': data.get('archive_count', 0),
             }
         except Exception as e:
             return {'exists': True, 'error': str(e)}
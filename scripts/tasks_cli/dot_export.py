@@ -0,0 +1,254 @@
+"""
+Graphviz DOT export for the task dependency graph.
+
+Output is produced line by line by a generator so the graph command can
+stream it to stdout or a file. Exports can be scoped to keep rendered
+graphs tractable at repo scale:
+
+- N-hop neighborhood of a task (following blocked_by/depends_on edges in
+  both directions)
+- active tasks only (no completed tasks)
+- a single area
+
+Completed tasks can also be collapsed: each connected group of completed
+tasks becomes one summary node, and edges leaving the group start from it.
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Set
+
+from .constants import DOT_STATUS_COLORS
+from .models import Task
+
+if TYPE_CHECKING:
+    from .graph import DependencyGraph
+
+# Edge kinds in output order: (task attribute, DOT comment, DOT attributes)
+_EDGE_KINDS = (
+    ('blocked_by', 'blocked_by edges (hard blockers)', 'style=solid, color=black'),
+    ('depends_on', 'depends_on edges (informational)', 'style=dashed, color=gray'),
+)
+
+
+def select_scope(
+    graph: "DependencyGraph",
+    root: Optional[str] = None,
+    hops: int = 2,
+    active_only: bool = False,
+    area: Optional[str] = None,
+) -> Optional[Set[str]]:
+    """
+    Select the task IDs to export.
+
+    Filters apply during traversal, so a neighborhood never reaches tasks
+    through nodes that are filtered out.
+
+    Args:
+        graph: Dependency graph
+        root: Task ID whose neighborhood to export (None for all tasks)
+        hops: Neighborhood radius around root
+        active_only: Exclude completed tasks
+        area: Only include tasks in this area
+
+    Returns:
+        Set of task IDs, or None when no scope applies (export everything)
+
+    Raises:
+        KeyError: root is not a known task
+    """
+    if root is None and not active_only and area is None:
+        return None
+
+    def allowed(task: Task) -> bool:
+        if active_only and task.is_completed():
+            return False
+        return area is None or task.area == area
+
+    if root is None:
+        return {task.id for task in graph.tasks if allowed(task)}
+
+    if root not in graph.task_by_id:
+        raise KeyError(root)
+
+    # Undirected adjacency over both edge kinds
+    reverse_depends_on: Dict[str, List[str]] = {}
+    for task in graph.tasks:
+        for dep_id in task.depends_on:
+            reverse_depends_on.setdefault(dep_id, []).append(task.id)
+
+    def neighbors(task_id: str) -> Iterator[str]:
+        yield from graph.blocked_by_edges.get(task_id, ())
+        yield from graph.depends_on_edges.get(task_id, ())
+        yield from graph.reverse_blocked_by.get(task_id, ())
+        yield from reverse_depends_on.get(task_id, ())
+
+    selected = {root}
+    frontier = deque([(root, 0)])
+    while frontier:
+        task_id, distance = frontier.popleft()
+        if distance >= hops:
+            continue
+        for neighbor_id in neighbors(task_id):
+            neighbor = graph.task_by_id.get(neighbor_id)
+            if neighbor_id in selected or neighbor is None or not allowed(neighbor):
+                continue
+            selected.add(neighbor_id)
+            frontier.append((neighbor_id, distance + 1))
+    return selected
+
+
+def iter_dot_lines(
+    graph: "DependencyGraph",
+    task_ids: Optional[Set[str]] = None,
+    collapse_completed: bool = False,
+) -> Iterator[str]:
+    """
+    Generate DOT lines for the graph (or a scoped subset).
+
+    Node styling:
+    - Color by status: completed=green, in_progress=yellow, blocked=red, todo=gray
+    - Unblocker tasks have double border and bold label
+    - Node label includes task ID and priority
+    - Collapsed completed groups are shown as a single summary node
+
+    Edge styling:
+    - Solid arrows for blocked_by (hard blockers)
+    - Dashed arrows for depends_on (informational)
+
+    Args:
+        graph: Dependency graph
+        task_ids: Task IDs to include (None for all tasks). Scoped exports
+            only keep edges between included tasks.
+        collapse_completed: Collapse connected completed tasks into summary nodes
+
+    Yields:
+        DOT lines (without trailing newlines)
+    """
+    if task_ids is None:
+        tasks = graph.tasks
+        include_edge: Callable[[str], bool] = lambda dep_id: True
+    else:
+        tasks = [task for task in graph.tasks if task.id in task_ids]
+        include_edge = task_ids.__contains__
+
+    summary_of = _completed_groups(tasks, include_edge) if collapse_completed else {}
+
+    yield 'digraph task_dependencies {'
+    yield '  rankdir=LR;'  # Left to right layout
+    yield '  node [shape=box, style=filled];'
+    yield ''
+
+    # Define nodes with styling
+    emitted_summaries = set()
+    for task in tasks:
+        summary = summary_of.get(task.id)
+        if summary is None:
+            yield _task_node(task)
+        elif summary.node_id not in emitted_summaries:
+            emitted_summaries.add(summary.node_id)
+            yield summary.node_line()
+
+    # Define edges (solid for blocked_by, dashed for depends_on)
+    for attribute, comment, style in _EDGE_KINDS:
+        yield ''
+        yield f'  // {comment}'
+        seen_edges = set()
+        for task in tasks:
+            target = _node_id(task.id, summary_of)
+            for dep_id in getattr(task, attribute):
+                if not include_edge(dep_id):
+                    continue
+                source = _node_id(dep_id, summary_of)
+                if summary_of:
+                    # Collapsed groups: drop internal edges and duplicates
+                    if source == target or (source, target) in seen_edges:
+                        continue
+                    seen_edges.add((source, target))
+                yield f'  "{source}" -> "{target}" [{style}];'
+
+    yield '}'
+
+
+def _task_node(task: Task) -> str:
+    """DOT node line for a single task."""
+    color = DOT_STATUS_COLORS.get(task.status, 'white')
+
+    # Build node label
+    label = f"{task.id}\\n{task.priority}"
+    if task.unblocker:
+        label += "\\n[UNBLOCKER]"
+
+    # Build node attributes
+    attrs = [f'label="{label}"', f'fillcolor="{color}"']
+
+    # Unblockers get special styling
+    if task.unblocker:
+        attrs.append('peripheries=2')  # Double border
+        attrs.append('fontweight=bold')
+
+    return f'  "{task.id}" [{", ".join(attrs)}];'
+
+
+class _CompletedGroup:
+    """A connected group of completed tasks shown as one summary node."""
+
+    __slots__ = ('node_id', 'first', 'last', 'count')
+
+    def __init__(self, task_ids: List[str]):
+        task_ids.sort()
+        self.first = task_ids[0]
+        self.last = task_ids[-1]
+        self.count = len(task_ids)
+        self.node_id = f"completed:{self.first}"
+
+    def node_line(self) -> str:
+        color = DOT_STATUS_COLORS.get('completed', 'white')
+        label = f"{self.count} completed\\n{self.first} .. {self.last}"
+        return f'  "{self.node_id}" [label="{label}", fillcolor="{color}", shape=folder];'
+
+
+def _completed_groups(
+    tasks: List[Task],
+    include_edge: Callable[[str], bool],
+) -> Dict[str, _CompletedGroup]:
+    """
+    Group completed tasks connected by dependency edges (union-find).
+
+    Single completed tasks are left as regular nodes.
+
+    Returns:
+        Mapping of task ID to its group, for tasks in groups of 2+
+    """
+    parent = {task.id: task.id for task in tasks if task.is_completed()}
+
+    def find(task_id: str) -> str:
+        while parent[task_id] != task_id:
+            parent[task_id] = parent[parent[task_id]]
+            task_id = parent[task_id]
+        return task_id
+
+    for task in tasks:
+        if task.id not in parent:
+            continue
+        for dep_id in (*task.blocked_by, *task.depends_on):
+            if dep_id in parent and include_edge(dep_id):
+                root_a, root_b = find(task.id), find(dep_id)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    members: Dict[str, List[str]] = {}
+    for task_id in parent:
+        members.setdefault(find(task_id), []).append(task_id)
+
+    summary_of = {}
+    for group_ids in members.values():
+        if len(group_ids) > 1:
+            group = _CompletedGroup(group_ids)
+            for task_id in group_ids:
+                summary_of[task_id] = group
+    return summary_of
+
+
+def _node_id(task_id: str, summary_of: Dict[str, _CompletedGroup]) -> str:
+    group = summary_of.get(task_id)
+    return group.node_id if group is not None else task_id
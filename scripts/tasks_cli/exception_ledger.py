@@ -3,15 +3,24 @@ Exception ledger operations for task validation exceptions.
 
 Manages docs/compliance/context-cache-exceptions.json ledger with atomic
 file updates and idempotent operations per task-context-cache-hardening-schemas.md.
+
+Writes take the ledger file lock and replace the file atomically. Reads
+are lock-free and served from an in-process snapshot indexed by task_id,
+which is re-read only when the file's (mtime, size, inode) changes. Use
+suppressed_ids() when checking many tasks.
 """
 
 import json
+import os
+import tempfile
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from filelock import FileLock
 
+from .file_modes import match_target_mode
 from .models import ExceptionLedgerEntry, RemediationStatus
 
 # Default ledger path relative to repo root
@@ -33,10 +42,47 @@ def _get_ledger_path(repo_root: Optional[Path] = None) -> Path:
     return repo_root / LEDGER_PATH
 
 
+class _LedgerSnapshot:
+    """Parsed ledger plus a task_id index, tied to one on-disk file version."""
+
+    __slots__ = ('stat_key', 'ledger', 'by_task', 'suppressed')
+
+    def __init__(self, stat_key: Optional[Tuple[int, int, int]], ledger: dict):
+        self.stat_key = stat_key
+        self.ledger = ledger
+        self.by_task: Dict[str, dict] = {entry["task_id"]: entry for entry in ledger["exceptions"]}
+        self.suppressed: FrozenSet[str] = frozenset(self.by_task)
+
+
+# Ledger path -> snapshot of the last version read or written by this process
+_snapshots: Dict[Path, _LedgerSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def _stat_key(ledger_path: Path) -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of the ledger, or None if it does not exist."""
+    try:
+        stat = os.stat(ledger_path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _empty_ledger() -> dict:
+    return {
+        "version": "1.0",
+        "last_updated": datetime.now(timezone.utc).isoformat(),
+        "exceptions": []
+    }
+
+
 def _load_ledger(ledger_path: Path) -> dict:
     """
     Load ledger from JSON file or create empty structure.
 
+    Always reads from disk and returns a new dict the caller may modify
+    (used by write operations under the ledger lock).
+
     Args:
         ledger_path: Absolute path to ledger file
 
@@ -44,20 +90,52 @@ def _load_ledger(ledger_path: Path) -> dict:
         Ledger dictionary with version, last_updated, and exceptions
     """
     if not ledger_path.exists():
-        return {
-            "version": "1.0",
-            "last_updated": datetime.now(timezone.utc).isoformat(),
-            "exceptions": []
-        }
+        return _empty_ledger()
 
     with open(ledger_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+def _read_snapshot(ledger_path: Path) -> _LedgerSnapshot:
+    """
+    Get the indexed ledger for read-only use.
+
+    Lock-free: writers replace the file atomically, so a reader sees either
+    the old or the new version. The parsed ledger is reused while the
+    file's (mtime, size, inode) is unchanged. Callers must not modify it.
+
+    Args:
+        ledger_path: Absolute path to ledger file
+
+    Returns:
+        Ledger snapshot
+    """
+    stat_key = _stat_key(ledger_path)
+    snapshot = _snapshots.get(ledger_path)
+    if snapshot is not None and snapshot.stat_key == stat_key:
+        return snapshot
+
+    if stat_key is None:
+        snapshot = _LedgerSnapshot(None, _empty_ledger())
+    else:
+        try:
+            snapshot = _LedgerSnapshot(stat_key, _load_ledger(ledger_path))
+        except FileNotFoundError:
+            # Removed between stat and open
+            snapshot = _LedgerSnapshot(None, _empty_ledger())
+
+    with _snapshots_lock:
+        _snapshots[ledger_path] = snapshot
+    return snapshot
+
+
 def _save_ledger(ledger_path: Path, ledger: dict) -> None:
     """
     Save ledger to JSON file atomically with deterministic formatting.
 
+    Writes a temp file in the same directory and renames it over the
+    ledger, so lock-free readers never see a partial file.
+
     Args:
         ledger_path: Absolute path to ledger file
         ledger: Ledger dictionary to save
@@ -69,9 +147,24 @@ def _save_ledger(ledger_path: Path, ledger: dict) -> None:
     ledger["last_updated"] = datetime.now(timezone.utc).isoformat()
 
     # Write with deterministic formatting
-    with open(ledger_path, 'w', encoding='utf-8') as f:
-        json.dump(ledger, f, indent=2, sort_keys=True)
-        f.write('\n')  # Add trailing newline
+    fd, tmp_path = tempfile.mkstemp(dir=ledger_path.parent, prefix=f".{ledger_path.name}.tmp", text=True)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(ledger, f, indent=2, sort_keys=True)
+            f.write('\n')  # Add trailing newline
+            f.flush()
+            # Rename keeps inode and mtime, so this is the ledger's stat key
+            stat = os.fstat(f.fileno())
+        match_target_mode(tmp_path, ledger_path)
+        os.replace(tmp_path, ledger_path)
+    except Exception:
+        # Clean up temp file on error
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    # The saved dict becomes the cached version (callers don't modify it after saving)
+    with _snapshots_lock:
+        _snapshots[ledger_path] = _LedgerSnapshot((stat.st_mtime_ns, stat.st_size, stat.st_ino), ledger)
 
 
 def add_exception(
@@ -99,19 +192,15 @@ def add_exception(
         ledger = _load_ledger(ledger_path)
 
         # Check if task_id already exists
-        existing_idx = None
-        for idx, entry_dict in enumerate(ledger["exceptions"]):
-            if entry_dict["task_id"] == task_id:
-                existing_idx = idx
-                break
+        existing = _index_by_task(ledger).get(task_id)
 
         now = datetime.now(timezone.utc).isoformat()
 
-        if existing_idx is not None:
+        if existing is not None:
             # Update existing entry
-            ledger["exceptions"][existing_idx]["detected_at"] = now
+            existing["detected_at"] = now
             if parse_error is not None:
-                ledger["exceptions"][existing_idx]["parse_error"] = parse_error
+                existing["parse_error"] = parse_error
         else:
             # Create new entry with 30-day deadline
             deadline = (datetime.now(timezone.utc) + timedelta(days=30)).date().isoformat()
@@ -143,15 +232,44 @@ def should_suppress_warnings(task_id: str, repo_root: Optional[Path] = None) ->
     Returns:
         True if task_id exists in exceptions array
     """
-    ledger_path = _get_ledger_path(repo_root)
+    return task_id in suppressed_ids(repo_root)
 
-    if not ledger_path.exists():
-        return False
 
-    lock_path = ledger_path.with_suffix('.lock')
-    with FileLock(str(lock_path), timeout=10):
-        ledger = _load_ledger(ledger_path)
-        return any(entry["task_id"] == task_id for entry in ledger["exceptions"])
+def suppressed_ids(repo_root: Optional[Path] = None) -> FrozenSet[str]:
+    """
+    Get all task IDs with an exception entry (warnings should be suppressed).
+
+    Use this in loops over many tasks instead of calling
+    should_suppress_warnings per task. The set is cached until the ledger
+    file changes.
+
+    Args:
+        repo_root: Repository root path (defaults to current working directory)
+
+    Returns:
+        Frozen set of task IDs
+    """
+    return _read_snapshot(_get_ledger_path(repo_root)).suppressed
+
+
+def get_exception(task_id: str, repo_root: Optional[Path] = None) -> Optional[ExceptionLedgerEntry]:
+    """
+    Get the exception entry for a task.
+
+    Args:
+        task_id: Task identifier (TASK-NNNN format)
+        repo_root: Repository root path (defaults to current working directory)
+
+    Returns:
+        ExceptionLedgerEntry, or None if the task has no entry
+    """
+    entry_dict = _read_snapshot(_get_ledger_path(repo_root)).by_task.get(task_id)
+    return ExceptionLedgerEntry.from_dict(entry_dict) if entry_dict is not None else None
+
+
+def _index_by_task(ledger: dict) -> Dict[str, dict]:
+    """Map task_id to its entry dict (entries are shared, not copied)."""
+    return {entry["task_id"]: entry for entry in ledger["exceptions"]}
 
 
 def cleanup_exception(
@@ -169,7 +287,8 @@ def cleanup_exception(
     """
     ledger_path = _get_ledger_path(repo_root)
 
-    if not ledger_path.exists():
+    # Fast path: nothing to remove (no lock or full load needed)
+    if task_id not in _read_snapshot(ledger_path).suppressed:
         return
 
     lock_path = ledger_path.with_suffix('.lock')
@@ -202,27 +321,20 @@ def list_exceptions(
     Returns:
         List of ExceptionLedgerEntry objects
     """
-    ledger_path = _get_ledger_path(repo_root)
+    ledger = _read_snapshot(_get_ledger_path(repo_root)).ledger
 
-    if not ledger_path.exists():
-        return []
-
-    lock_path = ledger_path.with_suffix('.lock')
-    with FileLock(str(lock_path), timeout=10):
-        ledger = _load_ledger(ledger_path)
+    entries = [
+        ExceptionLedgerEntry.from_dict(entry_dict)
+        for entry_dict in ledger["exceptions"]
+    ]
 
+    if status_filter is not None:
         entries = [
-            ExceptionLedgerEntry.from_dict(entry_dict)
-            for entry_dict in ledger["exceptions"]
+            entry for entry in entries
+            if entry.remediation.status == status_filter
         ]
 
-        if status_filter is not None:
-            entries = [
-                entry for entry in entries
-                if entry.remediation.status == status_filter
-            ]
-
-        return entries
+    return entries
 
 
 def resolve_exception(
@@ -248,18 +360,14 @@ def resolve_exception(
         ledger = _load_ledger(ledger_path)
 
         # Find matching entry
-        found = False
-        for entry_dict in ledger["exceptions"]:
-            if entry_dict["task_id"] == task_id:
-                found = True
-                now = datetime.now(timezone.utc).isoformat()
-                entry_dict["remediation"]["status"] = "resolved"
-                entry_dict["remediation"]["resolved_at"] = now
-                if notes is not None:
-                    entry_dict["remediation"]["notes"] = notes
-                break
-
-        if not found:
+        entry_dict = _index_by_task(ledger).get(task_id)
+        if entry_dict is None:
             raise ValueError(f"Task {task_id} not found in exception ledger")
 
+        now = datetime.now(timezone.utc).isoformat()
+        entry_dict["remediation"]["status"] = "resolved"
+        entry_dict["remediation"]["resolved_at"] = now
+        if notes is not None:
+            entry_dict["remediation"]["notes"] = notes
+
         _save_ledger(ledger_path, ledger)
@@ -0,0 +1,341 @@
+"""
+Existence checks for validation commands' expected_paths globs.
+
+Validation only needs to know whether a pattern matches *something*, but
+``list(repo_root.glob(pattern))`` expands every match - ``**/dist/**``
+walks the whole monorepo, node_modules included. GlobExistenceChecker
+answers the same question with pathlib glob semantics, but:
+
+- stops at the first match
+- resolves literal segments with a single stat instead of listing the
+  directory (``packages/*/dist/index.js`` only lists ``packages/``)
+- never descends into excluded directories while expanding ``*``/``**``
+  (gitignore-style patterns, node_modules and .git by default; optionally
+  also whatever ``git check-ignore`` reports). Literal segments are always
+  followed, so ``node_modules/.bin/jest`` can still be expected.
+- caches directory listings and stats in a DirectoryIndex that lives for
+  one batch of checks (e.g. the pre-flight of a validation pipeline)
+- times every pattern, so slow patterns can be found and fixed
+"""
+
+import fnmatch
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .telemetry import get_tracer
+
+_tracer = get_tracer(__name__)
+
+# Directories never worth searching for expected build outputs
+DEFAULT_EXCLUDES: Tuple[str, ...] = ("node_modules", ".git")
+
+# Patterns slower than this are listed in span attributes
+SLOW_PATTERN_MS = 100.0
+
+_MAGIC = re.compile(r"[*?\[]")
+
+# Returns path -> ignored for repo-relative paths (dirs end with '/')
+IgnoreChecker = Callable[[Sequence[str]], Dict[str, bool]]
+
+
+@dataclass(frozen=True)
+class PatternCheck:
+    """Outcome of one expected-path pattern."""
+    pattern: str
+    exists: bool
+    match: Optional[str]   # First matching repo-relative path found
+    duration_ms: float
+
+
+@dataclass
+class ExpectedPathsReport:
+    """Outcome of a batch of expected-path patterns, in input order."""
+    checks: List[PatternCheck] = field(default_factory=list)
+
+    @property
+    def all_exist(self) -> bool:
+        return all(check.exists for check in self.checks)
+
+    @property
+    def missing(self) -> List[str]:
+        return [check.pattern for check in self.checks if not check.exists]
+
+    def slow_patterns(self, threshold_ms: float = SLOW_PATTERN_MS) -> List[PatternCheck]:
+        """Checks that took longer than threshold_ms, slowest first."""
+        slow = [check for check in self.checks if check.duration_ms > threshold_ms]
+        return sorted(slow, key=lambda check: check.duration_ms, reverse=True)
+
+
+class DirectoryIndex:
+    """Directory listings and stats cached for the duration of a batch.
+
+    Assumes the tree does not change while the batch runs; create a new
+    index (or checker) for the next batch.
+    """
+
+    def __init__(self):
+        # Absolute dir path -> {name: (is_dir following symlinks, is_symlink)}
+        self._listings: Dict[str, Dict[str, Tuple[bool, bool]]] = {}
+        # Absolute path -> (exists, is_dir), following symlinks
+        self._stats: Dict[str, Tuple[bool, bool]] = {}
+
+    def entries(self, directory: str) -> Dict[str, Tuple[bool, bool]]:
+        listing = self._listings.get(directory)
+        if listing is None:
+            listing = {}
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            is_symlink = entry.is_symlink()
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            continue
+                        listing[entry.name] = (is_dir, is_symlink)
+            except OSError:
+                pass
+            self._listings[directory] = listing
+        return listing
+
+    def stat(self, path: str) -> Tuple[bool, bool]:
+        """(exists, is_dir) for path, following symlinks."""
+        result = self._stats.get(path)
+        if result is None:
+            parent, name = os.path.split(path)
+            listing = self._listings.get(parent)
+            if listing is not None and name not in (".", ".."):
+                entry = listing.get(name)
+                if entry is None:
+                    result = (False, False)
+                elif not entry[1]:
+                    result = (True, entry[0])
+            if result is None:
+                result = (os.path.exists(path), os.path.isdir(path))
+            self._stats[path] = result
+        return result
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+
+class ExcludeRules:
+    """gitignore-style exclude patterns (no negation).
+
+    A pattern without '/' matches a name at any depth; a pattern containing
+    '/' is anchored at the repo root. A trailing '/' limits it to directories.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self._names: List[Tuple[re.Pattern, bool]] = []
+        self._paths: List[Tuple[re.Pattern, bool]] = []
+        for raw in patterns:
+            pattern = raw.strip()
+            if not pattern or pattern.startswith("#"):
+                continue
+            dir_only = pattern.endswith("/")
+            pattern = pattern.strip("/")
+            compiled = re.compile(fnmatch.translate(pattern))
+            (self._paths if "/" in pattern else self._names).append((compiled, dir_only))
+
+    def __bool__(self) -> bool:
+        return bool(self._names or self._paths)
+
+    def excludes(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        for compiled, dir_only in self._names:
+            if (is_dir or not dir_only) and compiled.match(name):
+                return True
+        for compiled, dir_only in self._paths:
+            if (is_dir or not dir_only) and compiled.match(rel_path):
+                return True
+        return False
+
+
+class GlobExistenceChecker:
+    """Answers "does this glob match anything?" under a repository root.
+
+    Matching follows pathlib.Path.glob (``**`` spans zero or more
+    directories without following symlinked ones, a trailing ``**`` matches
+    directories, ``*`` also matches dotfiles), except that names matched by
+    wildcards are skipped when excluded.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        excludes: Sequence[str] = DEFAULT_EXCLUDES,
+        ignore_checker: Optional[IgnoreChecker] = None,
+        index: Optional[DirectoryIndex] = None,
+    ):
+        """
+        Initialize checker.
+
+        Args:
+            repo_root: Root that patterns are relative to
+            excludes: gitignore-style patterns pruned during wildcard expansion
+            ignore_checker: Optional batch check for ignored paths, asked
+                once per listed directory
+            index: DirectoryIndex to share (defaults to a new one for this checker)
+        """
+        self.repo_root = Path(repo_root)
+        self.index = index or DirectoryIndex()
+        self._root = os.fspath(self.repo_root)
+        self._excludes = ExcludeRules(excludes)
+        self._ignore_checker = ignore_checker
+        self._ignored: Dict[str, frozenset] = {}
+        self._regexes: Dict[str, Callable[[str], Optional[re.Match]]] = {}
+
+    def check(self, patterns: Sequence[str]) -> ExpectedPathsReport:
+        """
+        Check every pattern, timing each one.
+
+        Args:
+            patterns: Glob patterns relative to repo_root
+
+        Returns:
+            ExpectedPathsReport in pattern order
+        """
+        with _tracer.start_as_current_span("cli.expected_paths.check") as span:
+            report = ExpectedPathsReport()
+            for pattern in patterns:
+                start = time.perf_counter()
+                match = self.first_match(pattern)
+                duration_ms = (time.perf_counter() - start) * 1000
+                report.checks.append(PatternCheck(pattern, match is not None, match, duration_ms))
+
+            span.set_attribute("pattern_count", len(report.checks))
+            span.set_attribute("missing_count", len(report.missing))
+            span.set_attribute("patterns", [check.pattern for check in report.checks])
+            span.set_attribute("pattern_durations_ms", [check.duration_ms for check in report.checks])
+            span.set_attribute("slow_patterns", [check.pattern for check in report.slow_patterns()])
+            span.set_attribute("listed_dirs", len(self.index))
+            return report
+
+    def exists(self, pattern: str) -> bool:
+        """True if pattern matches at least one path."""
+        return self.first_match(pattern) is not None
+
+    def first_match(self, pattern: str) -> Optional[str]:
+        """
+        Find one path matching pattern.
+
+        Args:
+            pattern: Glob pattern relative to repo_root
+
+        Returns:
+            Repo-relative path of the first match found, or None
+
+        Raises:
+            ValueError: Empty pattern
+            NotImplementedError: Absolute pattern (as pathlib)
+        """
+        if not pattern:
+            raise ValueError(f"Unacceptable pattern: {pattern!r}")
+        pure = PurePosixPath(pattern)
+        if pure.is_absolute():
+            raise NotImplementedError("Non-relative patterns are unsupported")
+        segments = pure.parts
+        if not segments:
+            raise ValueError(f"Unacceptable pattern: {pattern!r}")
+        return self._match(self._root, "", segments, 0)
+
+    # ========================================================================
+    # Matching
+    # ========================================================================
+
+    def _match(self, directory: str, rel: str, segments: Sequence[str], i: int) -> Optional[str]:
+        """First match of segments[i:] below directory (which exists)."""
+        if i == len(segments):
+            return rel or "."
+        segment = segments[i]
+        last = i == len(segments) - 1
+
+        if segment == "**":
+            for sub_dir, sub_rel in self._walk(directory, rel):
+                found = self._match(sub_dir, sub_rel, segments, i + 1)
+                if found is not None:
+                    return found
+            return None
+
+        if _MAGIC.search(segment):
+            matches = self._regex(segment)
+            for name, (is_dir, _) in self.index.entries(directory).items():
+                if not matches(name) or not (last or is_dir):
+                    continue
+                child_rel = f"{rel}/{name}" if rel else name
+                if self._is_excluded(directory, child_rel, name, is_dir):
+                    continue
+                found = self._match(os.path.join(directory, name), child_rel, segments, i + 1)
+                if found is not None:
+                    return found
+            return None
+
+        # Literal segment: one (cached) stat, no listing
+        child = os.path.join(directory, segment)
+        exists, is_dir = self.index.stat(child)
+        if not exists or not (last or is_dir):
+            return None
+        return self._match(child, f"{rel}/{segment}" if rel else segment, segments, i + 1)
+
+    def _walk(self, directory: str, rel: str) -> Iterator[Tuple[str, str]]:
+        """Depth-first: directory itself, then non-symlinked, non-excluded subdirectories."""
+        yield directory, rel
+        for name, (is_dir, is_symlink) in self.index.entries(directory).items():
+            if not is_dir or is_symlink:
+                continue
+            child_rel = f"{rel}/{name}" if rel else name
+            if self._is_excluded(directory, child_rel, name, True):
+                continue
+            yield from self._walk(os.path.join(directory, name), child_rel)
+
+    def _regex(self, segment: str) -> Callable[[str], Optional[re.Match]]:
+        matches = self._regexes.get(segment)
+        if matches is None:
+            matches = self._regexes[segment] = re.compile(fnmatch.translate(segment)).match
+        return matches
+
+    def _is_excluded(self, directory: str, rel: str, name: str, is_dir: bool) -> bool:
+        if self._excludes and self._excludes.excludes(rel, name, is_dir):
+            return True
+        if self._ignore_checker is None:
+            return False
+        ignored = self._ignored.get(directory)
+        if ignored is None:
+            ignored = self._ignored[directory] = self._ignored_children(directory)
+        return name in ignored
+
+    def _ignored_children(self, directory: str) -> frozenset:
+        """Ask the ignore checker about every entry of a directory at once."""
+        rel_dir = os.path.relpath(directory, self._root)
+        prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+        entries = self.index.entries(directory)
+        queries = {f"{prefix}{name}{'/' if is_dir else ''}": name for name, (is_dir, _) in entries.items()}
+        if not queries:
+            return frozenset()
+        try:
+            result = self._ignore_checker(list(queries))
+        except Exception:
+            return frozenset()  # Not a git repo etc.: only the static excludes apply
+        return frozenset(queries[path] for path, ignored in result.items() if ignored)
+
+
+def check_expected_paths(
+    patterns: Sequence[str],
+    repo_root: Path,
+    checker: Optional[GlobExistenceChecker] = None,
+) -> ExpectedPathsReport:
+    """
+    Check expected-path patterns with a fresh (or the batch's) checker.
+
+    Args:
+        patterns: Glob patterns relative to repo_root
+        repo_root: Repository root path
+        checker: Checker whose DirectoryIndex is shared across the batch
+
+    Returns:
+        ExpectedPathsReport with per-pattern timings
+    """
+    return (checker or GlobExistenceChecker(repo_root)).check(patterns)
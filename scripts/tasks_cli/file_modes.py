@@ -0,0 +1,34 @@
+"""
+Permission handling for atomic file replacement.
+
+tempfile.mkstemp() creates files with mode 0600. Writers that rename such a
+temp file over a target would otherwise silently make shared files
+(ledgers, indexes, archives) unreadable to other users.
+"""
+
+import os
+import stat
+from pathlib import Path
+from typing import Union
+
+# Read once: os.umask() can only be queried by setting it
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def match_target_mode(temp_path: Union[str, Path], target: Path) -> None:
+    """
+    Give a temp file the permissions of the file it is about to replace.
+
+    New targets get the mode open() would create them with (0666 minus
+    the umask).
+
+    Args:
+        temp_path: Temp file that will be renamed over target
+        target: File being replaced
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    os.chmod(temp_path, mode)
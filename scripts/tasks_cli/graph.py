@@ -9,43 +9,66 @@ Key semantics (per proposal Section 3.5):
 - depends_on: Informational dependencies (not enforced by readiness)
 """
 
-from collections import deque
-from typing import Dict, List, Set, Tuple
+from typing import AbstractSet, Dict, Iterator, List, Optional, Set, Tuple
 
+from .closure_index import ClosureIndex
+from .dot_export import iter_dot_lines, select_scope
 from .models import Task
+from .telemetry import get_tracer
+
+_tracer = get_tracer(__name__)
 
 
 class DependencyGraph:
     """Manages task dependency graph and validation."""
 
-    def __init__(self, tasks: List[Task]):
+    def __init__(
+        self,
+        tasks: List[Task],
+        archived_ids: Optional[AbstractSet[str]] = None,
+        closure_index: Optional[ClosureIndex] = None,
+    ):
         """
         Initialize dependency graph.
 
         Args:
-            tasks: List of all tasks (including completed/archived)
+            tasks: List of tasks (all tasks, or only the datastore's hot tier)
+            archived_ids: IDs of archived tasks that are not in tasks; they
+                satisfy dependencies without being materialized
+            closure_index: Prebuilt closure index for these tasks (e.g. cached
+                by the datastore for the current snapshot)
         """
-        self.tasks = tasks
-        self.task_by_id = {task.id: task for task in tasks}
-
-        # Build adjacency lists for blocked_by (hard blockers)
-        self.blocked_by_edges: Dict[str, List[str]] = {}
-        for task in tasks:
-            self.blocked_by_edges[task.id] = task.blocked_by.copy()
-
-        # Build adjacency list for depends_on (informational)
-        self.depends_on_edges: Dict[str, List[str]] = {}
-        for task in tasks:
-            self.depends_on_edges[task.id] = task.depends_on.copy()
-
-        # Phase 2: Build reverse adjacency list for priority propagation
-        # Maps blocker_id → [task_ids that are blocked by it]
-        self.reverse_blocked_by: Dict[str, List[str]] = {}
-        for task in tasks:
-            for blocker_id in task.blocked_by:
-                if blocker_id not in self.reverse_blocked_by:
-                    self.reverse_blocked_by[blocker_id] = []
-                self.reverse_blocked_by[blocker_id].append(task.id)
+        with _tracer.start_as_current_span("cli.graph.build") as span:
+            self.tasks = tasks
+            self._closure_index = closure_index
+            self.task_by_id = {task.id: task for task in tasks}
+            self.archived_ids = archived_ids if archived_ids is not None else frozenset()
+
+            # Adjacency lists share the tasks' immutable dependency tuples
+            # (blocked_by = hard blockers, depends_on = informational)
+            self.blocked_by_edges: Dict[str, Tuple[str, ...]] = {
+                task.id: task.blocked_by for task in tasks
+            }
+            self.depends_on_edges: Dict[str, Tuple[str, ...]] = {
+                task.id: task.depends_on for task in tasks
+            }
+
+            # Phase 2: Build reverse adjacency list for priority propagation
+            # Maps blocker_id → [task_ids that are blocked by it]
+            self.reverse_blocked_by: Dict[str, List[str]] = {}
+            for task in tasks:
+                for blocker_id in task.blocked_by:
+                    if blocker_id not in self.reverse_blocked_by:
+                        self.reverse_blocked_by[blocker_id] = []
+                    self.reverse_blocked_by[blocker_id].append(task.id)
+            span.set_attribute("task_count", len(tasks))
+
+    @property
+    def closure_index(self) -> ClosureIndex:
+        """Transitive-closure index over this graph's tasks (built on first use)."""
+        if self._closure_index is None:
+            self._closure_index = ClosureIndex(self.tasks)
+        return self._closure_index
 
     def detect_cycles(self) -> List[List[str]]:
         """
@@ -115,12 +138,12 @@ class DependencyGraph:
 
             # Check blocked_by dependencies
             for dep_id in task.blocked_by:
-                if dep_id not in self.task_by_id:
+                if dep_id not in self.task_by_id and dep_id not in self.archived_ids:
                     missing_deps.append(dep_id)
 
             # Check depends_on dependencies
             for dep_id in task.depends_on:
-                if dep_id not in self.task_by_id:
+                if dep_id not in self.task_by_id and dep_id not in self.archived_ids:
                     missing_deps.append(dep_id)
 
             if missing_deps:
@@ -186,8 +209,8 @@ class DependencyGraph:
             Dictionary with 'blocked_by' and 'depends_on' lists
         """
         return {
-            'blocked_by': self.blocked_by_edges.get(task_id, []),
-            'depends_on': self.depends_on_edges.get(task_id, []),
+            'blocked_by': list(self.blocked_by_edges.get(task_id, ())),
+            'depends_on': list(self.depends_on_edges.get(task_id, ())),
         }
 
     def validate(self) -> Tuple[bool, List[str]]:
@@ -255,43 +278,10 @@ class DependencyGraph:
         if task_id not in self.task_by_id:
             return closure
 
-        # Track visited nodes to prevent infinite loops
-        visited_blocking = set()
-        visited_artifacts = set()
-
-        def traverse_blocking(tid: str):
-            """Recursively traverse blocked_by edges."""
-            if tid in visited_blocking or tid not in self.task_by_id:
-                return
-
-            visited_blocking.add(tid)
-
-            # Add all blocked_by dependencies
-            for dep_id in self.blocked_by_edges.get(tid, []):
-                if dep_id in self.task_by_id:  # Only follow existing tasks
-                    closure['blocking'].add(dep_id)
-                    closure['transitive'].add(dep_id)
-                    # Recursively traverse
-                    traverse_blocking(dep_id)
-
-        def traverse_artifacts(tid: str):
-            """Recursively traverse depends_on edges."""
-            if tid in visited_artifacts or tid not in self.task_by_id:
-                return
-
-            visited_artifacts.add(tid)
-
-            # Add all depends_on dependencies
-            for dep_id in self.depends_on_edges.get(tid, []):
-                if dep_id in self.task_by_id:  # Only follow existing tasks
-                    closure['artifacts'].add(dep_id)
-                    closure['transitive'].add(dep_id)
-                    # Recursively traverse
-                    traverse_artifacts(dep_id)
-
-        # Start traversal from the given task
-        traverse_blocking(task_id)
-        traverse_artifacts(task_id)
+        # Only existing tasks are followed (archived/missing IDs are leaves)
+        closure['blocking'] = self.closure_index.blockers(task_id)
+        closure['artifacts'] = self.closure_index.artifacts(task_id)
+        closure['transitive'] = closure['blocking'] | closure['artifacts']
 
         return closure
 
@@ -299,12 +289,10 @@ class DependencyGraph:
         """
         Find all tasks that are transitively blocked by this task.
 
-        Traverses the dependency graph in REVERSE: if task_id appears in
-        another task's blocked_by, that task is directly blocked. Recursively
-        traverses to find all downstream tasks.
-
-        Uses BFS with visited set to handle diamond dependencies correctly
-        and prevent infinite loops (even though cycles are validated elsewhere).
+        Follows the dependency graph in REVERSE: if task_id appears in
+        another task's blocked_by, that task is directly blocked. Downstream
+        tasks come from the closure index, so diamonds yield no duplicates
+        and cycles (validated elsewhere) terminate.
 
         Args:
             task_id: Task ID to find downstream blocked tasks for
@@ -317,26 +305,42 @@ class DependencyGraph:
             TASK-A blocks TASK-B, TASK-B blocks TASK-C
             find_transitively_blocked("TASK-A") → [TASK-B, TASK-C]
         """
-        blocked = []
-        blocked_ids = set()  # Track IDs to prevent duplicates
-        queue = deque([task_id])
-        visited = {task_id}
+        return [
+            self.task_by_id[blocked_id]
+            for blocked_id in self.closure_index.blocked_tasks(task_id)
+        ]
 
-        while queue:
-            current_id = queue.popleft()  # O(1) with deque, not list.pop(0)
+    def select_scope(
+        self,
+        root: Optional[str] = None,
+        hops: int = 2,
+        active_only: bool = False,
+        area: Optional[str] = None,
+    ) -> Optional[Set[str]]:
+        """
+        Select task IDs for a scoped export (see dot_export.select_scope).
 
-            # Find tasks directly blocked by current task
-            for blocked_id in self.reverse_blocked_by.get(current_id, []):
-                if blocked_id not in visited:
-                    visited.add(blocked_id)
-                    queue.append(blocked_id)
+        Returns:
+            Set of task IDs, or None when no scope applies
+        """
+        return select_scope(self, root=root, hops=hops, active_only=active_only, area=area)
 
-                    # Add to result list (only if task exists and not already added)
-                    if blocked_id in self.task_by_id and blocked_id not in blocked_ids:
-                        blocked_ids.add(blocked_id)
-                        blocked.append(self.task_by_id[blocked_id])
+    def iter_dot(
+        self,
+        task_ids: Optional[Set[str]] = None,
+        collapse_completed: bool = False,
+    ) -> Iterator[str]:
+        """
+        Generate the graph in Graphviz DOT format, one line at a time.
 
-        return blocked
+        Args:
+            task_ids: Restrict the export to these task IDs (None for all)
+            collapse_completed: Collapse connected completed tasks into summary nodes
+
+        Yields:
+            DOT lines (without trailing newlines)
+        """
+        return iter_dot_lines(self, task_ids=task_ids, collapse_completed=collapse_completed)
 
     def export_dot(self) -> str:
         """
@@ -354,56 +358,4 @@ class DependencyGraph:
         Returns:
             DOT format string suitable for rendering with Graphviz
         """
-        lines = ['digraph task_dependencies {']
-        lines.append('  rankdir=LR;')  # Left to right layout
-        lines.append('  node [shape=box, style=filled];')
-        lines.append('')
-
-        # Define nodes with styling
-        for task in self.tasks:
-            # Determine color based on status
-            status_colors = {
-                'completed': 'lightgreen',
-                'in_progress': 'lightyellow',
-                'blocked': 'lightcoral',
-                'draft': 'aliceblue',
-                'todo': 'lightgray',
-            }
-            color = status_colors.get(task.status, 'white')
-
-            # Build node label
-            label = f"{task.id}\\n{task.priority}"
-            if task.unblocker:
-                label += "\\n[UNBLOCKER]"
-
-            # Build node attributes
-            attrs = [f'label="{label}"', f'fillcolor="{color}"']
-
-            # Unblockers get special styling
-            if task.unblocker:
-                attrs.append('peripheries=2')  # Double border
-                attrs.append('fontweight=bold')
-
-            attrs_str = ', '.join(attrs)
-            lines.append(f'  "{task.id}" [{attrs_str}];')
-
-        lines.append('')
-
-        # Define edges for blocked_by (solid)
-        lines.append('  // blocked_by edges (hard blockers)')
-        for task in self.tasks:
-            for dep_id in task.blocked_by:
-                # Solid arrow: dependency blocks this task
-                lines.append(f'  "{dep_id}" -> "{task.id}" [style=solid, color=black];')
-
-        lines.append('')
-
-        # Define edges for depends_on (dashed)
-        lines.append('  // depends_on edges (informational)')
-        for task in self.tasks:
-            for dep_id in task.depends_on:
-                # Dashed arrow: task depends on this for context
-                lines.append(f'  "{dep_id}" -> "{task.id}" [style=dashed, color=gray];')
-
-        lines.append('}')
-        return '\n'.join(lines)
+        return '\n'.join(self.iter_dot())
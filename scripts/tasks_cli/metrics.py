@@ -6,6 +6,8 @@ import json
 from datetime import datetime, timezone
 from dataclasses import dataclass, field, asdict
 
+from .metrics_store import MetricsStore, TaskRollup
+
 
 # Success criteria targets from proposal section 6
 SUCCESS_CRITERIA = {
@@ -115,7 +117,8 @@ class MetricsDashboard:
 def collect_task_metrics(
     task_id: str,
     repo_root: Path,
-    baseline: Optional[Dict[str, Any]] = None
+    baseline: Optional[Dict[str, Any]] = None,
+    store: Optional[MetricsStore] = None
 ) -> TaskMetricsSummary:
     """
     Collect metrics for a single task.
@@ -124,57 +127,48 @@ def collect_task_metrics(
         task_id: Task ID (e.g., "TASK-0818")
         repo_root: Repository root path
         baseline: Optional baseline metrics for comparison
+        store: Optional MetricsStore (defaults to the repo's persistent store)
 
     Returns:
         TaskMetricsSummary with all collected metrics
     """
-    agent_output_dir = repo_root / ".agent-output" / task_id
-
-    if not agent_output_dir.exists():
-        raise FileNotFoundError(f"Agent output directory not found: {agent_output_dir}")
-
-    # Collect telemetry from all agents
-    telemetry_files = list(agent_output_dir.glob("telemetry-*.json"))
-
-    total_file_reads = 0
-    file_reads_by_agent = {}
-    total_cache_hits = 0
-    total_cache_misses = 0
-    estimated_tokens = 0
-    agents_run = []
-    total_warnings = 0
-    json_calls = 0
-    json_failures = 0
-
-    for telemetry_file in telemetry_files:
-        with open(telemetry_file) as f:
-            telemetry = json.load(f)
-
-        agent_role = telemetry.get("agent_role", "unknown")
-        agents_run.append(agent_role)
-
-        # Per schema: metrics are nested under "metrics" key
-        metrics_data = telemetry.get("metrics", {})
-
-        # File operations (nested under metrics.file_operations)
-        file_ops = metrics_data.get("file_operations", {})
-        agent_reads = file_ops.get("read_calls", 0)
-        total_file_reads += agent_reads
-        file_reads_by_agent[agent_role] = agent_reads
-
-        # Cache operations (nested under metrics.cache_operations)
-        cache_ops = metrics_data.get("cache_operations", {})
-        total_cache_hits += cache_ops.get("cache_hits", 0)
-        total_cache_misses += cache_ops.get("cache_misses", 0)
-        estimated_tokens += cache_ops.get("estimated_tokens_saved", 0)
-
-        # Warnings
-        warnings = telemetry.get("warnings", [])
-        total_warnings += len(warnings)
-
-        # JSON calls (track from commands or explicit field)
-        json_calls += telemetry.get("json_calls", 0)
-        json_failures += telemetry.get("json_parse_failures", 0)
+    owns_store = store is None
+    if owns_store:
+        store = MetricsStore(repo_root)
+
+    try:
+        errors = store.sync([task_id])
+        if task_id in errors:
+            raise errors[task_id]
+        rollup = store.rollups([task_id])[task_id]
+    finally:
+        if owns_store:
+            store.close()
+
+    return _summarize_rollup(rollup, baseline)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a telemetry timestamp (ISO 8601 fast path, dateutil fallback)."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        from dateutil.parser import parse
+        return parse(value)
+
+
+def _summarize_rollup(
+    rollup: TaskRollup,
+    baseline: Optional[Dict[str, Any]] = None
+) -> TaskMetricsSummary:
+    """Derive ratios and success criteria from a task's aggregated metrics."""
+    agents_run = rollup.agents_run
+    total_file_reads = rollup.total_file_reads
+    total_cache_hits = rollup.total_cache_hits
+    total_cache_misses = rollup.total_cache_misses
+    estimated_tokens = rollup.estimated_tokens_saved
+    json_failures = rollup.json_parse_failures
+    repeated_warnings = rollup.repeated_warnings
 
     # Calculate derived metrics
     avg_file_reads = total_file_reads / len(agents_run) if agents_run else 0
@@ -185,49 +179,10 @@ def collect_task_metrics(
     )
 
     # QA artifact coverage
-    context_file = agent_output_dir / "context.json"
-    qa_commands = 0
-    qa_with_logs = 0
-
-    if context_file.exists():
-        with open(context_file) as f:
-            context = json.load(f)
-
-        # Read from nested immutable object per TaskContext.to_dict structure
-        immutable = context.get("immutable", {})
-        validation_baseline = immutable.get("validation_baseline", {})
-        initial_results_data = validation_baseline.get("initial_results")
-
-        # Handle both new format (QAResults dict) and legacy format (list)
-        if isinstance(initial_results_data, dict):
-            # New format: QAResults with "results" array
-            initial_results = initial_results_data.get("results", [])
-        elif isinstance(initial_results_data, list):
-            # Legacy format: direct list
-            initial_results = initial_results_data
-        else:
-            # None or other
-            initial_results = []
-
-        qa_commands = len(initial_results)
-        qa_with_logs = sum(
-            1 for result in initial_results
-            if result.get("log_path") and Path(repo_root / result["log_path"]).exists()
-        )
-
+    qa_commands = rollup.qa_commands_run
+    qa_with_logs = rollup.qa_commands_with_logs
     qa_coverage = (qa_with_logs / qa_commands * 100) if qa_commands > 0 else 0
 
-    # Count repeated warnings (basic heuristic: duplicate messages)
-    all_warning_messages = []
-    for telemetry_file in telemetry_files:
-        with open(telemetry_file) as f:
-            telemetry = json.load(f)
-        warnings = telemetry.get("warnings", [])
-        all_warning_messages.extend([w.get("message", "") for w in warnings])
-
-    unique_warnings = set(all_warning_messages)
-    repeated_warnings = len(all_warning_messages) - len(unique_warnings)
-
     # Prompt size savings (if baseline provided)
     prompt_savings_pct = None
     baseline_tokens = None
@@ -254,27 +209,17 @@ def collect_task_metrics(
 
     # Calculate duration (rough estimate from telemetry timestamps)
     duration_minutes = 0.0
-    if telemetry_files:
-        timestamps = []
-        for telemetry_file in telemetry_files:
-            with open(telemetry_file) as f:
-                telemetry = json.load(f)
-            timestamps.append(telemetry.get("session_start"))
-            timestamps.append(telemetry.get("session_end"))
-
-        valid_timestamps = [t for t in timestamps if t]
-        if len(valid_timestamps) >= 2:
-            from dateutil.parser import parse
-            start = parse(min(valid_timestamps))
-            end = parse(max(valid_timestamps))
-            duration_minutes = (end - start).total_seconds() / 60
+    if rollup.session_timestamps >= 2:
+        start = _parse_timestamp(rollup.session_first)
+        end = _parse_timestamp(rollup.session_last)
+        duration_minutes = (end - start).total_seconds() / 60
 
     return TaskMetricsSummary(
-        task_id=task_id,
+        task_id=rollup.task_id,
         duration_minutes=duration_minutes,
         agents_run=agents_run,
         total_file_reads=total_file_reads,
-        file_reads_by_agent=file_reads_by_agent,
+        file_reads_by_agent=rollup.file_reads_by_agent,
         avg_file_reads_per_agent=avg_file_reads,
         total_cache_hits=total_cache_hits,
         total_cache_misses=total_cache_misses,
@@ -283,9 +228,9 @@ def collect_task_metrics(
         qa_commands_run=qa_commands,
         qa_commands_with_logs=qa_with_logs,
         qa_artifact_coverage=qa_coverage,
-        total_warnings=total_warnings,
+        total_warnings=rollup.total_warnings,
         repeated_warnings=repeated_warnings,
-        json_calls=json_calls,
+        json_calls=rollup.json_calls,
         json_parse_failures=json_failures,
         baseline_prompt_tokens=baseline_tokens,
         current_prompt_tokens=current_tokens,
@@ -297,7 +242,8 @@ def collect_task_metrics(
 def generate_metrics_dashboard(
     task_ids: List[str],
     repo_root: Path,
-    output_path: Path
+    output_path: Path,
+    store: Optional[MetricsStore] = None
 ) -> MetricsDashboard:
     """
     Generate rollup metrics dashboard across multiple tasks.
@@ -306,18 +252,26 @@ def generate_metrics_dashboard(
         task_ids: List of task IDs to analyze
         repo_root: Repository root path
         output_path: Path to write dashboard JSON
+        store: Optional MetricsStore (defaults to the repo's persistent store)
 
     Returns:
         MetricsDashboard with aggregate metrics
     """
-    # Collect metrics for each task
-    task_summaries = []
-    for task_id in task_ids:
-        try:
-            summary = collect_task_metrics(task_id, repo_root)
-            task_summaries.append(summary)
-        except Exception as e:
+    # Index new/changed telemetry once, then aggregate all tasks together
+    owns_store = store is None
+    if owns_store:
+        store = MetricsStore(repo_root)
+
+    try:
+        errors = store.sync(task_ids)
+        for task_id, e in errors.items():
             print(f"Warning: Could not collect metrics for {task_id}: {e}")
+        rollups = store.rollups(t for t in task_ids if t not in errors)
+    finally:
+        if owns_store:
+            store.close()
+
+    task_summaries = [_summarize_rollup(rollup) for rollup in rollups.values()]
 
     if not task_summaries:
         raise ValueError("No task metrics collected")
@@ -0,0 +1,466 @@
+"""
+Incremental SQLite store for task metrics.
+
+collect-metrics and the metrics dashboard used to re-read every
+``.agent-output/TASK-*/telemetry-*.json`` file several times per task. The
+MetricsStore ingests each telemetry file (keyed by path, mtime and size) and
+each task context (keyed by its ContextStorage signature, so either context
+backend works) exactly once, and answers the per-task rollups (file reads
+per agent, cache hit rate, QA coverage, warning repetition) as aggregate
+queries over the ingested rows.
+
+The store lives at ``.agent-output/.metrics.sqlite3``. It is a cache: deleting
+it only costs one full re-ingest, and a schema version mismatch rebuilds it.
+"""
+
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .context_store.storage import ContextStorage, create_context_storage
+
+METRICS_STORE_FILENAME = ".metrics.sqlite3"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS telemetry (
+    path TEXT PRIMARY KEY,
+    task_id TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    agent_role TEXT NOT NULL,
+    read_calls INTEGER NOT NULL,
+    cache_hits INTEGER NOT NULL,
+    cache_misses INTEGER NOT NULL,
+    tokens_saved INTEGER NOT NULL,
+    warning_count INTEGER NOT NULL,
+    json_calls INTEGER NOT NULL,
+    json_failures INTEGER NOT NULL,
+    session_start TEXT,
+    session_end TEXT
+);
+CREATE INDEX IF NOT EXISTS telemetry_task ON telemetry (task_id);
+
+CREATE TABLE IF NOT EXISTS warnings (
+    path TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS warnings_task ON warnings (task_id);
+CREATE INDEX IF NOT EXISTS warnings_path ON warnings (path);
+
+-- mtime_ns/size hold ContextStorage.context_signature()
+CREATE TABLE IF NOT EXISTS contexts (
+    task_id TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS qa_logs (
+    task_id TEXT NOT NULL,
+    log_path TEXT,
+    present INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS qa_logs_task ON qa_logs (task_id);
+"""
+
+# Per-task rollups over ingested rows. Repeated warnings are duplicate
+# messages.
+_TASK_ROLLUP_QUERY = """
+SELECT
+    t.task_id,
+    SUM(t.read_calls), SUM(t.cache_hits), SUM(t.cache_misses),
+    SUM(t.tokens_saved), SUM(t.warning_count),
+    SUM(t.json_calls), SUM(t.json_failures)
+FROM telemetry AS t
+JOIN selected AS s ON s.task_id = t.task_id
+GROUP BY t.task_id
+"""
+
+# Agents are listed in path order (group_concat order is unspecified)
+_AGENTS_RUN_QUERY = """
+SELECT t.task_id, t.agent_role
+FROM telemetry AS t
+JOIN selected AS s ON s.task_id = t.task_id
+ORDER BY t.task_id, t.path
+"""
+
+# Last file (by path) wins when several telemetry files share a role
+_READS_BY_AGENT_QUERY = """
+SELECT t.task_id, t.agent_role, t.read_calls, MAX(t.path)
+FROM telemetry AS t
+JOIN selected AS s ON s.task_id = t.task_id
+GROUP BY t.task_id, t.agent_role
+"""
+
+_WARNING_REPEATS_QUERY = """
+SELECT w.task_id, COUNT(*) - COUNT(DISTINCT w.message)
+FROM warnings AS w
+JOIN selected AS s ON s.task_id = w.task_id
+GROUP BY w.task_id
+"""
+
+_QA_COVERAGE_QUERY = """
+SELECT q.task_id, COUNT(*), SUM(q.present)
+FROM qa_logs AS q
+JOIN selected AS s ON s.task_id = q.task_id
+GROUP BY q.task_id
+"""
+
+_SESSION_BOUNDS_QUERY = """
+SELECT b.task_id, MIN(b.ts), MAX(b.ts), COUNT(*)
+FROM (
+    SELECT task_id, session_start AS ts FROM telemetry
+    UNION ALL
+    SELECT task_id, session_end AS ts FROM telemetry
+) AS b
+JOIN selected AS s ON s.task_id = b.task_id
+WHERE b.ts IS NOT NULL AND b.ts != ''
+GROUP BY b.task_id
+"""
+
+
+@dataclass
+class TaskRollup:
+    """Aggregated telemetry and QA metrics for one task."""
+    task_id: str
+    agents_run: List[str]
+    file_reads_by_agent: Dict[str, int]
+    total_file_reads: int = 0
+    total_cache_hits: int = 0
+    total_cache_misses: int = 0
+    estimated_tokens_saved: int = 0
+    total_warnings: int = 0
+    repeated_warnings: int = 0
+    json_calls: int = 0
+    json_parse_failures: int = 0
+    qa_commands_run: int = 0
+    qa_commands_with_logs: int = 0
+    session_first: Optional[str] = None
+    session_last: Optional[str] = None
+    session_timestamps: int = 0
+
+
+class MetricsStore:
+    """
+    SQLite-backed incremental index of task telemetry and QA artifacts.
+
+    Call sync() with the tasks of interest, then rollups() to read their
+    aggregates. Unchanged files (same mtime and size) are never re-parsed.
+
+    The database is opened on first use. The default location is only
+    created when sync() has agent output to index, so read-only commands in
+    a checkout without .agent-output/ leave the tree untouched.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        db_path: Optional[Path] = None,
+        context_storage: Optional[ContextStorage] = None,
+    ):
+        """
+        Initialize metrics store.
+
+        Args:
+            repo_root: Repository root path
+            db_path: SQLite database path (defaults to
+                .agent-output/.metrics.sqlite3; ":memory:" for a throwaway store)
+            context_storage: Backend to read task contexts from (defaults
+                to the configured backend, created on first use)
+        """
+        self.repo_root = Path(repo_root)
+        self.agent_output_dir = self.repo_root / ".agent-output"
+        self._default_location = db_path is None
+        self.db_path = self.agent_output_dir / METRICS_STORE_FILENAME if db_path is None else db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._context_storage = context_storage
+        self._owns_context_storage = context_storage is None
+
+    @property
+    def context_storage(self) -> ContextStorage:
+        """Context backend (read-only use; no atomic writer needed)."""
+        if self._context_storage is None:
+            self._context_storage = create_context_storage(self.agent_output_dir, atomic_write_fn=None)
+        return self._context_storage
+
+    def _connect(self, create: bool) -> Optional[sqlite3.Connection]:
+        """
+        Open the database on first use.
+
+        Args:
+            create: Create the database (and .agent-output/) if missing
+
+        Returns:
+            Connection, or None when create is False and no database exists
+        """
+        if self._conn is None:
+            if self._default_location:
+                if not create and not self.db_path.exists():
+                    return None
+                self.agent_output_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._ensure_schema()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._owns_context_storage and self._context_storage is not None:
+            self._context_storage.close()
+
+    def __enter__(self) -> "MetricsStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ========================================================================
+    # Ingestion
+    # ========================================================================
+
+    def sync(self, task_ids: Iterable[str]) -> Dict[str, Exception]:
+        """
+        Bring the store up to date for the given tasks.
+
+        Parses only telemetry/context files that are new or whose mtime or
+        size changed, drops rows for deleted files and refreshes QA log
+        presence.
+
+        Args:
+            task_ids: Task IDs to index
+
+        Returns:
+            Mapping of task ID to the error that prevented indexing it
+            (FileNotFoundError for a missing agent output directory,
+            JSON or I/O errors for unreadable files). Failed tasks keep no
+            rows.
+        """
+        task_ids = list(task_ids)
+        if not os.path.isdir(self.agent_output_dir):
+            # Nothing to index; don't create the store in a clean checkout
+            return {
+                task_id: FileNotFoundError(
+                    f"Agent output directory not found: {os.path.join(self.agent_output_dir, task_id)}"
+                )
+                for task_id in task_ids
+            }
+
+        conn = self._connect(create=True)
+        known: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        for task_id, path, mtime_ns, size in conn.execute(
+            "SELECT task_id, path, mtime_ns, size FROM telemetry"
+        ):
+            known.setdefault(task_id, {})[path] = (mtime_ns, size)
+        contexts = {
+            task_id: (mtime_ns, size)
+            for task_id, mtime_ns, size in conn.execute("SELECT * FROM contexts")
+        }
+
+        errors: Dict[str, Exception] = {}
+        with conn:
+            for task_id in task_ids:
+                try:
+                    self._sync_task(task_id, known.get(task_id, {}), contexts.get(task_id))
+                except Exception as e:
+                    self._forget_task(task_id)
+                    errors[task_id] = e
+        return errors
+
+    def _sync_task(
+        self,
+        task_id: str,
+        known: Dict[str, Tuple[int, int]],
+        context_signature: Optional[Tuple[int, int]],
+    ) -> None:
+        task_dir = os.path.join(self.agent_output_dir, task_id)
+        if not os.path.isdir(task_dir):
+            raise FileNotFoundError(f"Agent output directory not found: {task_dir}")
+
+        with os.scandir(task_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("telemetry-") and name.endswith(".json")):
+                    continue
+                stat = entry.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if known.pop(entry.path, None) != signature:
+                    self._ingest_telemetry(task_id, entry.path, signature)
+
+        for stale_path in known:
+            self._delete_telemetry(stale_path)
+
+        self._sync_context(task_id, context_signature)
+
+    def _ingest_telemetry(self, task_id: str, path: str, signature: Tuple[int, int]) -> None:
+        with open(path) as f:
+            telemetry = json.load(f)
+
+        # Per schema: metrics are nested under "metrics" key
+        metrics_data = telemetry.get("metrics", {})
+        file_ops = metrics_data.get("file_operations", {})
+        cache_ops = metrics_data.get("cache_operations", {})
+        warnings = telemetry.get("warnings", [])
+
+        self._delete_telemetry(path)
+        self._conn.execute(
+            "INSERT INTO telemetry VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path, task_id, signature[0], signature[1],
+                telemetry.get("agent_role", "unknown"),
+                file_ops.get("read_calls", 0),
+                cache_ops.get("cache_hits", 0),
+                cache_ops.get("cache_misses", 0),
+                cache_ops.get("estimated_tokens_saved", 0),
+                len(warnings),
+                telemetry.get("json_calls", 0),
+                telemetry.get("json_parse_failures", 0),
+                telemetry.get("session_start"),
+                telemetry.get("session_end"),
+            ),
+        )
+        self._conn.executemany(
+            "INSERT INTO warnings VALUES (?, ?, ?)",
+            [(path, task_id, w.get("message", "")) for w in warnings],
+        )
+
+    def _delete_telemetry(self, path: str) -> None:
+        self._conn.execute("DELETE FROM telemetry WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM warnings WHERE path = ?", (path,))
+
+    def _sync_context(self, task_id: str, known_signature: Optional[Tuple[int, int]]) -> None:
+        signature = self.context_storage.context_signature(task_id)
+        if signature is not None and signature == known_signature:
+            self._refresh_qa_presence(task_id)
+            return
+
+        context = self.context_storage.read_context(task_id) if signature is not None else None
+        if context is None:
+            if known_signature is not None:
+                self._conn.execute("DELETE FROM contexts WHERE task_id = ?", (task_id,))
+                self._conn.execute("DELETE FROM qa_logs WHERE task_id = ?", (task_id,))
+            return
+
+        self._conn.execute("DELETE FROM qa_logs WHERE task_id = ?", (task_id,))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO contexts VALUES (?, ?, ?)", (task_id, *signature)
+        )
+        self._conn.executemany(
+            "INSERT INTO qa_logs VALUES (?, ?, ?)",
+            [
+                (task_id, log_path, self._log_present(log_path))
+                for log_path in _initial_result_log_paths(context)
+            ],
+        )
+
+    def _refresh_qa_presence(self, task_id: str) -> None:
+        """Log files can appear or vanish without the context changing."""
+        rows = self._conn.execute(
+            "SELECT rowid, log_path, present FROM qa_logs WHERE task_id = ?", (task_id,)
+        ).fetchall()
+        changed = [
+            (present, rowid)
+            for rowid, log_path, old in rows
+            if (present := self._log_present(log_path)) != old
+        ]
+        if changed:
+            self._conn.executemany("UPDATE qa_logs SET present = ? WHERE rowid = ?", changed)
+
+    def _log_present(self, log_path: Optional[str]) -> int:
+        return int(bool(log_path) and (self.repo_root / log_path).exists())
+
+    def _forget_task(self, task_id: str) -> None:
+        for table in ("telemetry", "warnings", "contexts", "qa_logs"):
+            self._conn.execute(f"DELETE FROM {table} WHERE task_id = ?", (task_id,))
+
+    # ========================================================================
+    # Rollups
+    # ========================================================================
+
+    def rollups(self, task_ids: Iterable[str]) -> Dict[str, TaskRollup]:
+        """
+        Aggregate indexed metrics per task.
+
+        Args:
+            task_ids: Task IDs to aggregate (tasks without rows get an
+                empty rollup)
+
+        Returns:
+            Mapping of task ID to TaskRollup, in the order given
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        rollups: Dict[str, TaskRollup] = {}
+
+        def rollup(task_id: str) -> TaskRollup:
+            if task_id not in rollups:
+                rollups[task_id] = TaskRollup(task_id=task_id, agents_run=[], file_reads_by_agent={})
+            return rollups[task_id]
+
+        conn = self._connect(create=False)
+        if conn is None:
+            return {task_id: rollup(task_id) for task_id in task_ids}
+
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS selected (task_id TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM selected")
+        conn.executemany("INSERT INTO selected VALUES (?)", [(t,) for t in task_ids])
+
+        for row in conn.execute(_TASK_ROLLUP_QUERY):
+            r = rollup(row[0])
+            (r.total_file_reads, r.total_cache_hits, r.total_cache_misses,
+             r.estimated_tokens_saved, r.total_warnings,
+             r.json_calls, r.json_parse_failures) = row[1:]
+
+        for task_id, agent_role in conn.execute(_AGENTS_RUN_QUERY):
+            rollup(task_id).agents_run.append(agent_role)
+
+        for task_id, agent_role, read_calls, _ in conn.execute(_READS_BY_AGENT_QUERY):
+            rollup(task_id).file_reads_by_agent[agent_role] = read_calls
+
+        for task_id, repeated in conn.execute(_WARNING_REPEATS_QUERY):
+            rollup(task_id).repeated_warnings = repeated
+
+        for task_id, commands, with_logs in conn.execute(_QA_COVERAGE_QUERY):
+            r = rollup(task_id)
+            r.qa_commands_run, r.qa_commands_with_logs = commands, with_logs
+
+        for task_id, first, last, count in conn.execute(_SESSION_BOUNDS_QUERY):
+            r = rollup(task_id)
+            r.session_first, r.session_last, r.session_timestamps = first, last, count
+
+        return {task_id: rollup(task_id) for task_id in task_ids}
+
+    # ========================================================================
+    # Helpers
+    # ========================================================================
+
+    def _ensure_schema(self) -> None:
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            with self._conn:
+                for table in ("telemetry", "warnings", "contexts", "qa_logs"):
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def _initial_result_log_paths(context: dict) -> List[Optional[str]]:
+    """Log paths of validation_baseline.initial_results in a context dict."""
+    # Read from nested immutable object per TaskContext.to_dict structure
+    immutable = context.get("immutable", {})
+    validation_baseline = immutable.get("validation_baseline", {})
+    initial_results_data = validation_baseline.get("initial_results")
+
+    # Handle both new format (QAResults dict) and legacy format (list)
+    if isinstance(initial_results_data, dict):
+        initial_results = initial_results_data.get("results", [])
+    elif isinstance(initial_results_data, list):
+        initial_results = initial_results_data
+    else:
+        initial_results = []
+
+    return [result.get("log_path") for result in initial_results]
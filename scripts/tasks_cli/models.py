@@ -1,21 +1,30 @@
 """
 Task model for the task workflow CLI.
 
-Defines the Task dataclass that represents a parsed .task.yaml file
+Defines the Task record that represents a parsed .task.yaml file
 with all metadata needed for prioritization, dependency resolution,
 and workflow management.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
-@dataclass
 class Task:
     """
     Represents a single task from a .task.yaml file.
 
+    Task records are slotted and compact because every CLI call loads the
+    whole backlog, including tens of thousands of archived tasks:
+
+    - status, priority, area, schema_version and task IDs are interned, so
+      repeated values share one string object
+    - blocked_by/depends_on are tuples (the empty tuple is a singleton) and
+      are shared with DependencyGraph instead of copied
+    - hash is kept as its 32-byte digest and only rendered as hex on access
+
     Attributes:
         id: Unique task identifier (e.g., TASK-0824)
         title: Human-readable task title
@@ -26,32 +35,67 @@ class Task:
         schema_version: Task schema version (e.g., "1.0", "1.1")
         unblocker: Whether this task unblocks other tasks (prioritized first)
         order: Optional ordering within same priority/status
-        blocked_by: List of task IDs that block this task (hard blockers)
-        depends_on: List of task IDs this depends on (informational only)
+        blocked_by: Task IDs that block this task (hard blockers)
+        depends_on: Task IDs this depends on (informational only)
         blocked_reason: Optional reason why task is blocked (required when status=blocked)
         mtime: File modification time (Unix timestamp)
         hash: File content hash for cache invalidation
+        effective_priority: Runtime-only propagated priority (not serialized)
+        priority_reason: Runtime-only reason for effective_priority (not serialized)
     """
 
-    id: str
-    title: str
-    status: str
-    priority: str
-    area: str
-    path: str
-    schema_version: str = "1.0"  # Default to 1.0 for backward compatibility
-    unblocker: bool = False
-    order: Optional[int] = None
-    blocked_by: List[str] = field(default_factory=list)
-    depends_on: List[str] = field(default_factory=list)
-    blocked_reason: Optional[str] = None
-    mtime: float = 0.0
-    hash: str = ""
-
-    # Phase 2: Runtime-only fields for effective priority propagation
-    # (NOT serialized to YAML, recomputed fresh on every CLI invocation)
-    effective_priority: Optional[str] = field(default=None, init=False, repr=False)
-    priority_reason: Optional[str] = field(default=None, init=False, repr=False)
+    __slots__ = (
+        'id', 'title', 'status', 'priority', 'area', 'path', 'schema_version',
+        'unblocker', 'order', 'blocked_by', 'depends_on', 'blocked_reason',
+        'mtime', '_hash',
+        # Phase 2: Runtime-only fields for effective priority propagation
+        # (NOT serialized to YAML, recomputed fresh on every CLI invocation)
+        'effective_priority', 'priority_reason',
+    )
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        status: str,
+        priority: str,
+        area: str,
+        path: str,
+        schema_version: str = "1.0",  # Default to 1.0 for backward compatibility
+        unblocker: bool = False,
+        order: Optional[int] = None,
+        blocked_by: Iterable[str] = (),
+        depends_on: Iterable[str] = (),
+        blocked_reason: Optional[str] = None,
+        mtime: float = 0.0,
+        hash: str = "",
+    ):
+        self.id = _intern(id)
+        self.title = title
+        self.status = _intern(status)
+        self.priority = _intern(priority)
+        self.area = _intern(area)
+        self.path = path
+        self.schema_version = _intern(schema_version)
+        self.unblocker = unblocker
+        self.order = order
+        self.blocked_by = _intern_ids(blocked_by) if blocked_by else ()
+        self.depends_on = _intern_ids(depends_on) if depends_on else ()
+        self.blocked_reason = blocked_reason
+        self.mtime = mtime
+        self._hash = _pack_hash(hash)
+        self.effective_priority: Optional[str] = None
+        self.priority_reason: Optional[str] = None
+
+    @property
+    def hash(self) -> str:
+        """File content hash (hex SHA256, or the value given at construction)."""
+        value = self._hash
+        return value.hex() if isinstance(value, bytes) else value
+
+    @hash.setter
+    def hash(self, value: str) -> None:
+        self._hash = _pack_hash(value)
 
     def is_ready(self, completed_ids: set) -> bool:
         """
@@ -72,16 +116,56 @@ class Task:
         """Check if task has completed status."""
         return self.status == "completed"
 
+    def _key(self) -> tuple:
+        return (
+            self.id, self.title, self.status, self.priority, self.area, self.path,
+            self.schema_version, self.unblocker, self.order, self.blocked_by,
+            self.depends_on, self.blocked_reason, self.mtime, self._hash,
+        )
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # Mutable record (matches the former dataclass semantics)
+
     def __repr__(self) -> str:
         """String representation for debugging."""
-        blockers = f"blocked_by={self.blocked_by}" if self.blocked_by else ""
-        deps = f"depends_on={self.depends_on}" if self.depends_on else ""
+        blockers = f"blocked_by={list(self.blocked_by)}" if self.blocked_by else ""
+        deps = f"depends_on={list(self.depends_on)}" if self.depends_on else ""
         return (
             f"Task(id={self.id!r}, status={self.status!r}, "
             f"priority={self.priority!r}, unblocker={self.unblocker}, {blockers} {deps})"
         ).strip()
 
 
+def _intern(value):
+    """Intern string values; pass anything else (e.g. None in tests) through."""
+    try:
+        return sys.intern(value)
+    except TypeError:
+        return value
+
+
+def _intern_ids(ids: Iterable[str]) -> Tuple[str, ...]:
+    """Freeze a dependency list into a tuple of interned task IDs."""
+    try:
+        return tuple(map(sys.intern, ids))
+    except TypeError:
+        return tuple(map(_intern, ids))
+
+
+def _pack_hash(value):
+    """Store hex SHA256 digests as 32 raw bytes; keep anything else (including None) as-is."""
+    if isinstance(value, str) and len(value) == 64:
+        try:
+            return bytes.fromhex(value)
+        except ValueError:
+            pass
+    return value
+
+
 @dataclass(frozen=True)
 class RetryPolicy:
     """
@@ -10,6 +10,10 @@ Key behaviors:
 - Text mode: All output to stdout
 - Structured warning collection for context.warnings array
 - Standardized JSON response format per schemas doc Section 6.3
+- Streaming JSON: top-level iterator values (e.g. a generator of task dicts)
+  are written element by element instead of being built up in memory
+- JSON style: pretty (default), compact or ndjson, selected with the
+  TASKS_JSON_STYLE environment variable; orjson is used when installed
 
 Usage:
     from .output import OutputChannel
@@ -25,12 +29,100 @@ Usage:
     warnings = ctx.output_channel.warnings_as_evidence()
 """
 
+import dataclasses
 import json
+import math
+import os
 import sys
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import date, datetime, time, timezone
 from io import StringIO
-from typing import Any, Dict, List, Optional, TextIO
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json produces the same output
+    orjson = None
+
+JSON_STYLE_ENV_VAR = "TASKS_JSON_STYLE"
+JSON_STYLES = ("pretty", "compact", "ndjson")
+DEFAULT_JSON_STYLE = "pretty"
+
+# Indentation of streamed array elements (inside a top-level key)
+_PRETTY_ELEMENT_INDENT = "\n    "
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Serialize values json has no native form for (shared by both encoders).
+
+    Dataclass instances become dicts and dates/times ISO 8601 strings;
+    anything else raises TypeError like json.dumps without a hook.
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite(value: Any) -> Any:
+    """Copy of value with NaN/Infinity floats replaced by None (as orjson writes them)."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _finite(dataclasses.asdict(value))
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _dumps(value: Any, pretty: bool) -> str:
+    """
+    Serialize one JSON value, preserving dict insertion order.
+
+    orjson and stdlib json produce identical text: both use _json_default
+    (orjson's native dataclass/datetime handling is passed through to it)
+    and both write non-finite floats as null, since NaN is not valid JSON.
+
+    Args:
+        value: JSON-serializable value
+        pretty: Indent by 2 spaces (json.dumps(indent=2) layout), else compact
+
+    Returns:
+        Serialized JSON text
+    """
+    if orjson is not None:
+        options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | (orjson.OPT_INDENT_2 if pretty else 0)
+        )
+        try:
+            return orjson.dumps(value, default=_json_default, option=options).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; let stdlib json decide
+    if pretty:
+        kwargs = {"indent": 2}
+    else:
+        kwargs = {"separators": (",", ":")}
+    try:
+        return json.dumps(value, ensure_ascii=False, default=_json_default, allow_nan=False, **kwargs)
+    except ValueError as e:
+        # NaN/Infinity only; the common case pays no extra pass
+        if "not JSON compliant" not in str(e):
+            raise
+        return json.dumps(_finite(value), ensure_ascii=False, default=_json_default, **kwargs)
+
+
+def json_style_from_env() -> str:
+    """Return the JSON style requested via TASKS_JSON_STYLE (default: pretty)."""
+    style = os.environ.get(JSON_STYLE_ENV_VAR, "").strip().lower()
+    return style if style in JSON_STYLES else DEFAULT_JSON_STYLE
 
 
 @dataclass
@@ -47,6 +139,7 @@ class OutputChannel:
         verbose: When True, emit verbose/debug output
         stdout: Stream for primary output (default: sys.stdout)
         stderr: Stream for warning output (default: sys.stderr)
+        json_style: 'pretty' (indent=2), 'compact' (one line) or 'ndjson'
     """
 
     json_mode: bool = False
@@ -54,18 +147,78 @@ class OutputChannel:
     stdout: TextIO = field(default_factory=lambda: sys.stdout)
     stderr: TextIO = field(default_factory=lambda: sys.stderr)
     _warnings: List[Dict[str, str]] = field(default_factory=list)
+    json_style: str = DEFAULT_JSON_STYLE
 
     @classmethod
     def from_cli_flags(cls, json_mode: bool, verbose: bool = False) -> "OutputChannel":
-        """Create OutputChannel from CLI flags."""
-        return cls(json_mode=json_mode, verbose=verbose)
+        """Create OutputChannel from CLI flags (JSON style from TASKS_JSON_STYLE)."""
+        return cls(json_mode=json_mode, verbose=verbose, json_style=json_style_from_env())
 
     def emit_json(self, data: Dict[str, Any]) -> None:
-        """Output JSON data to stdout with consistent formatting."""
-        output = json.dumps(data, indent=2, ensure_ascii=False)
-        self.stdout.write(output + "\n")
+        """
+        Output JSON data to stdout with consistent formatting.
+
+        Top-level values that are iterators (generators, map objects) are
+        streamed: each element is serialized and written as it is produced,
+        so large responses never exist as one list or one string. The output
+        is identical to serializing the materialized list.
+
+        In ndjson style the non-streamed keys are written as one line,
+        followed by one line per streamed element.
+
+        Args:
+            data: Response dict (key order is preserved)
+        """
+        if self.json_style == "ndjson":
+            self._write_ndjson(data)
+        elif any(isinstance(value, Iterator) for value in data.values()):
+            self._write_streamed(data, pretty=self.json_style != "compact")
+        else:
+            self.stdout.write(_dumps(data, pretty=self.json_style != "compact") + "\n")
         self.stdout.flush()
 
+    def _write_streamed(self, data: Dict[str, Any], pretty: bool) -> None:
+        write = self.stdout.write
+        write("{")
+        for position, (key, value) in enumerate(data.items()):
+            separator = "," if position else ""
+            if pretty:
+                write(f"{separator}\n  {_dumps(str(key), False)}: ")
+            else:
+                write(f"{separator}{_dumps(str(key), False)}:")
+
+            if isinstance(value, Iterator):
+                self._write_array(value, pretty)
+            elif pretty:
+                write(_dumps(value, True).replace("\n", "\n  "))
+            else:
+                write(_dumps(value, False))
+        write("\n}\n" if pretty else "}\n")
+
+    def _write_array(self, items: Iterable[Any], pretty: bool) -> None:
+        write = self.stdout.write
+        opener = "["
+        for item in items:
+            if pretty:
+                text = _dumps(item, True).replace("\n", _PRETTY_ELEMENT_INDENT)
+                write(f"{opener}{_PRETTY_ELEMENT_INDENT}{text}")
+            else:
+                write(f"{opener}{_dumps(item, False)}")
+            opener = ","
+        if opener == "[":
+            write("[]")
+        else:
+            write("\n  ]" if pretty else "]")
+
+    def _write_ndjson(self, data: Dict[str, Any]) -> None:
+        write = self.stdout.write
+        streams = [value for value in data.values() if isinstance(value, Iterator)]
+        envelope = {key: value for key, value in data.items() if not isinstance(value, Iterator)}
+        write(_dumps(envelope, False) + "\n")
+        for stream in streams:
+            for item in stream:
+                write(_dumps(item, False) + "\n")
+
     def emit_text(self, message: str) -> None:
         """Output plain text to stdout."""
         self.stdout.write(message + "\n")
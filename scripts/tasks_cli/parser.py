@@ -165,37 +165,59 @@ class TaskParser:
         Returns:
             List of Task objects (completed tasks included)
         """
-        tasks = []
+        return self.discover_active_tasks() + [
+            task
+            for task in map(self.parse_archived_file, self.archived_task_files())
+            if task
+        ]
+
+    def discover_active_tasks(self) -> List[Task]:
+        """
+        Discover and parse .task.yaml files in tasks/ only.
 
-        # Scan active tasks
+        Returns:
+            List of Task objects outside the archive
+        """
+        tasks = []
         tasks_dir = self.repo_root / "tasks"
         if tasks_dir.exists():
             for task_file in tasks_dir.rglob("*.task.yaml"):
                 task = self.parse_file(task_file)
                 if task:
                     tasks.append(task)
+        return tasks
 
-        # Scan archived/completed tasks
+    def archived_task_files(self) -> List[Path]:
+        """List .task.yaml files under docs/completed-tasks/."""
         archive_dir = self.repo_root / "docs" / "completed-tasks"
-        if archive_dir.exists():
-            for task_file in archive_dir.rglob("*.task.yaml"):
-                task = self.parse_file(task_file)
-                if task:
-                    # Ensure archived tasks are marked as completed
-                    if task.status != "completed":
-                        try:
-                            import sys
-                            print(
-                                f"Warning: Archived task {task.id} has status '{task.status}' "
-                                f"but should be 'completed'",
-                                file=sys.stderr,
-                                flush=True
-                            )
-                        except (BrokenPipeError, IOError):
-                            pass
-                    tasks.append(task)
+        if not archive_dir.exists():
+            return []
+        return list(archive_dir.rglob("*.task.yaml"))
 
-        return tasks
+    def parse_archived_file(self, file_path: Path) -> Optional[Task]:
+        """
+        Parse an archived task file, warning when it is not completed.
+
+        Args:
+            file_path: Path to .task.yaml file in docs/completed-tasks/
+
+        Returns:
+            Task object or None if parsing fails
+        """
+        task = self.parse_file(file_path)
+        # Ensure archived tasks are marked as completed
+        if task and task.status != "completed":
+            try:
+                import sys
+                print(
+                    f"Warning: Archived task {task.id} has status '{task.status}' "
+                    f"but should be 'completed'",
+                    file=sys.stderr,
+                    flush=True
+                )
+            except (BrokenPipeError, IOError):
+                pass
+        return task
 
     def get_completed_ids(self, tasks: List[Task]) -> set:
         """
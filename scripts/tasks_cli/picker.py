@@ -14,6 +14,9 @@ from .constants import DEFAULT_PRIORITY_RANK, DEFAULT_STATUS_RANK, PRIORITY_RANK
 from .exceptions import WorkflowHaltError
 from .graph import DependencyGraph
 from .models import Task
+from .telemetry import get_tracer
+
+_tracer = get_tracer(__name__)
 
 
 def check_halt_conditions(tasks: List[Task]) -> None:
@@ -211,7 +214,8 @@ class TaskPicker:
     def list_tasks(
         self,
         status_filter: Optional[str] = None,
-        unblocker_only: bool = False
+        unblocker_only: bool = False,
+        archived: Optional[List[Task]] = None
     ) -> List[Task]:
         """
         List tasks with optional filtering.
@@ -219,11 +223,13 @@ class TaskPicker:
         Args:
             status_filter: Filter by status (todo, in_progress, blocked, completed)
             unblocker_only: Only show unblocker tasks
+            archived: Materialized archived tasks to include (the picker itself
+                only holds the datastore's hot tier)
 
         Returns:
             Filtered and sorted list of tasks
         """
-        tasks = self.tasks
+        tasks = self.tasks + archived if archived else self.tasks
 
         # Apply filters
         if status_filter:
@@ -365,45 +371,59 @@ class TaskPicker:
             → TASK-B effective priority: P0 (inherits from C)
             → TASK-C effective priority: P0 (own priority)
         """
-        # Priority rank map: lower numeric value = higher priority
-        PRIORITY_RANK = {"P0": 0, "P1": 1, "P2": 2}
-
-        # Reset all effective priorities to declared priority
-        for task in self.tasks:
-            task.effective_priority = task.priority
-            task.priority_reason = None
-
-        # For each task, compute max priority of transitively blocked work
-        for task in self.tasks:
-            # Find what this task blocks (transitively)
-            blocked_tasks = self.graph.find_transitively_blocked(task.id)
-
-            if not blocked_tasks:
-                continue  # No priority inheritance
-
-            # Find max priority among blocked tasks (min numeric rank)
-            blocked_priorities = [t.priority for t in blocked_tasks]
-            max_blocked_priority = min(
-                blocked_priorities,
-                key=lambda p: PRIORITY_RANK.get(p, 999)
-            )
-
-            # If blocking higher-priority work, inherit that urgency
-            task_rank = PRIORITY_RANK.get(task.priority, 999)
-            blocked_rank = PRIORITY_RANK.get(max_blocked_priority, 999)
-
-            if blocked_rank < task_rank:
-                task.effective_priority = max_blocked_priority
-
-                # Build audit trail: list all high-priority tasks blocked
-                high_priority_tasks = [
-                    t.id for t in blocked_tasks
-                    if t.priority == max_blocked_priority
-                ]
-                task.priority_reason = (
-                    f"Blocks {max_blocked_priority} work: " +
-                    ", ".join(sorted(high_priority_tasks))
-                )
+        with _tracer.start_as_current_span("cli.picker.propagate_priorities") as span:
+            span.set_attribute("task_count", len(self.tasks))
+
+            # Priority rank map: lower numeric value = higher priority
+            PRIORITY_RANK = {"P0": 0, "P1": 1, "P2": 2}
+
+            # Reset all effective priorities to declared priority
+            for task in self.tasks:
+                task.effective_priority = task.priority
+                task.priority_reason = None
+
+            # Bitsets of tasks per declared priority, in the index's
+            # reverse-blocked_by numbering, highest priority first
+            blocks = self.graph.closure_index.relation('blocks')
+            priority_masks: Dict[str, int] = {}
+            for task in self.tasks:
+                if task.priority in PRIORITY_RANK:
+                    priority_masks[task.priority] = (
+                        priority_masks.get(task.priority, 0) | blocks.bit(task.id)
+                    )
+            ranked_masks = sorted(priority_masks.items(), key=lambda item: PRIORITY_RANK[item[0]])
+
+            # For each task, find the highest priority among transitively blocked work
+            for task in self.tasks:
+                reachable = blocks.mask(task.id)
+                if not reachable:
+                    continue  # Blocks nothing, no priority inheritance
+
+                task_rank = PRIORITY_RANK.get(task.priority, 999)
+                for priority, mask in ranked_masks:
+                    # Only strictly higher-priority work changes anything
+                    if PRIORITY_RANK[priority] >= task_rank:
+                        break
+                    if not reachable & mask:
+                        continue
+
+                    # Build audit trail: list all high-priority tasks blocked
+                    # (cycle members share a bit, so re-check each candidate)
+                    high_priority_tasks = [
+                        blocked_id for blocked_id in blocks.ids_of(reachable & mask)
+                        if blocked_id != task.id
+                        and self.graph.task_by_id[blocked_id].priority == priority
+                    ]
+                    if not high_priority_tasks:
+                        continue
+
+                    # Blocking higher-priority work: inherit that urgency
+                    task.effective_priority = priority
+                    task.priority_reason = (
+                        f"Blocks {priority} work: " +
+                        ", ".join(sorted(high_priority_tasks))
+                    )
+                    break
 
     def _sort_key(self, task: Task) -> tuple:
         """
@@ -0,0 +1,231 @@
+"""
+Built-in profiling for tasks CLI commands.
+
+``tasks --profile [cpu|alloc] <command> ...`` (or ``--profile=<mode>``) runs
+the whole invocation, including initialize_commands(), under cProfile (cpu,
+the default) or tracemalloc (alloc). When the command finishes:
+
+- cpu: writes a pstats file (load with ``python -m pstats`` or snakeviz)
+- alloc: writes a collapsed-stack file (``frame;frame;frame bytes`` per
+  line, flamegraph.pl/speedscope compatible)
+
+Files go to ``.agent-output/profiles/``. A report with phase timings, the
+top N hot functions (or allocation sites) and peak memory is printed to
+stderr so JSON output on stdout stays parseable.
+
+The option is stripped from argv in __main__ before anything else runs;
+this module is only imported when profiling was requested.
+"""
+
+import cProfile
+import io
+import pstats
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, TextIO, Tuple
+
+PROFILE_MODES = ("cpu", "alloc")
+DEFAULT_PROFILE_MODE = "cpu"
+DEFAULT_PROFILE_TOP = 20
+PROFILES_RELPATH = Path(".agent-output") / "profiles"
+
+# Frames kept per allocation traceback in alloc mode
+TRACEMALLOC_FRAMES = 32
+
+
+def extract_profile_option(argv: List[str]) -> Tuple[Optional[str], List[str]]:
+    """
+    Remove ``--profile``, ``--profile <mode>`` or ``--profile=<mode>`` from an argument list.
+
+    A bare ``--profile`` only consumes the next argument when it is a known
+    mode, so ``tasks --profile list`` still profiles ``list`` in cpu mode.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        Tuple of (mode or None when absent, remaining arguments)
+
+    Raises:
+        ValueError: Unknown profile mode
+    """
+    mode = None
+    remaining = []
+    args = iter(enumerate(argv))
+    for index, arg in args:
+        if arg == "--":
+            remaining.extend(argv[index:])
+            break
+        if arg == "--profile":
+            mode = DEFAULT_PROFILE_MODE
+            if index + 1 < len(argv) and argv[index + 1] in PROFILE_MODES:
+                _, mode = next(args)
+        elif arg.startswith("--profile="):
+            mode = arg.split("=", 1)[1]
+            if mode not in PROFILE_MODES:
+                raise ValueError(
+                    f"Unknown profile mode '{mode}' (expected one of: {', '.join(PROFILE_MODES)})"
+                )
+        else:
+            remaining.append(arg)
+    return mode, remaining
+
+
+class CommandProfiler:
+    """
+    Profile one CLI invocation and report on exit.
+
+    Use as a context manager around command initialization and execution;
+    call mark() between phases to get per-phase wall times.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        output_dir: Path,
+        command: str,
+        top: int = DEFAULT_PROFILE_TOP,
+        stream: Optional[TextIO] = None,
+    ):
+        """
+        Initialize profiler.
+
+        Args:
+            mode: 'cpu' (cProfile) or 'alloc' (tracemalloc)
+            output_dir: Directory for profile files
+            command: Command name (used in the file name)
+            top: Number of hot functions/allocation sites to print
+            stream: Report stream (defaults to stderr)
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.mode = mode
+        self.output_dir = Path(output_dir)
+        self.command = command
+        self.top = top
+        self.stream = stream or sys.stderr
+        self.output_path: Optional[Path] = None
+        self._profiler: Optional[cProfile.Profile] = None
+        self._phases: List[Tuple[str, float]] = []
+        self._started = 0.0
+        self._last_mark = 0.0
+
+    def __enter__(self) -> "CommandProfiler":
+        self._started = self._last_mark = time.perf_counter()
+        if self.mode == "cpu":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        return self
+
+    def mark(self, phase: str) -> None:
+        """
+        Close the current phase and record its wall time.
+
+        Args:
+            phase: Name of the phase that just finished
+        """
+        now = time.perf_counter()
+        self._phases.append((phase, now - self._last_mark))
+        self._last_mark = now
+
+    def __exit__(self, *exc) -> None:
+        self.mark("command")
+        total = time.perf_counter() - self._started
+
+        if self.mode == "cpu":
+            self._profiler.disable()
+            body = self._finish_cpu()
+        else:
+            body = self._finish_alloc()
+
+        self._print_report(total, body)
+
+    # ========================================================================
+    # Mode-specific output
+    # ========================================================================
+
+    def _finish_cpu(self) -> str:
+        self.output_path = self._output_file("pstats")
+        stats = pstats.Stats(self._profiler, stream=io.StringIO())
+        stats.dump_stats(str(self.output_path))
+
+        buffer = io.StringIO()
+        stats.stream = buffer
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        peak = f"Peak RSS: {_format_bytes(_peak_rss_bytes())}"
+        return f"{peak}\n{buffer.getvalue().strip()}"
+
+    def _finish_alloc(self) -> str:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+        self.output_path = self._output_file("collapsed")
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            for stat in snapshot.statistics("traceback"):
+                # Collapsed stacks list the outermost frame first
+                frames = ";".join(
+                    f"{Path(frame.filename).name}:{frame.lineno}"
+                    for frame in reversed(stat.traceback)
+                )
+                f.write(f"{frames} {stat.size}\n")
+
+        lines = [f"Peak traced memory: {_format_bytes(peak)}", "Top allocation sites:"]
+        for stat in snapshot.statistics("lineno")[:self.top]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"  {_format_bytes(stat.size):>10}  {stat.count:>8} blocks  "
+                f"{frame.filename}:{frame.lineno}"
+            )
+        return "\n".join(lines)
+
+    # ========================================================================
+    # Helpers
+    # ========================================================================
+
+    def _output_file(self, suffix: str) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        safe_command = re.sub(r"[^A-Za-z0-9_.-]", "_", self.command) or "command"
+        return self.output_dir / f"{safe_command}-{stamp}-{self.mode}.{suffix}"
+
+    def _print_report(self, total: float, body: str) -> None:
+        out = self.stream
+        print(f"\n=== Profile ({self.mode}) for '{self.command}' ===", file=out)
+        for phase, seconds in self._phases:
+            print(f"  {phase:<22} {seconds * 1000:10.1f} ms", file=out)
+        print(f"  {'total':<22} {total * 1000:10.1f} ms", file=out)
+        print(body.rstrip(), file=out)
+        print(f"Profile written to: {self.output_path}", file=out)
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "n/a"
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} GiB"
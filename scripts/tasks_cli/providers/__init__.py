@@ -2,6 +2,7 @@
 
 Provides structured interfaces for:
 - ProcessProvider: Arbitrary shell commands (tar, pnpm, etc.)
+- AsyncProcessProvider: Concurrent asyncio counterpart of ProcessProvider
 - GitProvider: Git operations with retry/telemetry (S4.1)
 
 All providers share common exception hierarchy and telemetry integration.
@@ -18,6 +19,8 @@ from .exceptions import (
     NonZeroExitWithStdErr,
     TimeoutExceeded,
 )
+from .async_process import AsyncProcessProvider
+from .capture import SpilledOutput
 from .git import GitProvider
 from .process import ProcessProvider
 
@@ -29,4 +32,6 @@ __all__ = [
     'TimeoutExceeded',
     'GitProvider',
     'ProcessProvider',
+    'AsyncProcessProvider',
+    'SpilledOutput',
 ]
@@ -0,0 +1,318 @@
+"""Asyncio process execution provider for overlapping subprocess work.
+
+Async counterpart of ProcessProvider for work that can run concurrently
+(several QA commands, git diff alongside checksum calculation):
+- asyncio.create_subprocess_exec with a bounded number of live processes
+- Per-command timeouts that kill the whole process group (shell wrappers
+  such as `sh -c "pnpm test"` leave no orphaned grandchildren)
+- Incremental stdout/stderr delivery to callbacks and/or files, so large
+  output does not have to be held in memory
+- Optional spill-to-disk capture with head/tail previews (see capture.py)
+- Same span name, attributes, redaction and exception types as ProcessProvider
+
+Output is decoded as UTF-8 (undecodable bytes replaced); line endings are
+kept as emitted. Files receive the raw bytes.
+"""
+
+import asyncio
+import codecs
+import os
+import subprocess
+import weakref
+from contextlib import suppress
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional, Sequence, Tuple, Union
+
+from ..telemetry import get_tracer
+from .capture import DEFAULT_PREVIEW_BYTES, SpilledOutput, SpillWriter
+from .exceptions import CommandFailed, NonZeroExitWithStdErr, TimeoutExceeded
+from .process import ProcessProvider, _kill_process_group
+
+PROCESS_CONCURRENCY_ENV_VAR = "TASKS_PROCESS_CONCURRENCY"
+
+PREVIEW_CHARS = 200  # Span previews, as in ProcessProvider
+_READ_SIZE = 64 * 1024
+
+OutputCallback = Callable[[str], None]
+
+
+def default_concurrency() -> int:
+    """Concurrency limit from TASKS_PROCESS_CONCURRENCY, else the CPU count."""
+    value = os.environ.get(PROCESS_CONCURRENCY_ENV_VAR, "").strip()
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            pass
+    return os.cpu_count() or 1
+
+
+class _OutputSink:
+    """Destination of one output stream: memory, a callback, a file and/or a spill log."""
+
+    def __init__(
+        self,
+        capture: bool,
+        callback: Optional[OutputCallback],
+        path: Optional[Path],
+        spill: Optional[SpillWriter] = None,
+    ):
+        self.enabled = capture or callback is not None or path is not None or spill is not None
+        self.preview = ""
+        self._chunks = [] if capture and path is None and spill is None else None
+        self._callback = callback
+        self._path = path
+        self._file = None
+        self._spill = spill
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+    def open(self) -> None:
+        if self._path is not None:
+            self._file = open(self._path, "wb")
+        if self._spill is not None:
+            self._spill.open()
+
+    def feed(self, data: bytes) -> None:
+        if self._file is not None:
+            self._file.write(data)
+        if self._spill is not None:
+            self._spill.write(data)
+        self._deliver(self._decoder.decode(data))
+
+    def finish(self) -> None:
+        self._deliver(self._decoder.decode(b"", final=True))
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._spill is not None:
+            self._spill.__exit__(None, None, None)
+
+    def output(self) -> Union[str, SpilledOutput, None]:
+        """Captured text, the spill handle, or None when nothing was kept."""
+        if self._spill is not None:
+            return self._spill.close()
+        return "".join(self._chunks) if self._chunks is not None else None
+
+    def _deliver(self, text: str) -> None:
+        if not text:
+            return
+        if len(self.preview) < PREVIEW_CHARS:
+            self.preview += text[:PREVIEW_CHARS - len(self.preview)]
+        if self._chunks is not None:
+            self._chunks.append(text)
+        if self._callback is not None:
+            self._callback(text)
+
+
+class AsyncProcessProvider:
+    """Provider for executing commands concurrently under asyncio.
+
+    Attributes:
+        max_concurrency: Maximum number of commands running at once
+        _logger: Optional logger instance for structured logging
+        _clock: Optional clock for testing time-based operations
+        _tracer: OpenTelemetry tracer for span emission
+    """
+
+    _redact = ProcessProvider._redact
+
+    def __init__(self, logger=None, clock=None, max_concurrency: Optional[int] = None):
+        """Initialize AsyncProcessProvider.
+
+        Args:
+            logger: Optional logger instance (reserved for future use)
+            clock: Optional clock instance for testing (reserved for future use)
+            max_concurrency: Maximum concurrent commands (default: TASKS_PROCESS_CONCURRENCY,
+                else the CPU count)
+        """
+        self._logger = logger
+        self._clock = clock
+        self._tracer = get_tracer(__name__)
+        self.max_concurrency = max(1, max_concurrency or default_concurrency())
+        # asyncio primitives bind to one event loop; keep one semaphore per loop
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run(
+        self,
+        cmd: list[str],
+        *,
+        cwd: Optional[Path] = None,
+        capture: bool = True,
+        env: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = 120.0,
+        redact: Sequence[str] = (),
+        check: bool = True,
+        on_stdout: Optional[OutputCallback] = None,
+        on_stderr: Optional[OutputCallback] = None,
+        stdout_path: Optional[Path] = None,
+        stderr_path: Optional[Path] = None,
+        spill_dir: Optional[Path] = None,
+        spill_name: str = "output",
+        preview_bytes: int = DEFAULT_PREVIEW_BYTES,
+    ) -> subprocess.CompletedProcess:
+        """Execute command with telemetry, waiting for a concurrency slot first.
+
+        Args:
+            cmd: Command and arguments as list
+            cwd: Working directory (default: current)
+            capture: Keep stdout/stderr in memory (default: True)
+            env: Environment variables (default: inherit parent environment)
+            timeout: Timeout in seconds, not counting the wait for a slot (default: 120)
+            redact: Sequence of secret strings to redact from logs
+            check: Raise exception on non-zero exit (default: True)
+            on_stdout: Called with each decoded stdout chunk as it arrives
+            on_stderr: Called with each decoded stderr chunk as it arrives
+            stdout_path: Write raw stdout to this file instead of memory
+            stderr_path: Write raw stderr to this file instead of memory
+            spill_dir: Spill both streams to <spill_dir>/<spill_name>.{stdout,stderr}.log
+                (as ProcessProvider.run)
+            spill_name: Log file name prefix when spilling
+            preview_bytes: Bytes kept in memory from each end of a spilled stream
+
+        Returns:
+            CompletedProcess; stdout/stderr are SpilledOutput handles when
+            spilling, None for streams written to a file or not captured
+
+        Raises:
+            TimeoutExceeded: Command timed out (its process group is killed)
+            CommandFailed: Command failed with non-zero exit (no stderr)
+            NonZeroExitWithStdErr: Command failed with stderr output
+        """
+        with self._tracer.start_as_current_span("cli.provider.process") as span:
+            span.set_attribute("command", cmd[0] if cmd else "unknown")
+            span.set_attribute("timeout", timeout if timeout is not None else 0)
+
+            spills = (None, None)
+            if spill_dir is not None:
+                spills = tuple(
+                    SpillWriter(Path(spill_dir) / f"{spill_name}.{name}.log", preview_bytes)
+                    for name in ("stdout", "stderr")
+                )
+            stdout = _OutputSink(capture, on_stdout, stdout_path, spills[0])
+            stderr = _OutputSink(capture, on_stderr, stderr_path, spills[1])
+            async with self._semaphore():
+                try:
+                    returncode = await self._execute(cmd, cwd, env, timeout, stdout, stderr)
+                except asyncio.TimeoutError as e:
+                    span.set_attribute("timeout_exceeded", True)
+                    raise TimeoutExceeded(cmd, timeout) from e
+
+            span.set_attribute("returncode", returncode)
+            # Redact secrets before logging (only for span attributes)
+            span.set_attribute("stdout_preview", self._redact(stdout.preview, redact))
+            span.set_attribute("stderr_preview", self._redact(stderr.preview, redact))
+
+            result = subprocess.CompletedProcess(cmd, returncode, stdout.output(), stderr.output())
+            if spill_dir is not None:
+                span.set_attribute("stdout_bytes", result.stdout.size)
+                span.set_attribute("stderr_bytes", result.stderr.size)
+            if check and returncode != 0:
+                if isinstance(result.stderr, SpilledOutput):
+                    stderr_text = result.stderr.preview
+                else:
+                    stderr_text = result.stderr if result.stderr is not None else stderr.preview
+                if stderr_text:
+                    raise NonZeroExitWithStdErr(cmd, returncode, stderr_text)
+                raise CommandFailed(cmd, returncode)
+            return result
+
+    async def stream(
+        self,
+        cmd: list[str],
+        **kwargs,
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """Execute command and yield its output as it is produced.
+
+        Accepts the keyword arguments of run() except capture and the
+        callbacks. Exit status is enforced through check (default True) once
+        the output is exhausted; leaving the loop early kills the command.
+
+        Yields:
+            ("stdout" | "stderr", decoded chunk) tuples in arrival order
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        task = asyncio.ensure_future(self.run(
+            cmd,
+            capture=False,
+            on_stdout=lambda text: queue.put_nowait(("stdout", text)),
+            on_stderr=lambda text: queue.put_nowait(("stderr", text)),
+            **kwargs,
+        ))
+        task.add_done_callback(lambda _: queue.put_nowait(finished))
+        try:
+            while (item := await queue.get()) is not finished:
+                yield item
+            task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+    async def _execute(
+        self,
+        cmd: list[str],
+        cwd: Optional[Path],
+        env: Optional[dict[str, str]],
+        timeout: Optional[float],
+        stdout: _OutputSink,
+        stderr: _OutputSink,
+    ) -> int:
+        """Run cmd to completion, pumping enabled streams into their sinks.
+
+        Raises:
+            asyncio.TimeoutError: Timeout elapsed (process group already killed)
+        """
+        stdout.open()
+        try:
+            stderr.open()
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+                env=env,
+                stdout=asyncio.subprocess.PIPE if stdout.enabled else None,
+                stderr=asyncio.subprocess.PIPE if stderr.enabled else None,
+                start_new_session=True,
+            )
+            pumps = [
+                asyncio.ensure_future(self._pump(reader, sink))
+                for reader, sink in ((proc.stdout, stdout), (proc.stderr, stderr))
+                if reader is not None
+            ]
+            try:
+                return await asyncio.wait_for(self._wait(proc, pumps), timeout)
+            except BaseException:
+                # Timeout or cancellation: nothing of the command may outlive us
+                _kill_process_group(proc)
+                for pump in pumps:
+                    pump.cancel()
+                with suppress(asyncio.CancelledError):
+                    await asyncio.gather(*pumps, return_exceptions=True)
+                await proc.wait()
+                raise
+        finally:
+            stdout.close()
+            stderr.close()
+
+    @staticmethod
+    async def _wait(proc: asyncio.subprocess.Process, pumps: list) -> int:
+        await asyncio.gather(*pumps)
+        return await proc.wait()
+
+    @staticmethod
+    async def _pump(reader: asyncio.StreamReader, sink: _OutputSink) -> None:
+        while data := await reader.read(_READ_SIZE):
+            sink.feed(data)
+        sink.finish()
@@ -0,0 +1,123 @@
+"""Bounded-memory output capture that spills full streams to disk.
+
+QA commands (jest, tsc, turbo) can print hundreds of MB. Instead of holding
+a stream in memory, SpillWriter writes it straight to a log file, hashing
+it on the way, and keeps only the first and last preview_bytes in memory.
+Callers get a SpilledOutput handle (path, size, sha256 and previews) and
+open the log when they really need all of it.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+DEFAULT_PREVIEW_BYTES = 16 * 1024  # Kept in memory from each end of a stream
+
+
+@dataclass(frozen=True)
+class SpilledOutput:
+    """Handle to a stream captured on disk.
+
+    Attributes:
+        path: Log file holding the complete raw stream
+        size: Stream size in bytes
+        sha256: SHA256 of the raw stream, computed while writing
+        head: First bytes of the stream, decoded
+        tail: Last bytes of the stream, decoded ("" when head holds everything)
+        omitted: Bytes between head and tail that are only on disk
+    """
+    path: Path
+    size: int
+    sha256: str
+    head: str
+    tail: str
+    omitted: int
+
+    @property
+    def truncated(self) -> bool:
+        """True when the in-memory preview is missing part of the stream."""
+        return self.omitted > 0
+
+    @property
+    def preview(self) -> str:
+        """Head and tail joined; the complete text when nothing was omitted."""
+        if not self.truncated:
+            return self.head + self.tail
+        return f"{self.head}\n... [{self.omitted} bytes omitted, full output in {self.path}] ...\n{self.tail}"
+
+    def read_text(self) -> str:
+        """Load the complete stream (UTF-8, undecodable bytes replaced)."""
+        return self.path.read_text(encoding="utf-8", errors="replace")
+
+    def to_dict(self) -> dict:
+        return {"path": str(self.path), "size": self.size, "sha256": self.sha256}
+
+
+class SpillWriter:
+    """Writes one stream to a file while keeping head/tail previews.
+
+    Memory use is bounded by about 3 * preview_bytes regardless of how much
+    is written.
+    """
+
+    def __init__(self, path: Path, preview_bytes: int = DEFAULT_PREVIEW_BYTES):
+        self.path = Path(path)
+        self._preview_bytes = preview_bytes
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._size = 0
+        self._hash = hashlib.sha256()
+        self._file: Optional[BinaryIO] = None
+
+    def open(self) -> "SpillWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb")
+        return self
+
+    def write(self, data: bytes) -> None:
+        if not data:
+            return
+        self._file.write(data)
+        self._hash.update(data)
+        self._size += len(data)
+
+        room = self._preview_bytes - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if data:
+            self._tail += data
+            # Trim in batches so the ring costs O(1) amortized per byte
+            if len(self._tail) > 2 * self._preview_bytes:
+                del self._tail[:-self._preview_bytes]
+
+    def close(self) -> SpilledOutput:
+        """Close the file and return the handle."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        tail = bytes(self._tail[-self._preview_bytes:])
+        omitted = self._size - len(self._head) - len(tail)
+        if omitted:
+            head_text = self._head.decode("utf-8", "replace")
+            tail_text = tail.decode("utf-8", "replace")
+        else:
+            # Contiguous: decode together so no character is split at the seam
+            head_text, tail_text = (bytes(self._head) + tail).decode("utf-8", "replace"), ""
+        return SpilledOutput(
+            path=self.path,
+            size=self._size,
+            sha256=self._hash.hexdigest(),
+            head=head_text,
+            tail=tail_text,
+            omitted=omitted,
+        )
+
+    def __enter__(self) -> "SpillWriter":
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
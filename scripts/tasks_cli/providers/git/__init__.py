@@ -13,12 +13,15 @@ from typing import Optional
 import time
 
 from .provider import GitProvider as BaseGitProvider
-from .status_ops import GitStatusMixin
+from .batch_ops import GitBatchMixin, ObjectInfo
+from .porcelain import PorcelainParseError, StatusEntry, SubmoduleState, parse_porcelain_v2
+from .status_ops import GitStatusMixin, scope_pathspecs
+from .status_strategy import StatusStrategy
 from .diff_ops import GitDiffMixin
 from .history import GitHistoryMixin
 
 
-class GitProvider(GitHistoryMixin, GitDiffMixin, GitStatusMixin, BaseGitProvider):
+class GitProvider(GitBatchMixin, GitHistoryMixin, GitDiffMixin, GitStatusMixin, BaseGitProvider):
     """Git operations provider with retry logic and telemetry.
 
     Provides consistent git command execution with:
@@ -32,15 +35,27 @@ class GitProvider(GitHistoryMixin, GitDiffMixin, GitStatusMixin, BaseGitProvider
     - GitStatusMixin: File status and listing operations
     - GitDiffMixin: Diff and index operations
     - GitHistoryMixin: Commit history, branches, and refs
+    - GitBatchMixin: Pipelined object lookups over persistent workers
 
     Args:
         repo_root: Path to git repository root
         logger: Optional logger for retry diagnostics
         clock: Optional clock for testing (defaults to time module)
+        status_strategy: Optional status strategy name (defaults to
+            TASKS_GIT_STATUS_STRATEGY)
     """
 
     pass  # All functionality provided by parent classes
 
 
 # Re-export for backward compatibility
-__all__ = ["GitProvider"]
+__all__ = [
+    "GitProvider",
+    "ObjectInfo",
+    "PorcelainParseError",
+    "StatusEntry",
+    "StatusStrategy",
+    "SubmoduleState",
+    "parse_porcelain_v2",
+    "scope_pathspecs",
+]
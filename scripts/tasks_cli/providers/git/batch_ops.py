@@ -0,0 +1,234 @@
+"""Persistent git batch workers for object lookups.
+
+One-shot `git` invocations cost a process spawn per query. For object
+lookups (tree hashes of QA command scopes, object sizes) this module keeps
+a long-lived `git cat-file --batch-check` coprocess instead.
+
+Requests are pipelined: a batch of queries is written while responses are
+read, so thousands of lookups cost one round trip over one pipe. Workers
+start lazily, restart after a crash, and are closed by GitProvider.close()
+or at interpreter exit.
+"""
+
+import atexit
+import subprocess
+import threading
+import weakref
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+from ..exceptions import CommandFailed
+
+# Payloads up to this size are written inline; larger batches are written
+# from a helper thread so a full stdout pipe cannot deadlock the writer.
+_INLINE_WRITE_LIMIT = 16 * 1024
+
+_live_workers: "weakref.WeakSet[BatchWorker]" = weakref.WeakSet()
+
+
+class ObjectInfo(NamedTuple):
+    """Object metadata from `git cat-file --batch-check`."""
+    oid: str
+    type: str
+    size: int
+
+
+class _FramedReader:
+    """Delimiter framed reads over a binary pipe."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffer = bytearray()
+
+    def _fill(self) -> None:
+        chunk = self._stream.read1(65536)
+        if not chunk:
+            raise EOFError("git batch worker closed its output")
+        self._buffer += chunk
+
+    def read_until(self, delimiter: bytes) -> bytes:
+        """Read one field, excluding the delimiter."""
+        start = 0
+        while True:
+            index = self._buffer.find(delimiter, start)
+            if index >= 0:
+                field = bytes(self._buffer[:index])
+                del self._buffer[:index + len(delimiter)]
+                return field
+            start = len(self._buffer)
+            self._fill()
+
+
+class BatchWorker:
+    """A long-lived git coprocess answering pipelined requests.
+
+    Args:
+        repo_root: Repository to run in
+        args: Git arguments (without 'git')
+    """
+
+    def __init__(self, repo_root, args: Sequence[str]):
+        self.repo_root = repo_root
+        self.cmd = ["git", *args]
+        self.spawn_count = 0
+        self._proc: Optional[subprocess.Popen] = None
+        self._reader: Optional[_FramedReader] = None
+        self._lock = threading.Lock()
+        _live_workers.add(self)
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        self._proc = subprocess.Popen(
+            self.cmd,
+            cwd=self.repo_root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._reader = _FramedReader(self._proc.stdout)
+        self.spawn_count += 1
+        return self._proc
+
+    def request(self, payloads: Sequence[bytes], read_response: Callable[[_FramedReader], object]) -> list:
+        """Send requests and read one response per request, in order.
+
+        Args:
+            payloads: Encoded requests (including their terminators)
+            read_response: Reads one response from the worker output
+
+        Returns:
+            Responses in request order
+
+        Raises:
+            CommandFailed: Worker exited or closed its pipes mid-batch
+        """
+        if not payloads:
+            return []
+
+        with self._lock:
+            proc = self._ensure_started()
+            data = b"".join(payloads)
+            writer = None
+            write_errors: List[BaseException] = []
+
+            def write() -> None:
+                try:
+                    proc.stdin.write(data)
+                    proc.stdin.flush()
+                except OSError as e:
+                    write_errors.append(e)
+
+            if len(data) <= _INLINE_WRITE_LIMIT:
+                write()
+            else:
+                writer = threading.Thread(target=write, daemon=True)
+                writer.start()
+
+            try:
+                if write_errors:
+                    raise EOFError(str(write_errors[0]))
+                return [read_response(self._reader) for _ in payloads]
+            except EOFError as e:
+                self._stop(kill=True)
+                raise CommandFailed(self.cmd, proc.returncode if proc.returncode is not None else -1) from e
+            finally:
+                if writer is not None:
+                    writer.join()
+
+    def _stop(self, kill: bool = False, timeout: float = 5) -> None:
+        proc, self._proc, self._reader = self._proc, None, None
+        if proc is None:
+            return
+        try:
+            if kill:
+                proc.kill()
+            else:
+                proc.stdin.close()  # Workers exit on EOF
+            proc.wait(timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        finally:
+            for stream in (proc.stdin, proc.stdout):
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        """Stop the worker (it restarts on the next request)."""
+        with self._lock:
+            self._stop()
+
+
+@atexit.register
+def _close_live_workers() -> None:
+    for worker in list(_live_workers):
+        worker.close()
+
+
+def _read_object_header(reader: _FramedReader) -> Optional[ObjectInfo]:
+    # "<oid> <type> <size>" or "<name> missing" / "<name> ambiguous"
+    header = reader.read_until(b"\n").decode("utf-8", "surrogateescape")
+    parts = header.rsplit(" ", 2)
+    if len(parts) != 3 or not parts[2].isdigit():
+        return None
+    return ObjectInfo(oid=parts[0], type=parts[1], size=int(parts[2]))
+
+
+def _encode_object_names(specs: Sequence[str]) -> List[bytes]:
+    for spec in specs:
+        if "\n" in spec:
+            raise ValueError(f"Object name contains a newline: {spec!r}")
+    return [spec.encode("utf-8", "surrogateescape") + b"\n" for spec in specs]
+
+
+class GitBatchMixin:
+    """Mixin providing batched object lookups over persistent workers.
+
+    This mixin requires the including class to provide:
+    - self.repo_root (Path to repository)
+    - self._tracer (OpenTelemetry tracer)
+    - self.clock (time module or mock)
+    - self._batch_workers (dict, initialized empty)
+    """
+
+    def _batch_worker(self, name: str, args: Sequence[str]) -> BatchWorker:
+        worker = self._batch_workers.get(name)
+        if worker is None:
+            worker = self._batch_workers[name] = BatchWorker(self.repo_root, args)
+        return worker
+
+    def _batch_request(self, method_name, name, args, payloads, read_response) -> list:
+        with self._tracer.start_as_current_span(f"cli.provider.git.{method_name}") as span:
+            worker = self._batch_worker(name, args)
+            spawns_before = worker.spawn_count
+            start_time = self.clock.time()
+            try:
+                return worker.request(payloads, read_response)
+            except Exception as e:
+                span.set_attribute("error", str(e))
+                raise
+            finally:
+                span.set_attribute("command", " ".join(worker.cmd))
+                span.set_attribute("request_count", len(payloads))
+                span.set_attribute("worker_spawned", worker.spawn_count > spawns_before)
+                span.set_attribute("duration_ms", (self.clock.time() - start_time) * 1000)
+
+    def object_info(self, specs: Sequence[str]) -> List[Optional[ObjectInfo]]:
+        """Look up object id, type and size for many object names.
+
+        Args:
+            specs: Object names (e.g. "HEAD:path/to/file", a commit SHA)
+
+        Returns:
+            ObjectInfo per spec (None for missing/ambiguous objects)
+
+        Raises:
+            ValueError: An object name contains a newline
+            CommandFailed: Batch worker failed
+        """
+        return self._batch_request(
+            "object_info", "batch_check", ["cat-file", "--batch-check"],
+            _encode_object_names(specs), _read_object_header,
+        )
@@ -25,6 +25,7 @@ class GitDiffMixin:
     - self.clock (time module or mock)
     - self.repo_root (Path to repository)
     - self.logger (optional logger)
+    - self.invalidate_state_cache(env) (called after index writes)
     """
 
     @retry(
@@ -323,6 +324,7 @@ class GitDiffMixin:
                     result = self._run_git(args)
 
                 duration_ms = (self.clock.time() - start_time) * 1000
+                self.invalidate_state_cache(env)
 
                 # Set span attributes
                 span.set_attribute("command", " ".join(["git"] + args))
@@ -381,6 +383,7 @@ class GitDiffMixin:
                 )
 
                 duration_ms = (self.clock.time() - start_time) * 1000
+                self.invalidate_state_cache(env)
 
                 # Set span attributes
                 span.set_attribute("command", " ".join(["git"] + args))
@@ -444,6 +447,7 @@ class GitDiffMixin:
                 )
 
                 duration_ms = (self.clock.time() - start_time) * 1000
+                self.invalidate_state_cache(env)
 
                 # Set span attributes
                 span.set_attribute("command", " ".join(["git"] + args))
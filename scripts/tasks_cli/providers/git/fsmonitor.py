@@ -0,0 +1,410 @@
+"""inotify-backed fsmonitor for `git status` (Linux).
+
+With `core.fsmonitor` set to a hook, git asks the hook which paths changed
+since its last query instead of lstat()ing every tracked file and reading
+every directory. This module provides both sides of that hook:
+
+- FsmonitorWatcher: recursive inotify watch of a worktree that records
+  changed paths with a sequence number
+- `daemon`: serves a watcher over a Unix socket in the git directory and
+  exits after an idle timeout
+- fsmonitor_hook.py: the hook (protocol v2) git runs on every index
+  refresh, which forwards the query to the daemon
+
+The hook never makes status wrong, only slower: when the daemon is down it
+exits non-zero and git falls back to a full scan; when the token is unknown
+(daemon restarted, inotify queue overflow, watch limit reached) it answers
+"/" (everything may have changed).
+
+Both modules use only the standard library so they run as scripts without
+importing tasks_cli.
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import os
+import select
+import shlex
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+if __package__:
+    from .fsmonitor_hook import query_daemon
+else:  # Run as a script (the detached daemon)
+    from fsmonitor_hook import query_daemon
+
+HOOK_FILENAME = "tasks-fsmonitor-hook"
+SOCKET_FILENAME = "tasks-fsmonitor.sock"
+DEFAULT_IDLE_TIMEOUT = 30 * 60  # Seconds without a query before the daemon exits
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+    | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (then len bytes of name)
+_READ_SIZE = 256 * 1024
+_UNIX_PATH_MAX = 100  # sun_path is 108 bytes on Linux; keep a margin
+
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        _libc = libc
+    return _libc
+
+
+def inotify_available() -> bool:
+    """Whether this platform provides inotify."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        return hasattr(_load_libc(), "inotify_init1")
+    except OSError:
+        return False
+
+
+def socket_path(git_dir: Path) -> Path:
+    """Daemon socket for a git directory (in /tmp if the path is too long for AF_UNIX)."""
+    path = Path(git_dir) / SOCKET_FILENAME
+    if len(os.fsencode(path)) <= _UNIX_PATH_MAX:
+        return path
+    digest = hashlib.sha1(os.fsencode(Path(git_dir).resolve())).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"tasks-fsmonitor-{digest}.sock"
+
+
+class FsmonitorWatcher:
+    """Recursive inotify watch of a worktree recording changed paths.
+
+    Every change gets a sequence number; a token "<instance>:<seq>" names a
+    point in time. changes_since() answers with the paths changed after a
+    token, or None when the watcher cannot answer for that token.
+
+    Args:
+        root: Worktree root
+        exclude: Top-level directory names not watched (git's own directory)
+    """
+
+    def __init__(self, root: Path, exclude: Tuple[str, ...] = (".git",)):
+        self.root = Path(root)
+        self.exclude = frozenset(exclude)
+        self.instance = f"{os.getpid()}-{time.time_ns()}"
+        self._fd: Optional[int] = None
+        self._wd_paths: Dict[int, str] = {}
+        self._changed: Dict[str, int] = {}
+        self._seq = 0
+        self._valid_from = 0  # Tokens older than this cannot be answered
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Create the inotify instance and watch every directory under root."""
+        fd = _load_libc().inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self._fd = fd
+        self._add_tree("")
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def close(self) -> None:
+        """Release the inotify instance and its watches."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def token(self) -> str:
+        """Token for the current point in time."""
+        return f"{self.instance}:{self._seq}"
+
+    def changes_since(self, token: str) -> Tuple[str, Optional[List[str]]]:
+        """Paths changed after a token.
+
+        Pending inotify events are processed first, so a change made before
+        this call is always reported.
+
+        Args:
+            token: Token from an earlier answer (or anything else)
+
+        Returns:
+            Tuple of (new token, sorted changed paths or None if unknown)
+        """
+        with self._lock:
+            self._drain()
+            new_token = self.token()
+            instance, _, seq = token.rpartition(":")
+            if instance != self.instance or not seq.isdigit() or int(seq) < self._valid_from:
+                return new_token, None
+            since = int(seq)
+            return new_token, sorted(path for path, changed in self._changed.items() if changed > since)
+
+    def run(self, stop: threading.Event, poll_interval: float = 1.0) -> None:
+        """Process events until stop is set (keeps the kernel queue short)."""
+        while not stop.is_set():
+            readable, _, _ = select.select([self._fd], [], [], poll_interval)
+            if readable:
+                with self._lock:
+                    self._drain()
+
+    def _invalidate(self) -> None:
+        self._seq += 1
+        self._valid_from = self._seq
+        self._changed.clear()
+
+    def _record(self, path: str) -> None:
+        self._seq += 1
+        self._changed[path] = self._seq
+
+    def _add_watch(self, rel_dir: str) -> None:
+        path = os.fsencode(self.root / rel_dir) if rel_dir else os.fsencode(self.root)
+        wd = _load_libc().inotify_add_watch(self._fd, path, _WATCH_MASK)
+        if wd >= 0:
+            self._wd_paths[wd] = rel_dir
+            return
+        err = ctypes.get_errno()
+        if err == errno.ENOSPC:
+            # Watch limit reached: unwatched directories would be missed
+            self._valid_from = sys.maxsize
+        elif err not in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+            raise OSError(err, f"inotify_add_watch {rel_dir or '.'}: {os.strerror(err)}")
+
+    def _add_tree(self, rel_dir: str, record: bool = False) -> None:
+        """Watch a directory and everything below it.
+
+        With record=True (a directory that just appeared) its contents are
+        recorded as changed too: they may have been written before the watch
+        was added.
+        """
+        top = self.root / rel_dir if rel_dir else self.root
+        for dirpath, dirnames, filenames in os.walk(top):
+            rel = os.path.relpath(dirpath, self.root)
+            rel = "" if rel == "." else rel.replace(os.sep, "/")
+            if not rel:
+                dirnames[:] = [d for d in dirnames if d not in self.exclude]
+            self._add_watch(rel)
+            if record:
+                for name in filenames:
+                    self._record(f"{rel}/{name}")
+                for name in dirnames:
+                    self._record(f"{rel}/{name}/")
+
+    def _forget_tree(self, rel_dir: str) -> None:
+        """Drop watches below a directory that moved away (their paths are stale)."""
+        prefix = rel_dir + "/"
+        for wd, path in list(self._wd_paths.items()):
+            if path == rel_dir or path.startswith(prefix):
+                del self._wd_paths[wd]
+                _load_libc().inotify_rm_watch(self._fd, wd)
+
+    def _drain(self) -> None:
+        """Process all queued inotify events (caller holds the lock)."""
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = os.fsdecode(data[offset:offset + name_len].rstrip(b"\0"))
+                offset += name_len
+                self._handle_event(wd, mask, name)
+
+    def _handle_event(self, wd: int, mask: int, name: str) -> None:
+        if mask & IN_Q_OVERFLOW:
+            self._invalidate()
+            return
+        if mask & IN_IGNORED:
+            self._wd_paths.pop(wd, None)
+            return
+        rel_dir = self._wd_paths.get(wd)
+        if rel_dir is None or not name:
+            return  # Self events are reported by the parent's watch
+        if not rel_dir and name in self.exclude:
+            return
+        path = f"{rel_dir}/{name}" if rel_dir else name
+
+        if mask & IN_ISDIR:
+            self._record(path + "/")
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_tree(path, record=True)
+            elif mask & IN_MOVED_FROM:
+                self._forget_tree(path)
+        else:
+            self._record(path)
+
+
+def _encode_answer(token: str, paths: Optional[List[str]]) -> bytes:
+    """Hook protocol v2 answer: token NUL, then NUL-terminated paths ("/" = everything)."""
+    entries = ["/"] if paths is None else paths
+    return b"".join(os.fsencode(item) + b"\0" for item in [token, *entries])
+
+
+def serve(
+    root: Path,
+    sock_path: Path,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    stop: Optional[threading.Event] = None,
+    ready: Optional[threading.Event] = None,
+) -> None:
+    """Run the daemon until it has been idle for idle_timeout seconds.
+
+    It also stops when stop is set or the worktree is removed. ready (if
+    given) is set once queries are accepted.
+    """
+    try:
+        query_daemon(sock_path, "", timeout=1.0)
+        if ready is not None:
+            ready.set()
+        return  # Another daemon already serves this worktree
+    except OSError:
+        pass
+
+    root = Path(root)
+    watcher = FsmonitorWatcher(root)
+    watcher.start()
+    stop = stop or threading.Event()
+    events = threading.Thread(target=watcher.run, args=(stop,), daemon=True)
+    events.start()
+
+    if sock_path.exists():
+        sock_path.unlink()  # Stale socket of a daemon that died
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(os.fsencode(sock_path))
+        server.listen(16)
+        if ready is not None:
+            ready.set()
+        server.settimeout(1.0)
+        last_query = time.monotonic()
+        while not stop.is_set() and time.monotonic() - last_query < idle_timeout and root.is_dir():
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            last_query = time.monotonic()
+            with conn:
+                conn.settimeout(5.0)
+                try:
+                    request = b""
+                    while not request.endswith(b"\n") and (chunk := conn.recv(4096)):
+                        request += chunk
+                    token = request.rstrip(b"\n").decode("utf-8", "surrogateescape")
+                    conn.sendall(_encode_answer(*watcher.changes_since(token)))
+                except OSError:
+                    pass  # Client went away; it falls back to a full scan
+    finally:
+        stop.set()
+        server.close()
+        try:
+            sock_path.unlink()
+        except FileNotFoundError:
+            pass
+        events.join(timeout=2)
+        watcher.close()
+
+
+def start_daemon(root: Path, sock_path: Path, wait: float = 5.0) -> bool:
+    """Start a detached daemon for a worktree unless one is running.
+
+    Returns:
+        True once the daemon answers, False if it did not come up in time
+    """
+    try:
+        query_daemon(sock_path, "", timeout=1.0)
+        return True
+    except OSError:
+        pass
+
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "daemon", "--root", str(root), "--socket", str(sock_path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        try:
+            query_daemon(sock_path, "", timeout=1.0)
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def install_hook(git_dir: Path, sock_path: Path) -> Path:
+    """Write the fsmonitor hook script for a repository.
+
+    Returns:
+        Path to pass as core.fsmonitor
+    """
+    hook_path = Path(git_dir) / HOOK_FILENAME
+    hook_module = Path(__file__).resolve().with_name("fsmonitor_hook.py")
+    command = shlex.join([sys.executable, "-S", str(hook_module), str(sock_path)])
+    script = (
+        "#!/bin/sh\n"
+        "# Generated by tasks_cli: answers git fsmonitor queries from the inotify daemon\n"
+        f"exec {command} \"$@\"\n"
+    )
+    if not hook_path.exists() or hook_path.read_text() != script:
+        fd, temp_path = tempfile.mkstemp(dir=hook_path.parent, prefix=f".{hook_path.name}.tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(script)
+            os.chmod(temp_path, 0o755)
+            os.replace(temp_path, hook_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+    return hook_path
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Watch a worktree and answer fsmonitor hook queries")
+    parser.add_argument("command", choices=["daemon"])
+    parser.add_argument("--root", required=True, type=Path)
+    parser.add_argument("--socket", required=True, type=Path)
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+
+    args = parser.parse_args(argv)
+    serve(args.root, args.socket, args.idle_timeout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""fsmonitor hook client: forwards git's query to the inotify daemon.
+
+git runs the hook on every index refresh, so this module is kept to the
+bare minimum of imports (start-up time is most of the hook's cost). See
+fsmonitor.py for the daemon and the protocol.
+
+Usage (as written by fsmonitor.install_hook; git appends the last two):
+    python fsmonitor_hook.py <socket> <version> <token>
+"""
+
+import os
+import socket
+import sys
+
+HOOK_VERSION = 2
+
+
+def query_daemon(sock_path, token: str, timeout: float = 5.0) -> bytes:
+    """Ask a running daemon for changes since token.
+
+    Returns:
+        Hook protocol v2 answer (token NUL, then NUL-terminated paths)
+
+    Raises:
+        OSError: Daemon is not running or did not answer
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(os.fsencode(sock_path))
+        conn.sendall(token.encode("utf-8", "surrogateescape") + b"\n")
+        conn.shutdown(socket.SHUT_WR)
+        chunks = []
+        while chunk := conn.recv(65536):
+            chunks.append(chunk)
+    answer = b"".join(chunks)
+    if not answer:
+        raise ConnectionError("fsmonitor daemon closed the connection without answering")
+    return answer
+
+
+def main(argv) -> int:
+    """Run the hook; a non-zero exit makes git fall back to a full scan."""
+    if len(argv) < 2 or argv[1] != str(HOOK_VERSION):
+        return 1
+    try:
+        answer = query_daemon(argv[0], argv[2] if len(argv) > 2 else "")
+    except OSError:
+        return 1
+    sys.stdout.buffer.write(answer)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
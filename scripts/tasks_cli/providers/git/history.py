@@ -185,3 +185,67 @@ class GitHistoryMixin:
                     span.set_attribute("stderr_preview", stderr_preview)
                 span.set_attribute("error", str(e))
                 raise
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(min=0.5, max=8.0),
+        retry=retry_if_exception_type(CommandFailed),
+    )
+    def get_tree_hash(self, path: str = ".", rev: str = "HEAD") -> str:
+        """Get the git tree (or blob) object id for a path at a revision.
+
+        The id changes whenever any committed file below ``path`` changes,
+        so it serves as a cheap content fingerprint for a package directory.
+
+        Args:
+            path: Path relative to repo root ('.' for the root tree)
+            rev: Revision to resolve the path against (default: HEAD)
+
+        Returns:
+            Object SHA of the tree or blob at ``rev:path``
+
+        Raises:
+            TimeoutExceeded: Command exceeded timeout
+            NonZeroExitWithStdErr: Path does not exist at revision
+            CommandFailed: Git command failed
+        """
+        retry_count = 0
+        method_name = "get_tree_hash"
+
+        with self._tracer.start_as_current_span(f"cli.provider.git.{method_name}") as span:
+            try:
+                start_time = self.clock.time()
+
+                normalized = path.strip().rstrip("/")
+                while normalized.startswith("./"):
+                    normalized = normalized[2:]
+                if normalized == ".":
+                    normalized = ""
+                spec = f"{rev}:{normalized}"
+                # Served by the persistent cat-file worker, so fingerprinting
+                # every command of a QA pipeline reuses one git process
+                info = self.object_info([spec])[0]
+
+                duration_ms = (self.clock.time() - start_time) * 1000
+
+                # Set span attributes
+                span.set_attribute("object", spec)
+                span.set_attribute("duration_ms", duration_ms)
+                span.set_attribute("retry_count", retry_count)
+
+                if info is None:
+                    raise NonZeroExitWithStdErr(
+                        ["git", "cat-file", "--batch-check"], 128,
+                        f"fatal: path '{normalized}' does not exist in '{rev}'",
+                    )
+                return info.oid
+
+            except Exception as e:
+                # Record failure in span
+                if hasattr(e, 'returncode'):
+                    span.set_attribute("returncode", e.returncode)
+                if hasattr(e, 'stderr'):
+                    stderr_preview = e.stderr[:200] if e.stderr else ""
+                    span.set_attribute("stderr_preview", stderr_preview)
+                span.set_attribute("error", str(e))
+                raise
@@ -0,0 +1,164 @@
+"""Typed parser for `git status --porcelain=v2 -z`.
+
+The v1 line format quotes unusual paths and joins renames as "old -> new",
+so splitting lines misreports renames, paths with spaces or newlines and
+non-ASCII names. The v2 `-z` format is unambiguous: records are
+NUL-terminated, paths are raw, and rename sources follow as a separate
+field. Every status consumer goes through parse_porcelain_v2().
+
+Record formats (fields separated by one space):
+
+    1 XY sub mH mI mW hH hI path                  ordinary change
+    2 XY sub mH mI mW hH hI Xscore path NUL orig  rename or copy
+    u XY sub m1 m2 m3 mW h1 h2 h3 path            unmerged
+    ? path                                        untracked
+    ! path                                        ignored
+    # header                                      (--branch etc.; skipped)
+"""
+
+from typing import List, NamedTuple, Optional, Union
+
+KIND_CHANGED = "changed"
+KIND_RENAMED = "renamed"      # Also copies (score starts with C)
+KIND_UNMERGED = "unmerged"
+KIND_UNTRACKED = "untracked"
+KIND_IGNORED = "ignored"
+
+UNMODIFIED = "."  # v2 uses '.' where v1 printed a space
+
+
+class PorcelainParseError(ValueError):
+    """Status output is not valid porcelain v2 -z."""
+
+
+class SubmoduleState(NamedTuple):
+    """Submodule field of a v2 record ("S<c><m><u>")."""
+    commit_changed: bool
+    tracked_changes: bool
+    untracked_changes: bool
+
+
+class StatusEntry(NamedTuple):
+    """One path reported by `git status --porcelain=v2 -z`.
+
+    Modes and hashes are None for untracked/ignored entries. For unmerged
+    entries, mode_head/mode_index hold stage 1/2 and mode_stage3 stage 3
+    (likewise for hashes).
+    """
+    kind: str
+    path: str
+    index_status: str = UNMODIFIED     # X
+    worktree_status: str = UNMODIFIED  # Y
+    orig_path: Optional[str] = None    # Rename/copy source
+    score: Optional[str] = None        # e.g. "R100", "C75"
+    submodule: Optional[SubmoduleState] = None
+    mode_head: Optional[str] = None
+    mode_index: Optional[str] = None
+    mode_worktree: Optional[str] = None
+    hash_head: Optional[str] = None
+    hash_index: Optional[str] = None
+    mode_stage3: Optional[str] = None
+    hash_stage3: Optional[str] = None
+
+    @property
+    def xy(self) -> str:
+        """Two-letter status code ("??" for untracked, "!!" for ignored)."""
+        return self.index_status + self.worktree_status
+
+    @property
+    def is_untracked(self) -> bool:
+        return self.kind == KIND_UNTRACKED
+
+    @property
+    def paths(self) -> List[str]:
+        """Paths touched by the entry (rename sources included)."""
+        return [self.path] if self.orig_path is None else [self.path, self.orig_path]
+
+
+# Every valid submodule field, so records resolve it with one dict lookup
+_SUBMODULE_FIELDS = {"N...": None}
+for _c in "C.":
+    for _m in "M.":
+        for _u in "U.":
+            _SUBMODULE_FIELDS[f"S{_c}{_m}{_u}"] = SubmoduleState(_c == "C", _m == "M", _u == "U")
+
+_new_entry = tuple.__new__  # Skips NamedTuple.__new__ argument handling (hot loop)
+
+
+def _split(record: str, count: int) -> List[str]:
+    parts = record.split(" ", count - 1)
+    if len(parts) != count or len(parts[1]) != 2 or not parts[-1] or parts[2] not in _SUBMODULE_FIELDS:
+        raise PorcelainParseError(f"Malformed status record: {record[:200]!r}")
+    return parts
+
+
+def parse_porcelain_v2(output: Union[str, bytes]) -> List[StatusEntry]:
+    """Parse `git status --porcelain=v2 -z` output.
+
+    Args:
+        output: Raw output (bytes are decoded as UTF-8 with surrogateescape,
+            so undecodable names survive a round trip through os.fsencode)
+
+    Returns:
+        Entries in git's output order
+
+    Raises:
+        PorcelainParseError: Output is truncated or malformed
+    """
+    if isinstance(output, bytes):
+        output = output.decode("utf-8", "surrogateescape")
+    if not output:
+        return []
+    if not output.endswith("\0"):
+        raise PorcelainParseError("Status output is not NUL-terminated (missing -z or truncated)")
+
+    fields = output[:-1].split("\0")
+    entries: List[StatusEntry] = []
+    append = entries.append
+    submodules = _SUBMODULE_FIELDS
+    index = 0
+    count = len(fields)
+
+    while index < count:
+        record = fields[index]
+        index += 1
+        tag = record[:2]
+
+        if tag == "1 ":
+            _, xy, sub, m_head, m_index, m_worktree, h_head, h_index, path = _split(record, 9)
+            entry = (
+                KIND_CHANGED, path, xy[0], xy[1], None, None, submodules[sub],
+                m_head, m_index, m_worktree, h_head, h_index, None, None,
+            )
+        elif tag == "? ":
+            entry = (KIND_UNTRACKED, record[2:], "?", "?", None, None, None, None, None, None, None, None, None, None)
+        elif tag == "2 ":
+            _, xy, sub, m_head, m_index, m_worktree, h_head, h_index, score, path = _split(record, 10)
+            if index >= count:
+                raise PorcelainParseError(f"Rename record without source path: {record[:200]!r}")
+            orig_path = fields[index]
+            index += 1
+            if not orig_path or score[:1] not in ("R", "C"):
+                raise PorcelainParseError(f"Malformed rename record: {record[:200]!r}")
+            entry = (
+                KIND_RENAMED, path, xy[0], xy[1], orig_path, score, submodules[sub],
+                m_head, m_index, m_worktree, h_head, h_index, None, None,
+            )
+        elif tag == "u ":
+            _, xy, sub, m1, m2, m3, m_worktree, h1, h2, h3, path = _split(record, 11)
+            entry = (
+                KIND_UNMERGED, path, xy[0], xy[1], None, None, submodules[sub],
+                m1, m2, m_worktree, h1, h2, m3, h3,
+            )
+        elif tag == "! ":
+            entry = (KIND_IGNORED, record[2:], "!", "!", None, None, None, None, None, None, None, None, None, None)
+        elif tag == "# ":
+            continue
+        else:
+            raise PorcelainParseError(f"Unknown status record: {record[:200]!r}")
+
+        if not entry[1]:
+            raise PorcelainParseError(f"Status record without a path: {record[:200]!r}")
+        append(_new_entry(StatusEntry, entry))
+
+    return entries
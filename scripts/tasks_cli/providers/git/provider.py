@@ -5,9 +5,13 @@ Part of task-cli-modularization M2.2 decomposition.
 """
 
 import subprocess
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
+
+from opentelemetry import trace
 
 from tenacity import (
     retry,
@@ -17,8 +21,47 @@ from tenacity import (
 )
 
 from ..exceptions import ProcessError, CommandFailed, TimeoutExceeded, NonZeroExitWithStdErr
+from .status_strategy import StatusStrategy, resolve_status_strategy
 from ...telemetry import get_tracer
 
+# Read-only queries whose output depends only on HEAD, the index and the worktree
+STATE_QUERY_COMMANDS = frozenset({"status", "ls-files", "rev-parse"})
+
+
+class GitStateCache:
+    """Memoized git state queries for one CLI invocation.
+
+    Results are keyed by the full git argv, so different flags (e.g.
+    `--untracked-files=all` vs `--untracked-files=no`) are cached separately.
+    Only successful results are stored.
+    """
+
+    def __init__(self):
+        self._results: Dict[Tuple[str, ...], subprocess.CompletedProcess] = {}
+        self._lock = threading.Lock()
+        self.saved_spawns = 0
+        self.invalidations = 0
+
+    def get(self, key: Tuple[str, ...]) -> Optional[subprocess.CompletedProcess]:
+        """Get a memoized result (counts as a saved spawn), or None."""
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self.saved_spawns += 1
+            return result
+
+    def put(self, key: Tuple[str, ...], result: subprocess.CompletedProcess) -> None:
+        """Memoize a result."""
+        with self._lock:
+            self._results[key] = result
+
+    def invalidate(self) -> None:
+        """Drop all memoized results."""
+        with self._lock:
+            if self._results:
+                self._results.clear()
+            self.invalidations += 1
+
 
 class GitProvider:
     """Git operations provider with retry logic and telemetry.
@@ -33,6 +76,8 @@ class GitProvider:
         repo_root: Path to git repository root
         logger: Optional logger for retry diagnostics
         clock: Optional clock for testing (defaults to time module)
+        status_strategy: Optional status strategy name (defaults to
+            TASKS_GIT_STATUS_STRATEGY, see status_strategy.py)
     """
 
     def __init__(
@@ -40,11 +85,105 @@ class GitProvider:
         repo_root: Path,
         logger=None,
         clock=None,
+        status_strategy: Optional[str] = None,
     ):
         self.repo_root = repo_root
         self.logger = logger
         self.clock = clock or time
         self._tracer = get_tracer(__name__)
+        self._state_cache: Optional[GitStateCache] = None
+        self._batch_workers: Dict[str, object] = {}
+        self._status_strategy_name = status_strategy
+        self._status_strategy: Optional[StatusStrategy] = None
+
+    def close(self) -> None:
+        """Stop persistent batch workers (they restart on next use)."""
+        for worker in self._batch_workers.values():
+            worker.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def status_strategy(self) -> StatusStrategy:
+        """Status strategy for this repository (resolved on first use).
+
+        Raises:
+            ValueError: Unknown strategy name
+        """
+        if self._status_strategy is None:
+            self._status_strategy = resolve_status_strategy(
+                self.repo_root, self._git_dir, self._status_strategy_name
+            )
+        return self._status_strategy
+
+    def _git_dir(self) -> Path:
+        dot_git = Path(self.repo_root) / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        result = subprocess.run(
+            ["git", "rev-parse", "--absolute-git-dir"],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode != 0:
+            raise NonZeroExitWithStdErr(["git", "rev-parse", "--absolute-git-dir"], result.returncode, result.stderr)
+        return Path(result.stdout.strip())
+
+    @contextmanager
+    def request_scope(self) -> Iterator[GitStateCache]:
+        """Memoize HEAD/status/untracked queries until the scope exits.
+
+        Wrap one CLI command so repeated state queries (dirty check, untracked
+        listing, HEAD lookup) spawn git once. Nested scopes share the outer
+        cache. The scope span records how many spawns were saved.
+
+        Yields:
+            GitStateCache for the scope
+        """
+        if self._state_cache is not None:
+            yield self._state_cache
+            return
+
+        cache = GitStateCache()
+        self._state_cache = cache
+        with self._tracer.start_as_current_span("cli.provider.git.request_scope") as span:
+            try:
+                yield cache
+            finally:
+                self._state_cache = None
+                span.set_attribute("saved_spawns", cache.saved_spawns)
+                span.set_attribute("invalidations", cache.invalidations)
+
+    def invalidate_state_cache(self, env: Optional[dict] = None) -> None:
+        """Drop memoized state after an operation that changes the index, HEAD or worktree.
+
+        Args:
+            env: Environment of the mutating command. Writes to a temporary
+                index (GIT_INDEX_FILE set) leave the real state untouched and
+                do not invalidate.
+        """
+        if self._state_cache is None or (env and env.get("GIT_INDEX_FILE")):
+            return
+        self._state_cache.invalidate()
+
+    def git_argv(self, args: list[str]) -> list[str]:
+        """Full git argv for args, including the status strategy's config overrides.
+
+        Use this when a command runs outside _run_git (e.g. through
+        AsyncProcessProvider) so it sees the same configuration.
+
+        Args:
+            args: Git command arguments (without 'git' prefix)
+
+        Returns:
+            Command list starting with 'git'
+        """
+        return ["git", *self.status_strategy().config_args(), *args]
 
     def _run_git(
         self,
@@ -67,7 +206,19 @@ class GitProvider:
             NonZeroExitWithStdErr: Command failed with stderr output
             CommandFailed: Command failed with non-zero exit
         """
-        cmd = ["git"] + args
+        # Strategy overrides apply to every command: one that writes the index
+        # without them would drop the untracked-cache/fsmonitor extensions
+        cmd = self.git_argv(args)
+        cache = self._state_cache
+        cache_key = tuple(args)
+        if cache is not None and args and args[0] in STATE_QUERY_COMMANDS:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                trace.get_current_span().set_attribute("cache_hit", True)
+                return cached
+        else:
+            cache = None
+
         start_time = self.clock.time()
 
         try:
@@ -75,7 +226,9 @@ class GitProvider:
                 cmd,
                 cwd=self.repo_root,
                 capture_output=capture_output,
-                text=True,
+                # Undecodable path bytes survive as surrogates (os.fsencode restores them)
+                encoding="utf-8",
+                errors="surrogateescape",
                 timeout=timeout,
             )
 
@@ -88,6 +241,8 @@ class GitProvider:
                 else:
                     raise CommandFailed(cmd, result.returncode)
 
+            if cache is not None:
+                cache.put(cache_key, result)
             return result
 
         except subprocess.TimeoutExpired as e:
@@ -3,7 +3,7 @@
 Part of task-cli-modularization M2.2 decomposition.
 """
 
-from typing import Optional
+from typing import Iterable, Optional
 
 from tenacity import (
     retry,
@@ -13,6 +13,31 @@ from tenacity import (
 )
 
 from ..exceptions import CommandFailed
+from .porcelain import StatusEntry, parse_porcelain_v2
+
+
+def scope_pathspecs(repo_paths: Iterable[str]) -> list[str]:
+    """Literal pathspecs restricting a git command to task scope paths.
+
+    A directory pathspec matches everything below it, like the prefix
+    matching used for repo_paths; the literal magic keeps glob characters in
+    paths from being expanded.
+
+    Args:
+        repo_paths: Repo-relative files or directories
+
+    Returns:
+        Pathspecs to pass after '--'
+    """
+    return [f":(literal){path.rstrip('/') or '.'}" for path in repo_paths]
+
+
+def _status_args(untracked_files: str, pathspecs: Optional[list[str]]) -> list[str]:
+    """Arguments for a porcelain v2 status (identical queries share a cache entry)."""
+    args = ["status", "--porcelain=v2", "-z", f"--untracked-files={untracked_files}"]
+    if pathspecs:
+        args += ["--", *pathspecs]
+    return args
 
 
 class GitStatusMixin:
@@ -29,21 +54,25 @@ class GitStatusMixin:
         wait=wait_exponential(min=0.5, max=8.0),
         retry=retry_if_exception_type(CommandFailed),
     )
-    def status(self, include_untracked: bool = True) -> dict:
+    def status(self, include_untracked: bool = True, pathspecs: Optional[list[str]] = None) -> dict:
         """Get git status with file list and dirty flag.
 
         Args:
             include_untracked: Whether to include untracked files in result
+            pathspecs: Optional pathspecs limiting the scan (see scope_pathspecs);
+                git then only stats and walks the matching part of the tree
 
         Returns:
             Dict with keys:
-                - files: List of modified file paths
+                - files: List of modified file paths (renames list the new
+                  path followed by the source path)
                 - is_dirty: Boolean indicating if tree has changes
 
         Raises:
             TimeoutExceeded: Command exceeded timeout
             NonZeroExitWithStdErr: Git command failed with stderr
             CommandFailed: Git command failed
+            PorcelainParseError: Unparseable status output
         """
         retry_count = 0
         method_name = "status"
@@ -52,25 +81,13 @@ class GitStatusMixin:
             try:
                 start_time = self.clock.time()
 
-                args = ["status", "--porcelain"]
-                if include_untracked:
-                    args.append("--untracked-files=all")
-                else:
-                    args.append("--untracked-files=no")
-
+                args = _status_args("all" if include_untracked else "no", pathspecs)
                 result = self._run_git(args)
+                entries = parse_porcelain_v2(result.stdout)
 
                 duration_ms = (self.clock.time() - start_time) * 1000
 
-                # Parse porcelain output
-                files = []
-                for line in result.stdout.strip().split('\n'):
-                    if not line:
-                        continue
-                    # Format: XY filename
-                    filename = line[2:].strip()
-                    files.append(filename)
-
+                files = [path for entry in entries for path in entry.paths]
                 is_dirty = len(files) > 0
 
                 # Set span attributes
@@ -173,12 +190,14 @@ class GitStatusMixin:
         self,
         allow_preexisting: bool = False,
         expected_files: Optional[list[str]] = None,
+        pathspecs: Optional[list[str]] = None,
     ) -> tuple[bool, list[str]]:
         """Check if git working tree is dirty.
 
         Args:
             allow_preexisting: If True, allow pre-existing untracked files
             expected_files: List of file patterns expected to be modified
+            pathspecs: Optional pathspecs limiting the check (see scope_pathspecs)
 
         Returns:
             Tuple of (is_clean, dirty_files):
@@ -189,6 +208,7 @@ class GitStatusMixin:
             TimeoutExceeded: Command exceeded timeout
             NonZeroExitWithStdErr: Git command failed with stderr
             CommandFailed: Git command failed
+            PorcelainParseError: Unparseable status output
         """
         retry_count = 0
         method_name = "check_dirty_tree"
@@ -197,28 +217,19 @@ class GitStatusMixin:
             try:
                 start_time = self.clock.time()
 
-                args = ["status", "--porcelain"]
+                args = _status_args("normal", pathspecs)
                 result = self._run_git(args)
+                entries = parse_porcelain_v2(result.stdout)
 
                 duration_ms = (self.clock.time() - start_time) * 1000
 
-                dirty_files = []
-                for line in result.stdout.strip().split('\n'):
-                    if not line:
-                        continue
-
-                    # Parse git status porcelain format
-                    # Format: XY filename (with space separator)
-                    # X = index status, Y = worktree status
-                    status = line[:2]
-                    # Skip the two status chars and the space
-                    filename = line[2:].strip()
-
+                dirty_files = [
+                    path
+                    for entry in entries
                     # Skip untracked files if allow_preexisting
-                    if allow_preexisting and status.strip() == '??':
-                        continue
-
-                    dirty_files.append(filename)
+                    if not (allow_preexisting and entry.is_untracked)
+                    for path in entry.paths
+                ]
 
                 # If expected_files provided, filter to unexpected changes
                 if expected_files is not None:
@@ -254,11 +265,75 @@ class GitStatusMixin:
                 span.set_attribute("error", str(e))
                 raise
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(min=0.5, max=8.0),
+        retry=retry_if_exception_type(CommandFailed),
+    )
+    def status_entries(
+        self,
+        untracked_files: str = "all",
+        pathspecs: Optional[list[str]] = None,
+    ) -> list[StatusEntry]:
+        """Get typed status entries (XY codes, rename sources, modes, hashes).
+
+        Args:
+            untracked_files: git --untracked-files mode ("all", "normal" or "no")
+            pathspecs: Optional pathspecs limiting the scan (see scope_pathspecs)
+
+        Returns:
+            StatusEntry list in git's output order
+
+        Raises:
+            TimeoutExceeded: Command exceeded timeout
+            NonZeroExitWithStdErr: Git command failed with stderr
+            CommandFailed: Git command failed
+            PorcelainParseError: Unparseable status output
+        """
+        retry_count = 0
+        method_name = "status_entries"
+
+        with self._tracer.start_as_current_span(f"cli.provider.git.{method_name}") as span:
+            try:
+                start_time = self.clock.time()
+
+                args = _status_args(untracked_files, pathspecs)
+                result = self._run_git(args)
+                entries = parse_porcelain_v2(result.stdout)
+
+                duration_ms = (self.clock.time() - start_time) * 1000
+
+                # Set span attributes
+                span.set_attribute("command", " ".join(["git"] + args))
+                span.set_attribute("duration_ms", duration_ms)
+                span.set_attribute("returncode", result.returncode)
+                span.set_attribute("retry_count", retry_count)
+                span.set_attribute("entry_count", len(entries))
+                if result.stderr:
+                    stderr_preview = result.stderr[:200]
+                    span.set_attribute("stderr_preview", stderr_preview)
+
+                return entries
+
+            except Exception as e:
+                # Record failure in span
+                if hasattr(e, 'returncode'):
+                    span.set_attribute("returncode", e.returncode)
+                if hasattr(e, 'stderr'):
+                    stderr_preview = e.stderr[:200] if e.stderr else ""
+                    span.set_attribute("stderr_preview", stderr_preview)
+                span.set_attribute("error", str(e))
+                raise
+
     def status_porcelain_z(self) -> str:
-        """Get git status in porcelain format with null separators.
+        """Get git status in porcelain v2 format with null separators.
+
+        The output is the same query as status(include_untracked=True), so
+        within a request scope both share one git spawn. Parse it with
+        parse_porcelain_v2().
 
         Returns:
-            Status output in porcelain -z format
+            Status output in porcelain v2 -z format
 
         Raises:
             TimeoutExceeded: Command exceeded timeout
@@ -271,7 +346,7 @@ class GitStatusMixin:
             try:
                 start_time = self.clock.time()
 
-                args = ["status", "--porcelain", "-z"]
+                args = _status_args("all", None)
                 result = self._run_git(args)
 
                 duration_ms = (self.clock.time() - start_time) * 1000
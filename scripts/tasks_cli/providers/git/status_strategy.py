@@ -0,0 +1,90 @@
+"""How `git status` finds changes in large worktrees.
+
+A plain status lstat()s every tracked file and reads every directory to find
+untracked files. Two git features avoid most of that work:
+
+- `core.untrackedCache`: remembers directory listings (in the index) and
+  only re-reads directories whose mtime changed
+- `core.fsmonitor`: asks a hook which paths changed since the last status,
+  so unchanged files are not lstat()ed at all (see fsmonitor.py)
+
+The strategy is chosen with TASKS_GIT_STATUS_STRATEGY and applied as `-c`
+overrides on the git commands GitProvider runs, so repository config is
+never modified.
+"""
+
+import os
+import shlex
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from . import fsmonitor
+from .fsmonitor_hook import HOOK_VERSION
+
+STATUS_STRATEGY_ENV_VAR = "TASKS_GIT_STATUS_STRATEGY"
+STRATEGY_PLAIN = "plain"
+STRATEGY_UNTRACKED_CACHE = "untracked-cache"
+STRATEGY_FSMONITOR = "fsmonitor"  # Implies the untracked cache
+STATUS_STRATEGIES = (STRATEGY_PLAIN, STRATEGY_UNTRACKED_CACHE, STRATEGY_FSMONITOR)
+
+
+@dataclass(frozen=True)
+class StatusStrategy:
+    """Config overrides applied to `git status`."""
+    name: str = STRATEGY_PLAIN
+    untracked_cache: bool = False
+    fsmonitor_hook: Optional[Path] = None
+
+    def config_args(self) -> List[str]:
+        """`-c` arguments to place before the git subcommand."""
+        args: List[str] = []
+        if self.untracked_cache:
+            args += ["-c", "core.untrackedCache=true"]
+        if self.fsmonitor_hook is not None:
+            args += [
+                # git runs the hook through the shell
+                "-c", f"core.fsmonitor={shlex.quote(str(self.fsmonitor_hook))}",
+                "-c", f"core.fsmonitorHookVersion={HOOK_VERSION}",
+            ]
+        return args
+
+
+def resolve_status_strategy(
+    repo_root: Path,
+    git_dir: Callable[[], Path],
+    name: Optional[str] = None,
+) -> StatusStrategy:
+    """Build the status strategy for a repository.
+
+    The fsmonitor strategy installs the hook in the git directory and starts
+    the watcher daemon if needed. Where inotify is unavailable or the daemon
+    does not start, it degrades to the untracked cache alone.
+
+    Args:
+        repo_root: Worktree root
+        git_dir: Returns the git directory (hook and socket location); only
+            called for the fsmonitor strategy
+        name: Strategy name (default: TASKS_GIT_STATUS_STRATEGY, else plain)
+
+    Returns:
+        StatusStrategy
+
+    Raises:
+        ValueError: Unknown strategy name
+    """
+    name = name or os.environ.get(STATUS_STRATEGY_ENV_VAR) or STRATEGY_PLAIN
+    if name not in STATUS_STRATEGIES:
+        raise ValueError(
+            f"Unknown git status strategy {name!r} (expected one of: {', '.join(STATUS_STRATEGIES)})"
+        )
+
+    if name == STRATEGY_PLAIN:
+        return StatusStrategy()
+    if name == STRATEGY_FSMONITOR and fsmonitor.inotify_available():
+        hook_dir = Path(git_dir()).resolve()
+        sock_path = fsmonitor.socket_path(hook_dir)
+        if fsmonitor.start_daemon(repo_root, sock_path):
+            hook = fsmonitor.install_hook(hook_dir, sock_path)
+            return StatusStrategy(name=name, untracked_cache=True, fsmonitor_hook=hook)
+    return StatusStrategy(name=STRATEGY_UNTRACKED_CACHE, untracked_cache=True)
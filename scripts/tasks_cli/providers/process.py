@@ -5,19 +5,49 @@ Handles arbitrary shell commands (tar, pnpm, etc.) with:
 - Secret redaction for stdout/stderr
 - Retry/backoff via Tenacity (optional, configurable)
 - OpenTelemetry span emission
+- Optional spill-to-disk capture with bounded memory (see capture.py)
 
 Standards compliance:
 - Follows standards/typescript.md principle of explicit error types
 - Supports observability per standards/cross-cutting.md
 """
 
+import os
+import signal
 import subprocess
+import threading
+import time
+from contextlib import suppress
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import BinaryIO, Optional, Sequence
 
 from ..telemetry import get_tracer
+from .capture import DEFAULT_PREVIEW_BYTES, SpillWriter
 from .exceptions import CommandFailed, NonZeroExitWithStdErr, TimeoutExceeded
 
+_READ_SIZE = 64 * 1024
+
+
+def _kill_process_group(proc) -> None:
+    """Kill a process started with start_new_session and everything it spawned.
+
+    The group is signalled even if the leader already exited, since children
+    may still hold its output pipes open.
+    """
+    with suppress(ProcessLookupError, PermissionError):
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+
+
+def _output_preview(output) -> str:
+    """First 200 characters of captured output (a string or SpilledOutput)."""
+    if not output:
+        return ""
+    text = output if isinstance(output, str) else output.head
+    return text[:200]
+
 
 class ProcessProvider:
     """Provider for executing arbitrary shell commands with telemetry and retry.
@@ -50,6 +80,9 @@ class ProcessProvider:
         redact: Sequence[str] = (),
         check: bool = True,
         retry_policy: Optional[dict] = None,
+        spill_dir: Optional[Path] = None,
+        spill_name: str = "output",
+        preview_bytes: int = DEFAULT_PREVIEW_BYTES,
     ) -> subprocess.CompletedProcess:
         """Execute command with telemetry and optional retry.
 
@@ -62,9 +95,14 @@ class ProcessProvider:
             redact: Sequence of secret strings to redact from logs
             check: Raise exception on non-zero exit (default: True)
             retry_policy: Override default retry (reserved for future use)
+            spill_dir: Stream stdout/stderr to <spill_dir>/<spill_name>.stdout.log
+                and .stderr.log instead of memory (capture is implied)
+            spill_name: Log file name prefix when spilling
+            preview_bytes: Bytes kept in memory from each end of a spilled stream
 
         Returns:
-            CompletedProcess with stdout/stderr (redacted in logs only)
+            CompletedProcess with stdout/stderr (redacted in logs only); when
+            spilling, stdout/stderr are SpilledOutput handles
 
         Raises:
             TimeoutExceeded: Command timed out
@@ -76,31 +114,35 @@ class ProcessProvider:
             span.set_attribute("timeout", timeout)
 
             try:
-                result = subprocess.run(
-                    cmd,
-                    cwd=cwd,
-                    capture_output=capture,
-                    text=True,
-                    timeout=timeout,
-                    env=env,
-                    check=False,  # Manual check for better error handling
-                )
+                if spill_dir is not None:
+                    result = self._run_spilled(
+                        cmd, cwd, env, timeout, Path(spill_dir), spill_name, preview_bytes
+                    )
+                    span.set_attribute("stdout_bytes", result.stdout.size)
+                    span.set_attribute("stderr_bytes", result.stderr.size)
+                else:
+                    result = subprocess.run(
+                        cmd,
+                        cwd=cwd,
+                        capture_output=capture,
+                        text=True,
+                        timeout=timeout,
+                        env=env,
+                        check=False,  # Manual check for better error handling
+                    )
 
                 span.set_attribute("returncode", result.returncode)
 
                 # Redact secrets before logging (only for span attributes)
-                stdout_preview = self._redact(
-                    result.stdout[:200] if result.stdout else "", redact
-                )
-                stderr_preview = self._redact(
-                    result.stderr[:200] if result.stderr else "", redact
-                )
+                stdout_preview = self._redact(_output_preview(result.stdout), redact)
+                stderr_preview = self._redact(_output_preview(result.stderr), redact)
                 span.set_attribute("stdout_preview", stdout_preview)
                 span.set_attribute("stderr_preview", stderr_preview)
 
                 if check and result.returncode != 0:
                     if result.stderr:
-                        raise NonZeroExitWithStdErr(cmd, result.returncode, result.stderr)
+                        stderr = result.stderr if isinstance(result.stderr, str) else result.stderr.preview
+                        raise NonZeroExitWithStdErr(cmd, result.returncode, stderr)
                     else:
                         raise CommandFailed(cmd, result.returncode)
 
@@ -110,6 +152,61 @@ class ProcessProvider:
                 span.set_attribute("timeout_exceeded", True)
                 raise TimeoutExceeded(cmd, timeout) from e
 
+    def _run_spilled(
+        self,
+        cmd: list[str],
+        cwd: Optional[Path],
+        env: Optional[dict[str, str]],
+        timeout: float,
+        spill_dir: Path,
+        spill_name: str,
+        preview_bytes: int,
+    ) -> subprocess.CompletedProcess:
+        """Run cmd with both streams pumped into SpillWriters by worker threads.
+
+        Raises:
+            subprocess.TimeoutExpired: Timeout elapsed (process group already killed)
+        """
+        with SpillWriter(spill_dir / f"{spill_name}.stdout.log", preview_bytes) as stdout, \
+                SpillWriter(spill_dir / f"{spill_name}.stderr.log", preview_bytes) as stderr:
+            proc = subprocess.Popen(
+                cmd,
+                cwd=cwd,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
+            )
+            pumps = [
+                threading.Thread(target=self._pump, args=(proc.stdout, stdout), daemon=True),
+                threading.Thread(target=self._pump, args=(proc.stderr, stderr), daemon=True),
+            ]
+            for pump in pumps:
+                pump.start()
+
+            deadline = time.monotonic() + timeout
+            try:
+                proc.wait(timeout=timeout)
+                # Pipes stay open while anything the command spawned is alive
+                for pump in pumps:
+                    pump.join(max(0.0, deadline - time.monotonic()))
+                if any(pump.is_alive() for pump in pumps):
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+            except BaseException:
+                _kill_process_group(proc)
+                proc.wait()
+                for pump in pumps:
+                    pump.join()
+                raise
+
+            return subprocess.CompletedProcess(cmd, proc.returncode, stdout.close(), stderr.close())
+
+    @staticmethod
+    def _pump(stream: BinaryIO, writer: SpillWriter) -> None:
+        with stream:
+            while data := stream.read1(_READ_SIZE):
+                writer.write(data)
+
     def _redact(self, text: str, patterns: Sequence[str]) -> str:
         """Redact secrets from text for logging.
 
@@ -0,0 +1,412 @@
+"""
+Streaming single-pass QA log scanner.
+
+Jest/tsc logs from the monorepo reach hundreds of MB, so QA logs are never
+loaded whole. QALogScanner consumes a log in fixed-size byte chunks and, in
+one pass with bounded memory:
+
+- computes the SHA256 and size of the raw bytes
+- records which command-type keywords occur (for auto-detection)
+- collects every lint/typecheck/test/coverage metric both QA parsers need
+
+Each block of complete lines is decoded once. Patterns that start with a
+literal run directly on the block (the regex engine's literal prefix search
+is fast); patterns that start with a count are only tried on lines where
+their keyword follows a number. All matches are line-local. The metric rules
+themselves live in QALogScan so that qa_parsing.parse_qa_log and the
+record-qa/compare-qa commands keep their existing semantics while sharing
+one read of the file.
+
+Per Section 4.2 of task-context-cache-hardening-schemas.md.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from .context_store.models import QACommandSummary, QACoverageSummary
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+MAX_LINE_BYTES = 4 * 1024 * 1024
+
+COVERAGE_METRICS = ('lines', 'branches', 'functions', 'statements')
+
+
+class _Pattern(NamedTuple):
+    """Pattern collected by the scanner (all patterns match within one line)."""
+    name: str
+    keyword: str           # Literal every match contains
+    regex: "re.Pattern"
+    count: bool            # True: count matches; False: keep first match groups
+    lowered: bool = False  # Match against lowercased text (case-insensitive)
+
+
+# ``[^\S\n]`` is whitespace other than newline, keeping matches line-local
+_S = r'[^\S\n]'
+
+_PATTERNS: Tuple[_Pattern, ...] = (
+    # qa_parsing semantics (lint / pyright / ruff)
+    _Pattern('errors_warnings', 'error', re.compile(rf'(\d+){_S}+errors?,{_S}+(\d+){_S}+warnings?'), False),
+    _Pattern('error_words', 'error', re.compile(rf'error{_S}+[a-z0-9_-]+'), True, True),
+    _Pattern('warning_words', 'warning', re.compile(rf'warning{_S}+[a-z0-9_-]+'), True, True),
+    _Pattern('ruff_found', 'Found', re.compile(rf'Found{_S}+(\d+){_S}+errors?'), False),
+    # qa_parsing semantics (tsc)
+    _Pattern('tsc_errors', 'error', re.compile(rf'error{_S}+TS\d+:'), True),
+    _Pattern('error_colon_lines', 'error:', re.compile(r'error:[^\n]*'), True),  # once per line
+    # qa_parsing semantics (jest / pytest)
+    _Pattern('jest_passed', 'Tests:', re.compile(rf'Tests:{_S}+(\d+){_S}+passed'), False),
+    _Pattern('failed', 'failed', re.compile(rf'(\d+){_S}+failed'), False),
+    _Pattern('pytest_passed', 'passed', re.compile(rf'(\d+){_S}+passed(?:,{_S}+(\d+){_S}+failed)?'), False),
+    # qa_parsing semantics (coverage)
+    *(
+        _Pattern(f'coverage_{metric}', metric,
+                 re.compile(rf'{metric}{_S}*:{_S}*([\d.]+)%'), False, True)
+        for metric in COVERAGE_METRICS
+    ),
+    _Pattern('coverage_total', 'TOTAL', re.compile(rf'TOTAL{_S}+\d+{_S}+\d+{_S}+([\d.]+)%'), False),
+    # record-qa semantics
+    _Pattern('problems', 'problem', re.compile(
+        rf'(\d+){_S}+problems?{_S}+\((\d+){_S}+errors?,{_S}+(\d+){_S}+warnings?\)'), False),
+    _Pattern('first_errors', 'error', re.compile(rf'(\d+){_S}+errors?'), False, True),
+    _Pattern('first_warnings', 'warning', re.compile(rf'(\d+){_S}+warnings?'), False, True),
+    _Pattern('first_type_errors', 'error', re.compile(rf'(\d+){_S}+(?:type{_S}+)?errors?'), False, True),
+    _Pattern('tests_passed', 'passed', re.compile(rf'(\d+){_S}+(?:tests?{_S}+)?passed'), False, True),
+    _Pattern('tests_failed', 'failed', re.compile(rf'(\d+){_S}+(?:tests?{_S}+)?failed'), False, True),
+    _Pattern('branch_pct', 'branch', re.compile(rf'branches?{_S}*:{_S}*([\d.]+)%'), False, True),
+)
+
+# Keywords whose mere presence drives command-type auto-detection
+_DETECTION_KEYWORDS = (
+    'eslint', 'prettier', 'typescript', 'error ts', 'tsc', 'jest', 'vitest',
+    'coverage', 'istanbul', 'error',
+)
+
+
+def _anchored(pattern: _Pattern) -> bool:
+    """True if the regex does not start with its keyword literal."""
+    return not pattern.regex.pattern.startswith(pattern.keyword)
+
+
+_COUNT_PATTERNS = tuple(p for p in _PATTERNS if p.count)
+
+# Words allowed between a count and an anchored keyword ("3 type errors")
+_QUALIFIERS = ('type', 'test', 'tests')
+_LOOKBEHIND = 64
+
+
+def _count_may_precede(source: str, pos: int) -> bool:
+    """
+    Cheap necessary condition for an anchored match at keyword position pos.
+
+    Every anchored pattern has ``<digits> <blank>+ [qualifier <blank>+]``
+    immediately before its keyword, so the stripped text before the keyword
+    must end in a digit or a qualifier word.
+    """
+    window_start = max(0, pos - _LOOKBEHIND)
+    window_start = source.rfind('\n', window_start, pos) + 1 or window_start
+    head = source[window_start:pos]
+    stripped = head.rstrip()
+    if len(stripped) == len(head):
+        return False
+    if not stripped:
+        return window_start == pos - _LOOKBEHIND  # Long blank run: be safe
+    return stripped[-1].isdigit() or stripped.endswith(_QUALIFIERS)
+
+
+@dataclass(frozen=True)
+class QALogScan:
+    """
+    Result of a single pass over a QA log.
+
+    Attributes:
+        sha256: SHA256 hex digest of the raw log bytes
+        size_bytes: Log size in bytes
+        line_count: Number of lines in the log
+        keywords: Detection keywords present in the log (lowercase)
+        firsts: First match groups per 'first' pattern
+        counts: Match counts per 'count' pattern
+    """
+    sha256: str
+    size_bytes: int
+    line_count: int
+    keywords: FrozenSet[str]
+    firsts: Dict[str, Tuple[Optional[str], ...]]
+    counts: Dict[str, int]
+
+    def detect_command_type(self) -> Optional[str]:
+        """
+        Auto-detect command type from log content keywords.
+
+        Returns:
+            'lint', 'typecheck', 'test', 'coverage' or None
+        """
+        found = self.keywords
+        if 'eslint' in found or 'prettier' in found:
+            return 'lint'
+        if 'typescript' in found or 'error ts' in found or 'tsc' in found:
+            return 'typecheck'
+        if 'jest' in found or 'vitest' in found:
+            return 'test'
+        if 'coverage' in found or 'istanbul' in found:
+            return 'coverage'
+        return None
+
+    def summary_for(self, command_type: str) -> QACommandSummary:
+        """
+        Build a QACommandSummary (parse_qa_log semantics: zero counts omitted).
+
+        Args:
+            command_type: One of 'lint', 'typecheck', 'test', 'coverage'
+
+        Returns:
+            QACommandSummary with parsed metrics (empty for unknown types)
+        """
+        firsts, counts = self.firsts, self.counts
+
+        if command_type == 'lint':
+            if 'errors_warnings' in firsts:
+                errors, warnings = (int(g) for g in firsts['errors_warnings'])
+            else:
+                errors, warnings = counts['error_words'], counts['warning_words']
+            if 'ruff_found' in firsts:
+                errors = int(firsts['ruff_found'][0])
+            return QACommandSummary(lint_errors=errors or None, lint_warnings=warnings or None)
+
+        if command_type == 'typecheck':
+            type_errors = counts['tsc_errors']
+            if 'errors_warnings' in firsts:
+                type_errors += int(firsts['errors_warnings'][0])
+            if type_errors == 0:
+                type_errors = counts['error_colon_lines']
+            return QACommandSummary(type_errors=type_errors or None)
+
+        if command_type == 'test':
+            passed = int(firsts['jest_passed'][0]) if 'jest_passed' in firsts else 0
+            failed = int(firsts['failed'][0]) if 'failed' in firsts else 0
+            if 'pytest_passed' in firsts and 'jest_passed' not in firsts:
+                pytest_passed, pytest_failed = firsts['pytest_passed']
+                passed = int(pytest_passed)
+                if pytest_failed:
+                    failed = int(pytest_failed)
+            return QACommandSummary(tests_passed=passed or None, tests_failed=failed or None)
+
+        if command_type == 'coverage':
+            metrics = {
+                metric: float(firsts[f'coverage_{metric}'][0])
+                for metric in COVERAGE_METRICS
+                if f'coverage_{metric}' in firsts
+            }
+            if 'lines' not in metrics and 'coverage_total' in firsts:
+                metrics['lines'] = float(firsts['coverage_total'][0])
+            if metrics:
+                return QACommandSummary(coverage=QACoverageSummary(**metrics))
+
+        return QACommandSummary()
+
+    def results_for(self, command_type: Optional[str] = None) -> dict:
+        """
+        Build the record-qa/compare-qa metrics dict (zero counts preserved).
+
+        Args:
+            command_type: Command type, auto-detected from content when None
+
+        Returns:
+            Dict with any of lint_errors, lint_warnings, type_errors,
+            tests_passed, tests_failed, coverage
+        """
+        firsts = self.firsts
+        if command_type is None:
+            command_type = self.detect_command_type()
+
+        def first_int(name: str, group: int = 0) -> Optional[int]:
+            return int(firsts[name][group]) if name in firsts else None
+
+        results: dict = {}
+        if command_type == 'lint':
+            if 'problems' in firsts:
+                results['lint_errors'] = first_int('problems', 1)
+                results['lint_warnings'] = first_int('problems', 2)
+            else:
+                results['lint_errors'] = first_int('first_errors')
+                results['lint_warnings'] = first_int('first_warnings')
+
+        elif command_type == 'typecheck':
+            if 'first_type_errors' in firsts:
+                results['type_errors'] = first_int('first_type_errors')
+            elif 'error' not in self.keywords:
+                results['type_errors'] = 0
+
+        elif command_type == 'test':
+            results['tests_passed'] = first_int('tests_passed')
+            results['tests_failed'] = first_int('tests_failed')
+
+        elif command_type == 'coverage':
+            coverage = {}
+            if 'coverage_lines' in firsts:
+                coverage['lines'] = float(firsts['coverage_lines'][0])
+            if 'branch_pct' in firsts:
+                coverage['branches'] = float(firsts['branch_pct'][0])
+            if coverage:
+                results['coverage'] = coverage
+
+        return {k: v for k, v in results.items() if v is not None}
+
+
+class QALogScanner:
+    """
+    Incremental QA log scanner with bounded memory.
+
+    Feed raw bytes in any chunking via feed(), then call finish(). Memory use
+    is bounded by the chunk size plus the longest line (capped at
+    MAX_LINE_BYTES; longer lines are split).
+    """
+
+    def __init__(self):
+        self._hasher = hashlib.sha256()
+        self._size = 0
+        self._lines = 0
+        self._pending = b''
+        self._ends_with_newline = True
+        self._keywords: set = set()
+        self._firsts: Dict[str, Tuple[Optional[str], ...]] = {}
+        self._counts: Dict[str, int] = {p.name: 0 for p in _COUNT_PATTERNS}
+        self._open: List[_Pattern] = [p for p in _PATTERNS if not p.count]
+
+    def feed(self, data: bytes) -> None:
+        """
+        Consume the next chunk of raw log bytes.
+
+        Args:
+            data: Raw bytes (chunk boundaries need not align with lines)
+        """
+        if not data:
+            return
+
+        self._hasher.update(data)
+        self._size += len(data)
+        self._lines += data.count(b'\n')
+        self._ends_with_newline = data.endswith(b'\n')
+
+        buffer = self._pending + data if self._pending else data
+        cut = buffer.rfind(b'\n') + 1
+        if cut == 0 and len(buffer) < MAX_LINE_BYTES:
+            self._pending = buffer
+            return
+        if cut == 0:
+            cut = len(buffer)
+
+        self._pending = buffer[cut:]
+        self._scan_block(buffer[:cut])
+
+    def finish(self) -> QALogScan:
+        """
+        Flush the trailing partial line and return the scan result.
+
+        Returns:
+            QALogScan with hash, size and collected metrics
+        """
+        if self._pending:
+            self._scan_block(self._pending)
+            self._pending = b''
+
+        line_count = self._lines + (0 if self._ends_with_newline else 1)
+        return QALogScan(
+            sha256=self._hasher.hexdigest(),
+            size_bytes=self._size,
+            line_count=line_count if self._size else 0,
+            keywords=frozenset(self._keywords),
+            firsts=dict(self._firsts),
+            counts=dict(self._counts),
+        )
+
+    def _scan_block(self, block: bytes) -> None:
+        """Process a block of complete lines."""
+        text = block.decode('utf-8', errors='ignore')
+        lowered = text.lower()
+
+        for keyword in _DETECTION_KEYWORDS:
+            if keyword not in self._keywords and keyword in lowered:
+                self._keywords.add(keyword)
+
+        for pattern in _COUNT_PATTERNS:
+            source = lowered if pattern.lowered else text
+            self._counts[pattern.name] += len(pattern.regex.findall(source))
+
+        for pattern in self._open:
+            if not _anchored(pattern):
+                self._match_first(pattern, lowered if pattern.lowered else text, 0, None)
+
+        # Patterns starting with digits cannot use the regex engine's literal
+        # prefix search: locate their keyword instead, and match the line only
+        # when a count can precede that keyword occurrence.
+        anchored: Dict[Tuple[bool, str], List[_Pattern]] = {}
+        for pattern in self._open:
+            if _anchored(pattern):
+                anchored.setdefault((pattern.lowered, pattern.keyword), []).append(pattern)
+
+        for (is_lowered, keyword), patterns in anchored.items():
+            source = lowered if is_lowered else text
+            pos = source.find(keyword)
+            while pos != -1 and patterns:
+                if not _count_may_precede(source, pos):
+                    pos = source.find(keyword, pos + 1)
+                    continue
+                line_start = source.rfind('\n', 0, pos) + 1
+                line_end = source.find('\n', pos)
+                if line_end == -1:
+                    line_end = len(source)
+                patterns = [
+                    p for p in patterns
+                    if not self._match_first(p, source, line_start, line_end)
+                ]
+                pos = source.find(keyword, line_end)
+
+        self._open = [p for p in self._open if p.name not in self._firsts]
+
+    def _match_first(
+        self, pattern: _Pattern, source: str, start: int, end: Optional[int]
+    ) -> bool:
+        """Record the first match of a pattern within source[start:end]."""
+        found = pattern.regex.search(source, start, len(source) if end is None else end)
+        if found:
+            self._firsts[pattern.name] = found.groups()
+        return found is not None
+
+
+def scan_qa_log_bytes(data: bytes) -> QALogScan:
+    """
+    Scan an in-memory QA log.
+
+    Args:
+        data: Raw log bytes
+
+    Returns:
+        QALogScan for the content
+    """
+    scanner = QALogScanner()
+    scanner.feed(data)
+    return scanner.finish()
+
+
+def scan_qa_log(log_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> QALogScan:
+    """
+    Scan a QA log file in one streaming pass.
+
+    Args:
+        log_path: Path to log file
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        QALogScan for the file
+
+    Raises:
+        FileNotFoundError: Log file does not exist
+        PermissionError: Log file is not readable
+    """
+    scanner = QALogScanner()
+    with open(log_path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            scanner.feed(chunk)
+    return scanner.finish()
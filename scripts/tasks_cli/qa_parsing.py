@@ -4,10 +4,34 @@ QA log parsing helpers for context_store.py
 Per Section 4 of task-context-cache-hardening-schemas.md
 """
 
-import re
 from pathlib import Path
 
-from .context_store import QACommandSummary, QACoverageSummary, QAResults
+from .context_store import QACommandSummary, QAResults
+from .qa_log_scanner import scan_qa_log, scan_qa_log_bytes
+
+
+def infer_command_type(command: str) -> str:
+    """
+    Infer QA command type from command string.
+
+    Maps common command patterns to standard types: lint, typecheck, test, coverage.
+    Falls back to 'unknown' if no pattern matches.
+    """
+    command_lower = command.lower()
+
+    if any(pattern in command_lower for pattern in ['lint', 'eslint', 'ruff', 'flake8', 'pylint']):
+        return 'lint'
+
+    if any(pattern in command_lower for pattern in ['typecheck', 'tsc', 'pyright', 'mypy']):
+        return 'typecheck'
+
+    if any(pattern in command_lower for pattern in ['coverage', 'cov']):
+        return 'coverage'
+
+    if any(pattern in command_lower for pattern in ['test', 'jest', 'pytest', 'vitest']):
+        return 'test'
+
+    return 'unknown'
 
 
 def parse_qa_log(log_path: Path, command_type: str) -> QACommandSummary:
@@ -16,6 +40,9 @@ def parse_qa_log(log_path: Path, command_type: str) -> QACommandSummary:
 
     Per Section 4.2 of task-context-cache-hardening-schemas.md.
 
+    The log is streamed in a single pass with bounded memory
+    (see qa_log_scanner), so multi-hundred-MB logs are never loaded whole.
+
     Args:
         log_path: Path to log file
         command_type: One of 'lint', 'typecheck', 'test', 'coverage'
@@ -24,33 +51,30 @@ def parse_qa_log(log_path: Path, command_type: str) -> QACommandSummary:
         QACommandSummary with parsed metrics (empty if parse fails)
     """
     try:
-        log_content = log_path.read_text(encoding='utf-8', errors='ignore')
+        scan = scan_qa_log(log_path)
     except (FileNotFoundError, PermissionError):
         # Return empty summary if log can't be read
         return QACommandSummary()
 
     try:
-        if command_type == 'lint':
-            return _parse_lint_log(log_content)
-        elif command_type == 'typecheck':
-            return _parse_typecheck_log(log_content)
-        elif command_type == 'test':
-            return _parse_test_log(log_content)
-        elif command_type == 'coverage':
-            return _parse_coverage_log(log_content)
-        else:
-            # Unknown command type, return empty summary
-            return QACommandSummary()
+        return scan.summary_for(command_type)
     except Exception:
         # Parse failure - return empty summary gracefully
         return QACommandSummary()
 
 
+def _parse_content(content: str, command_type: str) -> QACommandSummary:
+    """Parse in-memory log content with the streaming scanner."""
+    return scan_qa_log_bytes(content.encode('utf-8')).summary_for(command_type)
+
+
 def _parse_lint_log(content: str) -> QACommandSummary:
     """
     Parse ESLint/Ruff lint output.
 
-    Extracts error and warning counts from lint tool output.
+    Extracts error and warning counts from lint tool output:
+    ESLint "N problems (X errors, Y warnings)" summaries, individual
+    error/warning lines, and Ruff "Found X errors".
 
     Args:
         content: Log file content
@@ -58,37 +82,15 @@ def _parse_lint_log(content: str) -> QACommandSummary:
     Returns:
         QACommandSummary with lint_errors and lint_warnings
     """
-    lint_errors = 0
-    lint_warnings = 0
-
-    # ESLint format: "✖ N problems (X errors, Y warnings)"
-    eslint_match = re.search(r'(\d+)\s+errors?,\s+(\d+)\s+warnings?', content)
-    if eslint_match:
-        lint_errors = int(eslint_match.group(1))
-        lint_warnings = int(eslint_match.group(2))
-    else:
-        # Alternative ESLint format: count individual error/warning lines
-        error_lines = re.findall(r'error\s+[A-Za-z0-9_-]+', content, re.IGNORECASE)
-        warning_lines = re.findall(r'warning\s+[A-Za-z0-9_-]+', content, re.IGNORECASE)
-        lint_errors = len(error_lines)
-        lint_warnings = len(warning_lines)
-
-    # Ruff format: "Found X errors"
-    ruff_match = re.search(r'Found\s+(\d+)\s+errors?', content)
-    if ruff_match:
-        lint_errors = int(ruff_match.group(1))
-
-    return QACommandSummary(
-        lint_errors=lint_errors if lint_errors > 0 else None,
-        lint_warnings=lint_warnings if lint_warnings > 0 else None
-    )
+    return _parse_content(content, 'lint')
 
 
 def _parse_typecheck_log(content: str) -> QACommandSummary:
     """
     Parse tsc/pyright typecheck output.
 
-    Extracts type error count from TypeScript/Python type checkers.
+    Extracts type error count from TypeScript "error TS1234:" lines, pyright
+    "X errors, Y warnings" summaries, or generic "error:" lines.
 
     Args:
         content: Log file content
@@ -96,32 +98,15 @@ def _parse_typecheck_log(content: str) -> QACommandSummary:
     Returns:
         QACommandSummary with type_errors
     """
-    type_errors = 0
-
-    # TypeScript tsc format: "error TS1234:"
-    tsc_errors = re.findall(r'error\s+TS\d+:', content)
-    type_errors += len(tsc_errors)
-
-    # Pyright format: "X errors, Y warnings"
-    pyright_match = re.search(r'(\d+)\s+errors?,\s+(\d+)\s+warnings?', content)
-    if pyright_match:
-        type_errors += int(pyright_match.group(1))
-
-    # Alternative: count "error:" lines
-    if type_errors == 0:
-        error_lines = re.findall(r'^.*error:.*$', content, re.MULTILINE)
-        type_errors = len(error_lines)
-
-    return QACommandSummary(
-        type_errors=type_errors if type_errors > 0 else None
-    )
+    return _parse_content(content, 'typecheck')
 
 
 def _parse_test_log(content: str) -> QACommandSummary:
     """
     Parse Jest/pytest test output.
 
-    Extracts test pass/fail counts from test runner output.
+    Extracts test pass/fail counts from Jest "Tests: 5 passed, 2 failed"
+    and pytest "5 passed, 2 failed in 1.23s" summaries.
 
     Args:
         content: Log file content
@@ -129,36 +114,15 @@ def _parse_test_log(content: str) -> QACommandSummary:
     Returns:
         QACommandSummary with tests_passed and tests_failed
     """
-    tests_passed = 0
-    tests_failed = 0
-
-    # Jest format: "Tests: 5 passed, 2 failed, 7 total"
-    jest_passed_match = re.search(r'Tests:\s+(\d+)\s+passed', content)
-    jest_failed_match = re.search(r'(\d+)\s+failed', content)
-
-    if jest_passed_match:
-        tests_passed = int(jest_passed_match.group(1))
-    if jest_failed_match:
-        tests_failed = int(jest_failed_match.group(1))
-
-    # Pytest format: "5 passed, 2 failed in 1.23s"
-    pytest_match = re.search(r'(\d+)\s+passed(?:,\s+(\d+)\s+failed)?', content)
-    if pytest_match and not jest_passed_match:
-        tests_passed = int(pytest_match.group(1))
-        if pytest_match.group(2):
-            tests_failed = int(pytest_match.group(2))
-
-    return QACommandSummary(
-        tests_passed=tests_passed if tests_passed > 0 else None,
-        tests_failed=tests_failed if tests_failed > 0 else None
-    )
+    return _parse_content(content, 'test')
 
 
 def _parse_coverage_log(content: str) -> QACommandSummary:
     """
     Parse Jest/pytest coverage report.
 
-    Extracts lines/branches coverage percentages.
+    Extracts lines/branches/functions/statements percentages from Jest
+    "Lines : 85.5%" summaries, falling back to pytest-cov "TOTAL ... 85%".
 
     Args:
         content: Log file content
@@ -166,32 +130,7 @@ def _parse_coverage_log(content: str) -> QACommandSummary:
     Returns:
         QACommandSummary with coverage metrics
     """
-    coverage_metrics = {}
-
-    # Jest coverage format: "Lines      : 85.5% ( 342/400 )"
-    for metric in ['lines', 'branches', 'functions', 'statements']:
-        pattern = rf'{metric}\s*:\s*([\d.]+)%'
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match:
-            coverage_metrics[metric] = float(match.group(1))
-
-    # Pytest coverage format: "TOTAL    400    342    85%"
-    # Look for lines coverage if not found above
-    if 'lines' not in coverage_metrics:
-        total_match = re.search(r'TOTAL\s+\d+\s+\d+\s+([\d.]+)%', content)
-        if total_match:
-            coverage_metrics['lines'] = float(total_match.group(1))
-
-    if coverage_metrics:
-        coverage_summary = QACoverageSummary(
-            lines=coverage_metrics.get('lines'),
-            branches=coverage_metrics.get('branches'),
-            functions=coverage_metrics.get('functions'),
-            statements=coverage_metrics.get('statements')
-        )
-        return QACommandSummary(coverage=coverage_summary)
-    else:
-        return QACommandSummary()
+    return _parse_content(content, 'coverage')
 
 
 def detect_qa_drift(baseline: QAResults, current: QAResults) -> dict:
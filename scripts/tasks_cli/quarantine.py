@@ -10,22 +10,124 @@ Directory structure:
         TASK-XXXX.quarantine.json       # Individual quarantine entries
         index.json                       # Fast lookup index
         resolved/                        # Archived resolved entries
+
+The index is cached per process as a frozenset and re-read only when
+index.json changes; all writes replace files atomically.
 """
 
 import json
+import os
 import shutil
+import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from filelock import FileLock
 
+from .file_modes import match_target_mode
 from .models import QuarantineEntry
 
 # Quarantine directory location
 QUARANTINE_DIR = Path('docs/compliance/quarantine')
 
 
+class _IndexSnapshot:
+    """Quarantined task IDs from one version of index.json."""
+
+    __slots__ = ('stat_key', 'task_ids')
+
+    def __init__(self, stat_key: Optional[Tuple[int, int, int]], task_ids: FrozenSet[str]):
+        self.stat_key = stat_key
+        self.task_ids = task_ids
+
+
+# index.json path -> last version read or written by this process
+_snapshots: Dict[Path, _IndexSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _atomic_write_text(path: Path, content: str) -> Tuple[int, int, int]:
+    """
+    Write a file via temp file + os.replace().
+
+    Returns:
+        Stat key of the written file
+    """
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.tmp", text=True)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            # Rename keeps inode and mtime, so this is the target's stat key
+            stat = os.fstat(f.fileno())
+        match_target_mode(temp_path, path)
+        os.replace(temp_path, path)
+    except Exception:
+        # Clean up temp file on error
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _read_index(index_path: Path) -> dict:
+    """Read index.json from disk (empty index if missing)."""
+    if not index_path.exists():
+        return {"quarantined_tasks": []}
+    return json.loads(index_path.read_text())
+
+
+def _write_index(index_path: Path, index: dict) -> None:
+    """Write index.json atomically and cache it as the current snapshot."""
+    stat_key = _atomic_write_text(index_path, json.dumps(index, indent=2, sort_keys=True))
+    with _snapshots_lock:
+        _snapshots[index_path] = _IndexSnapshot(stat_key, frozenset(index["quarantined_tasks"]))
+
+
+def quarantined_ids(repo_root: Optional[Path] = None) -> FrozenSet[str]:
+    """
+    Get the IDs of all quarantined tasks.
+
+    The index is parsed once and reused until index.json changes (checked
+    with one stat per call). Lock-free: writers replace the file atomically.
+
+    Args:
+        repo_root: Repository root path (defaults to cwd)
+
+    Returns:
+        Frozen set of quarantined task IDs
+    """
+    if repo_root is None:
+        repo_root = Path.cwd()
+
+    index_path = repo_root / QUARANTINE_DIR / "index.json"
+    stat_key = _stat_key(index_path)
+    snapshot = _snapshots.get(index_path)
+    if snapshot is not None and snapshot.stat_key == stat_key:
+        return snapshot.task_ids
+
+    task_ids: FrozenSet[str] = frozenset()
+    if stat_key is not None:
+        try:
+            task_ids = frozenset(_read_index(index_path).get("quarantined_tasks", []))
+        except FileNotFoundError:
+            stat_key = None  # Removed between stat and read
+
+    with _snapshots_lock:
+        _snapshots[index_path] = _IndexSnapshot(stat_key, task_ids)
+    return task_ids
+
+
 def quarantine_task(
     task_id: str,
     reason: str,
@@ -47,51 +149,78 @@ def quarantine_task(
     Raises:
         ValueError: If task_id or reason format is invalid
     """
+    return quarantine_tasks([(task_id, reason, error_details)], repo_root)[0]
+
+
+def quarantine_tasks(
+    entries: Iterable[Tuple[str, str, Optional[str]]],
+    repo_root: Path
+) -> List[Path]:
+    """
+    Quarantine several tasks with a single index update.
+
+    All entries are validated before anything is written.
+
+    Args:
+        entries: (task_id, reason, error_details) tuples
+        repo_root: Repository root path
+
+    Returns:
+        Paths to created quarantine entry files, in input order
+
+    Raises:
+        ValueError: If any task_id or reason format is invalid
+    """
     # Ensure quarantine directory exists
     quarantine_dir = repo_root / QUARANTINE_DIR
     quarantine_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create QuarantineEntry with validation
-    entry = QuarantineEntry(
-        task_id=task_id,
-        quarantined_at=datetime.now(timezone.utc).isoformat(),
-        reason=reason,
-        original_path=f"tasks/{task_id}.task.yaml",
-        error_details=error_details,
-        auto_repair_attempted=False,
-        repair_status="pending"
-    )
-
-    # Write quarantine entry file
-    entry_path = quarantine_dir / f"{task_id}.quarantine.json"
-    entry_path.write_text(json.dumps(entry.to_dict(), indent=2, sort_keys=True))
-
-    # Update index atomically using file lock
+    # Create QuarantineEntry objects with validation
+    now = datetime.now(timezone.utc).isoformat()
+    quarantine_entries = [
+        QuarantineEntry(
+            task_id=task_id,
+            quarantined_at=now,
+            reason=reason,
+            original_path=f"tasks/{task_id}.task.yaml",
+            error_details=error_details,
+            auto_repair_attempted=False,
+            repair_status="pending"
+        )
+        for task_id, reason, error_details in entries
+    ]
+
+    # Update entries and index under one lock
     index_path = quarantine_dir / "index.json"
     lock_path = quarantine_dir / "index.json.lock"
 
+    entry_paths = []
     with FileLock(str(lock_path), timeout=10):
-        # Load or create index
-        if index_path.exists():
-            index = json.loads(index_path.read_text())
-        else:
-            index = {"quarantined_tasks": []}
+        for entry in quarantine_entries:
+            entry_path = quarantine_dir / f"{entry.task_id}.quarantine.json"
+            _atomic_write_text(entry_path, json.dumps(entry.to_dict(), indent=2, sort_keys=True))
+            entry_paths.append(entry_path)
+
+        index = _read_index(index_path)
 
         # Add to index if not already present (idempotent)
-        if task_id not in index["quarantined_tasks"]:
-            index["quarantined_tasks"].append(task_id)
+        present = set(index["quarantined_tasks"])
+        for entry in quarantine_entries:
+            if entry.task_id not in present:
+                present.add(entry.task_id)
+                index["quarantined_tasks"].append(entry.task_id)
 
-        # Write index with sorted keys
-        index_path.write_text(json.dumps(index, indent=2, sort_keys=True))
+        _write_index(index_path, index)
 
-    return entry_path
+    return entry_paths
 
 
 def is_quarantined(task_id: str, repo_root: Optional[Path] = None) -> bool:
     """
     Check if task is currently in quarantine.
 
-    Performs fast lookup using index.json without reading individual entries.
+    Performs fast lookup using the cached index (see quarantined_ids).
+    Use quarantined_ids() directly when checking many tasks.
 
     Args:
         task_id: Task identifier (TASK-NNNN format)
@@ -100,16 +229,7 @@ def is_quarantined(task_id: str, repo_root: Optional[Path] = None) -> bool:
     Returns:
         True if task is quarantined, False otherwise
     """
-    if repo_root is None:
-        repo_root = Path.cwd()
-
-    index_path = repo_root / QUARANTINE_DIR / "index.json"
-
-    if not index_path.exists():
-        return False
-
-    index = json.loads(index_path.read_text())
-    return task_id in index.get("quarantined_tasks", [])
+    return task_id in quarantined_ids(repo_root)
 
 
 def attempt_auto_repair(task_id: str, repo_root: Optional[Path] = None) -> bool:
@@ -154,38 +274,63 @@ def release_from_quarantine(task_id: str, repo_root: Optional[Path] = None) -> N
     Raises:
         FileNotFoundError: If quarantine entry does not exist
     """
-    if repo_root is None:
-        repo_root = Path.cwd()
+    release_tasks([task_id], repo_root)
 
-    quarantine_dir = repo_root / QUARANTINE_DIR
-    entry_path = quarantine_dir / f"{task_id}.quarantine.json"
 
-    if not entry_path.exists():
-        raise FileNotFoundError(f"Quarantine entry not found: {entry_path}")
+def release_tasks(task_ids: Iterable[str], repo_root: Optional[Path] = None) -> None:
+    """
+    Release several tasks from quarantine with a single index update.
 
-    # Create resolved archive directory
-    resolved_dir = quarantine_dir / "resolved"
-    resolved_dir.mkdir(exist_ok=True)
+    Args:
+        task_ids: Task identifiers (TASK-NNNN format)
+        repo_root: Repository root path (defaults to cwd)
 
-    # Move entry to resolved/
-    shutil.move(str(entry_path), str(resolved_dir / entry_path.name))
+    Raises:
+        FileNotFoundError: If any quarantine entry does not exist (nothing
+            is released in that case)
+    """
+    if repo_root is None:
+        repo_root = Path.cwd()
+
+    quarantine_dir = repo_root / QUARANTINE_DIR
+    task_ids = list(dict.fromkeys(task_ids))
 
-    # Update index atomically
     index_path = quarantine_dir / "index.json"
     lock_path = quarantine_dir / "index.json.lock"
 
     with FileLock(str(lock_path), timeout=10):
-        if index_path.exists():
-            index = json.loads(index_path.read_text())
-
-            # Remove from quarantined_tasks list
-            index["quarantined_tasks"] = [
-                t for t in index.get("quarantined_tasks", [])
-                if t != task_id
-            ]
-
-            # Write updated index
-            index_path.write_text(json.dumps(index, indent=2, sort_keys=True))
+        entry_paths = [quarantine_dir / f"{task_id}.quarantine.json" for task_id in task_ids]
+        for entry_path in entry_paths:
+            if not entry_path.exists():
+                raise FileNotFoundError(f"Quarantine entry not found: {entry_path}")
+
+        # Create resolved archive directory
+        resolved_dir = quarantine_dir / "resolved"
+        resolved_dir.mkdir(exist_ok=True)
+
+        # Move entries to resolved/, moving them back if any step fails so
+        # the entries and the index never disagree
+        moved: List[Path] = []
+        try:
+            for entry_path in entry_paths:
+                shutil.move(str(entry_path), str(resolved_dir / entry_path.name))
+                moved.append(entry_path)
+
+            if index_path.exists():
+                index = _read_index(index_path)
+
+                # Remove from quarantined_tasks list
+                released = set(task_ids)
+                index["quarantined_tasks"] = [
+                    t for t in index.get("quarantined_tasks", [])
+                    if t not in released
+                ]
+
+                _write_index(index_path, index)
+        except Exception:
+            for entry_path in reversed(moved):
+                shutil.move(str(resolved_dir / entry_path.name), str(entry_path))
+            raise
 
 
 def list_quarantined(
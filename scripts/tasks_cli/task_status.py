@@ -0,0 +1,206 @@
+"""
+Process-wide task status lookups.
+
+Blocker checks only need "what is the status of TASK-XXXX?", yet each
+check used to construct a TaskDatastore, load every task (archive
+included) and scan for the ID - once per validation command. This module
+keeps one status map per repository for the whole process:
+
+- active tasks (hot tier) map to their status
+- archived IDs are answered from the datastore's ArchiveIndex as
+  'completed' (the archive tier only holds completed tasks)
+
+The map is built from TaskDatastore.load_active_tasks() on first use and
+reused until the hot-tier cache file changes (checked with one stat per
+lookup), i.e. until some process rebuilt the datastore index.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from .archive_index import ArchiveIndex
+from .telemetry import get_tracer
+
+_tracer = get_tracer(__name__)
+
+ARCHIVED_STATUS = "completed"
+
+
+class TaskStatusIndex:
+    """Task ID -> status map from one version of the datastore hot tier."""
+
+    __slots__ = ('stat_key', '_statuses', '_archive')
+
+    def __init__(
+        self,
+        stat_key: Optional[Tuple[int, int, int]],
+        statuses: Dict[str, str],
+        archive: ArchiveIndex,
+    ):
+        self.stat_key = stat_key
+        self._statuses = statuses
+        self._archive = archive
+
+    def status_of(self, task_id: str) -> Optional[str]:
+        """
+        Get a task's status in O(1).
+
+        Args:
+            task_id: Task ID (e.g., TASK-0001)
+
+        Returns:
+            Status string, or None if the task does not exist
+        """
+        status = self._statuses.get(task_id)
+        if status is None and task_id in self._archive:
+            return ARCHIVED_STATUS
+        return status
+
+    def statuses_of(self, task_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Get the statuses of many tasks at once.
+
+        Args:
+            task_ids: Task IDs to look up (duplicates collapse)
+
+        Returns:
+            Dict of task ID -> status (None for unknown tasks)
+        """
+        return {task_id: self.status_of(task_id) for task_id in task_ids}
+
+    def __len__(self) -> int:
+        return len(self._statuses) + len(self._archive)
+
+
+# tasks_index.json path -> index built from the last version seen by this process
+_indexes: Dict[Path, TaskStatusIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def get_task_status_index(repo_root: Path) -> TaskStatusIndex:
+    """
+    Get the shared status index for a repository.
+
+    Args:
+        repo_root: Repository root path
+
+    Returns:
+        TaskStatusIndex current with the datastore's hot-tier cache file
+    """
+    from .datastore import TaskDatastore
+
+    cache_file = Path(repo_root) / "tasks" / ".cache" / "tasks_index.json"
+    index = _indexes.get(cache_file)
+    if index is not None and index.stat_key == _stat_key(cache_file):
+        return index
+
+    with _indexes_lock:
+        index = _indexes.get(cache_file)
+        if index is not None and index.stat_key == _stat_key(cache_file):
+            return index
+
+        with _tracer.start_as_current_span("cli.task_status.load") as span:
+            datastore = TaskDatastore(Path(repo_root))
+            tasks = datastore.load_active_tasks()
+            index = TaskStatusIndex(
+                _stat_key(cache_file),
+                {task.id: task.status for task in tasks},
+                datastore.get_archive_index(),
+            )
+            span.set_attribute("task_count", len(tasks))
+            span.set_attribute("archive_count", len(index) - len(tasks))
+        _indexes[cache_file] = index
+        return index
+
+
+def invalidate_task_statuses(repo_root: Optional[Path] = None) -> None:
+    """
+    Drop cached status indexes (all repositories when repo_root is None).
+
+    Args:
+        repo_root: Repository whose index should be rebuilt on next lookup
+    """
+    with _indexes_lock:
+        if repo_root is None:
+            _indexes.clear()
+        else:
+            _indexes.pop(Path(repo_root) / "tasks" / ".cache" / "tasks_index.json", None)
+
+
+def status_of(task_id: str, repo_root: Path) -> Optional[str]:
+    """
+    Get a task's status via the shared index.
+
+    Args:
+        task_id: Task ID (e.g., TASK-0001)
+        repo_root: Repository root path
+
+    Returns:
+        Status string, or None if the task does not exist
+    """
+    return get_task_status_index(repo_root).status_of(task_id)
+
+
+def blocker_status(status: Optional[str], blocker_id: str) -> Tuple[bool, str]:
+    """
+    Interpret a blocker task's status.
+
+    Args:
+        status: Status of the blocker (None if it does not exist)
+        blocker_id: Blocker task ID
+
+    Returns:
+        Tuple of (is_blocked, reason):
+        - is_blocked: True if blocker is active (not completed)
+        - reason: Human-readable reason string
+    """
+    if status is None:
+        return False, f"Blocker {blocker_id} not found"
+
+    if status != "completed":
+        return True, f"Blocked by {blocker_id} (status: {status})"
+
+    return False, ""
+
+
+def check_blocker_status(blocker_id: str, repo_root: Path) -> Tuple[bool, str]:
+    """
+    Check if a blocker task is active (not completed).
+
+    Args:
+        blocker_id: Task ID to check (e.g., TASK-0001)
+        repo_root: Repository root path
+
+    Returns:
+        Tuple of (is_blocked, reason), see blocker_status()
+    """
+    return blocker_status(status_of(blocker_id, repo_root), blocker_id)
+
+
+def check_blockers(blocker_ids: Iterable[str], repo_root: Path) -> Dict[str, Tuple[bool, str]]:
+    """
+    Check many blockers against one snapshot of the index.
+
+    Args:
+        blocker_ids: Blocker task IDs (duplicates collapse)
+        repo_root: Repository root path
+
+    Returns:
+        Dict of blocker ID -> (is_blocked, reason)
+    """
+    statuses = get_task_status_index(repo_root).statuses_of(blocker_ids)
+    return {
+        blocker_id: blocker_status(status, blocker_id)
+        for blocker_id, status in statuses.items()
+    }
@@ -1,42 +1,65 @@
 """OpenTelemetry telemetry infrastructure for tasks CLI.
 
-Phase 0 stub - will wire to OTLP collector in Phase 3.
+Tracing is off by default: get_tracer() returns the global proxy tracer,
+which stays a no-op until init_telemetry(enabled=True) installs a real
+TracerProvider. Spans are then exported offline - nothing leaves the machine:
 
-This module provides no-op telemetry infrastructure that can be populated
-with real spans and metrics in future phases without changing call sites.
+- JsonlSpanExporter: appends one JSON object per span to a local file
+  (``.agent-output/traces/spans.jsonl`` when enabled via TASKS_TRACE=1)
+- RingBufferSpanExporter: keeps the most recent spans in memory (tests,
+  in-process inspection)
+
+Hot paths instrumented with spans (``cli.*``): provider git/process calls,
+datastore load, graph build, priority propagation, context load/save and
+secret scanning. ``tasks trace-report`` summarizes the slowest spans per
+command across recent runs (see summarize_traces()).
 
 Architecture:
 - NullSpanExporter: Accepts and discards all spans without errors
-- get_tracer(): Returns NoOpTracer from opentelemetry-api
+- get_tracer(): Returns the global (proxy) tracer
 - get_meter(): Returns NoOpMeter from opentelemetry-api
-- init_telemetry(): Sets up global provider (no-op for now)
+- init_telemetry(): Installs a batch span processor with an offline exporter
+- shutdown_telemetry(): Flushes pending spans (call before process exit)
 
 Standards compliance:
 - Follows standards/typescript.md principle of fail-safe defaults
 - Supports future observability per standards/cross-cutting.md
 """
 
-from typing import Optional, Sequence
+import json
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
 from opentelemetry import trace
 from opentelemetry import metrics
-from opentelemetry.sdk.trace import TracerProvider, ReadableSpan
-from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
-from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
 from opentelemetry.sdk.resources import Resource
 
+TRACE_ENV_VAR = "TASKS_TRACE"
+TRACE_FILE_RELPATH = Path(".agent-output") / "traces" / "spans.jsonl"
+DEFAULT_TRACE_FILE_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_RING_BUFFER_SIZE = 2048
 
-class NullSpanExporter(SpanExporter):
-    """No-op span exporter that discards all spans.
+# Root span wrapping one CLI invocation; its cli.command attribute names the run
+ROOT_SPAN_NAME = "cli.command"
 
-    Phase 0 implementation - accepts spans but performs no I/O.
-    Future phases will replace with OTLP exporter for real telemetry.
-    """
+
+class NullSpanExporter(SpanExporter):
+    """No-op span exporter that discards all spans."""
 
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         """Accept and discard spans without errors.
 
         Args:
-            spans: Sequence of spans to export (ignored in Phase 0)
+            spans: Sequence of spans to export (ignored)
 
         Returns:
             SpanExportResult.SUCCESS to indicate no errors occurred
@@ -45,14 +68,14 @@ class NullSpanExporter(SpanExporter):
         return SpanExportResult.SUCCESS
 
     def shutdown(self) -> None:
-        """Shutdown exporter (no-op in Phase 0)."""
+        """Shutdown exporter (no-op)."""
         pass
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
-        """Force flush pending spans (no-op in Phase 0).
+        """Force flush pending spans (no-op).
 
         Args:
-            timeout_millis: Timeout in milliseconds (ignored in Phase 0)
+            timeout_millis: Timeout in milliseconds (ignored)
 
         Returns:
             True to indicate successful flush (no spans to flush)
@@ -60,27 +83,196 @@ class NullSpanExporter(SpanExporter):
         return True
 
 
+def span_to_record(span: ReadableSpan) -> Dict[str, Any]:
+    """Convert a finished span into the JSON record stored by exporters.
+
+    Args:
+        span: Finished span
+
+    Returns:
+        Dict with trace/span ids, name, start time (ns), duration_ms,
+        status and attributes
+    """
+    parent = span.parent
+    return {
+        "trace_id": format(span.context.trace_id, "032x"),
+        "span_id": format(span.context.span_id, "016x"),
+        "parent_id": format(parent.span_id, "016x") if parent else None,
+        "name": span.name,
+        "start_time_ns": span.start_time,
+        "duration_ms": ((span.end_time or span.start_time) - span.start_time) / 1e6,
+        "status": span.status.status_code.name,
+        "attributes": dict(span.attributes or {}),
+    }
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Append spans as JSON lines to a local file.
+
+    The file is rotated to ``<name>.1`` once it exceeds max_bytes, so at most
+    two generations are kept on disk.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_TRACE_FILE_MAX_BYTES):
+        """Initialize exporter.
+
+        Args:
+            path: JSONL file to append to (parent directories are created)
+            max_bytes: Rotate once the file grows beyond this size
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Append spans to the JSONL file.
+
+        Args:
+            spans: Finished spans
+
+        Returns:
+            SUCCESS, or FAILURE if the file cannot be written
+        """
+        lines = "".join(
+            json.dumps(span_to_record(span), default=str) + "\n" for span in spans
+        )
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._rotate_if_needed()
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+        except OSError:
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def _rotate_if_needed(self) -> None:
+        try:
+            if self.path.stat().st_size > self.max_bytes:
+                os.replace(self.path, rotated_trace_file(self.path))
+        except FileNotFoundError:
+            pass
+
+    def shutdown(self) -> None:
+        """Shutdown exporter (files are closed after every export)."""
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Force flush (writes are synchronous).
+
+        Args:
+            timeout_millis: Timeout in milliseconds (ignored)
+
+        Returns:
+            True
+        """
+        return True
+
+
+class RingBufferSpanExporter(SpanExporter):
+    """Keep the most recent span records in memory."""
+
+    def __init__(self, maxlen: int = DEFAULT_RING_BUFFER_SIZE):
+        """Initialize exporter.
+
+        Args:
+            maxlen: Number of span records retained
+        """
+        self._records: deque = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Store span records, evicting the oldest beyond maxlen.
+
+        Args:
+            spans: Finished spans
+
+        Returns:
+            SpanExportResult.SUCCESS
+        """
+        with self._lock:
+            self._records.extend(span_to_record(span) for span in spans)
+        return SpanExportResult.SUCCESS
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Return buffered span records, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        """Drop all buffered span records."""
+        with self._lock:
+            self._records.clear()
+
+    def shutdown(self) -> None:
+        """Shutdown exporter (no-op)."""
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Force flush (records are stored synchronously).
+
+        Args:
+            timeout_millis: Timeout in milliseconds (ignored)
+
+        Returns:
+            True
+        """
+        return True
+
+
+class _SwitchableSpanProcessor(SpanProcessor):
+    """Delegates to the current processor.
+
+    The global TracerProvider can only be installed once per process, so
+    re-initialization swaps the delegate instead of the provider.
+    """
+
+    def __init__(self):
+        self.delegate: Optional[SpanProcessor] = None
+
+    def on_start(self, span, parent_context=None) -> None:
+        delegate = self.delegate
+        if delegate is not None:
+            delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        delegate = self.delegate
+        if delegate is not None:
+            delegate.on_end(span)
+
+    def shutdown(self) -> None:
+        if self.delegate is not None:
+            self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        if self.delegate is None:
+            return True
+        return self.delegate.force_flush(timeout_millis)
+
+
+_switch = _SwitchableSpanProcessor()
+_provider: Optional[TracerProvider] = None
+
+
 def get_tracer(name: str) -> trace.Tracer:
     """Get a tracer instance for the given name.
 
-    Phase 0: Returns NoOpTracer that produces no spans.
-    Future phases will return real tracer with OTLP export.
+    Returns the global proxy tracer: spans are no-ops until
+    init_telemetry(enabled=True) runs, even for tracers obtained earlier.
 
     Args:
         name: Tracer name, typically module name (e.g., 'tasks_cli.commands')
 
     Returns:
-        NoOpTracer instance that safely ignores all tracing operations
+        Tracer instance
     """
-    # Return NoOpTracer by using the default (uninitialized) global provider
     return trace.get_tracer(name)
 
 
 def get_meter(name: str) -> metrics.Meter:
     """Get a meter instance for the given name.
 
-    Phase 0: Returns NoOpMeter that produces no metrics.
-    Future phases will return real meter with OTLP export.
+    Metrics export is not wired yet; returns NoOpMeter.
 
     Args:
         name: Meter name, typically module name (e.g., 'tasks_cli.metrics')
@@ -92,30 +284,167 @@ def get_meter(name: str) -> metrics.Meter:
     return metrics.get_meter(name)
 
 
-def init_telemetry(enabled: bool = False) -> None:
+def tracing_enabled() -> bool:
+    """Return True if TASKS_TRACE requests tracing for this process."""
+    return os.environ.get(TRACE_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+def init_telemetry(
+    enabled: bool = False,
+    exporter: Optional[SpanExporter] = None,
+    trace_file: Optional[Path] = None,
+) -> Optional[SpanExporter]:
     """Initialize telemetry infrastructure.
 
-    Phase 0: No-op initialization. Global providers remain unset,
-    causing get_tracer()/get_meter() to return no-op implementations.
+    With enabled=False nothing is installed and all tracers stay no-op.
+    With enabled=True a TracerProvider with a BatchSpanProcessor is
+    installed globally (once per process; later calls swap the exporter).
+
+    Args:
+        enabled: Whether to enable tracing
+        exporter: Span exporter to use (defaults to JsonlSpanExporter when
+            trace_file is given, otherwise RingBufferSpanExporter)
+        trace_file: JSONL file for JsonlSpanExporter
+
+    Returns:
+        The active exporter, or None when disabled
+    """
+    global _provider
+
+    if not enabled:
+        return None
+
+    if exporter is None:
+        exporter = (
+            JsonlSpanExporter(trace_file) if trace_file is not None
+            else RingBufferSpanExporter()
+        )
+
+    if _provider is None:
+        _provider = TracerProvider(resource=Resource.create({"service.name": "tasks-cli"}))
+        _provider.add_span_processor(_switch)
+        trace.set_tracer_provider(_provider)
+
+    previous = _switch.delegate
+    _switch.delegate = BatchSpanProcessor(exporter)
+    if previous is not None:
+        previous.shutdown()
 
-    Phase 3: Will configure TracerProvider/MeterProvider with OTLP exporters
-    when enabled=True.
+    return exporter
+
+
+def shutdown_telemetry() -> None:
+    """Flush pending spans and detach the exporter.
+
+    Safe to call when telemetry was never enabled.
+    """
+    previous = _switch.delegate
+    _switch.delegate = None
+    if previous is not None:
+        previous.shutdown()
+
+
+def rotated_trace_file(path: Path) -> Path:
+    """Path of the previous trace file generation."""
+    return path.with_name(path.name + ".1")
+
+
+def load_span_records(trace_file: Path) -> List[Dict[str, Any]]:
+    """Load span records from a trace file and its rotated generation.
+
+    Malformed lines (e.g. a write cut short) are skipped.
 
     Args:
-        enabled: Whether to enable telemetry (no effect in Phase 0)
+        trace_file: JSONL trace file
 
-    Side effects:
-        None in Phase 0. Future phases will set global tracer/meter providers.
+    Returns:
+        Span records, oldest generation first
     """
-    # Phase 0: No-op - global providers remain uninitialized (NoOp)
-    # Future phases will add:
-    # if enabled:
-    #     resource = Resource.create({"service.name": "tasks-cli"})
-    #     tracer_provider = TracerProvider(resource=resource)
-    #     tracer_provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
-    #     trace.set_tracer_provider(tracer_provider)
-    #
-    #     meter_provider = MeterProvider(resource=resource)
-    #     meter_provider.add_metric_reader(PeriodicExportingMetricReader(OTLPMetricExporter()))
-    #     metrics.set_meter_provider(meter_provider)
-    pass
+    records: List[Dict[str, Any]] = []
+    for path in (rotated_trace_file(trace_file), trace_file):
+        if not path.exists():
+            continue
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    return records
+
+
+def summarize_traces(
+    records: Sequence[Dict[str, Any]],
+    runs: int = 20,
+    top: int = 5,
+) -> Dict[str, Any]:
+    """Summarize the slowest spans per command across recent runs.
+
+    A run is one trace; its command is the ``cli.command`` attribute of the
+    root span (or the root span name when absent). Spans are aggregated by
+    name within each command.
+
+    Args:
+        records: Span records (as produced by span_to_record)
+        runs: Number of most recent runs to include
+        top: Number of span names to report per command
+
+    Returns:
+        Dict with runs_analyzed and per-command run counts, total durations
+        and the slowest span names (count, total/avg/max duration_ms)
+    """
+    traces: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        traces.setdefault(record["trace_id"], []).append(record)
+
+    def trace_start(spans: List[Dict[str, Any]]) -> int:
+        return min(span.get("start_time_ns") or 0 for span in spans)
+
+    recent = sorted(traces.values(), key=trace_start)[-runs:] if runs > 0 else []
+
+    commands: Dict[str, Dict[str, Any]] = {}
+    for spans in recent:
+        roots = [span for span in spans if span.get("parent_id") is None]
+        root = max(roots, key=lambda span: span["duration_ms"]) if roots else None
+        command = (
+            root["attributes"].get(ROOT_SPAN_NAME, root["name"]) if root else "unknown"
+        )
+
+        entry = commands.setdefault(command, {"runs": 0, "durations_ms": [], "spans": {}})
+        entry["runs"] += 1
+        if root is not None:
+            entry["durations_ms"].append(root["duration_ms"])
+
+        for span in spans:
+            if span is root:
+                continue
+            stats = entry["spans"].setdefault(
+                span["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["count"] += 1
+            stats["total_ms"] += span["duration_ms"]
+            stats["max_ms"] = max(stats["max_ms"], span["duration_ms"])
+
+    summary = {}
+    for command, entry in sorted(commands.items()):
+        slowest = sorted(
+            entry["spans"].items(), key=lambda item: item[1]["total_ms"], reverse=True
+        )[:top]
+        durations = entry["durations_ms"]
+        summary[command] = {
+            "runs": entry["runs"],
+            "avg_duration_ms": round(sum(durations) / len(durations), 3) if durations else None,
+            "max_duration_ms": round(max(durations), 3) if durations else None,
+            "slowest_spans": [
+                {
+                    "name": name,
+                    "count": stats["count"],
+                    "total_ms": round(stats["total_ms"], 3),
+                    "avg_ms": round(stats["total_ms"] / stats["count"], 3),
+                    "max_ms": round(stats["max_ms"], 3),
+                }
+                for name, stats in slowest
+            ],
+        }
+
+    return {"runs_analyzed": len(recent), "commands": summary}
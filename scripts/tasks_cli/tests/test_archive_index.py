@@ -0,0 +1,53 @@
+"""Tests for the compact archived-ID index."""
+
+from tasks_cli.archive_index import ArchiveIndex, BloomFilter, CompletedIds
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    """Every added key is found; unrelated keys rarely are."""
+    bloom = BloomFilter.for_capacity(5000)
+    for i in range(5000):
+        bloom.add(f"TASK-{i:05d}")
+
+    assert all(f"TASK-{i:05d}" in bloom for i in range(5000))
+    false_positives = sum(f"OTHER-{i:05d}" in bloom for i in range(5000))
+    assert false_positives < 150  # ~1% target
+
+
+def test_archive_index_round_trip():
+    """Serialized indexes answer membership like the original."""
+    index = ArchiveIndex.from_dict(ArchiveIndex.from_ids(["TASK-0002", "TASK-0001"]).to_dict())
+
+    assert len(index) == 2
+    assert "TASK-0001" in index
+    assert "TASK-0003" not in index
+    assert sorted(index) == ["TASK-0001", "TASK-0002"]
+
+
+def test_archive_index_builds_set_only_on_bloom_hit():
+    """Lookups the bloom filter rules out never split the ID blob."""
+    index = ArchiveIndex.from_dict(ArchiveIndex.from_ids(["TASK-0001"]).to_dict())
+
+    assert "TASK-9999" not in index
+    assert index._ids is None
+    assert "TASK-0001" in index
+    assert index._ids == {"TASK-0001"}
+
+
+def test_empty_archive_index():
+    """An empty archive contains nothing (including the empty string)."""
+    index = ArchiveIndex.from_ids([])
+
+    assert len(index) == 0
+    assert "" not in index
+    assert list(index) == []
+
+
+def test_completed_ids_combines_tiers():
+    """CompletedIds behaves like the union of active and archived IDs."""
+    completed = CompletedIds(["TASK-0003", "TASK-0001"], ArchiveIndex.from_ids(["TASK-0001", "TASK-0002"]))
+
+    assert "TASK-0002" in completed
+    assert "TASK-0004" not in completed
+    assert len(completed) == 3
+    assert completed == {"TASK-0001", "TASK-0002", "TASK-0003"}
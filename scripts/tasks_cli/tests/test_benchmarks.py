@@ -0,0 +1,55 @@
+"""Tests for the benchmark suite (generators, harness and baseline gating)."""
+
+import json
+
+from tasks_cli.benchmarks import RepoSpec, compare_to_baseline, generate_repo, run_benchmarks
+from tasks_cli.benchmarks.generators import GeneratedRepo
+
+
+def _report(**medians):
+    return {
+        "results": [
+            {"scenario": name, "mode": "warm", "median_seconds": seconds, "max_rss_kb": rss}
+            for name, (seconds, rss) in medians.items()
+        ]
+    }
+
+
+def test_generate_and_run_small_repo(tmp_path):
+    """A tiny repo runs cold and warm with one sample per mode and a JSON-ready report."""
+    spec = RepoSpec(task_count=80, context_count=1, qa_log_lines=10)
+    repo = generate_repo(tmp_path / "repo", spec)
+
+    assert len(repo.task_ids) == 80
+    assert repo.ready_task_ids and repo.context_task_ids
+    assert GeneratedRepo.load(repo.root).spec == spec
+    assert len(list((repo.root / "docs" / "completed-tasks").glob("*.task.yaml"))) == 48
+
+    finished = []
+    report = run_benchmarks(repo.root, scenarios=["list", "validate"], samples=1, progress=finished.append)
+
+    assert [(r["scenario"], r["mode"]) for r in report["results"]] == [
+        ("list", "cold"), ("list", "warm"), ("validate", "cold"), ("validate", "warm"),
+    ]
+    assert len(finished) == 4
+    for result in report["results"]:
+        assert result["exit_codes"] == [0]
+        assert result["median_seconds"] > 0 and result["max_rss_kb"] > 0
+    assert report["repo"]["task_count"] == 80
+    assert json.loads(json.dumps(report))["results"] == report["results"]
+    assert compare_to_baseline(report, report) == []
+
+
+def test_compare_to_baseline_tolerances():
+    """Only increases past the tolerance (and the noise floor for time) regress."""
+    baseline = _report(list=(1.0, 1000), pick=(0.002, 1000), validate=(1.0, 1000))
+    current = _report(list=(1.3, 1100), pick=(0.004, 1000), validate=(0.5, 2000), explain=(9.0, 9000))
+
+    regressions = compare_to_baseline(current, baseline, tolerance=0.25, rss_tolerance=0.5)
+
+    # pick doubled but stays under MIN_REGRESSION_SECONDS; explain has no baseline
+    assert [(r["scenario"], r["metric"]) for r in regressions] == [
+        ("list", "median_seconds"), ("validate", "max_rss_kb"),
+    ]
+    assert round(regressions[0]["change"], 2) == 0.3
+    assert compare_to_baseline(current, baseline, tolerance=0.5, rss_tolerance=1.0) == []
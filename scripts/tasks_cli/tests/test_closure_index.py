@@ -0,0 +1,73 @@
+"""Tests for the transitive-closure index."""
+
+from tasks_cli.closure_index import ClosureIndex, Reachability
+from tasks_cli.models import Task
+
+
+def _task(task_id, blocked_by=(), depends_on=()):
+    return Task(
+        id=task_id,
+        title=task_id,
+        status="todo",
+        priority="P1",
+        area="test",
+        path=f"/test/{task_id}.yaml",
+        blocked_by=list(blocked_by),
+        depends_on=list(depends_on),
+    )
+
+
+def test_reachability_condenses_cycles():
+    """Cycle members reach each other and everything downstream of the cycle."""
+    successors = {"A": ["B"], "B": ["C"], "C": ["B", "D"], "D": [], "E": ["E"]}
+    reach = Reachability(list(successors), successors, signature=0)
+
+    assert len(reach) == 4  # {B, C} collapse into one component
+    assert sorted(reach.reachable("A")) == ["B", "C", "D"]
+    assert sorted(reach.reachable("B")) == ["B", "C", "D"]
+    assert reach.reachable("D") == []
+    assert reach.reachable("E") == ["E"]  # Self-loop
+    assert reach.mask("UNKNOWN") == 0 and reach.bit("UNKNOWN") == 0
+
+
+def test_closure_queries_ignore_unknown_ids():
+    """Missing/archived dependencies are leaves; downstream lookups still work for them."""
+    tasks = [
+        _task("TASK-A", blocked_by=["TASK-ARCHIVED"]),
+        _task("TASK-B", blocked_by=["TASK-A"], depends_on=["TASK-C"]),
+        _task("TASK-C"),
+        _task("TASK-D", blocked_by=["TASK-B"]),
+    ]
+    index = ClosureIndex(tasks)
+
+    assert index.blockers("TASK-D") == {"TASK-A", "TASK-B"}
+    assert index.artifacts("TASK-B") == {"TASK-C"}
+    assert sorted(index.blocked_tasks("TASK-A")) == ["TASK-B", "TASK-D"]
+    assert sorted(index.blocked_tasks("TASK-ARCHIVED")) == ["TASK-A", "TASK-B", "TASK-D"]
+
+
+def test_deep_chain_does_not_recurse():
+    """Tarjan runs iteratively, so long chains don't hit the recursion limit."""
+    tasks = [_task("TASK-00000")] + [
+        _task(f"TASK-{i:05d}", blocked_by=[f"TASK-{i - 1:05d}"]) for i in range(1, 5000)
+    ]
+    index = ClosureIndex(tasks)
+
+    assert len(index.blockers("TASK-04999")) == 4999
+    assert len(index.blocked_tasks("TASK-00000")) == 4999
+
+
+def test_unchanged_relations_are_reused_across_snapshots():
+    """Only relations whose edges changed are rebuilt for a new snapshot."""
+    tasks = [_task("TASK-A"), _task("TASK-B", blocked_by=["TASK-A"])]
+    previous = ClosureIndex(tasks, snapshot_id=1)
+    blocked_by = previous.relation('blocked_by')
+    depends_on = previous.relation('depends_on')
+
+    # New snapshot: same blocked_by edges, one new depends_on edge
+    updated = [_task("TASK-A"), _task("TASK-B", blocked_by=["TASK-A"], depends_on=["TASK-A"])]
+    index = ClosureIndex(updated, snapshot_id=2, previous=previous)
+
+    assert index.relation('blocked_by') is blocked_by
+    assert index.relation('depends_on') is not depends_on
+    assert index.artifacts("TASK-B") == {"TASK-A"}
@@ -130,7 +130,8 @@ class TestListTasks:
         mock_context.output_channel.set_json_mode.assert_called_with(False)
         mock_context.picker.list_tasks.assert_called_with(
             status_filter=None,
-            unblocker_only=False
+            unblocker_only=False,
+            archived=mock_context.datastore.load_archived_tasks.return_value
         )
 
         # Check stdout contains tab-delimited output
@@ -150,7 +151,7 @@ class TestListTasks:
         # Verify JSON output structure
         call_args = mock_context.output_channel.print_json.call_args[0][0]
         assert call_args['count'] == 2
-        assert len(call_args['tasks']) == 2
+        assert len(list(call_args['tasks'])) == 2
         assert call_args['filter']['status'] is None
         assert call_args['filter']['unblocker_only'] is False
 
@@ -164,8 +165,10 @@ class TestListTasks:
         assert exit_code == 0
         mock_context.picker.list_tasks.assert_called_with(
             status_filter='todo',
-            unblocker_only=False
+            unblocker_only=False,
+            archived=None
         )
+        mock_context.datastore.load_archived_tasks.assert_not_called()
 
         call_args = mock_context.output_channel.print_json.call_args[0][0]
         assert call_args['filter']['status'] == 'todo'
@@ -181,7 +184,8 @@ class TestListTasks:
         assert exit_code == 0
         mock_context.picker.list_tasks.assert_called_with(
             status_filter=None,
-            unblocker_only=True
+            unblocker_only=True,
+            archived=mock_context.datastore.load_archived_tasks.return_value
         )
 
         call_args = mock_context.output_channel.print_json.call_args[0][0]
@@ -0,0 +1,112 @@
+"""Tests for context storage backends (filesystem and SQLite)."""
+
+import json
+import threading
+
+import pytest
+
+from tasks_cli.context_store.runtime import RuntimeHelper
+from tasks_cli.context_store.storage import (
+    FilesystemContextStorage,
+    SQLiteContextStorage,
+    copy_contexts,
+    create_context_storage,
+)
+
+
+def _context(task_id, drift=0, status="pending"):
+    return {
+        "version": 1,
+        "task_id": task_id,
+        "git_head": "abc123",
+        "coordination": {
+            "implementer": {"status": status, "drift_budget": drift},
+            "reviewer": {"status": "pending", "drift_budget": 0},
+            "validator": {"status": "pending", "drift_budget": 0},
+        },
+    }
+
+
+def _filesystem(root):
+    runtime = RuntimeHelper(repo_root=root, context_root=root / ".agent-output", git_provider=None)
+    return FilesystemContextStorage(root / ".agent-output", runtime.atomic_write)
+
+
+def _sqlite(root):
+    return SQLiteContextStorage(root / ".agent-output" / ".contexts.sqlite3")
+
+
+@pytest.fixture(params=["filesystem", "sqlite"])
+def storage(request, tmp_path):
+    backend = _filesystem(tmp_path) if request.param == "filesystem" else _sqlite(tmp_path)
+    yield backend
+    backend.close()
+
+
+def test_contexts_evidence_and_queries(storage):
+    """Contexts round-trip, evidence upserts keep order and queries filter coordination."""
+    storage.write_context("TASK-0002", _context("TASK-0002", drift=2))
+    storage.write_context("TASK-0001", _context("TASK-0001", status="in_progress"))
+    storage.write_context("TASK-0003", _context("TASK-0003"))
+
+    assert storage.read_context("TASK-0002") == _context("TASK-0002", drift=2)
+    assert storage.read_context("TASK-9999") is None
+    assert storage.list_task_ids() == ["TASK-0001", "TASK-0002", "TASK-0003"]
+    assert storage.find_contexts(min_drift_budget=1) == ["TASK-0002"]
+    assert storage.find_contexts(agent_role="implementer", status="in_progress") == ["TASK-0001"]
+    assert storage.find_contexts(agent_role="reviewer", min_drift_budget=1) == []
+
+    storage.upsert_evidence("TASK-0001", [{"id": "a", "v": 1}, {"id": "b", "v": 1}])
+    storage.upsert_evidence("TASK-0001", [{"id": "c", "v": 1}, {"id": "a", "v": 2}])
+    assert storage.read_evidence("TASK-0001") == [{"id": "a", "v": 2}, {"id": "b", "v": 1}, {"id": "c", "v": 1}]
+
+    storage.delete_context("TASK-0001")
+    assert not storage.context_exists("TASK-0001")
+    assert storage.read_evidence("TASK-0001") == []
+
+
+def test_sqlite_transactions_roll_back_and_allow_concurrent_readers(tmp_path):
+    """A failed bulk update leaves nothing behind; other threads read committed state."""
+    storage = _sqlite(tmp_path)
+    storage.write_context("TASK-0001", _context("TASK-0001"))
+
+    with pytest.raises(RuntimeError):
+        with storage.transaction():
+            storage.write_context("TASK-0001", _context("TASK-0001", drift=5))
+            with storage.transaction():
+                storage.write_context("TASK-0002", _context("TASK-0002"))
+            raise RuntimeError("migration failed")
+
+    assert storage.list_task_ids() == ["TASK-0001"]
+    assert storage.find_contexts(min_drift_budget=1) == []
+
+    seen = []
+    with storage.transaction():
+        storage.write_context("TASK-0001", _context("TASK-0001", drift=1))
+        reader = threading.Thread(target=lambda: seen.append(storage.read_context("TASK-0001")))
+        reader.start()
+        reader.join(timeout=5)
+    assert seen == [_context("TASK-0001")]
+    assert storage.find_contexts(min_drift_budget=1) == ["TASK-0001"]
+    storage.close()
+
+
+def test_copy_contexts_between_backends(tmp_path, monkeypatch):
+    """Existing filesystem contexts migrate to SQLite in one pass."""
+    source = _filesystem(tmp_path)
+    source.write_context("TASK-0001", _context("TASK-0001", drift=3))
+    source.upsert_evidence("TASK-0001", [{"id": "e1"}])
+    assert json.loads((tmp_path / ".agent-output" / "TASK-0001" / "context.json").read_text())["task_id"] == "TASK-0001"
+
+    monkeypatch.setenv("TASKS_CONTEXT_BACKEND", "sqlite")
+    target = create_context_storage(tmp_path / ".agent-output", atomic_write_fn=None)
+    assert isinstance(target, SQLiteContextStorage)
+
+    assert copy_contexts(source, target) == 1
+    assert target.read_context("TASK-0001") == source.read_context("TASK-0001")
+    assert target.read_evidence("TASK-0001") == [{"id": "e1"}]
+    assert target.find_contexts(min_drift_budget=1) == ["TASK-0001"]
+    target.close()
+
+    with pytest.raises(ValueError):
+        create_context_storage(tmp_path, None, backend="redis")
@@ -2348,3 +2348,16 @@ def test_macro_expanded_directories_allow_new_files(context_store, sample_immuta
     # Out-of-scope should only contain .agent-output files (not our new files)
     for oos_file in out_of_scope:
         assert '.agent-output' in oos_file, f"Unexpected out-of-scope file: {oos_file}"
+
+
+def test_get_current_git_head_is_memoized_in_request_scope(context_store, temp_repo):
+    """The public HEAD lookup goes through the store's git provider and request scope."""
+    expected = subprocess.run(
+        ['git', 'rev-parse', 'HEAD'], cwd=temp_repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    with context_store.git_request_scope() as cache:
+        assert context_store.get_current_git_head() == expected
+        assert context_store.get_current_git_head() == expected
+
+    assert cache.saved_spawns == 1
@@ -0,0 +1,209 @@
+"""
+Test QA result cache for validation commands.
+
+Covers cache keys/fingerprints, hits and misses through
+QABaselineManager.execute_command, eviction and the opt-in switch.
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tasks_cli.context_store.qa import QABaselineManager
+from tasks_cli.context_store.qa_cache import (
+    QA_CACHE_ENV_VAR,
+    QAResultCache,
+    qa_cache_enabled,
+)
+from tasks_cli.models import ValidationCommand
+
+
+class FakeClock:
+    """Controllable clock for age-based eviction tests."""
+
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def temp_repo(tmp_path):
+    """Create temporary git repository with a package directory."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+
+    subprocess.run(['git', 'init', '-b', 'main'], cwd=repo, check=True, capture_output=True)
+    subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=repo, check=True, capture_output=True)
+    subprocess.run(['git', 'config', 'user.email', 'test@example.com'], cwd=repo, check=True, capture_output=True)
+    subprocess.run(['git', 'config', 'commit.gpgsign', 'false'], cwd=repo, check=True, capture_output=True)
+
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / "index.ts").write_text("export const a = 1;\n")
+    (repo / "other.txt").write_text("unrelated\n")
+    (repo / ".gitignore").write_text(".agent-output/\n")
+    subprocess.run(['git', 'add', '.'], cwd=repo, check=True, capture_output=True)
+    subprocess.run(['git', 'commit', '-m', 'Initial commit'], cwd=repo, check=True, capture_output=True)
+
+    return repo
+
+
+@pytest.fixture
+def counting_command(temp_repo):
+    """Validation command that appends to a counter file on every run."""
+    counter = temp_repo.parent / "runs.txt"
+    return ValidationCommand(
+        id="val-010",
+        command=f"echo run >> {counter} && echo '1 problem (1 error, 0 warnings)' && echo lint",
+        description="Lint package",
+        cwd="pkg",
+        timeout_ms=5000,
+    ), counter
+
+
+def _run_count(counter: Path) -> int:
+    return len(counter.read_text().splitlines()) if counter.exists() else 0
+
+
+def test_cache_hit_skips_execution(temp_repo, counting_command):
+    """Second run with unchanged inputs is served from cache."""
+    cmd, counter = counting_command
+    manager = QABaselineManager(temp_repo, result_cache=QAResultCache(temp_repo))
+
+    first = manager.execute_command(cmd, "TASK-0001")
+    second = manager.execute_command(cmd, "TASK-0001")
+
+    assert _run_count(counter) == 1
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["exit_code"] == first["exit_code"] == 0
+    assert second["success"] is True
+    assert second["log_path"] == first["log_path"]
+    assert second["summary"] == {"lint_errors": 1}
+    assert (temp_repo / second["log_path"]).exists()
+
+
+def test_dirty_file_in_scope_invalidates(temp_repo, counting_command):
+    """Modifying a file under the command's cwd changes the key."""
+    cmd, counter = counting_command
+    manager = QABaselineManager(temp_repo, result_cache=QAResultCache(temp_repo))
+
+    manager.execute_command(cmd, "TASK-0001")
+    (temp_repo / "pkg" / "index.ts").write_text("export const a = 2;\n")
+    result = manager.execute_command(cmd, "TASK-0001")
+
+    assert _run_count(counter) == 2
+    assert result["cached"] is False
+
+
+def test_dirty_file_out_of_scope_keeps_hit(temp_repo, counting_command):
+    """Changes outside the command's cwd do not invalidate."""
+    cmd, counter = counting_command
+    manager = QABaselineManager(temp_repo, result_cache=QAResultCache(temp_repo))
+
+    manager.execute_command(cmd, "TASK-0001")
+    (temp_repo / "other.txt").write_text("changed\n")
+    result = manager.execute_command(cmd, "TASK-0001")
+
+    assert _run_count(counter) == 1
+    assert result["cached"] is True
+
+
+def test_new_commit_in_scope_invalidates(temp_repo, counting_command):
+    """Committing a change under cwd changes the tree hash."""
+    cmd, counter = counting_command
+    manager = QABaselineManager(temp_repo, result_cache=QAResultCache(temp_repo))
+
+    manager.execute_command(cmd, "TASK-0001")
+    (temp_repo / "pkg" / "new.ts").write_text("export {};\n")
+    subprocess.run(['git', 'add', '.'], cwd=temp_repo, check=True, capture_output=True)
+    subprocess.run(['git', 'commit', '-m', 'Add file'], cwd=temp_repo, check=True, capture_output=True)
+    manager.execute_command(cmd, "TASK-0001")
+
+    assert _run_count(counter) == 2
+
+
+def test_env_overrides_change_key(temp_repo, counting_command):
+    """Explicit env overrides participate in the key."""
+    cmd, _ = counting_command
+    cache = QAResultCache(temp_repo)
+    other = ValidationCommand(
+        id=cmd.id, command=cmd.command, description=cmd.description,
+        cwd=cmd.cwd, env={"CI": "1"},
+    )
+
+    assert cache.key_for(cmd) != cache.key_for(other)
+    assert cache.key_for(cmd) == cache.key_for(cmd)
+
+
+def test_non_git_directory_not_cached(tmp_path):
+    """Commands outside a git repository are never cached."""
+    cmd = ValidationCommand(id="val-001", command="echo hi", description="d")
+    assert QAResultCache(tmp_path).key_for(cmd) is None
+
+
+def test_without_cache_no_cache_fields(temp_repo, counting_command):
+    """Default manager executes every time and omits cache fields."""
+    cmd, counter = counting_command
+    manager = QABaselineManager(temp_repo)
+
+    manager.execute_command(cmd, "TASK-0001")
+    result = manager.execute_command(cmd, "TASK-0001")
+
+    assert _run_count(counter) == 2
+    assert "cached" not in result
+
+
+def test_expired_entry_is_miss(temp_repo, counting_command):
+    """Entries older than max_age_seconds are discarded."""
+    cmd, _ = counting_command
+    clock = FakeClock()
+    cache = QAResultCache(temp_repo, max_age_seconds=60, clock=clock)
+    key = cache.key_for(cmd)
+    cache.put(key, cmd, 0, 10, "ok\n", "")
+
+    assert cache.get(key) is not None
+    clock.now += 61
+    assert cache.get(key) is None
+    assert not (cache.cache_dir / f"{key}.log").exists()
+
+
+def test_lru_eviction_keeps_recently_used(temp_repo):
+    """Eviction drops least recently used entries beyond max_entries."""
+    clock = FakeClock()
+    cache = QAResultCache(temp_repo, max_entries=2, clock=clock)
+    cmd = ValidationCommand(id="val-001", command="echo hi", description="d")
+
+    for key in ("a" * 64, "b" * 64):
+        cache.put(key, cmd, 0, 1, "", "")
+        clock.now += 1
+    cache.get("a" * 64)  # refresh a
+    clock.now += 1
+    cache.put("c" * 64, cmd, 0, 1, "", "")
+
+    assert cache.get("a" * 64) is not None
+    assert cache.get("b" * 64) is None
+    assert cache.get("c" * 64) is not None
+
+
+def test_clear_removes_entries(temp_repo):
+    """clear() removes every entry and log."""
+    cache = QAResultCache(temp_repo)
+    cmd = ValidationCommand(id="val-001", command="echo hi", description="d")
+    cache.put("a" * 64, cmd, 0, 1, "out", "")
+
+    assert cache.clear() == 1
+    assert list(cache.cache_dir.iterdir()) == []
+
+
+def test_qa_cache_enabled_resolution(monkeypatch):
+    """Explicit flag wins over environment variable."""
+    monkeypatch.delenv(QA_CACHE_ENV_VAR, raising=False)
+    assert qa_cache_enabled() is False
+    monkeypatch.setenv(QA_CACHE_ENV_VAR, "1")
+    assert qa_cache_enabled() is True
+    assert qa_cache_enabled(False) is False
+    monkeypatch.delenv(QA_CACHE_ENV_VAR)
+    assert qa_cache_enabled(True) is True
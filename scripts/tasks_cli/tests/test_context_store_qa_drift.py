@@ -0,0 +1,116 @@
+"""Tests for bulk (columnar) QA drift detection across task contexts."""
+
+import random
+
+from tasks_cli.context_store.qa import QABaselineManager
+from tasks_cli.context_store.models import QAResults
+from tasks_cli.context_store.qa_drift import (
+    QADriftTable,
+    detect_bulk_drift,
+    format_bulk_drift_report,
+)
+from tasks_cli.context_store.runtime import RuntimeHelper
+from tasks_cli.context_store.storage import FilesystemContextStorage
+
+
+def _result(command_id, exit_code=0, **summary):
+    coverage = {k: summary.pop(k) for k in ("lines", "branches") if k in summary}
+    if coverage:
+        summary["coverage"] = coverage
+    result = {"command_id": command_id, "command": command_id, "exit_code": exit_code, "duration_ms": 1}
+    if summary:
+        result["summary"] = summary
+    return result
+
+
+def _qa_results(agent, results):
+    return {"recorded_at": "2025-01-01T00:00:00+00:00", "agent": agent, "git_sha": None, "results": results}
+
+
+def _context(task_id, baseline=None, **coordination):
+    return {
+        "task_id": task_id,
+        "immutable": {"validation_baseline": {"commands": [], "initial_results": baseline}},
+        "coordination": {role: {"qa_results": qa} for role, qa in coordination.items()},
+    }
+
+
+def _random_result(rng, command_id):
+    summary = {}
+    for name in ("lint_errors", "type_errors", "tests_failed"):
+        if rng.random() < 0.8:
+            summary[name] = rng.randint(0, 3)
+    for name in ("lines", "branches"):
+        if rng.random() < 0.7:
+            summary[name] = rng.choice([70.0, 70.5, 71.0, 71.5, 72.5])
+    return _result(command_id, exit_code=rng.choice([0, 0, 1]), **summary)
+
+
+def test_bulk_drift_matches_detect_drift(tmp_path):
+    """Every pairwise comparison agrees with QABaselineManager.detect_drift."""
+    rng = random.Random(7)
+    manager = QABaselineManager(tmp_path)
+    table = QADriftTable()
+    expected_regressions, expected_improvements = [], []
+
+    for t in range(50):
+        task_id = f"TASK-{t:04d}"
+        commands = [f"val-{c:03d}" for c in range(5)]
+        baseline = [_random_result(rng, c) for c in commands]
+        current = [_random_result(rng, c) for c in commands if rng.random() < 0.9]
+        table.add_context(task_id, _context(
+            task_id, _qa_results("baseline", baseline), implementer=_qa_results("implementer", current)
+        ))
+
+        drift = manager.detect_drift(
+            QAResults.from_dict(_qa_results("baseline", baseline)),
+            QAResults.from_dict(_qa_results("implementer", current)),
+        )
+        expected_regressions += [dict(r, task_id=task_id) for r in drift["regressions"]]
+        expected_improvements += [dict(r, task_id=task_id) for r in drift["improvements"]]
+
+    report = detect_bulk_drift(table)
+    strip = lambda items: [  # noqa: E731
+        {k: v for k, v in item.items() if k not in ("agent", "compared_to")} for item in items
+    ]
+    key = lambda item: (item["task_id"], item["command_id"], item["type"])  # noqa: E731
+
+    assert expected_regressions and expected_improvements
+    assert sorted(strip(report["regressions"]), key=key) == sorted(expected_regressions, key=key)
+    assert sorted(strip(report["improvements"]), key=key) == sorted(expected_improvements, key=key)
+    assert report["has_drift"] and report["task_count"] == 50
+
+
+def test_stages_compare_with_nearest_earlier_stage(tmp_path):
+    """Reviewer compares with implementer; record-qa summaries are keyed by command type."""
+    runtime = RuntimeHelper(repo_root=tmp_path, context_root=tmp_path / ".agent-output", git_provider=None)
+    storage = FilesystemContextStorage(tmp_path / ".agent-output", runtime.atomic_write)
+    storage.write_context("TASK-0001", _context(
+        "TASK-0001",
+        _qa_results("baseline", [_result("lint", lint_errors=0), _result("test", tests_failed=0)]),
+        implementer=_qa_results("implementer", [_result("lint", lint_errors=2), _result("test", exit_code=1)]),
+        reviewer={"command_type": "lint", "summary": {"lint_errors": 1}},
+        validator=None,
+    ))
+    storage.write_context("TASK-0002", _context(
+        "TASK-0002", None, validator={"command_type": "coverage", "summary": {"coverage": {"lines": 80.0}}},
+    ))
+
+    table = QADriftTable.from_storage(storage)
+    report = detect_bulk_drift(table)
+
+    assert len(table) == 6 and report["comparison_count"] == 3
+    assert [(r["agent"], r["compared_to"], r["command_id"], r["type"]) for r in report["regressions"]] == [
+        ("implementer", "baseline", "lint", "lint_errors_increased"),
+        ("implementer", "baseline", "test", "exit_code_regression"),
+    ]
+    assert [(i["agent"], i["compared_to"], i["type"], i["delta"]) for i in report["improvements"]] == [
+        ("reviewer", "implementer", "lint_errors_decreased", 1),
+    ]
+    assert report["tasks_with_drift"] == ["TASK-0001"]
+    assert report["regression_counts"] == {"exit_code_regression": 1, "lint_errors_increased": 1}
+
+    text = format_bulk_drift_report(report)
+    assert "2 regression(s) in 1 task(s)" in text
+    assert "TASK-0001 implementer vs baseline lint: lint_errors_increased" in text
+    assert "1 improvement(s)" in text
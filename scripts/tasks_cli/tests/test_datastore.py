@@ -4,6 +4,7 @@ Test persistent datastore and cache management.
 Tests cache invalidation, atomic writes, and file tracking.
 """
 
+import os
 import pytest
 import json
 import time
@@ -11,6 +12,7 @@ from pathlib import Path
 
 from tasks_cli.datastore import TaskDatastore
 from tasks_cli.constants import CACHE_VERSION
+from tasks_cli.models import Task
 
 
 @pytest.fixture
@@ -149,3 +151,164 @@ depends_on: []
     # Check cache tracks archives
     info = datastore.get_cache_info()
     assert info['archive_count'] == 1
+
+
+def test_cached_tasks_are_compact(temp_repo):
+    """Tasks rebuilt from the cache keep the hash and share interned values."""
+    first = TaskDatastore(temp_repo).load_tasks()[0]
+    cached = TaskDatastore(temp_repo).load_tasks()[0]
+
+    assert cached.hash == first.hash and len(cached.hash) == 64
+    assert cached.status is first.status
+    assert cached.blocked_by == () and cached.depends_on == ()
+    assert not hasattr(cached, '__dict__')
+
+
+def _write_archived(temp_repo, task_id, status="completed"):
+    archive_dir = temp_repo / "docs" / "completed-tasks"
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{task_id}.task.yaml"
+    path.write_text(f"""id: {task_id}
+title: Archived {task_id}
+status: {status}
+priority: P1
+area: test
+""")
+    return path
+
+
+def _count_parses(monkeypatch, datastore):
+    parsed = []
+    real_parse = datastore.parser.parse_file
+
+    def counting_parse(path):
+        parsed.append(path.name)
+        return real_parse(path)
+
+    monkeypatch.setattr(datastore.parser, 'parse_file', counting_parse)
+    return parsed
+
+
+def test_hot_tier_keeps_archive_as_id_index(temp_repo):
+    """Active loads expose archived IDs as completed without materializing them."""
+    _write_archived(temp_repo, "TASK-0099")
+    TaskDatastore(temp_repo).load_tasks()
+
+    datastore = TaskDatastore(temp_repo)
+    active = datastore.load_active_tasks()
+
+    assert [t.id for t in active] == ["TASK-0001"]
+    assert "TASK-0099" in datastore.get_completed_ids()
+    assert "TASK-0001" not in datastore.get_completed_ids()
+    assert {t.id for t in datastore.load_archived_tasks()} == {"TASK-0099"}
+    assert "TASK-0099" in datastore.get_dependency_graph().task_by_id
+
+
+def test_archiving_reparses_only_new_archive_files(temp_repo, monkeypatch):
+    """Moving a file into the archive invalidates the hot tier incrementally."""
+    _write_archived(temp_repo, "TASK-0098")
+    TaskDatastore(temp_repo).load_tasks()
+
+    datastore = TaskDatastore(temp_repo)
+    parsed = _count_parses(monkeypatch, datastore)
+    _write_archived(temp_repo, "TASK-0099")
+    datastore.refresh(archive_changed=True)
+
+    assert "TASK-0099.task.yaml" in parsed
+    assert "TASK-0098.task.yaml" not in parsed
+    assert "TASK-0099" in datastore.get_completed_ids()
+
+
+def test_non_completed_archived_task_stays_hot(temp_repo):
+    """Archived tasks with a non-completed status remain full records."""
+    _write_archived(temp_repo, "TASK-0097", status="todo")
+
+    datastore = TaskDatastore(temp_repo)
+    active_ids = {t.id for t in datastore.load_active_tasks()}
+
+    assert active_ids == {"TASK-0001", "TASK-0097"}
+    assert "TASK-0097" not in datastore.get_completed_ids()
+    assert datastore.get_cache_info()['archive_count'] == 1
+
+
+def test_materialization_picks_up_edited_archive_file(temp_repo):
+    """Archived files edited in place are re-parsed when materialized."""
+    path = _write_archived(temp_repo, "TASK-0099")
+    TaskDatastore(temp_repo).load_tasks()
+
+    path.write_text(path.read_text().replace("Archived TASK-0099", "Renamed"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    archived = TaskDatastore(temp_repo).load_archived_tasks()
+    assert [t.title for t in archived] == ["Renamed"]
+
+
+def test_closure_index_memoized_per_snapshot(temp_repo):
+    """The closure index is reused until the snapshot changes."""
+    datastore = TaskDatastore(temp_repo)
+    tasks = datastore.load_active_tasks()
+    index = datastore.get_closure_index(tasks)
+
+    assert datastore.get_closure_index(datastore.load_active_tasks()) is index
+    assert datastore.get_dependency_graph().closure_index is not index  # Separate scope
+
+    refreshed = datastore.refresh()
+    rebuilt = datastore.get_closure_index(refreshed)
+    assert rebuilt is not index
+    assert rebuilt.snapshot_id != index.snapshot_id
+
+
+def test_quarantined_tasks_excluded_when_requested(temp_repo):
+    """Quarantined tasks are skipped while building records, not dropped from the cache."""
+    from tasks_cli.quarantine import quarantine_task, release_from_quarantine
+
+    (temp_repo / "tasks" / "TASK-0002.task.yaml").write_text(
+        "id: TASK-0002\ntitle: Other\nstatus: todo\npriority: P1\narea: test\n"
+    )
+    quarantine_task("TASK-0001", "manual", None, temp_repo)
+
+    datastore = TaskDatastore(temp_repo)
+    assert [t.id for t in datastore.load_active_tasks(exclude_quarantined=True)] == ["TASK-0002"]
+    excluded_index = datastore.get_closure_index(datastore.load_active_tasks(exclude_quarantined=True))
+    assert {t.id for t in datastore.load_active_tasks()} == {"TASK-0001", "TASK-0002"}
+    assert datastore.get_closure_index(datastore.load_active_tasks()) is not excluded_index
+
+    release_from_quarantine("TASK-0001", temp_repo)
+    assert len(datastore.load_active_tasks(exclude_quarantined=True)) == 2
+
+
+def test_quarantined_completed_task_still_unblocks_dependents(temp_repo):
+    """Excluding a quarantined task must not drop it from the completed IDs."""
+    from tasks_cli.graph import DependencyGraph
+    from tasks_cli.quarantine import quarantine_task
+
+    (temp_repo / "tasks" / "TASK-0001.task.yaml").write_text(
+        "id: TASK-0001\ntitle: Done\nstatus: completed\npriority: P1\narea: test\n"
+    )
+    (temp_repo / "tasks" / "TASK-0002.task.yaml").write_text(
+        "id: TASK-0002\ntitle: Next\nstatus: todo\npriority: P1\narea: test\n"
+        "blocked_by:\n  - TASK-0001\n"
+    )
+    quarantine_task("TASK-0001", "manual", None, temp_repo)
+
+    datastore = TaskDatastore(temp_repo)
+    ready = {}
+    for exclude in (False, True):
+        tasks = datastore.load_active_tasks(exclude_quarantined=exclude)
+        graph = DependencyGraph(tasks, archived_ids=datastore.get_archive_index())
+        ready[exclude] = [t.id for t in graph.topological_ready_set(datastore.get_completed_ids())]
+
+    assert "TASK-0001" in datastore.get_completed_ids()
+    assert ready[False] == ready[True] == ["TASK-0002"]
+
+
+def test_task_hash_accepts_none_and_non_digest_values():
+    """Only 64-char hex digests are packed; None and other values pass through."""
+    task = Task(id="TASK-0001", title="T", status="todo", priority="P1", area="a", path="p", hash=None)
+    assert task.hash is None
+
+    task.hash = "a" * 64
+    assert task.hash == "a" * 64 and task._hash == bytes.fromhex("a" * 64)
+    task.hash = "not-a-digest"
+    assert task.hash == "not-a-digest"
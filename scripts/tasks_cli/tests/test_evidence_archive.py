@@ -0,0 +1,88 @@
+"""Tests for the in-process evidence directory archiver."""
+
+import json
+import tarfile
+
+import pytest
+
+from tasks_cli.context_store.archive import (
+    FORMAT_GZIP,
+    FORMAT_ZSTD,
+    ArchiveError,
+    read_member,
+    write_archive,
+    zstandard,
+)
+from tasks_cli.context_store.evidence import EvidenceManager
+from tasks_cli.exceptions import ValidationError
+
+FORMATS = [
+    FORMAT_GZIP,
+    pytest.param(FORMAT_ZSTD, marks=pytest.mark.skipif(zstandard is None, reason="zstandard not installed")),
+]
+
+
+@pytest.fixture
+def evidence_dir(tmp_path):
+    """Directory with nested, empty and multi-block files."""
+    root = tmp_path / "reports"
+    (root / "nested" / "deeper").mkdir(parents=True)
+    (root / "empty").mkdir()
+    (root / "a.txt").write_text("alpha\n")
+    (root / "nested" / "b.log").write_bytes(bytes(range(256)) * 40)
+    (root / "nested" / "deeper" / "c.json").write_text('{"ok": true}\n')
+    (root / "zero.bin").write_bytes(b"")
+    return root
+
+
+@pytest.mark.parametrize("archive_format", FORMATS)
+def test_archive_is_deterministic_tar_with_seekable_members(tmp_path, evidence_dir, archive_format):
+    """Archives are byte-identical across runs, readable by tarfile and seekable per file."""
+    first = write_archive(evidence_dir, tmp_path / "one-archive", archive_format)
+    second = write_archive(evidence_dir, tmp_path / "two-archive", archive_format)
+
+    assert first.path.read_bytes() == second.path.read_bytes()
+    assert [f["path"] for f in first.files] == ["a.txt", "nested/b.log", "nested/deeper/c.json", "zero.bin"]
+    assert first.original_size == sum(f["size"] for f in first.files)
+
+    if archive_format == FORMAT_GZIP:
+        with tarfile.open(first.path, "r:gz") as tar:
+            assert tar.getmember("reports/empty").isdir()
+            assert tar.extractfile("reports/nested/b.log").read() == (evidence_dir / "nested" / "b.log").read_bytes()
+
+    for entry in first.files:
+        assert read_member(first.path, archive_format, entry) == (evidence_dir / entry["path"]).read_bytes()
+
+    corrupt = dict(first.files[0], sha256="0" * 64)
+    with pytest.raises(ArchiveError):
+        read_member(first.path, archive_format, corrupt)
+
+
+def test_attach_directory_indexes_offsets_for_extraction(tmp_path, evidence_dir):
+    """Directory evidence records per-file offsets used to extract a single file."""
+    repo_root = tmp_path
+    manager = EvidenceManager(repo_root, repo_root / ".agent-output")
+
+    def atomic_write(path, content):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    attachment = manager.attach_evidence(
+        task_id="TASK-0001",
+        artifact_type="directory",
+        artifact_path=evidence_dir,
+        description="Reports",
+        atomic_write_func=atomic_write,
+    )
+
+    assert attachment.type == "archive"
+    index_path = repo_root / attachment.compression.index_path
+    index = json.loads(index_path.read_text())
+    assert index["format"] == attachment.compression.format
+    assert (index_path.parent / index["archive"]).exists()
+    assert all({"offset", "length", "data_offset"} <= set(entry) for entry in index["files"])
+
+    content = manager.extract_archived_file(index_path.relative_to(repo_root), "nested/deeper/c.json")
+    assert content == b'{"ok": true}\n'
+    with pytest.raises(ValidationError):
+        manager.extract_archived_file(index_path, "missing.txt")
@@ -0,0 +1,91 @@
+"""Tests for the indexed exception ledger."""
+
+import json
+import os
+import stat
+
+import pytest
+
+from tasks_cli import exception_ledger
+from tasks_cli.exception_ledger import (
+    LEDGER_PATH,
+    add_exception,
+    cleanup_exception,
+    get_exception,
+    list_exceptions,
+    resolve_exception,
+    should_suppress_warnings,
+    suppressed_ids,
+)
+
+
+def test_add_and_query_by_task_id(tmp_path):
+    """Entries are idempotent per task and visible to the bulk and single lookups."""
+    add_exception("TASK-0001", "malformed_yaml", "bad indent", repo_root=tmp_path)
+    add_exception("TASK-0002", "invalid_schema", repo_root=tmp_path)
+    add_exception("TASK-0001", "malformed_yaml", "still bad", repo_root=tmp_path)
+
+    assert suppressed_ids(tmp_path) == frozenset({"TASK-0001", "TASK-0002"})
+    assert should_suppress_warnings("TASK-0002", tmp_path)
+    assert not should_suppress_warnings("TASK-0003", tmp_path)
+    assert get_exception("TASK-0001", tmp_path).parse_error == "still bad"
+    assert get_exception("TASK-0003", tmp_path) is None
+
+    ledger = json.loads((tmp_path / LEDGER_PATH).read_text())
+    assert [e["task_id"] for e in ledger["exceptions"]] == ["TASK-0001", "TASK-0002"]
+
+
+def test_reads_are_cached_until_file_changes(tmp_path, monkeypatch):
+    """Repeated reads reuse the parsed ledger; external edits are picked up."""
+    add_exception("TASK-0001", "malformed_yaml", repo_root=tmp_path)
+
+    loads = []
+    real_load = exception_ledger._load_ledger
+
+    def counting_load(path):
+        loads.append(path)
+        return real_load(path)
+
+    monkeypatch.setattr(exception_ledger, "_load_ledger", counting_load)
+
+    for _ in range(100):
+        assert should_suppress_warnings("TASK-0001", tmp_path)
+    assert loads == []
+
+    # Another process rewrites the ledger
+    ledger_path = tmp_path / LEDGER_PATH
+    ledger = json.loads(ledger_path.read_text())
+    ledger["exceptions"] = []
+    tmp_file = ledger_path.with_suffix(".new")
+    tmp_file.write_text(json.dumps(ledger))
+    os.replace(tmp_file, ledger_path)
+
+    assert suppressed_ids(tmp_path) == frozenset()
+    assert len(loads) == 1
+
+
+def test_resolve_and_cleanup(tmp_path):
+    """Resolution updates the entry in place; cleanup removes it atomically."""
+    add_exception("TASK-0001", "missing_standards", repo_root=tmp_path)
+
+    resolve_exception("TASK-0001", notes="fixed", repo_root=tmp_path)
+    entry = get_exception("TASK-0001", tmp_path)
+    assert entry.remediation.status == "resolved"
+    assert [e.task_id for e in list_exceptions("resolved", repo_root=tmp_path)] == ["TASK-0001"]
+
+    with pytest.raises(ValueError):
+        resolve_exception("TASK-0002", repo_root=tmp_path)
+
+    cleanup_exception("TASK-0001", "task_completion", repo_root=tmp_path)
+    assert suppressed_ids(tmp_path) == frozenset()
+    assert not list((tmp_path / LEDGER_PATH).parent.glob("*.tmp*"))
+
+
+def test_save_keeps_ledger_permissions(tmp_path):
+    """Atomic rewrites keep the ledger's mode instead of mkstemp's 0600."""
+    add_exception("TASK-0001", "malformed_yaml", repo_root=tmp_path)
+    ledger_path = tmp_path / LEDGER_PATH
+    os.chmod(ledger_path, 0o664)
+
+    add_exception("TASK-0002", "invalid_schema", repo_root=tmp_path)
+    assert stat.S_IMODE(os.stat(ledger_path).st_mode) == 0o664
@@ -0,0 +1,104 @@
+"""Tests for the expected_paths glob existence checker."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from tasks_cli.expected_paths import DirectoryIndex, GlobExistenceChecker, check_expected_paths
+from tasks_cli.validation import verify_expected_paths
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    """Small monorepo with build output and dependencies."""
+    for rel in (
+        "backend/dist/handler.js",
+        "backend/src/index.ts",
+        "mobile/src/App.tsx",
+        "shared/package.json",
+        "node_modules/pkg/dist/index.js",
+        "node_modules/.bin/jest",
+        "coverage/lcov.info",
+    ):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("x")
+    return tmp_path
+
+
+def test_matches_pathlib_glob_semantics(tmp_path):
+    """Randomized trees and patterns agree with Path.glob when nothing is excluded."""
+    rng = random.Random(48)
+    names = ["a", "dist", "src", ".hidden", "x.js", "node_modules"]
+    for trial in range(20):
+        root = tmp_path / str(trial)
+        root.mkdir()
+        for _ in range(30):
+            path = root.joinpath(*(rng.choice(names) for _ in range(rng.randint(1, 4))))
+            try:
+                if rng.random() < 0.5:
+                    path.mkdir(parents=True, exist_ok=True)
+                else:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.touch()
+            except (FileExistsError, NotADirectoryError):
+                pass
+        checker = GlobExistenceChecker(root, excludes=())
+        for _ in range(30):
+            pattern = "/".join(rng.choice(names + ["*", "**", "*.js", "?", "[ad]*"]) for _ in range(rng.randint(1, 4)))
+            assert checker.exists(pattern) == bool(list(root.glob(pattern))), pattern
+
+
+def test_excludes_prune_wildcards_but_not_literals(monorepo):
+    """node_modules is skipped while expanding wildcards, yet can be named explicitly."""
+    checker = GlobExistenceChecker(monorepo)
+
+    assert checker.first_match("**/dist/*.js") == "backend/dist/handler.js"
+    assert not checker.exists("**/pkg/dist/**")
+    assert checker.exists("node_modules/pkg/dist/**")
+    assert checker.exists("node_modules/.bin/jest")
+
+    custom = GlobExistenceChecker(monorepo, excludes=["/backend/dist/", "*.info"])
+    assert not custom.exists("**/handler.js")
+    assert not custom.exists("coverage/*")
+    assert custom.exists("node_modules/*/dist")
+
+
+def test_literal_prefixes_and_first_match_limit_listing(monorepo):
+    """Only directories under wildcard segments are listed, and the search stops early."""
+    checker = GlobExistenceChecker(monorepo)
+    with patch("tasks_cli.expected_paths.os.scandir", wraps=__import__("os").scandir) as scandir:
+        assert checker.exists("backend/*/handler.js")
+        assert checker.exists("shared/package.json")
+    assert [call.args[0] for call in scandir.call_args_list] == [str(monorepo / "backend")]
+
+    shared = DirectoryIndex()
+    first = GlobExistenceChecker(monorepo, index=shared)
+    first.check(["**/*.tsx", "**/lcov.info"])
+    listed = len(shared)
+    GlobExistenceChecker(monorepo, index=shared).check(["**/*.tsx", "**/lcov.info"])
+    assert len(shared) == listed  # Second pass served from the batch index
+
+
+def test_gitignore_checker_and_timing_report(monorepo):
+    """Ignore checker results prune wildcards; each pattern is timed."""
+    def ignore_checker(paths):
+        return {path: path.startswith("coverage") for path in paths}
+
+    checker = GlobExistenceChecker(monorepo, ignore_checker=ignore_checker)
+    report = checker.check(["*/lcov.info", "coverage/lcov.info", "mobile/src/*.tsx"])
+
+    assert report.missing == ["*/lcov.info"]
+    assert [check.match for check in report.checks] == [None, "coverage/lcov.info", "mobile/src/App.tsx"]
+    assert all(check.duration_ms >= 0 for check in report.checks)
+    assert report.slow_patterns(threshold_ms=-1)[0].duration_ms == max(c.duration_ms for c in report.checks)
+
+
+def test_validation_wrappers_use_checker(monorepo):
+    """verify_expected_paths keeps its tuple API and pathlib's error cases."""
+    assert verify_expected_paths(["backend/dist/**", "missing/*.js"], monorepo) == (False, ["missing/*.js"])
+    assert check_expected_paths([], monorepo).all_exist
+    with pytest.raises(ValueError):
+        verify_expected_paths([""], monorepo)
+    with pytest.raises(NotImplementedError):
+        verify_expected_paths(["/etc/*"], monorepo)
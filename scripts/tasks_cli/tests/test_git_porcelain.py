@@ -0,0 +1,176 @@
+"""Tests for the porcelain v2 -z status parser and its status consumers."""
+
+import random
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tasks_cli.providers import GitProvider
+from tasks_cli.providers.git import PorcelainParseError, StatusEntry, SubmoduleState, parse_porcelain_v2
+from tasks_cli.providers.git.porcelain import (
+    KIND_CHANGED,
+    KIND_IGNORED,
+    KIND_RENAMED,
+    KIND_UNMERGED,
+    KIND_UNTRACKED,
+)
+
+CORPUS_DIR = Path(__file__).parent / "fixtures" / "porcelain_v2"
+CORPUS = sorted(CORPUS_DIR.glob("*.z"))
+
+
+def _by_path(entries):
+    return {entry.path: entry for entry in entries}
+
+
+def _format_entry(entry: StatusEntry) -> str:
+    """Inverse of the parser for one entry (used to round-trip random entries)."""
+    if entry.kind in (KIND_UNTRACKED, KIND_IGNORED):
+        return f"{'?' if entry.kind == KIND_UNTRACKED else '!'} {entry.path}\0"
+    sub = "N..." if entry.submodule is None else "S" + "".join(
+        flag if value else "." for flag, value in zip("CMU", entry.submodule)
+    )
+    if entry.kind == KIND_UNMERGED:
+        fields = [entry.mode_head, entry.mode_index, entry.mode_stage3, entry.mode_worktree,
+                  entry.hash_head, entry.hash_index, entry.hash_stage3]
+        return f"u {entry.xy} {sub} {' '.join(fields)} {entry.path}\0"
+    fields = [entry.mode_head, entry.mode_index, entry.mode_worktree, entry.hash_head, entry.hash_index]
+    if entry.kind == KIND_RENAMED:
+        return f"2 {entry.xy} {sub} {' '.join(fields)} {entry.score} {entry.path}\0{entry.orig_path}\0"
+    return f"1 {entry.xy} {sub} {' '.join(fields)} {entry.path}\0"
+
+
+def _random_entry(rng: random.Random) -> StatusEntry:
+    alphabet = "ab c/é\n\\\"->.日\udcff"
+    path = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))).strip("/") or "p"
+    kind = rng.choice([KIND_CHANGED, KIND_RENAMED, KIND_UNMERGED, KIND_UNTRACKED, KIND_IGNORED])
+    if kind in (KIND_UNTRACKED, KIND_IGNORED):
+        code = "?" if kind == KIND_UNTRACKED else "!"
+        return StatusEntry(kind, path, code, code)
+    mode = lambda: rng.choice(["000000", "100644", "100755", "120000", "160000"])  # noqa: E731
+    sha = lambda: "".join(rng.choice("0123456789abcdef") for _ in range(40))  # noqa: E731
+    submodule = rng.choice([None, SubmoduleState(*(rng.random() < 0.5 for _ in range(3)))])
+    x, y = rng.choice(".MTADRCU"), rng.choice(".MTADRCU")
+    if kind == KIND_UNMERGED:
+        return StatusEntry(kind, path, x, y, None, None, submodule,
+                           mode(), mode(), mode(), sha(), sha(), mode(), sha())
+    orig, score = (path[::-1] + "~", rng.choice(["R100", "C75", "R050"])) if kind == KIND_RENAMED else (None, None)
+    return StatusEntry(kind, path, x, y, orig, score, submodule, mode(), mode(), mode(), sha(), sha())
+
+
+def test_corpus_entries_are_typed():
+    """Real git output: renames, odd names, submodules, type changes and conflicts."""
+    mixed = _by_path(parse_porcelain_v2((CORPUS_DIR / "mixed.z").read_bytes()))
+
+    renamed = mixed["new name.txt"]
+    assert (renamed.kind, renamed.orig_path, renamed.score, renamed.xy) == (KIND_RENAMED, "old name.txt", "R100", "R.")
+    assert renamed.paths == ["new name.txt", "old name.txt"]
+    assert mixed["modified.txt"].xy == "MM" and mixed["modified.txt"].hash_head != mixed["modified.txt"].hash_index
+    assert mixed["exec.sh"].mode_worktree == "100755"
+    assert mixed["typechange"].worktree_status == "T" and mixed["typechange"].mode_worktree == "120000"
+    assert mixed["vendor/sub"].submodule == SubmoduleState(commit_changed=False, tracked_changes=True, untracked_changes=True)
+    assert mixed["café.txt"].kind == KIND_CHANGED
+    assert mixed['quote"back\\slash.txt'].worktree_status == "M"
+    assert mixed["new\nline.txt"].is_untracked
+    assert mixed["dir with space/deep/ü.txt"].is_untracked
+    assert mixed["raw\udcff.bin"].is_untracked
+    assert mixed["debug.log"].kind == KIND_IGNORED and mixed["debug.log"].xy == "!!"
+
+    unmerged = _by_path(parse_porcelain_v2((CORPUS_DIR / "unmerged.z").read_bytes()))
+    conflict = unmerged["conflict.txt"]
+    assert (conflict.kind, conflict.xy, conflict.mode_head, conflict.mode_stage3) == (KIND_UNMERGED, "AA", "000000", "100644")
+    assert conflict.hash_index != conflict.hash_stage3
+
+    headers_only = parse_porcelain_v2((CORPUS_DIR / "branch_headers.z").read_bytes())
+    assert all(entry.kind != KIND_UNTRACKED for entry in headers_only)
+    assert parse_porcelain_v2((CORPUS_DIR / "clean.z").read_bytes()) == []
+
+
+@pytest.mark.parametrize("seed_file", CORPUS, ids=lambda p: p.stem)
+def test_fuzzed_corpus_never_crashes(seed_file):
+    """Mutated git output either parses or raises PorcelainParseError, nothing else."""
+    rng = random.Random(seed_file.name)
+    seed = seed_file.read_bytes() or b"? x\0"
+    for _ in range(500):
+        data = bytearray(seed)
+        for _ in range(rng.randint(1, 4)):
+            position = rng.randrange(len(data) + 1)
+            mutation = rng.randrange(4)
+            if mutation == 0:
+                del data[position:]
+            elif mutation == 1 and position < len(data):
+                data[position] = rng.choice(b"\0 12u?!#.\xff")
+            elif mutation == 2:
+                data[position:position] = rng.choice([b"\0", b" ", b"2 ", b"\xc3"])
+            else:
+                del data[position:position + rng.randint(1, 50)]
+        try:
+            entries = parse_porcelain_v2(bytes(data))
+        except PorcelainParseError:
+            continue
+        assert all(isinstance(entry, StatusEntry) and entry.path for entry in entries)
+
+
+def test_random_entries_round_trip():
+    """Formatting random entries and parsing them back is lossless."""
+    rng = random.Random(44)
+    for _ in range(50):
+        entries = [_random_entry(rng) for _ in range(rng.randint(0, 40))]
+        output = "".join(_format_entry(entry) for entry in entries)
+        assert parse_porcelain_v2(output) == entries
+        assert parse_porcelain_v2(output.encode("utf-8", "surrogateescape")) == entries
+
+
+def test_status_consumers_report_exact_paths(tmp_path):
+    """status() and check_dirty_tree() list rename targets/sources and unquoted names."""
+    git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", "-c", "commit.gpgsign=false"]
+    (tmp_path / "old name.txt").write_text("content\n" * 5)
+    (tmp_path / "keep.txt").write_text("keep\n")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], cwd=tmp_path, check=True)
+
+    subprocess.run(["git", "mv", "old name.txt", "new name.txt"], cwd=tmp_path, check=True)
+    (tmp_path / "keep.txt").write_text("changed\n")
+    (tmp_path / "naïve file.md").write_text("new\n")
+
+    provider = GitProvider(tmp_path)
+    assert provider.status()["files"] == ["keep.txt", "new name.txt", "old name.txt", "naïve file.md"]
+    assert provider.check_dirty_tree(allow_preexisting=True) == (False, ["keep.txt", "new name.txt", "old name.txt"])
+
+    entries = _by_path(provider.status_entries())
+    assert entries["new name.txt"].orig_path == "old name.txt"
+    assert parse_porcelain_v2(provider.status_porcelain_z()) == list(entries.values())
+
+
+def test_undecodable_file_name_survives_context_round_trip(tmp_path):
+    """Non-UTF-8 file names in status_report persist to context.json and back."""
+    import os
+
+    from tasks_cli.context_store.delta_tracking import DeltaTracker
+    from tasks_cli.context_store.storage import FilesystemContextStorage
+
+    git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", "-c", "commit.gpgsign=false"]
+    (tmp_path / "keep.txt").write_text("keep\n")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], cwd=tmp_path, check=True)
+    head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=tmp_path, capture_output=True, text=True).stdout.strip()
+
+    raw_name = b"caf\xe9-latin1.txt"  # Latin-1 bytes, not valid UTF-8
+    with open(os.path.join(os.fsencode(tmp_path), raw_name), "wb") as f:
+        f.write(b"new\n")
+    context_root = tmp_path / ".agent-output"
+    (context_root / "TASK-0001").mkdir(parents=True)
+
+    snapshot = DeltaTracker(tmp_path).snapshot_worktree(head, ["."], context_root / "TASK-0001", "implementer")
+    names = [entry.path for entry in parse_porcelain_v2(snapshot.status_report)]
+    assert raw_name in [os.fsencode(name) for name in names]
+
+    storage = FilesystemContextStorage(
+        context_root, lambda path, content: path.write_text(content, encoding="utf-8")
+    )
+    storage.write_context("TASK-0001", {"worktree_snapshot": snapshot.to_dict()})
+    stored = storage.read_context("TASK-0001")["worktree_snapshot"]["status_report"]
+    assert stored == snapshot.status_report
@@ -0,0 +1,140 @@
+"""Tests for git status strategies, the inotify fsmonitor and scoped status."""
+
+import subprocess
+import threading
+
+import pytest
+
+from tasks_cli.providers import GitProvider
+from tasks_cli.providers.git import scope_pathspecs
+from tasks_cli.providers.git import fsmonitor, fsmonitor_hook
+from tasks_cli.providers.git.status_strategy import StatusStrategy, resolve_status_strategy
+
+needs_inotify = pytest.mark.skipif(not fsmonitor.inotify_available(), reason="inotify not available")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Committed repository with two packages."""
+    root = tmp_path / "repo"
+    for rel in ("backend/app.py", "backend/[id].ts", "mobile/App.tsx", "README.md"):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(f"{rel}\n")
+    git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", "-c", "commit.gpgsign=false"]
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    subprocess.run(["git", "add", "."], cwd=root, check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], cwd=root, check=True)
+    return root
+
+
+@needs_inotify
+def test_watcher_reports_changes_since_token(tmp_path):
+    """Changes after a token are reported; new directories are watched and listed."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / ".git").mkdir()
+    watcher = fsmonitor.FsmonitorWatcher(tmp_path)
+    watcher.start()
+    try:
+        token, changed = watcher.changes_since("")
+        assert changed is None  # Unknown token: everything may have changed
+
+        (tmp_path / "src" / "a.py").write_text("a")
+        (tmp_path / ".git" / "index").write_text("ignored")
+        token, changed = watcher.changes_since(token)
+        assert changed == ["src/a.py"]
+
+        (tmp_path / "src" / "pkg" / "deep").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "deep" / "b.py").write_text("b")
+        token, changed = watcher.changes_since(token)
+        assert "src/pkg/" in changed and "src/pkg/deep/b.py" in changed
+
+        (tmp_path / "src" / "pkg").rename(tmp_path / "moved")
+        (tmp_path / "moved" / "deep" / "b.py").write_text("b2")
+        token, changed = watcher.changes_since(token)
+        assert {"src/pkg/", "moved/", "moved/deep/b.py"} <= set(changed)
+
+        assert watcher.changes_since(token)[1] == []
+        assert watcher.changes_since("other-instance:0")[1] is None
+    finally:
+        watcher.close()
+
+
+@needs_inotify
+def test_fsmonitor_strategy_keeps_status_exact(repo):
+    """Status through the hook matches a plain scan; the hook falls back when the daemon is down."""
+    git_dir = repo / ".git"
+    sock_path = fsmonitor.socket_path(git_dir)
+    stop, ready = threading.Event(), threading.Event()
+    daemon = threading.Thread(
+        target=fsmonitor.serve, args=(repo, sock_path), kwargs={"stop": stop, "ready": ready}, daemon=True,
+    )
+    daemon.start()
+    assert ready.wait(timeout=10)
+    try:
+        provider = GitProvider(repo, status_strategy="fsmonitor")
+        assert provider.status_strategy().fsmonitor_hook == git_dir / fsmonitor.HOOK_FILENAME
+        plain = GitProvider(repo)
+
+        assert provider.status() == plain.status() == {"files": [], "is_dirty": False}
+        (repo / "backend" / "app.py").write_text("changed\n")
+        (repo / "mobile" / "screens").mkdir()
+        (repo / "mobile" / "screens" / "Home.tsx").write_text("new\n")
+        assert sorted(provider.status()["files"]) == ["backend/app.py", "mobile/screens/Home.tsx"]
+
+        ls_files = provider._run_git(["ls-files", "-f"])
+        assert "h README.md" in ls_files.stdout.splitlines()  # Unchanged files trusted from the hook
+    finally:
+        stop.set()
+        daemon.join(timeout=5)
+
+    assert fsmonitor_hook.main([str(sock_path), "2", "token"]) == 1
+    assert provider.status() == plain.status()
+    assert sorted(provider.status()["files"]) == ["backend/app.py", "mobile/screens/Home.tsx"]
+
+
+def test_scope_pathspecs_limit_status_and_untracked_listing(repo):
+    """Scoped queries only report paths under repo_paths, literally matched."""
+    (repo / "backend" / "[id].ts").write_text("changed\n")
+    (repo / "backend" / "i.ts").write_text("untracked\n")
+    (repo / "mobile" / "App.tsx").write_text("changed\n")
+    (repo / "notes.txt").write_text("untracked\n")
+
+    provider = GitProvider(repo)
+    assert scope_pathspecs(["backend/", "."]) == [":(literal)backend", ":(literal)."]
+    assert sorted(provider.status(pathspecs=scope_pathspecs(["backend/[id].ts"]))["files"]) == ["backend/[id].ts"]
+    assert sorted(provider.status(pathspecs=scope_pathspecs(["backend"]))["files"]) == ["backend/[id].ts", "backend/i.ts"]
+    assert len(provider.status(pathspecs=scope_pathspecs(["."]))["files"]) == 4
+    assert provider.ls_files(paths=["--", *scope_pathspecs(["mobile", "backend"])], untracked=True) == ["backend/i.ts"]
+    assert provider.check_dirty_tree(pathspecs=scope_pathspecs(["mobile"])) == (False, ["mobile/App.tsx"])
+
+
+def test_resolve_status_strategy_names(tmp_path, monkeypatch):
+    """Strategies come from the argument or environment; unknown names are rejected."""
+    def no_git_dir():
+        raise AssertionError("git dir only needed for fsmonitor")
+
+    assert resolve_status_strategy(tmp_path, no_git_dir).config_args() == []
+    monkeypatch.setenv("TASKS_GIT_STATUS_STRATEGY", "untracked-cache")
+    assert resolve_status_strategy(tmp_path, no_git_dir).config_args() == ["-c", "core.untrackedCache=true"]
+    with pytest.raises(ValueError):
+        resolve_status_strategy(tmp_path, no_git_dir, "watchman")
+
+
+def test_fsmonitor_hook_path_with_spaces(repo):
+    """The hook path is shell-quoted, so git runs hooks under directories with spaces."""
+    hook_dir = repo.parent / "git dir"
+    hook_dir.mkdir()
+    hook = hook_dir / "fsmonitor hook"
+    marker = repo.parent / "hook-ran"
+    hook.write_text(f"#!/bin/sh\ntouch '{marker}'\nexit 1\n")  # Non-zero: git falls back to a full scan
+    hook.chmod(0o755)
+
+    strategy = StatusStrategy(name="fsmonitor", untracked_cache=True, fsmonitor_hook=hook)
+    (repo / "README.md").write_text("changed\n")
+    result = subprocess.run(
+        ["git", *strategy.config_args(), "status", "--porcelain"], cwd=repo, capture_output=True, text=True,
+    )
+
+    assert result.returncode == 0
+    assert marker.exists()
+    assert result.stdout.strip() == "M README.md"
@@ -207,6 +207,27 @@ def test_archive_resolution():
     assert "TASK-NEW" in ready_ids
 
 
+def test_archive_resolution_with_unmaterialized_archive():
+    """Archived IDs passed as an index satisfy dependencies without Task records."""
+    tasks = [
+        Task(
+            id="TASK-NEW",
+            title="New task blocked by archived task",
+            status="todo",
+            priority="P0",
+            area="test",
+            path="/tasks/TASK-NEW.yaml",
+            blocked_by=["TASK-OLD"],
+            depends_on=["TASK-GONE"],
+        ),
+    ]
+
+    graph = DependencyGraph(tasks, archived_ids=frozenset({"TASK-OLD"}))
+
+    assert graph.missing_dependencies() == {"TASK-NEW": ["TASK-GONE"]}
+    assert [t.id for t in graph.topological_ready_set({"TASK-OLD"})] == ["TASK-NEW"]
+
+
 def test_depends_on_not_blocking():
     """Test that depends_on does NOT block execution (informational only)."""
     tasks = [
@@ -714,3 +735,100 @@ def test_reverse_adjacency_list_construction():
 
     # TASK-C blocks nothing, should not be in reverse map
     assert "TASK-C" not in graph.reverse_blocked_by
+
+
+def test_graph_shares_task_dependency_tuples(simple_tasks):
+    """Adjacency lists reuse the tasks' tuples instead of copying them."""
+    graph = DependencyGraph(simple_tasks)
+
+    for task in simple_tasks:
+        assert graph.blocked_by_edges[task.id] is task.blocked_by
+        assert graph.depends_on_edges[task.id] is task.depends_on
+    assert isinstance(graph.get_blockers(simple_tasks[1].id)['blocked_by'], list)
+
+
+def _area_task(task_id, status="todo", area="test", blocked_by=(), depends_on=()):
+    return Task(
+        id=task_id,
+        title=task_id,
+        status=status,
+        priority="P1",
+        area=area,
+        path=f"/test/{task_id}.yaml",
+        blocked_by=list(blocked_by),
+        depends_on=list(depends_on),
+    )
+
+
+def test_iter_dot_matches_export_dot(simple_tasks):
+    """export_dot() is the joined output of the streaming generator."""
+    graph = DependencyGraph(simple_tasks)
+
+    lines = list(graph.iter_dot())
+
+    assert graph.export_dot() == '\n'.join(lines)
+    assert lines[0] == 'digraph task_dependencies {'
+    assert lines[-1] == '}'
+    assert '  "TASK-0001" -> "TASK-0002" [style=solid, color=black];' in lines
+
+
+def test_select_scope_hops_follow_both_directions():
+    """Neighborhood export walks blockers and dependents up to N hops."""
+    tasks = [
+        _area_task("TASK-A"),
+        _area_task("TASK-B", blocked_by=["TASK-A"]),
+        _area_task("TASK-C", blocked_by=["TASK-B"]),
+        _area_task("TASK-D", depends_on=["TASK-C"]),
+        _area_task("TASK-E"),
+    ]
+    graph = DependencyGraph(tasks)
+
+    assert graph.select_scope() is None
+    assert graph.select_scope(root="TASK-B", hops=1) == {"TASK-A", "TASK-B", "TASK-C"}
+    assert graph.select_scope(root="TASK-B", hops=2) == {"TASK-A", "TASK-B", "TASK-C", "TASK-D"}
+    with pytest.raises(KeyError):
+        graph.select_scope(root="TASK-MISSING")
+
+
+def test_scoped_export_filters_nodes_and_edges():
+    """Active-only/area scopes drop filtered nodes and edges touching them."""
+    tasks = [
+        _area_task("TASK-A", status="completed"),
+        _area_task("TASK-B", blocked_by=["TASK-A"]),
+        _area_task("TASK-C", area="mobile", blocked_by=["TASK-B"]),
+    ]
+    graph = DependencyGraph(tasks)
+
+    active = '\n'.join(graph.iter_dot(task_ids=graph.select_scope(active_only=True)))
+    assert '"TASK-A"' not in active
+    assert '"TASK-B" -> "TASK-C"' in active
+
+    mobile = graph.select_scope(area="mobile")
+    assert mobile == {"TASK-C"}
+    assert '->' not in '\n'.join(graph.iter_dot(task_ids=mobile))
+
+    # Traversal does not pass through filtered-out tasks
+    assert graph.select_scope(root="TASK-C", hops=3, area="mobile") == {"TASK-C"}
+
+
+def test_collapse_completed_chains():
+    """Connected completed tasks become one summary node with deduplicated edges."""
+    tasks = [
+        _area_task("TASK-0001", status="completed"),
+        _area_task("TASK-0002", status="completed", blocked_by=["TASK-0001"]),
+        _area_task("TASK-0003", status="completed", blocked_by=["TASK-0002"]),
+        _area_task("TASK-0004", blocked_by=["TASK-0002", "TASK-0003"]),
+        _area_task("TASK-0005", status="completed"),
+    ]
+    graph = DependencyGraph(tasks)
+
+    lines = list(graph.iter_dot(collapse_completed=True))
+    dot = '\n'.join(lines)
+
+    assert '"completed:TASK-0001" [label="3 completed\\nTASK-0001 .. TASK-0003"' in dot
+    assert '"TASK-0002" [' not in dot
+    # Lone completed tasks stay regular nodes
+    assert '"TASK-0005" [' in dot
+    # Internal edges dropped, duplicate edges out of the group merged
+    assert lines.count('  "completed:TASK-0001" -> "TASK-0004" [style=solid, color=black];') == 1
+    assert '"completed:TASK-0001" -> "completed:TASK-0001"' not in dot
@@ -0,0 +1,158 @@
+"""Tests for batched context initialization (init-context --all-ready)."""
+
+import json
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+import typer
+import yaml
+
+from tasks_cli.commands import init_context
+from tasks_cli.commands.init_context import SharedInitState, init_contexts_batch
+from tasks_cli.context_store.source_index import SourceFileIndex
+
+
+STANDARDS = """# Backend Tier
+
+## Handler Constraints
+
+- Handlers must stay under 75 LOC.
+- No direct AWS SDK imports.
+
+
+## Testing Standards
+
+Coverage thresholds apply.
+"""
+
+
+def _task(task_id, **overrides):
+    data = {
+        "id": task_id,
+        "title": f"Task {task_id}",
+        "description": "Test task.",
+        "status": "todo",
+        "priority": "P1",
+        "area": "docs",
+        "acceptance_criteria": ["Works"],
+        "plan": [{"step": "Do it"}],
+        "scope": {"in": ["a"], "out": ["b"]},
+        "deliverables": ["x.py"],
+        "validation": {"pipeline": ["pytest"]},
+        "context": {"related_docs": ["standards/handlers.md"]},
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Git repo with standards, a checklist and three tasks (one invalid)."""
+    (tmp_path / "standards").mkdir()
+    (tmp_path / "standards" / "handlers.md").write_text(STANDARDS)
+    (tmp_path / "docs" / "agents").mkdir(parents=True)
+    (tmp_path / "docs" / "agents" / "implementation-preflight.md").write_text("# Preflight\n")
+    (tmp_path / "tasks" / "backend").mkdir(parents=True)
+    for task_id, overrides in (("TASK-0001", {}), ("TASK-0002", {}), ("TASK-0003", {"plan": []})):
+        path = tmp_path / "tasks" / "backend" / f"{task_id}.task.yaml"
+        path.write_text(yaml.safe_dump(_task(task_id, **overrides)))
+    (tmp_path / ".gitignore").write_text(".agent-output/\ndocs/compliance/\n")
+
+    for args in (["init"], ["add", "."], ["-c", "user.email=t@t", "-c", "user.name=t", "commit", "-m", "init"]):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+    return tmp_path
+
+
+def test_batch_initializes_tasks_with_shared_state(repo):
+    """Valid tasks get contexts; invalid tasks report errors without stopping the batch."""
+    results = init_contexts_batch(
+        repo,
+        [(task_id, repo / "tasks" / "backend" / f"{task_id}.task.yaml") for task_id in ("TASK-0001", "TASK-0002", "TASK-0003")],
+        workers=3,
+    )
+
+    assert [r["task_id"] for r in results] == ["TASK-0001", "TASK-0002", "TASK-0003"]
+    assert [r["success"] for r in results] == [True, True, False]
+    assert results[2]["error"]["code"] == "E001"
+    assert results[0]["base_commit"] == results[1]["base_commit"]
+
+    for task_id in ("TASK-0001", "TASK-0002"):
+        context = json.loads((repo / ".agent-output" / task_id / "context.json").read_text())
+        citations = context["immutable"]["standards_citations"]
+        assert citations and citations[0]["section"] == "Handler Constraints"
+        assert citations[0]["requirement"] == "Handlers must stay under 75 LOC."
+
+        evidence = json.loads((repo / ".agent-output" / task_id / "evidence" / "index.json").read_text())
+        descriptions = {e["description"] for e in evidence["evidence"]}
+        assert "Checklist snapshot: implementation-preflight.md" in descriptions
+
+    assert not (repo / ".agent-output" / "TASK-0003" / "context.json").exists()
+
+
+def test_batch_reports_unexpected_dirty_files(repo):
+    """One dirty-tree check is shared; unrelated dirty files fail every task."""
+    (repo / "README.md").write_text("dirty\n")
+
+    results = init_contexts_batch(repo, ["TASK-0001"])
+    assert results[0]["error"]["code"] == "E050"
+    assert results[0]["error"]["details"]["files"] == ["README.md"]
+
+    shared = SharedInitState(base_commit="abc", dirty_files=[".agent-output/TASK-0001/x", "README.md"])
+    assert shared.unexpected_dirty("TASK-0001") == ["README.md"]
+
+
+@pytest.mark.parametrize("task_id, code", [("TASK-0001", "E030"), ("TASK-0009", "E041"), ("TASK-0003", "E001")])
+def test_single_task_errors_precede_git_checks(repo, monkeypatch, capsys, task_id, code):
+    """Quarantine, lookup and schema errors are reported without running git."""
+    from tasks_cli.context import TaskCliContext
+    from tasks_cli.quarantine import quarantine_task
+
+    quarantine_task("TASK-0001", "manual", None, repo)
+
+    def git_unavailable(*args, **kwargs):
+        raise AssertionError("git state captured before task validation")
+
+    monkeypatch.setattr(init_context.SharedInitState, "capture", git_unavailable)
+    monkeypatch.chdir(repo)
+    with pytest.raises(SystemExit):
+        init_context.cmd_init_context(TaskCliContext.from_repo_root(repo), SimpleNamespace(task_id=task_id))
+
+    assert f"Error [{code}]" in capsys.readouterr().err
+
+
+def test_source_index_reuses_entries_until_file_changes(repo):
+    """Standards files are read once and re-read after modification."""
+    index = SourceFileIndex(repo)
+    entry = index.get("standards/handlers.md")
+
+    assert index.get("standards/handlers.md") is entry
+    first = index.excerpt("standards/handlers.md", "handler constraints")
+    assert first.line_span == "L5-L6"
+    assert first.content == "- Handlers must stay under 75 LOC.\n- No direct AWS SDK imports.\n"
+    assert index.excerpt("standards/handlers.md", "Missing Section") is None
+
+    (repo / "standards" / "handlers.md").write_text(STANDARDS + "\nExtra.\n")
+    assert index.get("standards/handlers.md") is not entry
+    assert index.get("standards/missing.md") is None
+    with pytest.raises(FileNotFoundError):
+        index.excerpt("standards/missing.md", "Any")
+
+
+def test_all_ready_skips_contexts_in_sqlite_backend(repo, monkeypatch, capsys):
+    """Existing contexts are found through the storage backend, not context.json."""
+    from tasks_cli.commands.init_context import cmd_init_all_ready
+    from tasks_cli.context import TaskCliContext
+
+    monkeypatch.setenv("TASKS_CONTEXT_BACKEND", "sqlite")
+    init_contexts_batch(repo, [("TASK-0001", repo / "tasks" / "backend" / "TASK-0001.task.yaml")])
+    assert not (repo / ".agent-output" / "TASK-0001" / "context.json").exists()
+
+    ctx = TaskCliContext.from_repo_root(repo)
+    with pytest.raises(typer.Exit):  # TASK-0003 is invalid
+        cmd_init_all_ready(ctx, "test", False, True, 2, "json")
+
+    output = json.loads(capsys.readouterr().out)
+    assert output["skipped"] == ["TASK-0001"]
+    assert [r["task_id"] for r in output["initialized"]] == ["TASK-0002"]
+    assert [f["task_id"] for f in output["failed"]] == ["TASK-0003"]
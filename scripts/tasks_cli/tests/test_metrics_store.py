@@ -0,0 +1,178 @@
+"""Tests for the incremental metrics store."""
+
+import json
+import os
+
+import pytest
+
+from tasks_cli import metrics_store
+from tasks_cli.metrics import collect_task_metrics, generate_metrics_dashboard
+from tasks_cli.metrics_store import METRICS_STORE_FILENAME, MetricsStore
+
+
+def _write_telemetry(task_dir, role, read_calls=2, warnings=()):
+    path = task_dir / f"telemetry-{role}.json"
+    path.write_text(json.dumps({
+        "agent_role": role,
+        "session_start": "2025-11-18T10:00:00Z",
+        "session_end": "2025-11-18T10:20:00Z",
+        "metrics": {
+            "file_operations": {"read_calls": read_calls},
+            "cache_operations": {"cache_hits": 3, "cache_misses": 1},
+        },
+        "warnings": [{"message": m} for m in warnings],
+    }))
+    return path
+
+
+@pytest.fixture
+def task_dir(tmp_path):
+    directory = tmp_path / ".agent-output" / "TASK-0001"
+    directory.mkdir(parents=True)
+    _write_telemetry(directory, "implementer", read_calls=4, warnings=["w1", "w1"])
+    _write_telemetry(directory, "reviewer", read_calls=2)
+    return directory
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    """Count JSON files parsed by the store."""
+    calls = []
+    real_load = metrics_store.json.load
+
+    def counting_load(f):
+        calls.append(f.name)
+        return real_load(f)
+
+    monkeypatch.setattr(metrics_store.json, "load", counting_load)
+    return calls
+
+
+def test_rollup_aggregates_telemetry(tmp_path, task_dir):
+    """Per-task rollups match the telemetry files."""
+    with MetricsStore(tmp_path) as store:
+        assert store.sync(["TASK-0001"]) == {}
+        rollup = store.rollups(["TASK-0001"])["TASK-0001"]
+
+    assert rollup.agents_run == ["implementer", "reviewer"]
+    assert rollup.file_reads_by_agent == {"implementer": 4, "reviewer": 2}
+    assert rollup.total_cache_hits == 6
+    assert rollup.total_warnings == 2
+    assert rollup.repeated_warnings == 1
+    assert (tmp_path / ".agent-output" / METRICS_STORE_FILENAME).exists()
+
+
+def test_agents_listed_in_path_order_after_reingest(tmp_path, task_dir):
+    """agents_run follows telemetry path order, not row insertion order."""
+    with MetricsStore(tmp_path) as store:
+        store.sync(["TASK-0001"])
+        path = _write_telemetry(task_dir, "implementer", read_calls=5)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        store.sync(["TASK-0001"])  # implementer row is now inserted last
+
+        assert store.rollups(["TASK-0001"])["TASK-0001"].agents_run == ["implementer", "reviewer"]
+
+
+def test_read_only_use_does_not_create_agent_output(tmp_path):
+    """Without .agent-output/ neither sync nor rollups create the store."""
+    with MetricsStore(tmp_path) as store:
+        errors = store.sync(["TASK-0001"])
+        rollup = store.rollups(["TASK-0001"])["TASK-0001"]
+
+    assert isinstance(errors["TASK-0001"], FileNotFoundError)
+    assert rollup.agents_run == [] and rollup.total_file_reads == 0
+    assert not (tmp_path / ".agent-output").exists()
+
+
+def test_unchanged_files_are_not_reparsed(tmp_path, task_dir, parse_counter):
+    """A second sync over unchanged files parses nothing."""
+    MetricsStore(tmp_path).sync(["TASK-0001"])
+    assert len(parse_counter) == 2
+
+    MetricsStore(tmp_path).sync(["TASK-0001"])
+    assert len(parse_counter) == 2
+
+
+def test_changed_and_deleted_files_are_reindexed(tmp_path, task_dir, parse_counter):
+    """Modified files are re-parsed and deleted files dropped."""
+    with MetricsStore(tmp_path) as store:
+        store.sync(["TASK-0001"])
+
+        path = _write_telemetry(task_dir, "implementer", read_calls=9)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        (task_dir / "telemetry-reviewer.json").unlink()
+        store.sync(["TASK-0001"])
+        rollup = store.rollups(["TASK-0001"])["TASK-0001"]
+
+    assert len(parse_counter) == 3
+    assert rollup.file_reads_by_agent == {"implementer": 9}
+    assert rollup.repeated_warnings == 0
+
+
+def test_qa_log_presence_refreshed_without_context_change(tmp_path, task_dir):
+    """QA coverage follows log files appearing after context.json was indexed."""
+    (task_dir / "context.json").write_text(json.dumps({
+        "immutable": {"validation_baseline": {"initial_results": {
+            "results": [{"log_path": "logs/lint.log"}, {"log_path": None}],
+        }}},
+    }))
+
+    with MetricsStore(tmp_path) as store:
+        store.sync(["TASK-0001"])
+        before = store.rollups(["TASK-0001"])["TASK-0001"]
+
+        (tmp_path / "logs").mkdir()
+        (tmp_path / "logs" / "lint.log").write_text("ok\n")
+        store.sync(["TASK-0001"])
+        after = store.rollups(["TASK-0001"])["TASK-0001"]
+
+    assert (before.qa_commands_run, before.qa_commands_with_logs) == (2, 0)
+    assert (after.qa_commands_run, after.qa_commands_with_logs) == (2, 1)
+
+
+def test_sync_reports_missing_and_corrupt_tasks(tmp_path, task_dir):
+    """Unreadable tasks are reported and keep no rows."""
+    broken = tmp_path / ".agent-output" / "TASK-0002"
+    broken.mkdir()
+    (broken / "telemetry-implementer.json").write_text("{not json")
+
+    with MetricsStore(tmp_path) as store:
+        errors = store.sync(["TASK-0001", "TASK-0002", "TASK-9999"])
+        assert set(errors) == {"TASK-0002", "TASK-9999"}
+        assert isinstance(errors["TASK-9999"], FileNotFoundError)
+        assert store.rollups(["TASK-0002"])["TASK-0002"].agents_run == []
+
+
+def test_collect_and_dashboard_share_store(tmp_path, task_dir):
+    """collect_task_metrics and the dashboard accept an explicit store."""
+    with MetricsStore(tmp_path, db_path=":memory:") as store:
+        summary = collect_task_metrics("TASK-0001", tmp_path, store=store)
+        dashboard = generate_metrics_dashboard(
+            ["TASK-0001", "TASK-9999"], tmp_path, tmp_path / "dashboard.json", store=store
+        )
+
+    assert summary.avg_file_reads_per_agent == 3.0
+    assert summary.duration_minutes == 20.0
+    assert dashboard.tasks_analyzed == ["TASK-0001"]
+    assert not (tmp_path / ".agent-output" / METRICS_STORE_FILENAME).exists()
+
+
+def test_contexts_read_through_sqlite_backend(tmp_path, task_dir):
+    """QA coverage comes from the configured context backend, not context.json."""
+    from tasks_cli.context_store.storage import SQLiteContextStorage
+
+    storage = SQLiteContextStorage(tmp_path / ".agent-output" / ".contexts.sqlite3")
+    storage.write_context("TASK-0001", {
+        "immutable": {"validation_baseline": {"initial_results": {"results": [{"log_path": None}]}}},
+    })
+
+    with MetricsStore(tmp_path, context_storage=storage) as store:
+        store.sync(["TASK-0001"])
+        assert store.rollups(["TASK-0001"])["TASK-0001"].qa_commands_run == 1
+
+        storage.write_context("TASK-0001", {"immutable": {"validation_baseline": {"initial_results": []}}})
+        store.sync(["TASK-0001"])
+        assert store.rollups(["TASK-0001"])["TASK-0001"].qa_commands_run == 0
+    storage.close()
@@ -13,6 +13,7 @@ from typing import List
 
 import pytest
 
+from scripts.tasks_cli import output as output_module
 from scripts.tasks_cli.output import (
     BufferingOutputChannel,
     NullOutputChannel,
@@ -312,3 +313,106 @@ class TestConcurrency:
             # No cross-contamination
             other_name = "validate" if name == "list" else "list"
             assert other_name not in result["stderr"]
+
+
+class TestJsonStreaming:
+    """Tests for streamed, compact and NDJSON output."""
+
+    @staticmethod
+    def _response(tasks):
+        return {"tasks": tasks, "count": 2, "filter": {"status": None, "tags": ["ü", 1.5]}}
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def serializer(self, request, monkeypatch):
+        """Run each test with and without orjson."""
+        if request.param == "stdlib":
+            monkeypatch.setattr(output_module, "orjson", None)
+        elif output_module.orjson is None:
+            pytest.skip("orjson not installed")
+        return request.param
+
+    @pytest.mark.parametrize("style,expected", [
+        ("pretty", lambda data: json.dumps(data, indent=2, ensure_ascii=False)),
+        ("compact", lambda data: json.dumps(data, ensure_ascii=False, separators=(",", ":"))),
+    ])
+    def test_streamed_output_matches_materialized(self, serializer, style, expected) -> None:
+        """Generators serialize byte-identically to lists, keeping key order."""
+        items = [{"id": "TASK-0002", "blocked_by": ("TASK-0001",)}, {"id": "TASK-0001", "a": {}}]
+        channel = BufferingOutputChannel()
+        channel.json_style = style
+
+        channel.emit_json(self._response(item for item in items))
+
+        assert channel.get_stdout() == expected(self._response(items)) + "\n"
+
+    def test_empty_stream(self, serializer) -> None:
+        """An exhausted iterator is written as an empty array."""
+        channel = BufferingOutputChannel()
+        channel.emit_json({"tasks": iter([])})
+        assert channel.get_stdout() == '{\n  "tasks": []\n}\n'
+
+    def test_ndjson_writes_envelope_then_elements(self, serializer) -> None:
+        """NDJSON puts the non-streamed keys first, then one line per element."""
+        channel = BufferingOutputChannel()
+        channel.json_style = "ndjson"
+
+        channel.emit_json(self._response(iter([{"id": "TASK-0001"}, {"id": "TASK-0002"}])))
+
+        lines = channel.get_stdout().splitlines()
+        assert json.loads(lines[0]) == {"count": 2, "filter": {"status": None, "tags": ["ü", 1.5]}}
+        assert [json.loads(line)["id"] for line in lines[1:]] == ["TASK-0001", "TASK-0002"]
+        assert len(channel.get_json_output()) == 3
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_encoders_agree_on_dataclasses_datetimes_and_nan(self, monkeypatch, pretty) -> None:
+        """orjson and stdlib json produce identical text for non-native values."""
+        if output_module.orjson is None:
+            pytest.skip("orjson not installed")
+        from dataclasses import dataclass
+        from datetime import date, datetime, timedelta, timezone
+
+        @dataclass
+        class Item:
+            id: str
+            due: date
+            score: float
+
+        value = {
+            "item": Item("TASK-0001", date(2025, 11, 18), float("nan")),
+            "at": datetime(2025, 11, 18, 10, 0, 0, 123456, tzinfo=timezone(timedelta(hours=2))),
+            "naive": datetime(2025, 11, 18, 10, 0),
+            "ratios": [1.5, float("inf"), -float("inf")],
+            1: "non-str key",
+        }
+
+        fast = output_module._dumps(value, pretty)
+        with pytest.raises(TypeError):
+            output_module._dumps({"x": object()}, pretty)
+
+        monkeypatch.setattr(output_module, "orjson", None)
+        assert output_module._dumps(value, pretty) == fast
+        assert json.loads(fast)["item"] == {"id": "TASK-0001", "due": "2025-11-18", "score": None}
+        assert json.loads(fast)["at"] == "2025-11-18T10:00:00.123456+02:00"
+        with pytest.raises(TypeError):
+            output_module._dumps({"x": object()}, pretty)
+
+    def test_elements_are_written_as_produced(self) -> None:
+        """Each element reaches the stream before the next one is generated."""
+        channel = BufferingOutputChannel()
+        seen = []
+
+        def produce():
+            for i in range(3):
+                seen.append(channel.get_stdout().count('"id"'))
+                yield {"id": i}
+
+        channel.emit_json({"tasks": produce()})
+        assert seen == [0, 1, 2]
+
+    @pytest.mark.parametrize("value,style", [
+        ("compact", "compact"), ("NDJSON", "ndjson"), ("bogus", "pretty"), ("", "pretty"),
+    ])
+    def test_style_from_environment(self, monkeypatch, value, style) -> None:
+        """TASKS_JSON_STYLE selects the style; unknown values fall back to pretty."""
+        monkeypatch.setenv(output_module.JSON_STYLE_ENV_VAR, value)
+        assert OutputChannel.from_cli_flags(json_mode=True).json_style == style
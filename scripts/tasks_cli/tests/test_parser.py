@@ -30,8 +30,8 @@ def test_parse_inline_blocked_by(parser, fixtures_dir):
 
     assert task is not None
     assert task.id == "TASK-0003"
-    assert task.blocked_by == ["TASK-0001", "TASK-0002"]
-    assert task.depends_on == ["TASK-0099"]
+    assert task.blocked_by == ("TASK-0001", "TASK-0002")
+    assert task.depends_on == ("TASK-0099",)
 
 
 def test_parse_multiline_blocked_by(parser, fixtures_dir):
@@ -41,8 +41,8 @@ def test_parse_multiline_blocked_by(parser, fixtures_dir):
 
     assert task is not None
     assert task.id == "TASK-0004"
-    assert task.blocked_by == ["TASK-0001", "TASK-0002"]
-    assert task.depends_on == ["TASK-0099"]
+    assert task.blocked_by == ("TASK-0001", "TASK-0002")
+    assert task.depends_on == ("TASK-0099",)
 
 
 def test_parse_empty_blocked_by(parser, fixtures_dir):
@@ -52,8 +52,8 @@ def test_parse_empty_blocked_by(parser, fixtures_dir):
 
     assert task is not None
     assert task.id == "TASK-0001"
-    assert task.blocked_by == []
-    assert task.depends_on == []
+    assert task.blocked_by == ()
+    assert task.depends_on == ()
 
 
 def test_parse_unblocker_flag(parser, fixtures_dir):
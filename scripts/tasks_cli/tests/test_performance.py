@@ -10,12 +10,34 @@ Performance targets (per proposal Section 5):
 - Cold cache: <2s on 50-task backlog
 - Cycle detection: <500ms on 100-task graph
 - Graph validation: <1s on 100-task graph
+- Metrics dashboard: sub-second over 10k tasks once telemetry is indexed
+- Task records: <900 bytes per task (records + graph) at 50k tasks
+- Pick startup: independent of archive size (hot tier + archived-ID index)
+- list --format json: <2s at 20k tasks, streamed with bounded memory
+- Priority propagation + closure queries: <2s at 2k tasks (closure index)
+- DOT export: <2s full export at 20k tasks; neighborhood export independent
+  of graph size
+- Exception ledger: <0.5s for 10k suppression checks against 2k entries
+- QA log scan: bounded memory on large logs (QA_LOG_BENCH_MB, default 20;
+  set QA_LOG_BENCH_MB=500 to reproduce the monorepo-sized jest/tsc logs)
+- git status: warm fsmonitor and scoped status faster than a warm plain scan
+  (GIT_STATUS_BENCH_FILES, default 50k; set 200000 for the large worktree)
+- Porcelain v2 status parsing: <1s for 100k entries
+- expected_paths checks: <0.1s for a 10-command pipeline over a monorepo
+  with a 30k-file node_modules (pathlib glob expands every match)
+- Bulk QA drift: <1s for 1,000 task contexts x 10 commands (load + compare)
 
 Run with: pytest scripts/tasks_cli/tests/test_performance.py -m slow -v
+
+End-to-end command timings (cold/warm, peak RSS) against generated repos of
+1k-100k tasks, gated on a stored baseline: python -m tasks_cli.benchmarks
 """
 
+import json
+import os
 import pytest
 import time
+import tracemalloc
 import tempfile
 import shutil
 from pathlib import Path
@@ -23,6 +45,8 @@ from tasks_cli.models import Task
 from tasks_cli.graph import DependencyGraph
 from tasks_cli.datastore import TaskDatastore
 from tasks_cli.picker import TaskPicker
+from tasks_cli.metrics import generate_metrics_dashboard
+from tasks_cli.qa_log_scanner import scan_qa_log
 
 
 def create_test_tasks(count: int, completed_count: int = 0) -> list[Task]:
@@ -289,6 +313,34 @@ def test_dependency_closure_performance_deep_chain():
     assert len(closure['blocking']) == 49
 
 
+@pytest.mark.slow
+def test_closure_index_queries_2k_tasks():
+    """
+    Performance: priority propagation and explain-style closure queries
+    share one memoized closure index instead of traversing per task.
+
+    Target: <2s for propagation over 2k tasks plus 2k closure queries.
+    The fixture is one 2k-task blocked_by chain, so the queries return
+    ~2M task IDs in total (task i has i ancestors): ~0.5s measured is
+    spent materializing that output, not in the index. The budget is 4x
+    that so the test holds on a loaded CI runner; the recursive
+    per-query traversal it replaces cannot finish at all (RecursionError
+    past ~1k links).
+    """
+    tasks = create_test_tasks(2000, completed_count=500)
+    graph = DependencyGraph(tasks)
+    picker = TaskPicker(tasks, graph)
+
+    start_time = time.perf_counter()
+    picker.compute_effective_priorities()
+    for task in tasks:
+        graph.compute_dependency_closure(task.id)
+    elapsed = time.perf_counter() - start_time
+
+    assert elapsed < 2.0, f"Closure queries took {elapsed:.3f}s (target: <2s)"
+    assert len(graph.compute_dependency_closure("TASK-1999")['blocking']) == 1999
+
+
 @pytest.mark.slow
 def test_dot_export_performance_100_tasks():
     """
@@ -314,6 +366,265 @@ def test_dot_export_performance_100_tasks():
     assert "TASK-0000" in dot_output
 
 
+@pytest.mark.slow
+def test_dot_export_streaming_20k_tasks():
+    """
+    Performance: DOT export streams large graphs and scopes cheaply.
+
+    Target: <2s full export (with collapsed completed chains) at 20k tasks;
+    a 2-hop neighborhood export stays well under 100ms.
+    """
+    tasks = create_test_tasks(20000, completed_count=15000)
+    graph = DependencyGraph(tasks)
+
+    start_time = time.perf_counter()
+    line_count = sum(1 for _ in graph.iter_dot(collapse_completed=True))
+    full_elapsed = time.perf_counter() - start_time
+
+    # Completed chain (TASK-0000..TASK-14999) collapses into one summary node
+    assert line_count < 20000 * 3
+    assert full_elapsed < 2.0, f"Full DOT export took {full_elapsed:.3f}s (target: <2s)"
+
+    start_time = time.perf_counter()
+    scope = graph.select_scope(root="TASK-17000", hops=2, active_only=True)
+    scoped = list(graph.iter_dot(task_ids=scope))
+    scoped_elapsed = time.perf_counter() - start_time
+
+    assert len(scope) < 50
+    assert '"TASK-17000"' in '\n'.join(scoped)
+    assert scoped_elapsed < 0.1, f"Scoped DOT export took {scoped_elapsed:.3f}s (target: <0.1s)"
+
+
+@pytest.mark.slow
+def test_qa_log_scan_streaming_large_log(tmp_path):
+    """
+    Performance: QA log scanning streams large logs in bounded memory.
+
+    Target: peak traced memory <32MB regardless of log size, >=2MB/s
+    """
+    size_mb = int(os.environ.get("QA_LOG_BENCH_MB", "20"))
+    block = b"".join([
+        b"  PASS  src/components/Button.test.tsx (5.123 s)\n",
+        b"      at Object.<anonymous> (src/utils/format.ts:42:13)\n",
+        b"src/app.ts(12,5): error TS2345: Argument of type 'string' is not assignable.\n",
+        b"console.log\n    some debug output value=42\n",
+    ]) * 2000
+
+    log_file = tmp_path / "jest.log"
+    with open(log_file, "wb") as f:
+        for _ in range(size_mb * 1024 * 1024 // len(block) + 1):
+            f.write(block)
+        f.write(b"Tests:       3 failed, 1200 passed, 1203 total\n")
+
+    start_time = time.time()
+    scan = scan_qa_log(log_file)
+    elapsed = time.time() - start_time
+
+    # Separate pass: tracemalloc itself slows allocation-heavy code
+    tracemalloc.start()
+    scan_qa_log(log_file)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert scan.summary_for("test").tests_passed == 1200
+    assert scan.summary_for("test").tests_failed == 3
+    assert peak < 32 * 1024 * 1024, f"Peak memory {peak / 1e6:.1f}MB (target: <32MB)"
+    assert size_mb / elapsed >= 2, f"Scanned {size_mb}MB in {elapsed:.2f}s (target: >=2MB/s)"
+
+
+@pytest.mark.slow
+def test_metrics_dashboard_performance_10k_tasks(tmp_path):
+    """
+    Performance: dashboard over 10k tasks reuses the indexed metrics store.
+
+    Target: <1.5s warm (sub-second on development hardware)
+    """
+    task_ids = [f"TASK-{i:05d}" for i in range(10000)]
+    for i, task_id in enumerate(task_ids):
+        task_dir = tmp_path / ".agent-output" / task_id
+        task_dir.mkdir(parents=True)
+        for role in ("implementer", "reviewer", "validator"):
+            (task_dir / f"telemetry-{role}.json").write_text(json.dumps({
+                "agent_role": role,
+                "session_start": "2025-11-18T10:00:00Z",
+                "session_end": "2025-11-18T10:30:00Z",
+                "metrics": {"file_operations": {"read_calls": i % 7}},
+                "warnings": [{"message": "stale cache"}],
+            }))
+
+    output_path = tmp_path / "dashboard.json"
+    generate_metrics_dashboard(task_ids, tmp_path, output_path)  # Cold ingest
+
+    start_time = time.time()
+    dashboard = generate_metrics_dashboard(task_ids, tmp_path, output_path)
+    elapsed = time.time() - start_time
+
+    assert dashboard.total_tasks == 10000
+    assert elapsed < 1.5, f"Warm dashboard took {elapsed:.3f}s (target: <1.5s)"
+
+
+@pytest.mark.slow
+def test_task_records_memory_50k_tasks():
+    """
+    Performance: 50k cached task records plus their graph stay compact.
+
+    Mirrors a warm datastore load (records rebuilt from decoded JSON).
+
+    Target: <900 bytes retained per task, <2s to build records and graph
+    """
+    count = 50000
+    blob = json.dumps({
+        f"TASK-{i:05d}": {
+            'path': f"/repo/docs/completed-tasks/TASK-{i:05d}-task.task.yaml",
+            'title': f"Task {i}",
+            'status': 'completed' if i < 45000 else 'todo',
+            'priority': ('P0', 'P1', 'P2')[i % 3],
+            'area': ('backend', 'mobile', 'infra')[i % 3],
+            'blocked_by': [f"TASK-{i - 1:05d}"] if i % 2 else [],
+            'depends_on': [],
+            'blocked_reason': None,
+            'mtime': 1700000000.0 + i,
+            'hash': f"{i:064x}",
+        }
+        for i in range(count)
+    })
+
+    def build():
+        tasks = [
+            Task(
+                id=task_id,
+                title=entry['title'],
+                status=entry['status'],
+                priority=entry['priority'],
+                area=entry['area'],
+                path=entry['path'],
+                blocked_by=entry['blocked_by'],
+                depends_on=entry['depends_on'],
+                blocked_reason=entry['blocked_reason'],
+                mtime=entry['mtime'],
+                hash=entry['hash'],
+            )
+            for task_id, entry in json.loads(blob).items()
+        ]
+        return tasks, DependencyGraph(tasks)
+
+    start_time = time.time()
+    tasks, graph = build()
+    elapsed = time.time() - start_time
+    del tasks, graph
+
+    tracemalloc.start()
+    try:
+        tasks, graph = build()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    per_task = retained / count
+    assert len(graph.task_by_id) == count
+    assert tasks[1].hash == f"{1:064x}"
+    assert per_task < 900, f"{per_task:.0f} bytes retained per task (target: <900)"
+    assert elapsed < 2.0, f"Building 50k tasks took {elapsed:.3f}s (target: <2s)"
+
+
+@pytest.mark.slow
+def test_pick_startup_independent_of_archive_size(tmp_path):
+    """
+    Performance: warm hot-tier load does not grow with the archive.
+
+    Builds 1500 archived tasks once, then times the pick startup path
+    (active tasks + completed-ID index) against an empty archive.
+
+    Target: <3x the no-archive load time (plus 20ms slack)
+    """
+    def make_repo(root, archived):
+        (root / "tasks").mkdir(parents=True)
+        archive_dir = root / "docs" / "completed-tasks"
+        archive_dir.mkdir(parents=True)
+        for i in range(archived):
+            (archive_dir / f"TASK-{i:05d}.task.yaml").write_text(
+                f"id: TASK-{i:05d}\ntitle: Archived {i}\nstatus: completed\n"
+                f"priority: P1\narea: backend\n"
+            )
+        for i in range(50):
+            (root / "tasks" / f"TASK-9{i:04d}.task.yaml").write_text(
+                f"id: TASK-9{i:04d}\ntitle: Active {i}\nstatus: todo\n"
+                f"priority: P1\narea: backend\nblocked_by: [TASK-{i:05d}]\n"
+            )
+        TaskDatastore(root).load_tasks()  # Cold build
+        return root
+
+    def warm_pick_startup(root):
+        start_time = time.perf_counter()
+        datastore = TaskDatastore(root)
+        tasks = datastore.load_active_tasks()
+        graph = DependencyGraph(tasks, archived_ids=datastore.get_archive_index())
+        ready = graph.topological_ready_set(datastore.get_completed_ids())
+        return time.perf_counter() - start_time, tasks, ready
+
+    small = make_repo(tmp_path / "small", 0)
+    large = make_repo(tmp_path / "large", 1500)
+
+    baseline = min(warm_pick_startup(small)[0] for _ in range(3))
+    elapsed, tasks, ready = min(
+        (warm_pick_startup(large) for _ in range(3)), key=lambda run: run[0]
+    )
+
+    assert len(tasks) == 50
+    assert len(ready) == 50  # Every blocker resolved through the archive index
+    assert elapsed < baseline * 3 + 0.02, (
+        f"Warm pick startup took {elapsed:.3f}s with 1500 archived tasks "
+        f"vs {baseline:.3f}s without"
+    )
+
+
+@pytest.mark.slow
+def test_list_json_streaming_20k_tasks():
+    """
+    Performance: `list --format json` over 20k tasks streams its output.
+
+    Compares the streamed emitter against materializing every task dict
+    and the pretty-printed string first (the previous behavior).
+
+    Target: <2s, peak memory under half of the materialized approach
+    """
+    from types import SimpleNamespace
+    from tasks_cli.commands.tasks import list_tasks, task_to_dict
+    from tasks_cli.output import OutputChannel
+
+    tasks = create_test_tasks(20000, completed_count=2000)
+    picker = TaskPicker(tasks, DependencyGraph(tasks))
+
+    with open(os.devnull, 'w', encoding='utf-8') as sink:
+        ctx = SimpleNamespace(
+            picker=picker,
+            datastore=SimpleNamespace(load_archived_tasks=list),
+            output_channel=OutputChannel(stdout=sink),
+        )
+        list_tasks(ctx, format_arg='json')  # Warm-up (effective priorities, imports)
+
+        start_time = time.time()
+        list_tasks(ctx, format_arg='json')
+        elapsed = time.time() - start_time
+
+        listed = picker.list_tasks()
+        tracemalloc.start()
+        try:
+            list_tasks(ctx, format_arg='json')
+            _, streamed_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            sink.write(json.dumps({'tasks': [task_to_dict(t) for t in listed]}, indent=2))
+            _, materialized_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    assert elapsed < 2.0, f"list --format json took {elapsed:.3f}s at 20k tasks (target: <2s)"
+    assert streamed_peak < materialized_peak / 2, (
+        f"Streamed peak {streamed_peak / 1e6:.1f}MB vs "
+        f"materialized {materialized_peak / 1e6:.1f}MB"
+    )
+
+
 @pytest.mark.slow
 def test_scalability_stress_test_500_tasks():
     """
@@ -378,6 +689,267 @@ def test_deterministic_performance():
         f"Performance variance too high: min={min_time:.3f}s, max={max_time:.3f}s, avg={avg_time:.3f}s, variance={variance:.3f}s"
 
 
+@pytest.mark.slow
+def test_exception_ledger_lookups_10k(tmp_path):
+    """
+    Performance: suppression checks are served from the in-process ledger
+    index (no lock, no re-parse) until the ledger file changes.
+
+    Target: <0.5s for 10k lookups against a 2k-entry ledger (one stat each)
+    """
+    from tasks_cli.exception_ledger import LEDGER_PATH, should_suppress_warnings, suppressed_ids
+
+    ledger_path = tmp_path / LEDGER_PATH
+    ledger_path.parent.mkdir(parents=True)
+    ledger_path.write_text(json.dumps({
+        "version": "1.0",
+        "last_updated": "2025-01-01T00:00:00+00:00",
+        "exceptions": [
+            {
+                "task_id": f"TASK-{i:04d}",
+                "exception_type": "invalid_schema",
+                "detected_at": "2025-01-01T00:00:00+00:00",
+                "remediation": {"owner": "system", "status": "open"},
+                "suppressed_warnings": [],
+                "auto_remove_on": "task_completion",
+            }
+            for i in range(0, 4000, 2)
+        ],
+    }))
+
+    assert len(suppressed_ids(tmp_path)) == 2000
+
+    start_time = time.perf_counter()
+    hits = sum(should_suppress_warnings(f"TASK-{i % 4000:04d}", tmp_path) for i in range(10000))
+    elapsed = time.perf_counter() - start_time
+
+    assert hits == 5000
+    assert elapsed < 0.5, f"Ledger lookups took {elapsed:.3f}s (target: <0.5s)"
+
+
+def _synthetic_worktree(root: Path, file_count: int) -> None:
+    """Commit file_count small files (100 per directory) without a slow `git add`."""
+    import subprocess
+
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    blob = subprocess.run(
+        ["git", "hash-object", "-w", "--stdin"], cwd=root, input=b"x\n", capture_output=True, check=True,
+    ).stdout.decode().strip()
+
+    entries = []
+    for i in range(file_count):
+        rel_dir = f"pkg{i // 10000:02d}/mod{i // 100 % 100:02d}"
+        if i % 100 == 0:
+            (root / rel_dir).mkdir(parents=True)
+        (root / rel_dir / f"f{i % 100:02d}.txt").write_bytes(b"x\n")
+        entries.append(f"100644 {blob}\t{rel_dir}/f{i % 100:02d}.txt\n")
+
+    def git(*args, stdin=None):
+        return subprocess.run(
+            ["git", *args], cwd=root, input=stdin, capture_output=True, check=True, text=True,
+        ).stdout.strip()
+
+    git("update-index", "--index-info", stdin="".join(entries))
+    commit = git(
+        "-c", "user.name=Bench", "-c", "user.email=bench@example.com",
+        "commit-tree", git("write-tree"), "-m", "synthetic worktree",
+    )
+    git("update-ref", "HEAD", commit)
+    git("status", "--porcelain")  # Record stat data so strategies start from the same index
+
+
+@pytest.mark.slow
+def test_git_status_strategies_large_worktree(tmp_path):
+    """
+    Performance: warm/cold git status per strategy on a synthetic worktree.
+
+    Target: warm fsmonitor status and scoped status faster than a warm plain
+    scan (the untracked cache only saves the directory walk and is reported)
+    """
+    import threading
+
+    from tasks_cli.providers import GitProvider
+    from tasks_cli.providers.git import fsmonitor, scope_pathspecs
+
+    file_count = int(os.environ.get("GIT_STATUS_BENCH_FILES", "50000"))
+    _synthetic_worktree(tmp_path, file_count)
+
+    def timed_status(provider, **kwargs):
+        start = time.perf_counter()
+        result = provider.status(**kwargs)
+        return time.perf_counter() - start, result
+
+    def cold_and_warm(provider, **kwargs):
+        cold, result = timed_status(provider, **kwargs)
+        assert result == {"files": [], "is_dirty": False}
+        warm = min(timed_status(provider, **kwargs)[0] for _ in range(3))
+        return cold, warm
+
+    timings = {
+        "plain": cold_and_warm(GitProvider(tmp_path, status_strategy="plain")),
+        "scoped": cold_and_warm(GitProvider(tmp_path), pathspecs=scope_pathspecs(["pkg00/mod00"])),
+        "untracked-cache": cold_and_warm(GitProvider(tmp_path, status_strategy="untracked-cache")),
+    }
+
+    stop, ready = threading.Event(), threading.Event()
+    sock_path = fsmonitor.socket_path(tmp_path / ".git")
+    daemon = threading.Thread(
+        target=fsmonitor.serve, args=(tmp_path, sock_path), kwargs={"stop": stop, "ready": ready}, daemon=True,
+    )
+    daemon.start()
+    assert ready.wait(timeout=10)
+    try:
+        provider = GitProvider(tmp_path, status_strategy="fsmonitor")
+        assert provider.status_strategy().fsmonitor_hook is not None
+        timings["fsmonitor"] = cold_and_warm(provider)
+
+        (tmp_path / "pkg00" / "mod01" / "f07.txt").write_bytes(b"changed\n")
+        (tmp_path / "pkg00" / "mod02" / "new.txt").write_bytes(b"new\n")
+        assert sorted(provider.status()["files"]) == ["pkg00/mod01/f07.txt", "pkg00/mod02/new.txt"]
+    finally:
+        stop.set()
+        daemon.join(timeout=5)
+
+    print(f"\ngit status on {file_count} files (cold / warm):")
+    for name, (cold, warm) in timings.items():
+        print(f"  {name:16s} {cold * 1000:8.1f}ms {warm * 1000:8.1f}ms")
+
+    plain_warm = timings["plain"][1]
+    assert timings["fsmonitor"][1] < plain_warm, f"fsmonitor warm status not faster: {timings}"
+    assert timings["scoped"][1] < plain_warm, f"Scoped status not faster: {timings}"
+
+
+@pytest.mark.slow
+def test_porcelain_v2_parse_100k_entries():
+    """
+    Performance: typed porcelain v2 parsing of a 100k-entry status.
+
+    Target: <1s for 100k mixed entries (changed, renamed, unmerged, untracked)
+    """
+    from tasks_cli.providers.git import parse_porcelain_v2
+
+    oid = "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+    records = []
+    for i in range(100000):
+        kind = i % 4
+        if kind == 0:
+            records.append(f"1 .M N... 100644 100644 100644 {oid} {oid} src/pkg{i // 1000}/file {i}.ts\0")
+        elif kind == 1:
+            records.append(f"2 R. N... 100644 100644 100644 {oid} {oid} R100 src/new{i}.ts\0src/old{i}.ts\0")
+        elif kind == 2:
+            records.append(f"? build/out {i}.js\0")
+        else:
+            records.append(f"u UU N... 100644 100644 100644 100644 {oid} {oid} {oid} conflict{i}.ts\0")
+    output = "".join(records).encode()
+
+    def timed_parse():
+        start_time = time.perf_counter()
+        entries = parse_porcelain_v2(output)
+        return time.perf_counter() - start_time, entries
+
+    elapsed, entries = min((timed_parse() for _ in range(3)), key=lambda run: run[0])
+
+    assert len(entries) == 100000
+    assert entries[1].orig_path == "src/old1.ts"
+    assert entries[2].path == "build/out 2.js"
+    assert elapsed < 1.0, f"Parsing 100k status entries took {elapsed:.3f}s (target: <1s)"
+
+
+
+@pytest.mark.slow
+def test_expected_paths_checks_skip_node_modules(tmp_path):
+    """
+    Benchmark: expected_paths pre-flight for a validation pipeline.
+
+    Target: <0.1s for 10 commands x 3 patterns over a monorepo with a
+    30k-file node_modules, where list(Path.glob()) walks everything
+    """
+    from tasks_cli.expected_paths import GlobExistenceChecker
+
+    for pkg in range(3000):
+        package_dir = tmp_path / "node_modules" / f"pkg{pkg}" / "dist"
+        package_dir.mkdir(parents=True)
+        for name in ("index.js", "index.d.ts", "package.json", "README.md", "LICENSE",
+                     "a.js", "b.js", "c.js", "d.js", "e.js"):
+            (package_dir / name).touch()
+    for app in ("backend", "mobile", "shared"):
+        (tmp_path / app / "dist").mkdir(parents=True)
+        (tmp_path / app / "dist" / "index.js").touch()
+        (tmp_path / app / "package.json").touch()
+
+    patterns = ["**/dist/**", "*/package.json", "backend/dist/*.js"] * 10
+
+    start_time = time.perf_counter()
+    baseline_missing = [p for p in patterns if not list(tmp_path.glob(p))]
+    glob_elapsed = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    report = GlobExistenceChecker(tmp_path).check(patterns)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"\nexpected_paths: pathlib glob {glob_elapsed:.3f}s, checker {elapsed:.4f}s")
+    assert report.missing == baseline_missing == []
+    assert elapsed < 0.1, f"expected_paths checks took {elapsed:.3f}s (target: <0.1s)"
+
+
+
+@pytest.mark.slow
+def test_bulk_qa_drift_1000_tasks(tmp_path):
+    """
+    Benchmark: release-gate drift report over every active task context.
+
+    Target: <1s to load 1,000 contexts (baseline + 3 agents x 10 commands)
+    and compute all regressions/improvements
+    """
+    import random
+
+    from tasks_cli.context_store.qa_drift import QADriftTable, detect_bulk_drift
+    from tasks_cli.context_store.runtime import RuntimeHelper
+    from tasks_cli.context_store.storage import FilesystemContextStorage
+
+    rng = random.Random(0)
+    runtime = RuntimeHelper(repo_root=tmp_path, context_root=tmp_path / ".agent-output", git_provider=None)
+    storage = FilesystemContextStorage(tmp_path / ".agent-output", runtime.atomic_write)
+
+    def qa_results(agent):
+        # Mostly stable results with a few percent of drifting commands
+        return {
+            "recorded_at": "2025-01-01T00:00:00+00:00", "agent": agent, "git_sha": None,
+            "results": [
+                {
+                    "command_id": f"val-{c:03d}", "command": "pnpm test", "duration_ms": 1000,
+                    "exit_code": 0 if rng.random() < 0.97 else 1,
+                    "summary": {
+                        "lint_errors": 0 if rng.random() < 0.95 else 3, "type_errors": 0,
+                        "tests_passed": 100, "tests_failed": 0 if rng.random() < 0.95 else 2,
+                        "coverage": {"lines": 80.0 if rng.random() < 0.95 else 75.5, "branches": 70.0},
+                    },
+                }
+                for c in range(10)
+            ],
+        }
+
+    for t in range(1000):
+        storage.write_context(f"TASK-{t:04d}", {
+            "task_id": f"TASK-{t:04d}",
+            "immutable": {"validation_baseline": {"commands": [], "initial_results": qa_results("baseline")}},
+            "coordination": {
+                role: {"status": "done", "drift_budget": 0, "qa_results": qa_results(role)}
+                for role in ("implementer", "reviewer", "validator")
+            },
+        })
+
+    start_time = time.perf_counter()
+    table = QADriftTable.from_storage(storage)
+    report = detect_bulk_drift(table)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"\nBulk QA drift: {report['comparison_count']} comparisons, "
+          f"{len(report['regressions'])} regressions in {elapsed:.3f}s")
+    assert report["task_count"] == 1000 and report["comparison_count"] == 30000
+    assert elapsed < 1.0, f"Bulk QA drift took {elapsed:.3f}s (target: <1s)"
+
+
 # Performance baselines (documented for future reference)
 """
 Performance Baselines (measured 2025-11-01):
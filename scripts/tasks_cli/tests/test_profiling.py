@@ -0,0 +1,83 @@
+"""Tests for the built-in --profile switch."""
+
+import io
+import pstats
+
+import pytest
+
+from tasks_cli.profiling import CommandProfiler, extract_profile_option
+
+
+@pytest.mark.parametrize("argv,expected", [
+    (["list"], (None, ["list"])),
+    (["--profile", "list"], ("cpu", ["list"])),
+    (["--profile", "cpu", "list"], ("cpu", ["list"])),
+    (["--profile", "alloc", "list", "--format", "json"], ("alloc", ["list", "--format", "json"])),
+    (["list", "--profile=alloc", "--format", "json"], ("alloc", ["list", "--format", "json"])),
+    (["run", "--", "--profile"], (None, ["run", "--", "--profile"])),
+])
+def test_extract_profile_option(argv, expected):
+    """--profile is stripped wherever it appears before '--'."""
+    assert extract_profile_option(argv) == expected
+
+
+def test_extract_profile_option_rejects_unknown_mode():
+    """Unknown modes are reported instead of silently ignored."""
+    with pytest.raises(ValueError, match="wall"):
+        extract_profile_option(["--profile=wall", "list"])
+
+
+def test_app_reports_resolved_subcommand():
+    """The command name comes from Click, not the first non-dash argument."""
+    from types import SimpleNamespace
+
+    from typer.testing import CliRunner
+
+    from tasks_cli.app import app
+
+    invocation = SimpleNamespace(command="help")
+    assert CliRunner().invoke(app, ["version"], obj=invocation).exit_code == 0
+    assert invocation.command == "version"
+
+    # Option values are never mistaken for the command
+    invocation = SimpleNamespace(command="help")
+    assert CliRunner().invoke(app, ["--format", "json", "list"], obj=invocation).exit_code == 2
+    assert invocation.command == "help"
+
+
+def _busy():
+    return sum(i * i for i in range(20000))
+
+
+def test_cpu_profile_writes_pstats_and_report(tmp_path):
+    """cpu mode dumps loadable pstats and reports phases and peak RSS."""
+    stream = io.StringIO()
+    with CommandProfiler("cpu", tmp_path, "list", top=5, stream=stream) as profiler:
+        _busy()
+        profiler.mark("initialize_commands")
+        _busy()
+
+    report = stream.getvalue()
+    assert profiler.output_path.parent == tmp_path
+    assert profiler.output_path.name.startswith("list-")
+    assert profiler.output_path.suffix == ".pstats"
+    assert "_busy" in str(pstats.Stats(str(profiler.output_path)).stats)
+    assert "initialize_commands" in report
+    assert "command" in report
+    assert "Peak RSS" in report
+
+
+def test_alloc_profile_writes_collapsed_stacks(tmp_path):
+    """alloc mode writes 'frames bytes' lines and reports peak memory."""
+    stream = io.StringIO()
+    with CommandProfiler("alloc", tmp_path, "task/graph", stream=stream) as profiler:
+        retained = [bytearray(1024) for _ in range(200)]
+
+    assert retained
+    assert profiler.output_path.name.startswith("task_graph-")
+    lines = profiler.output_path.read_text().splitlines()
+    assert lines
+    frames, size = lines[0].rsplit(" ", 1)
+    assert frames and int(size) > 0
+    assert any("test_profiling.py" in line for line in lines)
+    assert "Peak traced memory" in stream.getvalue()
@@ -0,0 +1,203 @@
+"""Tests for AsyncProcessProvider and its QA/delta-tracking consumers."""
+
+import asyncio
+import os
+import subprocess
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from tasks_cli.context_store.delta_tracking import DeltaTracker
+from tasks_cli.context_store.qa import QABaselineManager
+from tasks_cli.models import RetryPolicy, ValidationCommand
+from tasks_cli.providers import (
+    AsyncProcessProvider,
+    CommandFailed,
+    NonZeroExitWithStdErr,
+    TimeoutExceeded,
+)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_run_bounds_concurrency():
+    """No more than max_concurrency commands are alive at once."""
+    provider = AsyncProcessProvider(max_concurrency=2)
+    live = {"peak": 0}
+
+    async def tracked():
+        result = await provider.run(["sh", "-c", "sleep 0.2; echo done"])
+        return result.stdout
+
+    async def sampler(tasks):
+        while not all(task.done() for task in tasks):
+            children = subprocess.run(
+                ["pgrep", "-P", str(os.getpid()), "-f", "sleep 0.2"], capture_output=True, text=True,
+            ).stdout.split()
+            live["peak"] = max(live["peak"], len(children))
+            await asyncio.sleep(0.02)
+
+    async def main():
+        tasks = [asyncio.ensure_future(tracked()) for _ in range(5)]
+        await asyncio.gather(sampler(tasks), *tasks)
+        return [task.result() for task in tasks]
+
+    start = time.monotonic()
+    assert _run(main()) == ["done\n"] * 5
+    assert time.monotonic() - start >= 0.55  # Three waves of 0.2s
+    assert live["peak"] <= 2
+
+
+def test_timeout_kills_process_group(tmp_path):
+    """A timed-out command and the processes it spawned are all killed."""
+    marker = tmp_path / "survived"
+    provider = AsyncProcessProvider()
+    script = f"(sleep 1; touch '{marker}') & sleep 30"
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutExceeded):
+        _run(provider.run(["sh", "-c", script], timeout=0.3))
+    assert time.monotonic() - start < 5
+    time.sleep(1.2)
+    assert not marker.exists()
+
+
+def test_streams_to_callbacks_and_files(tmp_path):
+    """Output arrives incrementally; file sinks receive raw bytes instead of memory."""
+    chunks = []
+    provider = AsyncProcessProvider()
+    script = "printf 'one\\n'; sleep 0.2; printf 'two\\n'; printf 'caf\\303\\251' >&2"
+
+    result = _run(provider.run(
+        ["sh", "-c", script], on_stdout=chunks.append, stderr_path=tmp_path / "err.log",
+    ))
+    assert chunks == ["one\n", "two\n"]
+    assert result.stdout == "one\ntwo\n"
+    assert result.stderr is None
+    assert (tmp_path / "err.log").read_bytes() == "café".encode("utf-8")
+
+    async def collect():
+        return [item async for item in provider.stream(["sh", "-c", "echo a; echo b >&2"])]
+
+    assert sorted(_run(collect())) == [("stderr", "b\n"), ("stdout", "a\n")]
+
+
+def test_errors_and_span_semantics_match_process_provider():
+    """Failures raise the ProcessProvider exceptions; previews are redacted."""
+    provider = AsyncProcessProvider()
+    with pytest.raises(NonZeroExitWithStdErr) as excinfo:
+        _run(provider.run(["sh", "-c", "echo boom >&2; exit 3"]))
+    assert excinfo.value.returncode == 3
+    with pytest.raises(CommandFailed):
+        _run(provider.run(["sh", "-c", "exit 4"]))
+    assert _run(provider.run(["sh", "-c", "exit 5"], check=False)).returncode == 5
+
+    with patch.object(provider._tracer, "start_as_current_span") as mock_span:
+        span = MagicMock()
+        mock_span.return_value.__enter__ = Mock(return_value=span)
+        mock_span.return_value.__exit__ = Mock(return_value=False)
+        _run(provider.run(["echo", "token secret123"], redact=["secret123"], timeout=10.0))
+
+    mock_span.assert_called_once_with("cli.provider.process")
+    attributes = dict(call[0] for call in span.set_attribute.call_args_list)
+    assert attributes["command"] == "echo"
+    assert attributes["timeout"] == 10.0
+    assert attributes["returncode"] == 0
+    assert attributes["stdout_preview"] == "token ***REDACTED***\n"
+
+
+def test_qa_manager_executes_commands_concurrently(tmp_path):
+    """execute_commands() overlaps commands and keeps execute_command() results."""
+    def command(number, command, **overrides):
+        return ValidationCommand(
+            id=f"val-{number:03d}", command=command, description="QA step", cwd=".",
+            retry_policy=RetryPolicy(max_attempts=1, backoff_ms=0), **overrides,
+        )
+
+    manager = QABaselineManager(tmp_path, async_process_provider=AsyncProcessProvider(max_concurrency=4))
+    cmds = [command(i, "sleep 0.4; echo ok") for i in range(4)]
+    cmds.append(command(4, "true", expected_paths=["does-not-exist"]))
+
+    start = time.monotonic()
+    results = manager.execute_commands(cmds, "TASK-0001")
+    assert time.monotonic() - start < 1.4
+    assert [r["success"] for r in results] == [True] * 4 + [False]
+    assert results[0]["stdout"] == "ok\n" and results[0]["attempts"] == 1
+    assert results[-1]["skipped"] and "does-not-exist" in results[-1]["skip_reason"]
+
+    timed_out = manager.execute_commands([command(5, "sleep 30", timeout_ms=1000)], "TASK-0001")[0]
+    assert timed_out["timeout"] is True and timed_out["exit_code"] == -1
+
+
+def test_delta_tracker_async_snapshot_matches_sync(tmp_path):
+    """Overlapped snapshot produces the same diff, checksums and stat."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", "-c", "commit.gpgsign=false"]
+    (repo / "a.txt").write_text("a\n")
+    (repo / "b.txt").write_text("b\n")
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    subprocess.run(["git", "add", "."], cwd=repo, check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], cwd=repo, check=True)
+    head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+
+    (repo / "a.txt").write_text("changed\n")
+    (repo / "b.txt").unlink()
+    (repo / "new.txt").write_text("new\n")
+    context_dir = repo / ".agent-output" / "TASK-0001"
+    context_dir.mkdir(parents=True)
+
+    sync = DeltaTracker(repo).snapshot_worktree(head, ["."], context_dir, "implementer")
+    sync_diff = (context_dir / "implementer-from-base.diff").read_text()
+    overlapped = DeltaTracker(repo, async_process_provider=AsyncProcessProvider()).snapshot_worktree(
+        head, ["."], context_dir, "reviewer",
+    )
+
+    assert (context_dir / "reviewer-from-base.diff").read_text() == sync_diff
+    assert overlapped.diff_sha == sync.diff_sha
+    assert overlapped.diff_stat == sync.diff_stat
+    assert overlapped.files_changed == sync.files_changed
+    assert {f.path for f in overlapped.files_changed} == {"a.txt", "b.txt", "new.txt"}
+
+
+def test_delta_tracker_async_snapshot_uses_git_provider_config(tmp_path):
+    """The async diff commands carry the GitProvider's status-strategy config args."""
+    from tasks_cli.providers import GitProvider
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.txt").write_text("a\n")
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    subprocess.run(["git", "add", "."], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", "commit", "-qm", "init"],
+        cwd=repo, check=True,
+    )
+    head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+    (repo / "a.txt").write_text("changed\n")
+    context_dir = repo / ".agent-output" / "TASK-0001"
+    context_dir.mkdir(parents=True)
+
+    provider = AsyncProcessProvider()
+    argvs = []
+    real_run = provider.run
+
+    async def recording_run(args, **kwargs):
+        argvs.append(list(args))
+        return await real_run(args, **kwargs)
+
+    provider.run = recording_run
+    tracker = DeltaTracker(
+        repo,
+        git_provider=GitProvider(repo, status_strategy="untracked-cache"),
+        async_process_provider=provider,
+    )
+    tracker.snapshot_worktree(head, ["."], context_dir, "implementer")
+
+    assert argvs == [
+        ["git", "-c", "core.untrackedCache=true", "diff", head],
+        ["git", "-c", "core.untrackedCache=true", "diff", "--stat", head],
+    ]
@@ -0,0 +1,108 @@
+"""Tests for bounded-memory spill-to-disk output capture."""
+
+import asyncio
+import hashlib
+import tracemalloc
+
+import pytest
+
+from tasks_cli.context_store.qa import QABaselineManager
+from tasks_cli.context_store.qa_cache import QAResultCache
+from tasks_cli.models import RetryPolicy, ValidationCommand
+from tasks_cli.providers import (
+    AsyncProcessProvider,
+    NonZeroExitWithStdErr,
+    ProcessProvider,
+    SpilledOutput,
+    TimeoutExceeded,
+)
+from tasks_cli.providers.capture import SpillWriter
+
+
+def test_spill_writer_keeps_head_and_tail(tmp_path):
+    """Previews hold both ends; the handle hashes and sizes the whole stream."""
+    data = b"".join(f"line {i}\n".encode() for i in range(5000))
+    with SpillWriter(tmp_path / "out.log", preview_bytes=100) as writer:
+        for start in range(0, len(data), 777):
+            writer.write(data[start:start + 777])
+    handle = writer.close()
+
+    assert (tmp_path / "out.log").read_bytes() == data
+    assert handle.size == len(data) and handle.sha256 == hashlib.sha256(data).hexdigest()
+    assert handle.head == data[:100].decode() and handle.tail == data[-100:].decode()
+    assert handle.truncated and handle.omitted == len(data) - 200
+    assert "bytes omitted" in handle.preview and handle.read_text() == data.decode()
+
+
+def test_spill_writer_short_stream_is_complete(tmp_path):
+    """Streams within head + tail are previewed whole, even split inside a character."""
+    data = "é" * 150  # 300 bytes; the head/tail seam falls inside a character
+    with SpillWriter(tmp_path / "out.log", preview_bytes=201) as writer:
+        writer.write(data.encode())
+    handle = writer.close()
+    assert not handle.truncated and handle.preview == data
+
+
+def test_process_provider_spills_with_bounded_memory(tmp_path):
+    """Large output goes to disk; memory use stays near the preview size."""
+    provider = ProcessProvider()
+    tracemalloc.start()
+    try:
+        result = provider.run(
+            ["sh", "-c", "yes 0123456789abcdef | head -c 30000000; echo done >&2"],
+            spill_dir=tmp_path, spill_name="val-001", preview_bytes=4096,
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert isinstance(result.stdout, SpilledOutput)
+    assert result.stdout.size == 30_000_000 == (tmp_path / "val-001.stdout.log").stat().st_size
+    assert result.stdout.head.startswith("0123456789abcdef\n") and len(result.stdout.tail) == 4096
+    assert result.stderr.preview == "done\n"
+    assert peak < 5 * 1024 * 1024
+
+    with pytest.raises(NonZeroExitWithStdErr, match="boom"):
+        provider.run(["sh", "-c", "echo boom >&2; exit 2"], spill_dir=tmp_path)
+    with pytest.raises(TimeoutExceeded):
+        provider.run(["sh", "-c", "sleep 30"], spill_dir=tmp_path, timeout=0.3)
+
+
+def test_async_provider_spills_like_process_provider(tmp_path):
+    """AsyncProcessProvider returns the same handles as ProcessProvider."""
+    script = "seq 1 100000; echo warn >&2"
+    sync = ProcessProvider().run(["sh", "-c", script], spill_dir=tmp_path, spill_name="sync")
+    spilled = asyncio.run(AsyncProcessProvider().run(["sh", "-c", script], spill_dir=tmp_path, spill_name="async"))
+    assert (spilled.stdout.size, spilled.stdout.sha256, spilled.stdout.head, spilled.stdout.tail) == (
+        sync.stdout.size, sync.stdout.sha256, sync.stdout.head, sync.stdout.tail,
+    )
+    assert spilled.stderr.preview == "warn\n"
+
+
+def test_qa_results_carry_log_handles(tmp_path):
+    """QA results keep previews in stdout/stderr and point at the full logs."""
+    cmd = ValidationCommand(
+        id="val-001", command="seq 1 200000", description="Print a lot", cwd=".",
+        timeout_ms=30000, retry_policy=RetryPolicy(max_attempts=1, backoff_ms=0),
+    )
+    manager = QABaselineManager(tmp_path)
+    result = manager.execute_command(cmd, "TASK-0001")
+
+    log = result["stdout_log"]
+    assert log["path"] == ".agent-output/TASK-0001/qa-logs/val-001.stdout.log"
+    content = (tmp_path / log["path"]).read_bytes()
+    assert log["size"] == len(content) and log["sha256"] == hashlib.sha256(content).hexdigest()
+    assert log["truncated"] and len(result["stdout"]) < 64 * 1024
+    assert result["stdout"].startswith("1\n2\n") and result["stdout"].endswith("199999\n200000\n")
+    assert result["stderr_log"]["size"] == 0 and result["stderr"] == ""
+
+
+def test_qa_cache_stores_spilled_log(tmp_path):
+    """The cached combined log is streamed from the spilled logs."""
+    cache = QAResultCache(tmp_path)
+    cmd = ValidationCommand(id="val-002", command="true", description="Cached", cwd=".")
+    stdout = ProcessProvider().run(["sh", "-c", "echo out"], spill_dir=tmp_path, spill_name="o").stdout
+
+    stored = cache.put("k" * 64, cmd, 0, 5, stdout, "err\n")
+    assert (tmp_path / stored.log_path).read_text() == "out\nerr\n"
+    assert stored.log_sha256 == hashlib.sha256(b"out\nerr\n").hexdigest()
@@ -26,6 +26,16 @@ from scripts.tasks_cli.providers import (
     NonZeroExitWithStdErr,
 )
 
+_BLOB = "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+
+
+def _porcelain_v2(*records):
+    """Encode (XY, path) pairs as `git status --porcelain=v2 -z` output."""
+    return "".join(
+        f"? {path}\0" if xy == "??" else f"1 {xy} N... 100644 100644 100644 {_BLOB} {_BLOB} {path}\0"
+        for xy, path in records
+    )
+
 
 class TestGitProviderInitialization:
     """Test GitProvider initialization and dependency injection."""
@@ -80,7 +90,7 @@ class TestStatusMethod:
         """status() returns modified files for dirty tree."""
         mock_run.return_value = Mock(
             returncode=0,
-            stdout=" M file1.py\n M file2.py\n",
+            stdout=_porcelain_v2((".M", "file1.py"), (".M", "file2.py")),
             stderr="",
         )
 
@@ -97,7 +107,7 @@ class TestStatusMethod:
         """status() includes untracked files when requested."""
         mock_run.return_value = Mock(
             returncode=0,
-            stdout="?? new_file.py\n",
+            stdout=_porcelain_v2(("??", "new_file.py")),
             stderr="",
         )
 
@@ -283,7 +293,7 @@ class TestCheckDirtyTree:
         """check_dirty_tree() returns (False, files) for dirty tree."""
         mock_run.return_value = Mock(
             returncode=0,
-            stdout=" M file1.py\n M file2.py\n",
+            stdout=_porcelain_v2((".M", "file1.py"), (".M", "file2.py")),
             stderr="",
         )
 
@@ -298,7 +308,7 @@ class TestCheckDirtyTree:
         """check_dirty_tree() filters to unexpected changes."""
         mock_run.return_value = Mock(
             returncode=0,
-            stdout=" M expected.py\n M unexpected.py\n",
+            stdout=_porcelain_v2((".M", "expected.py"), (".M", "unexpected.py")),
             stderr="",
         )
 
@@ -315,7 +325,7 @@ class TestCheckDirtyTree:
         """check_dirty_tree() skips untracked files when allow_preexisting=True."""
         mock_run.return_value = Mock(
             returncode=0,
-            stdout="?? untracked.py\n M modified.py\n",
+            stdout=_porcelain_v2(("??", "untracked.py"), (".M", "modified.py")),
             stderr="",
         )
 
@@ -550,3 +560,93 @@ class TestResolveMergeBase:
         provider = GitProvider(Path("/test/repo"))
         with pytest.raises(NonZeroExitWithStdErr):
             provider.resolve_merge_base("invalid-branch")
+
+
+class TestRequestScopeCache:
+    """Test request-scoped memoization of git state queries."""
+
+    @patch('subprocess.run')
+    def test_state_queries_spawn_once_per_scope(self, mock_run):
+        """HEAD, status and untracked listings are memoized inside a scope only."""
+        mock_run.side_effect = lambda cmd, **kwargs: Mock(
+            returncode=0, stdout=_porcelain_v2() if "status" in cmd else "a" * 40 + "\n", stderr="",
+        )
+        provider = GitProvider(Path("/test/repo"))
+
+        with provider.request_scope() as cache:
+            provider.get_current_commit()
+            provider.get_current_commit()
+            provider.status()
+            provider.status()
+            provider.ls_files(untracked=True)
+            provider.ls_files(untracked=True)
+            with provider.request_scope() as inner:
+                assert inner is cache
+                provider.get_current_commit()
+
+        assert mock_run.call_count == 3
+        assert cache.saved_spawns == 4
+
+        provider.get_current_commit()
+        assert mock_run.call_count == 4
+
+    @patch('subprocess.run')
+    def test_real_index_writes_invalidate(self, mock_run):
+        """Writes to the real index drop memoized state; temporary-index writes do not."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        provider = GitProvider(Path("/test/repo"))
+
+        with provider.request_scope() as cache:
+            provider.status()
+            provider.read_tree("HEAD", env={"GIT_INDEX_FILE": "/tmp/index"})
+            provider.status()
+            assert mock_run.call_count == 2
+
+            provider.add_intent_to_add(["--", "new.py"])
+            provider.status()
+
+        assert mock_run.call_count == 4
+        assert cache.invalidations == 1
+        assert cache.saved_spawns == 1
+
+
+class TestBatchWorkers:
+    """Test the persistent cat-file worker against a real repository."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        for i in range(300):
+            (tmp_path / "src" / f"f{i}.py").write_text(f"value = {i}\n")
+        for args in (["init"], ["add", "."], ["-c", "user.email=t@t", "-c", "user.name=t", "commit", "-m", "init"]):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+        return tmp_path
+
+    def test_object_lookups_share_one_worker(self, repo):
+        """Object info for many names and tree hashes come from one process."""
+        with GitProvider(repo) as provider:
+            infos = provider.object_info([f"HEAD:src/f{i}.py" for i in range(300)] + ["HEAD:src", "HEAD:nope"])
+            assert infos[10].type == "blob" and infos[10].size == len("value = 10\n")
+            assert infos[300].type == "tree"
+            assert infos[-1] is None
+
+            root = subprocess.run(
+                ["git", "rev-parse", "HEAD^{tree}"], cwd=repo, capture_output=True, text=True
+            ).stdout.strip()
+            assert provider.get_tree_hash("./src/") == infos[300].oid
+            assert provider.get_tree_hash(".") == root
+            with pytest.raises(NonZeroExitWithStdErr):
+                provider.get_tree_hash("missing")
+
+            assert provider._batch_workers["batch_check"].spawn_count == 1
+
+    def test_worker_restarts_after_close(self, repo):
+        """Closed workers restart on demand; large batches are written from a helper thread."""
+        provider = GitProvider(repo)
+        provider.object_info(["HEAD"])
+        provider.close()
+
+        infos = provider.object_info([f"HEAD:src/f{i}.py" for i in range(300)] * 10)
+        assert len(infos) == 3000 and all(info.type == "blob" for info in infos)
+        assert provider._batch_workers["batch_check"].spawn_count == 2
+        provider.close()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the streaming QA log scanner.
+
+Covers chunk-boundary independence, hashing, command-type detection and the
+parse_qa_log / record-qa metric semantics built on a single pass.
+"""
+
+import hashlib
+
+import pytest
+
+from tasks_cli.qa_log_scanner import (
+    QALogScanner,
+    scan_qa_log,
+    scan_qa_log_bytes,
+)
+
+
+ESLINT_LOG = b"""/src/app.ts
+  5:10  error    'x' is defined but never used  no-unused-vars
+  8:15  warning  Missing return type             explicit-function-return-type
+
+\xe2\x9c\x96 2 problems (1 error, 1 warning)
+"""
+
+JEST_LOG = b"""PASS src/a.test.ts
+FAIL src/b.test.ts
+Tests:       2 failed, 40 passed, 42 total
+Lines        : 85.5% ( 342/400 )
+Branches     : 70.25% ( 90/128 )
+"""
+
+TSC_LOG = b"""src/a.ts(1,5): error TS2345: Argument of type 'string' is not assignable.
+src/b.ts(9,1): error TS2304: Cannot find name 'foo'.
+Found 2 errors in 2 files.
+"""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 4096])
+def test_chunking_does_not_change_result(chunk_size):
+    """Feeding arbitrary chunk sizes yields the same scan as one feed."""
+    data = ESLINT_LOG + JEST_LOG + TSC_LOG
+    expected = scan_qa_log_bytes(data)
+
+    scanner = QALogScanner()
+    for offset in range(0, len(data), chunk_size):
+        scanner.feed(data[offset:offset + chunk_size])
+
+    assert scanner.finish() == expected
+
+
+def test_hash_size_and_lines_cover_raw_bytes():
+    """SHA256, size and line count describe the raw bytes."""
+    data = b"one\ntwo\nthree"
+    scan = scan_qa_log_bytes(data)
+
+    assert scan.sha256 == hashlib.sha256(data).hexdigest()
+    assert scan.size_bytes == len(data)
+    assert scan.line_count == 3
+    assert scan_qa_log_bytes(b"").line_count == 0
+
+
+def test_scan_qa_log_reads_file(tmp_path):
+    """File scanning matches in-memory scanning."""
+    log_file = tmp_path / "test.log"
+    log_file.write_bytes(JEST_LOG)
+
+    assert scan_qa_log(log_file, chunk_size=16) == scan_qa_log_bytes(JEST_LOG)
+
+
+def test_detect_command_type():
+    """Detection uses keyword presence anywhere in the log."""
+    assert scan_qa_log_bytes(b"eslint v8\n" + ESLINT_LOG).detect_command_type() == 'lint'
+    assert scan_qa_log_bytes(TSC_LOG).detect_command_type() == 'typecheck'
+    assert scan_qa_log_bytes(b"jest --ci\n" + JEST_LOG).detect_command_type() == 'test'
+    assert scan_qa_log_bytes(b"nothing here\n").detect_command_type() is None
+
+
+def test_summary_and_results_semantics():
+    """Both parser semantics come from one scan."""
+    lint = scan_qa_log_bytes(ESLINT_LOG)
+    assert lint.results_for('lint') == {'lint_errors': 1, 'lint_warnings': 1}
+
+    tests = scan_qa_log_bytes(JEST_LOG)
+    assert tests.summary_for('test').tests_passed == 40
+    assert tests.summary_for('test').tests_failed == 2
+    assert tests.results_for('coverage') == {'coverage': {'lines': 85.5, 'branches': 70.25}}
+
+    tsc = scan_qa_log_bytes(TSC_LOG)
+    assert tsc.summary_for('typecheck').type_errors == 2
+    assert tsc.results_for('typecheck') == {'type_errors': 2}
+
+
+def test_matches_do_not_span_lines():
+    """A count on one line never pairs with a keyword on the next."""
+    scan = scan_qa_log_bytes(b"total 3\nfailed to start\n")
+    assert 'failed' not in scan.firsts
+
+
+def test_invalid_utf8_is_tolerated():
+    """Undecodable bytes are skipped rather than raising."""
+    scan = scan_qa_log_bytes(b"\xff\xfe garbage\n3 passed, 1 failed in 2s\n")
+    assert scan.summary_for('test').tests_passed == 3
+    assert scan.summary_for('test').tests_failed == 1
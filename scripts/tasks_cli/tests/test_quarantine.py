@@ -0,0 +1,117 @@
+"""Tests for the cached quarantine index."""
+
+import json
+import os
+import stat
+
+import pytest
+
+from tasks_cli import quarantine
+from tasks_cli.quarantine import (
+    QUARANTINE_DIR,
+    is_quarantined,
+    quarantine_task,
+    quarantine_tasks,
+    quarantined_ids,
+    release_from_quarantine,
+    release_tasks,
+)
+
+
+def test_batch_quarantine_and_release(tmp_path):
+    """Batch operations update the index once and keep it idempotent."""
+    paths = quarantine_tasks(
+        [("TASK-0001", "malformed_yaml", "bad indent"), ("TASK-0002", "manual", None)],
+        tmp_path,
+    )
+    quarantine_task("TASK-0001", "malformed_yaml", None, tmp_path)
+
+    assert [p.name for p in paths] == ["TASK-0001.quarantine.json", "TASK-0002.quarantine.json"]
+    assert quarantined_ids(tmp_path) == frozenset({"TASK-0001", "TASK-0002"})
+    index = json.loads((tmp_path / QUARANTINE_DIR / "index.json").read_text())
+    assert index["quarantined_tasks"] == ["TASK-0001", "TASK-0002"]
+
+    release_tasks(["TASK-0001", "TASK-0002"], tmp_path)
+    assert quarantined_ids(tmp_path) == frozenset()
+    assert (tmp_path / QUARANTINE_DIR / "resolved" / "TASK-0002.quarantine.json").exists()
+    assert not list((tmp_path / QUARANTINE_DIR).glob(".*tmp*"))
+
+
+def test_batch_validation_is_all_or_nothing(tmp_path):
+    """Invalid entries or missing releases leave the index untouched."""
+    quarantine_task("TASK-0001", "manual", None, tmp_path)
+
+    with pytest.raises(ValueError):
+        quarantine_tasks([("TASK-0002", "manual", None), ("TASK-0003", "bogus", None)], tmp_path)
+    with pytest.raises(FileNotFoundError):
+        release_tasks(["TASK-0001", "TASK-0009"], tmp_path)
+
+    assert quarantined_ids(tmp_path) == frozenset({"TASK-0001"})
+    with pytest.raises(FileNotFoundError):
+        release_from_quarantine("TASK-0009", tmp_path)
+
+
+def test_release_ignores_repeated_ids(tmp_path):
+    """A task listed twice is released once and leaves the index consistent."""
+    quarantine_tasks([("TASK-0001", "manual", None), ("TASK-0002", "manual", None)], tmp_path)
+
+    release_tasks(["TASK-0001", "TASK-0001"], tmp_path)
+
+    assert quarantined_ids(tmp_path) == frozenset({"TASK-0002"})
+    assert (tmp_path / QUARANTINE_DIR / "resolved" / "TASK-0001.quarantine.json").exists()
+
+
+def test_failed_release_moves_entries_back(tmp_path, monkeypatch):
+    """A move failing partway through restores the moved entries and the index."""
+    quarantine_tasks([("TASK-0001", "manual", None), ("TASK-0002", "manual", None)], tmp_path)
+    real_move = quarantine.shutil.move
+
+    def failing_move(src, dst):
+        if src.endswith("TASK-0002.quarantine.json"):
+            raise OSError("disk full")
+        return real_move(src, dst)
+
+    monkeypatch.setattr(quarantine.shutil, "move", failing_move)
+    with pytest.raises(OSError):
+        release_tasks(["TASK-0001", "TASK-0002"], tmp_path)
+    monkeypatch.undo()
+
+    assert quarantined_ids(tmp_path) == frozenset({"TASK-0001", "TASK-0002"})
+    assert not list((tmp_path / QUARANTINE_DIR / "resolved").iterdir())
+    release_from_quarantine("TASK-0001", tmp_path)
+    assert quarantined_ids(tmp_path) == frozenset({"TASK-0002"})
+
+
+def test_lookups_reuse_parsed_index(tmp_path, monkeypatch):
+    """The index is parsed once until the file changes."""
+    quarantine_task("TASK-0001", "manual", None, tmp_path)
+
+    reads = []
+    real_read = quarantine._read_index
+
+    def counting_read(path):
+        reads.append(path)
+        return real_read(path)
+
+    monkeypatch.setattr(quarantine, "_read_index", counting_read)
+
+    assert all(is_quarantined("TASK-0001", tmp_path) for _ in range(100))
+    assert reads == []
+
+    index_path = tmp_path / QUARANTINE_DIR / "index.json"
+    index_path.write_text(json.dumps({"quarantined_tasks": ["TASK-0001", "TASK-0005"]}))
+    assert is_quarantined("TASK-0005", tmp_path)
+    assert len(reads) == 1
+
+
+def test_index_rewrites_keep_permissions(tmp_path):
+    """New files get the umask default mode; rewrites keep the existing mode."""
+    quarantine_task("TASK-0001", "manual", None, tmp_path)
+    index_path = tmp_path / QUARANTINE_DIR / "index.json"
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(index_path).st_mode) == 0o666 & ~umask
+
+    os.chmod(index_path, 0o640)
+    quarantine_task("TASK-0002", "manual", None, tmp_path)
+    assert stat.S_IMODE(os.stat(index_path).st_mode) == 0o640
@@ -0,0 +1,73 @@
+"""Tests for the process-wide task status lookup service."""
+
+from unittest.mock import patch
+
+import pytest
+
+from tasks_cli import task_status
+from tasks_cli.context_store.qa import QABaselineManager
+from tasks_cli.datastore import TaskDatastore
+from tasks_cli.models import RetryPolicy, ValidationCommand
+from tasks_cli.validation import check_blocker_status
+
+
+def _write_task(directory, task_id, status):
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{task_id}.task.yaml").write_text(
+        f"id: {task_id}\ntitle: {task_id}\nstatus: {status}\npriority: P1\narea: test\n"
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repo with active, blocked and archived tasks."""
+    _write_task(tmp_path / "tasks", "TASK-0001", "todo")
+    _write_task(tmp_path / "tasks", "TASK-0002", "completed")
+    _write_task(tmp_path / "docs" / "completed-tasks", "TASK-0003", "completed")
+    yield tmp_path
+    task_status.invalidate_task_statuses(tmp_path)
+
+
+def test_status_of_covers_both_tiers(repo):
+    """Active statuses come from the hot tier; archived IDs are completed."""
+    index = task_status.get_task_status_index(repo)
+
+    assert index.status_of("TASK-0001") == "todo"
+    assert index.status_of("TASK-0002") == "completed"
+    assert index.status_of("TASK-0003") == "completed"
+    assert index.status_of("TASK-9999") is None
+    assert task_status.check_blockers(["TASK-0001", "TASK-0003", "TASK-9999"], repo) == {
+        "TASK-0001": (True, "Blocked by TASK-0001 (status: todo)"),
+        "TASK-0003": (False, ""),
+        "TASK-9999": (False, "Blocker TASK-9999 not found"),
+    }
+
+
+def test_datastore_loaded_once_for_many_checks(repo):
+    """Ten validation commands with blockers share one datastore load."""
+    manager = QABaselineManager(repo)
+    cmds = [
+        ValidationCommand(
+            id=f"val-{i:03d}", command="true", description="Blocked", cwd=".",
+            blocker_id="TASK-0001", retry_policy=RetryPolicy(max_attempts=1, backoff_ms=0),
+        )
+        for i in range(10)
+    ]
+    with patch.object(TaskDatastore, "load_active_tasks", autospec=True,
+                      side_effect=TaskDatastore.load_active_tasks) as load:
+        results = [manager.execute_command(cmd, "TASK-0100") for cmd in cmds]
+        assert check_blocker_status("TASK-0002", repo) == (False, "")
+
+    assert load.call_count == 1
+    assert all(r["skipped"] and "TASK-0001" in r["skip_reason"] for r in results)
+
+
+def test_index_reloads_when_datastore_is_rebuilt(repo):
+    """A rebuilt hot tier (e.g. after a status change) is picked up on next lookup."""
+    assert task_status.status_of("TASK-0001", repo) == "todo"
+
+    _write_task(repo / "tasks", "TASK-0001", "completed")
+    assert task_status.status_of("TASK-0001", repo) == "todo"  # Cached until rebuilt
+
+    TaskDatastore(repo).refresh()
+    assert task_status.status_of("TASK-0001", repo) == "completed"
@@ -1,4 +1,6 @@
-"""Tests for telemetry module (Phase 0 stubs)."""
+"""Tests for telemetry module (exporters, init and trace summaries)."""
+
+import json
 
 import pytest
 from opentelemetry import trace
@@ -7,10 +9,16 @@ from opentelemetry.sdk.trace.export import SpanExportResult
 from unittest.mock import Mock
 
 from tasks_cli.telemetry import (
+    JsonlSpanExporter,
     NullSpanExporter,
+    RingBufferSpanExporter,
     get_tracer,
     get_meter,
     init_telemetry,
+    load_span_records,
+    rotated_trace_file,
+    shutdown_telemetry,
+    summarize_traces,
 )
 
 
@@ -151,17 +159,32 @@ class TestInitTelemetry:
         assert isinstance(tracer, trace.Tracer)
         assert meter is not None
 
-    def test_init_enabled_noop(self):
-        """Verify init_telemetry(enabled=True) is no-op in Phase 0."""
-        # Phase 0: enabled flag has no effect
-        init_telemetry(enabled=True)
-
-        # Tracer and meter should still be no-op
-        tracer = get_tracer("test.module")
-        meter = get_meter("test.module")
-
-        assert isinstance(tracer, trace.Tracer)
-        assert meter is not None
+    def test_init_enabled_exports_spans(self):
+        """Verify init_telemetry(enabled=True) exports spans through the batch processor."""
+        exporter = init_telemetry(enabled=True, exporter=RingBufferSpanExporter())
+        try:
+            tracer = get_tracer("test.module")
+            with tracer.start_as_current_span("parent"):
+                with tracer.start_as_current_span("child") as span:
+                    span.set_attribute("task_count", 3)
+        finally:
+            shutdown_telemetry()
+
+        records = {r["name"]: r for r in exporter.records()}
+        assert set(records) == {"parent", "child"}
+        assert records["child"]["parent_id"] == records["parent"]["span_id"]
+        assert records["child"]["attributes"] == {"task_count": 3}
+        assert records["parent"]["duration_ms"] >= records["child"]["duration_ms"]
+
+    def test_shutdown_detaches_exporter(self):
+        """Verify spans after shutdown_telemetry() are not exported."""
+        exporter = init_telemetry(enabled=True, exporter=RingBufferSpanExporter())
+        shutdown_telemetry()
+
+        with get_tracer("test.module").start_as_current_span("late"):
+            pass
+
+        assert exporter.records() == []
 
     def test_init_default(self):
         """Verify init_telemetry() with default args completes."""
@@ -208,3 +231,96 @@ class TestEndToEnd:
         exporter.shutdown()
 
         # All operations should complete without errors
+
+
+class TestOfflineExporters:
+    """Test JSONL and ring buffer exporters."""
+
+    def test_jsonl_exporter_writes_and_rotates(self, tmp_path):
+        """Verify spans are appended as JSON lines and rotated past max_bytes."""
+        trace_file = tmp_path / "traces" / "spans.jsonl"
+        exporter = JsonlSpanExporter(trace_file, max_bytes=1)
+
+        for name in ("first", "second"):
+            init_telemetry(enabled=True, exporter=exporter)
+            try:
+                with get_tracer("test.jsonl").start_as_current_span(name):
+                    pass
+            finally:
+                shutdown_telemetry()  # Flush so each span lands in its own write
+
+        assert json.loads(rotated_trace_file(trace_file).read_text())["name"] == "first"
+        assert [r["name"] for r in load_span_records(trace_file)] == ["first", "second"]
+
+    def test_ring_buffer_keeps_latest(self):
+        """Verify ring buffer evicts oldest records."""
+        exporter = init_telemetry(enabled=True, exporter=RingBufferSpanExporter(maxlen=2))
+        try:
+            for name in ("a", "b", "c"):
+                with get_tracer("test.ring").start_as_current_span(name):
+                    pass
+        finally:
+            shutdown_telemetry()
+
+        assert [r["name"] for r in exporter.records()] == ["b", "c"]
+
+    def test_load_span_records_skips_malformed_lines(self, tmp_path):
+        """Verify truncated lines are ignored."""
+        trace_file = tmp_path / "spans.jsonl"
+        trace_file.write_text('{"name": "ok"}\n{"name": \n')
+
+        assert load_span_records(trace_file) == [{"name": "ok"}]
+
+
+def _record(trace_id, span_id, name, start, duration, parent=None, command=None):
+    return {
+        "trace_id": trace_id,
+        "span_id": span_id,
+        "parent_id": parent,
+        "name": name,
+        "start_time_ns": start,
+        "duration_ms": duration,
+        "status": "UNSET",
+        "attributes": {"cli.command": command} if command else {},
+    }
+
+
+class TestSummarizeTraces:
+    """Test trace-report aggregation."""
+
+    def test_groups_by_command_and_ranks_spans(self):
+        """Verify per-command aggregation of slowest spans."""
+        records = [
+            _record("t1", "r1", "cli.command", 1, 100.0, command="list"),
+            _record("t1", "s1", "cli.datastore.load_tasks", 2, 80.0, parent="r1"),
+            _record("t1", "s2", "cli.graph.build", 3, 5.0, parent="r1"),
+            _record("t2", "r2", "cli.command", 10, 60.0, command="list"),
+            _record("t2", "s3", "cli.datastore.load_tasks", 11, 40.0, parent="r2"),
+            _record("t3", "r3", "cli.command", 20, 30.0, command="pick"),
+        ]
+
+        report = summarize_traces(records, runs=20, top=1)
+
+        assert report["runs_analyzed"] == 3
+        listing = report["commands"]["list"]
+        assert listing["runs"] == 2
+        assert listing["avg_duration_ms"] == 80.0
+        assert listing["slowest_spans"] == [{
+            "name": "cli.datastore.load_tasks",
+            "count": 2,
+            "total_ms": 120.0,
+            "avg_ms": 60.0,
+            "max_ms": 80.0,
+        }]
+        assert report["commands"]["pick"]["slowest_spans"] == []
+
+    def test_limits_to_recent_runs(self):
+        """Verify only the most recent runs are analyzed."""
+        records = [
+            _record("old", "r1", "cli.command", 1, 10.0, command="list"),
+            _record("new", "r2", "cli.command", 5, 10.0, command="pick"),
+        ]
+
+        report = summarize_traces(records, runs=1)
+
+        assert list(report["commands"]) == ["pick"]
@@ -11,7 +11,7 @@ import subprocess
 import tempfile
 import time
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -43,16 +43,8 @@ def test_blocker_skip_logic(temp_repo):
         blocker_id="TASK-0001"
     )
 
-    # Mock datastore to return non-completed blocker
-    with patch("tasks_cli.datastore.TaskDatastore") as mock_ds:
-        mock_task = Mock()
-        mock_task.id = "TASK-0001"
-        mock_task.status = "in_progress"
-
-        mock_instance = Mock()
-        mock_instance.load_tasks.return_value = [mock_task]
-        mock_ds.return_value = mock_instance
-
+    # Mock the status lookup to return a non-completed blocker
+    with patch("tasks_cli.task_status.status_of", return_value="in_progress"):
         result = execute_validation_command(cmd, "TASK-0824", temp_repo)
 
         assert result["skipped"] is True
@@ -70,16 +62,8 @@ def test_blocker_completed_allows_execution(temp_repo):
         blocker_id="TASK-0001"
     )
 
-    # Mock datastore to return completed blocker
-    with patch("tasks_cli.datastore.TaskDatastore") as mock_ds:
-        mock_task = Mock()
-        mock_task.id = "TASK-0001"
-        mock_task.status = "completed"
-
-        mock_instance = Mock()
-        mock_instance.load_tasks.return_value = [mock_task]
-        mock_ds.return_value = mock_instance
-
+    # Mock the status lookup to return a completed blocker
+    with patch("tasks_cli.task_status.status_of", return_value="completed"):
         result = execute_validation_command(cmd, "TASK-0824", temp_repo)
 
         # Command should execute (not be skipped)
@@ -30,6 +30,8 @@ from .context_store.qa import (
     detect_qa_drift,
     format_drift_report,
 )
+from . import task_status
+from .expected_paths import check_expected_paths
 from .models import ValidationCommand
 
 
@@ -45,19 +47,11 @@ def check_blocker_status(blocker_id: str, repo_root: Path) -> tuple[bool, str]:
         Tuple of (is_blocked, reason):
         - is_blocked: True if blocker is active (not completed)
         - reason: Human-readable reason string
-    """
-    from .datastore import TaskDatastore
-    ds = TaskDatastore(repo_root)
-    tasks = ds.load_all_tasks()
-    blocker_task = next((t for t in tasks if t.id == blocker_id), None)
-
-    if blocker_task is None:
-        return False, f"Blocker {blocker_id} not found"
-
-    if blocker_task.status != "completed":
-        return True, f"Blocked by {blocker_id} (status: {blocker_task.status})"
 
-    return False, ""
+    Statuses come from the process-wide index in task_status.py, so repeated
+    checks do not reload the datastore.
+    """
+    return task_status.check_blocker_status(blocker_id, repo_root)
 
 
 def verify_expected_paths(patterns: list[str], repo_root: Path) -> tuple[bool, list[str]]:
@@ -72,14 +66,12 @@ def verify_expected_paths(patterns: list[str], repo_root: Path) -> tuple[bool, l
         Tuple of (all_exist, missing_patterns):
         - all_exist: True if all patterns have at least one match
         - missing_patterns: List of patterns that had no matches
-    """
-    missing = []
-    for pattern in patterns:
-        matches = list(repo_root.glob(pattern))
-        if not matches:
-            missing.append(pattern)
 
-    return len(missing) == 0, missing
+    Each pattern stops at its first match and wildcards skip node_modules/.git
+    (see expected_paths.py).
+    """
+    report = check_expected_paths(patterns, repo_root)
+    return report.all_exist, report.missing
 
 
 # execute_validation_command, detect_qa_drift, and format_drift_report